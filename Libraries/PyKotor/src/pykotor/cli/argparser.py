@@ -591,6 +591,9 @@ Compare two paths and show differences. Supports any combination of:
     validate_installation_parser = subparsers.add_parser("validate-installation", help="Validate a KOTOR installation")
     validate_installation_parser.add_argument("--installation", "-i", required=True, help="Path to KOTOR installation")
     validate_installation_parser.add_argument("--check-essential", action="store_true", default=True, help="Check for essential game files")
+    validate_installation_parser.add_argument("--resources", action="store_true", help="Run the resource checkers (missing textures/scripts, broken 2DA references, dangling conversation links, invalid GFFs)")
+    validate_installation_parser.add_argument("--cache", help="SQLite file caching resource validation results between runs")
+    validate_installation_parser.add_argument("--workers", type=int, help="Number of worker processes for --resources (default: CPU count)")
 
     investigate_module_parser = subparsers.add_parser("investigate-module", help="Investigate a module's structure")
     investigate_module_parser.add_argument("--module", "-m", required=True, help="Module name to investigate")
@@ -658,7 +661,9 @@ Compare two paths and show differences. Supports any combination of:
     batch_patch_parser.add_argument("--convert-gffs-to-k1", action="store_true", help="Convert GFFs to K1 format")
     batch_patch_parser.add_argument("--convert-gffs-to-tsl", action="store_true", help="Convert GFFs to TSL format")
     batch_patch_parser.add_argument("--always-backup", action="store_true", default=True, help="Always create backups")
+    batch_patch_parser.add_argument("--translation-cache", help="SQLite file reusing translations between runs")
     batch_patch_parser.add_argument("--max-threads", type=int, default=2, help="Maximum translation threads")
+    batch_patch_parser.add_argument("--workers", type=int, help="Number of patching workers (default: CPU count, 1 patches in-process)")
 
     patch_file_parser = subparsers.add_parser("patch-file", help="Patch a single file")
     patch_file_parser.add_argument("--file", "-f", required=True, help="File to patch")
@@ -669,6 +674,7 @@ Compare two paths and show differences. Supports any combination of:
     patch_file_parser.add_argument("--convert-gffs-to-k1", action="store_true", help="Convert GFFs to K1 format")
     patch_file_parser.add_argument("--convert-gffs-to-tsl", action="store_true", help="Convert GFFs to TSL format")
     patch_file_parser.add_argument("--always-backup", action="store_true", default=True, help="Always create backups")
+    patch_file_parser.add_argument("--translation-cache", help="SQLite file reusing translations between runs")
 
     patch_folder_parser = subparsers.add_parser("patch-folder", help="Patch all files in a folder recursively")
     patch_folder_parser.add_argument("--folder", "-f", required=True, help="Folder to patch")
@@ -679,7 +685,9 @@ Compare two paths and show differences. Supports any combination of:
     patch_folder_parser.add_argument("--convert-gffs-to-k1", action="store_true", help="Convert GFFs to K1 format")
     patch_folder_parser.add_argument("--convert-gffs-to-tsl", action="store_true", help="Convert GFFs to TSL format")
     patch_folder_parser.add_argument("--always-backup", action="store_true", default=True, help="Always create backups")
+    patch_folder_parser.add_argument("--translation-cache", help="SQLite file reusing translations between runs")
     patch_folder_parser.add_argument("--max-threads", type=int, default=2, help="Maximum translation threads")
+    patch_folder_parser.add_argument("--workers", type=int, help="Number of patching workers (default: CPU count, 1 patches in-process)")
 
     patch_installation_parser = subparsers.add_parser("patch-installation", help="Patch a KOTOR installation")
     patch_installation_parser.add_argument("--installation", "-i", required=True, help="Path to KOTOR installation")
@@ -690,6 +698,8 @@ Compare two paths and show differences. Supports any combination of:
     patch_installation_parser.add_argument("--convert-gffs-to-k1", action="store_true", help="Convert GFFs to K1 format")
     patch_installation_parser.add_argument("--convert-gffs-to-tsl", action="store_true", help="Convert GFFs to TSL format")
     patch_installation_parser.add_argument("--always-backup", action="store_true", default=True, help="Always create backups")
+    patch_installation_parser.add_argument("--translation-cache", help="SQLite file reusing translations between runs")
     patch_installation_parser.add_argument("--max-threads", type=int, default=2, help="Maximum translation threads")
+    patch_installation_parser.add_argument("--workers", type=int, help="Number of patching workers (default: CPU count, 1 patches in-process)")
 
     return parser
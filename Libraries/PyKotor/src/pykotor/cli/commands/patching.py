@@ -21,6 +21,7 @@ References:
 from __future__ import annotations
 
 import pathlib
+
 from argparse import Namespace
 
 from loggerplus import RobustLogger as Logger  # type: ignore[import-untyped]
@@ -33,6 +34,7 @@ from pykotor.tools.patching import (
     patch_folder,
     patch_install,
 )
+from pykotor.tools.translation import TranslationCache
 
 
 def cmd_batch_patch(args: Namespace, logger: Logger) -> int:
@@ -51,7 +53,10 @@ def cmd_batch_patch(args: Namespace, logger: Logger) -> int:
     config.k1_convert_gffs = args.convert_gffs_to_k1
     config.tsl_convert_gffs = args.convert_gffs_to_tsl
     config.always_backup = args.always_backup
+    if getattr(args, "translation_cache", None):
+        config.translation_cache = TranslationCache(args.translation_cache)
     config.max_threads = args.max_threads
+    config.max_workers = getattr(args, "workers", None)
     config.log_callback = lambda msg: logger.info(msg)
 
     # Setup translator if translation is enabled
@@ -100,6 +105,8 @@ def cmd_patch_file(args: Namespace, logger: Logger) -> int:
     config.k1_convert_gffs = args.convert_gffs_to_k1
     config.tsl_convert_gffs = args.convert_gffs_to_tsl
     config.always_backup = args.always_backup
+    if getattr(args, "translation_cache", None):
+        config.translation_cache = TranslationCache(args.translation_cache)
     config.log_callback = lambda msg: logger.info(msg)
 
     if config.translate and args.to_lang:
@@ -137,7 +144,10 @@ def cmd_patch_folder(args: Namespace, logger: Logger) -> int:
     config.k1_convert_gffs = args.convert_gffs_to_k1
     config.tsl_convert_gffs = args.convert_gffs_to_tsl
     config.always_backup = args.always_backup
+    if getattr(args, "translation_cache", None):
+        config.translation_cache = TranslationCache(args.translation_cache)
     config.max_threads = args.max_threads
+    config.max_workers = getattr(args, "workers", None)
     config.log_callback = lambda msg: logger.info(msg)
 
     if config.translate and args.to_lang:
@@ -175,7 +185,10 @@ def cmd_patch_installation(args: Namespace, logger: Logger) -> int:
     config.k1_convert_gffs = args.convert_gffs_to_k1
     config.tsl_convert_gffs = args.convert_gffs_to_tsl
     config.always_backup = args.always_backup
+    if getattr(args, "translation_cache", None):
+        config.translation_cache = TranslationCache(args.translation_cache)
     config.max_threads = args.max_threads
+    config.max_workers = getattr(args, "workers", None)
     config.log_callback = lambda msg: logger.info(msg)
 
     if config.translate and args.to_lang:
@@ -38,6 +38,7 @@ from pykotor.tools.validation import (
     investigate_module_structure,
     validate_installation,
 )
+from pykotor.tools.validation_engine import SEVERITY_ERROR, ValidationCache, run_validation
 
 from pykotor.cli.console import ok_fail_symbols
 
@@ -121,7 +122,11 @@ def cmd_validate_installation(args: Namespace, logger: Logger) -> int:
     results = validate_installation(installation, check_essential_files=args.check_essential)
     ok, _fail = ok_fail_symbols()
 
-    if results["valid"]:
+    resources_valid = True
+    if getattr(args, "resources", False):
+        resources_valid = _validate_installation_resources(installation, args, logger)
+
+    if results["valid"] and resources_valid:
         logger.info(f"{ok} Installation is valid")  # noqa: G004
         return 0
 
@@ -144,6 +149,19 @@ def cmd_validate_installation(args: Namespace, logger: Logger) -> int:
     return 1
 
 
+def _validate_installation_resources(installation: Installation, args: Namespace, logger: Logger) -> bool:
+    """Run the resource checkers and log their issues. Returns False if any error was found."""
+    cache = ValidationCache(args.cache) if getattr(args, "cache", None) else None
+    report = run_validation(installation, cache=cache, max_workers=getattr(args, "workers", None), logger=logger.info)
+    logger.info(f"Checked {report.resources} resources ({report.validated} validated, {report.cached} cached)")  # noqa: G004
+    for checker, issues in report.by_checker().items():
+        logger.warning(f"{checker} ({len(issues)}):")  # noqa: G004
+        for issue in issues:
+            log = logger.error if issue.severity == SEVERITY_ERROR else logger.warning
+            log(f"  - {issue.resource} [{issue.location}]: {issue.message}")  # noqa: G004
+    return report.valid
+
+
 def cmd_investigate_module(args: Namespace, logger: Logger) -> int:
     """Investigate a module's structure.
 
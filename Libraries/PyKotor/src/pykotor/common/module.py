@@ -3,6 +3,7 @@ from __future__ import annotations
 import errno
 import os
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 from enum import Enum
@@ -11,9 +12,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Collection, Generic, TypeVar, TypedDict, cast
 
 from loggerplus import RobustLogger
-
 from pykotor.common.language import LocalizedString
 from pykotor.common.misc import ResRef
+from pykotor.common.module_closure import ClosureResource, ModuleClosure, closure_key, collect_dependencies, get_module_closure_cache
 from pykotor.extract.capsule import Capsule
 from pykotor.extract.file import FileResource, LocationResult, ResourceIdentifier
 from pykotor.extract.installation import SearchLocation
@@ -54,6 +55,7 @@ if TYPE_CHECKING:
     from typing_extensions import Self  # pyright: ignore[reportMissingModuleSource]
 
     from pykotor.common.misc import Game
+    from pykotor.common.module_closure import ModuleClosureCache
     from pykotor.extract.file import LocationResult, ResourceResult
     from pykotor.extract.installation import Installation
     from pykotor.resource.formats.erf.erf_data import ERF
@@ -423,6 +425,10 @@ class Module:  # noqa: PLR0904
         _capsules: Dictionary of module archive capsules.
             Contains ModuleLinkPiece, ModuleDataPiece, ModuleDLGPiece, or ModuleFullOverridePiece
             depending on module type and available files.
+
+        _closure_cache: Cache of resolved resource closures.
+            PyKotor-specific: lets reload_resources skip the GIT/LYT/model crawl when none of
+            the files the closure was derived from changed.
     """
     def __init__(
         self,
@@ -431,6 +437,7 @@ class Module:  # noqa: PLR0904
         *,
         use_dot_mod: bool = True,  # Should this Module instance represent the .rim/_s.rim/._dlg.erf vanilla archives, or the singular `root`.mod override archive?
         load_textures: bool = True,  # Whether to crawl model references to locate textures/lightmaps.
+        closure_cache: ModuleClosureCache | None = None,  # Where resolved resource closures are cached; defaults to the process-wide cache.
     ):
         self.resources: dict[ResourceIdentifier, ModuleResource] = {}  # The keys are only used for ensured uniqueness.
         self.dot_mod: bool = use_dot_mod
@@ -439,6 +446,7 @@ class Module:  # noqa: PLR0904
         self._cached_mod_id: ResRef | None = None
         self._cached_sort_id: str | None = None
         self._load_textures: bool = load_textures
+        self._closure_cache: ModuleClosureCache = get_module_closure_cache() if closure_cache is None else closure_cache
 
         # Build all capsules relevant to this root in the provided installation
         # Based on swkotor.exe: FUN_004094a0 and swkotor2.exe: FUN_004096b0
@@ -732,6 +740,9 @@ class Module:  # noqa: PLR0904
             a. Skip TPC resources if the TGA equivalent is already found and activated
             b. Skip TGA resources if the TPC equivalent is already found and activated
 
+        Steps 3-10 only run when the closure cache has no valid entry for this module. Otherwise the
+        resolved locations are restored from it, and a fresh closure is stored after every full resolve.
+
         Raises:
         ------
             FileNotFoundError: If a required resource is not found in the expected locations.
@@ -739,6 +750,23 @@ class Module:  # noqa: PLR0904
         """
         display_name = f"{self._root}.mod" if self.dot_mod else f"{self._root}.rim"
         RobustLogger().info("Loading module resources needed for '%s'", display_name)
+        cache_key: str = closure_key(self._installation, self._root, dot_mod=self.dot_mod, load_textures=self._load_textures)
+        closure: ModuleClosure | None = self._closure_cache.get(cache_key)
+        if closure is not None:
+            RobustLogger().debug("Restoring %d cached resources for '%s'", len(closure.resources), display_name)
+            self._restore_closure(closure)
+            return
+
+        textures, lightmaps = self._resolve_resources(display_name)
+        self._closure_cache.put(cache_key, self._build_closure(textures, lightmaps))
+
+    def _resolve_resources(self, display_name: str) -> tuple[set[str], set[str]]:
+        """Resolves every resource of the module, see `reload_resources`.
+
+        Returns:
+        -------
+            The texture and lightmap names referenced by the module's models.
+        """
         capsules_to_search: list[ModuleFullOverridePiece | ModuleLinkPiece] = [self.lookup_main_capsule()]
         # Lookup the GIT and LYT first.
         order: tuple[SearchLocation, ...] = (
@@ -852,38 +880,31 @@ class Module:  # noqa: PLR0904
         if not self._load_textures:
             # Fast mode: skip model texture/lightmap crawling. This is the largest bottleneck in practice
             # and is unnecessary for workflows that only need module-local resources (e.g. IndoorMap/ModuleKit extraction).
-            return
+            return set(), set()
 
         lookup_texture_queries: set[str] = set()
         lookup_lightmap_queries: set[str] = set()
-        for model in self.models():
+        models: list[ModuleResource[MDL]] = self.models()
+        for model, (model_data, model_textures, model_lightmaps) in zip(models, self._read_model_textures(models)):
             print(f"Finding textures/lightmaps for model '{model.identifier()}'...")
-            try:
-                model_data: bytes | None = model.data()
-            except OSError:
+            if isinstance(model_data, OSError):
                 RobustLogger().warning(
                     "Suppressed known exception while executing %s.reload_resources() while getting model data '%s': %s",
                     repr(self),
                     model.identifier(),
-                    exc_info=True,
+                    model_data,
+                    exc_info=model_data,
                     extra={"detailed": False},
                 )
                 continue
-            else:
-                if model_data is None:
-                    RobustLogger().warning(f"Missing model '{model.identifier()}', needed by module '{display_name}'")
-                    continue
-                if not model_data:
-                    RobustLogger().warning(f"model '{model.identifier()}' was unexpectedly empty, but is needed by module '{display_name}'")
-                    continue
-            model_textures: set[str] = set()
-            model_lightmaps: set[str] = set()
-            with suppress(Exception):
-                model_textures.update(iterate_textures(model_data))
-                lookup_texture_queries.update(model_textures)
-            with suppress(Exception):
-                model_lightmaps.update(iterate_lightmaps(model_data))
-                lookup_lightmap_queries.update(model_lightmaps)
+            if model_data is None:
+                RobustLogger().warning(f"Missing model '{model.identifier()}', needed by module '{display_name}'")
+                continue
+            if not model_data:
+                RobustLogger().warning(f"model '{model.identifier()}' was unexpectedly empty, but is needed by module '{display_name}'")
+                continue
+            lookup_texture_queries.update(model_textures)
+            lookup_lightmap_queries.update(model_lightmaps)
             if model_textures:
                 print(f"    Textures: {', '.join(sorted(model_textures))}")
             if model_lightmaps:
@@ -923,6 +944,109 @@ class Module:  # noqa: PLR0904
             if ident.restype is ResourceType.TGA and ResourceIdentifier(ident.resname, ResourceType.TPC) in self.resources:
                 continue  # Skip TGA resources if the TPC equivalent resource is already found and activated.
             module_resource.activate()
+        return lookup_texture_queries, lookup_lightmap_queries
+
+    def _read_model_textures(
+        self,
+        models: list[ModuleResource[MDL]],
+    ) -> list[tuple[bytes | OSError | None, set[str], set[str]]]:
+        """Reads the given models and extracts the textures and lightmaps they reference.
+
+        Models stored in the same capsule are read in one batch so the capsule is only opened once,
+        and the batches run in a thread pool since the work is dominated by file I/O.
+
+        Returns:
+        -------
+            Per model, in order: its data (or the error raised reading it), its textures and its lightmaps.
+        """
+        batches: dict[Path, list[int]] = {}
+        loose: list[list[int]] = []
+        for index, model in enumerate(models):
+            active_path: Path | None = model.active()
+            if active_path is not None and is_capsule_file(active_path):
+                batches.setdefault(active_path, []).append(index)
+            else:
+                loose.append([index])
+
+        def read_batch(capsule_path: Path | None, indices: list[int]) -> list[tuple[int, bytes | OSError | None]]:
+            if capsule_path is not None:
+                try:
+                    found = Capsule(capsule_path).batch([models[index].identifier() for index in indices])
+                except OSError as e:
+                    # Fall back to reading each model on its own below, which reports the error per model
+                    RobustLogger().debug(f"Could not batch-read models from '{capsule_path}': {e}")
+                else:
+                    return [(index, None if found.get(models[index].identifier()) is None else found[models[index].identifier()].data) for index in indices]  # pyright: ignore[reportOptionalMemberAccess]
+            results: list[tuple[int, bytes | OSError | None]] = []
+            for index in indices:
+                try:
+                    results.append((index, models[index].data()))
+                except OSError as e:
+                    results.append((index, e))
+            return results
+
+        tasks: list[tuple[Path | None, list[int]]] = [*batches.items(), *((None, indices) for indices in loose)]
+        if len(tasks) <= 1:
+            read: list[list[tuple[int, bytes | OSError | None]]] = [read_batch(*task) for task in tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(tasks), (os.cpu_count() or 1) + 4, 32)) as executor:
+                read = list(executor.map(lambda task: read_batch(*task), tasks))
+
+        results: list[tuple[bytes | OSError | None, set[str], set[str]]] = [(None, set(), set()) for _ in models]
+        for batch in read:
+            for index, model_data in batch:
+                model_textures: set[str] = set()
+                model_lightmaps: set[str] = set()
+                if isinstance(model_data, bytes) and model_data:
+                    with suppress(Exception):
+                        model_textures.update(iterate_textures(model_data))
+                    with suppress(Exception):
+                        model_lightmaps.update(iterate_lightmaps(model_data))
+                results[index] = (model_data, model_textures, model_lightmaps)
+        return results
+
+    def _capsule_candidates(self) -> list[Path]:
+        """Returns the paths of every capsule this module would load if it existed."""
+        module_path: Path = self._installation.module_path()
+        return [module_path.joinpath(self._root + module_type.value) for module_type in KModuleType]
+
+    def _build_closure(self, textures: set[str], lightmaps: set[str]) -> ModuleClosure:
+        """Captures the resolved resources of this module for the closure cache."""
+        resources: list[ClosureResource] = [
+            ClosureResource(
+                module_resource.resname(),
+                module_resource.restype().name,
+                [str(location) for location in module_resource.locations()],
+                str(module_resource.active()) if module_resource.isActive() else None,
+            )
+            for module_resource in self.resources.values()
+        ]
+        return ModuleClosure(
+            module_id=None if self._cached_mod_id is None else str(self._cached_mod_id),
+            resources=resources,
+            textures=sorted(textures),
+            lightmaps=sorted(lightmaps),
+            dependencies=collect_dependencies(
+                self._installation,
+                [capsule.filepath() for capsule in self.capsules()] + self._capsule_candidates(),
+                resources,
+                load_textures=self._load_textures,
+            ),
+        )
+
+    def _restore_closure(self, closure: ModuleClosure):
+        """Recreates the resolved resources of this module from a closure cache entry."""
+        if closure.module_id is not None:
+            self._cached_mod_id = ResRef(closure.module_id)
+        for cached in closure.resources:
+            restype: ResourceType = ResourceType[cached.restype]
+            module_resource: ModuleResource | None = self.resource(cached.resname, restype)
+            if module_resource is None:
+                module_resource = ModuleResource(cached.resname, restype, self._installation, self._root)
+                self.resources[module_resource.identifier()] = module_resource
+            module_resource.add_locations(Path(location) for location in cached.locations)
+            if cached.active is not None:
+                module_resource.activate(cached.active)
 
     def _handle_git_lyt_reloads(
         self,
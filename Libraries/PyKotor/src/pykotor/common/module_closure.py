@@ -0,0 +1,283 @@
+"""Dependency-closure cache for `Module.reload_resources`.
+
+Building a module's resource table means scanning its capsules, parsing the GIT/LYT/VIS, walking
+chitin and every override folder, and reading each model to find its textures and lightmaps. The
+result only depends on a handful of files, so it is recorded per module (resource ids, their
+resolved locations, the active location and the texture/lightmap names) together with the
+(mtime, size) of every file and folder it was derived from. A later load of the same module
+restores the table after a stat of those dependencies instead of rebuilding it.
+
+The process-wide cache lives in memory unless persistence is opted into, either by setting
+``$PYKOTOR_CACHE_DIR`` or by calling :func:`configure_module_closure_cache` (applications pass
+:func:`default_cache_path`). A persisted cache is written when it is flushed or closed, and at
+interpreter exit, so a module opened in an earlier session opens warm in the next one.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import platform
+import threading
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from loggerplus import RobustLogger
+from pykotor.tools.misc import is_bif_file, is_capsule_file
+
+if TYPE_CHECKING:
+    from pykotor.extract.installation import Installation
+
+_CACHE_VERSION = 2
+_CACHE_FILENAME = "module_closures.json"
+
+
+@dataclass
+class ClosureResource:
+    """A module resource as resolved by `Module.reload_resources`."""
+
+    resname: str
+    restype: str  # ResourceType member name
+    locations: list[str]
+    active: str | None = None
+
+
+@dataclass
+class ModuleClosure:
+    """Everything `Module.reload_resources` resolved for one module."""
+
+    module_id: str | None
+    resources: list[ClosureResource]
+    textures: list[str] = field(default_factory=list)
+    lightmaps: list[str] = field(default_factory=list)
+    dependencies: dict[str, tuple[int, int] | None] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "module_id": self.module_id,
+            "resources": [[r.resname, r.restype, r.locations, r.active] for r in self.resources],
+            "textures": self.textures,
+            "lightmaps": self.lightmaps,
+            "dependencies": {path: list(sig) if sig is not None else None for path, sig in self.dependencies.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ModuleClosure:
+        return cls(
+            module_id=data["module_id"],
+            resources=[ClosureResource(resname, restype, list(locations), active) for resname, restype, locations, active in data["resources"]],
+            textures=list(data["textures"]),
+            lightmaps=list(data["lightmaps"]),
+            dependencies={path: (sig[0], sig[1]) if sig is not None else None for path, sig in data["dependencies"].items()},
+        )
+
+
+def _signature(path: str) -> tuple[int, int] | None:
+    try:
+        stat: os.stat_result = os.stat(path)  # noqa: PTH116
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def closure_key(
+    installation: Installation,
+    root: str,
+    *,
+    dot_mod: bool,
+    load_textures: bool,
+) -> str:
+    """Returns the cache key of a module load: the installation, module root and load options."""
+    return f"{installation.path()}|{root.lower()}|{'mod' if dot_mod else 'rim'}|{'textures' if load_textures else 'notextures'}"
+
+
+def collect_dependencies(
+    installation: Installation,
+    capsule_paths: Iterable[os.PathLike | str],
+    resources: Iterable[ClosureResource],
+    *,
+    load_textures: bool,
+) -> dict[str, tuple[int, int] | None]:
+    """Stat every file and folder a module closure was derived from.
+
+    Besides the capsules and every resolved location this includes the folders whose listings
+    decide where resources are found, so adding a file to Override invalidates the closure too.
+    Capsules that do not exist yet are recorded as missing, so one appearing in Modules later (say a
+    `_dlg.erf`) invalidates the closure as well.
+
+    Args:
+        installation: The installation the module was loaded from
+        capsule_paths: Every capsule the module loads or would load if it existed
+        resources: The resolved resources
+        load_textures: Whether texture packs were searched
+
+    Returns:
+        Map of path -> (mtime_ns, size), or None for paths that do not exist
+    """
+    paths: set[str] = {os.fspath(path) for path in capsule_paths}
+    paths.add(os.fspath(installation.path() / "chitin.key"))
+    override_path: Path = installation.override_path()
+    paths.update(os.fspath(override_path / directory) for directory in installation.override_list())
+    for resource in resources:
+        for location in resource.locations:
+            paths.add(location)
+            if not is_capsule_file(location) and not is_bif_file(location):
+                paths.add(os.path.dirname(location))  # noqa: PTH120
+    if load_textures:
+        texturepacks_path: Path = installation.texturepacks_path()
+        if texturepacks_path.is_dir():
+            paths.update(os.fspath(path) for path in texturepacks_path.iterdir() if path.is_file())
+    return {path: _signature(path) for path in sorted(paths)}
+
+
+class ModuleClosureCache:
+    """Cache of module dependency closures, optionally persisted to a JSON file.
+
+    Entries are validated against the (mtime, size) of their dependencies on every lookup and
+    dropped once any of them changed. Changes are only written to the file by :meth:`flush` or
+    :meth:`close`.
+    """
+
+    def __init__(self, path: os.PathLike | str | None = None):
+        self._path: Path | None = Path(path) if path is not None else None
+        self._entries: dict[str, ModuleClosure] = {}
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self._dirty: bool = False
+        if self._path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self):
+        assert self._path is not None
+        if not self._path.is_file():
+            return
+        try:
+            data: dict[str, Any] = json.loads(self._path.read_text(encoding="utf-8"))
+            if data.get("version") != _CACHE_VERSION:
+                return
+            self._entries = {key: ModuleClosure.from_dict(entry) for key, entry in data["modules"].items()}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            RobustLogger().warning(f"Ignoring unreadable module closure cache '{self._path}': {e}")
+            self._entries = {}
+
+    def flush(self):
+        """Write the cache to its file, if it has one and changed since it was loaded or last flushed."""
+        if self._path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            data = {"version": _CACHE_VERSION, "modules": {key: entry.to_dict() for key, entry in self._entries.items()}}
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path: Path = self._path.with_suffix(f"{self._path.suffix}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(self._path)
+        except OSError as e:
+            RobustLogger().warning(f"Could not save module closure cache '{self._path}': {e}")
+            with self._lock:
+                self._dirty = True
+
+    def close(self):
+        """Flush the cache to its file."""
+        self.flush()
+
+    def get(self, key: str) -> ModuleClosure | None:
+        """Returns the closure stored for a key if none of its dependencies changed since."""
+        with self._lock:
+            entry: ModuleClosure | None = self._entries.get(key)
+        if entry is not None and all(_signature(path) == sig for path, sig in entry.dependencies.items()):
+            self.hits += 1
+            return entry
+        if entry is not None:
+            with self._lock:
+                self._entries.pop(key, None)
+                self._dirty = True
+        self.misses += 1
+        return None
+
+    def put(self, key: str, closure: ModuleClosure):
+        """Store a closure; it is written to the cache file on the next flush."""
+        with self._lock:
+            self._entries[key] = closure
+            self._dirty = True
+
+    def invalidate(self, key: str | None = None):
+        """Drop one entry, or every entry when no key is given."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            self._dirty = True
+
+
+def default_cache_path() -> Path:
+    """Returns the closure cache file under ``$PYKOTOR_CACHE_DIR`` or else the platform's user cache directory."""
+    cache_dir: str = os.environ.get("PYKOTOR_CACHE_DIR", "")
+    if cache_dir:
+        return Path(cache_dir, _CACHE_FILENAME)
+    system: str = platform.system()
+    if system == "Windows":
+        base = Path(os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData" / "Local")))
+    elif system == "Darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache")))
+    return base / "pykotor" / _CACHE_FILENAME
+
+
+_MODULE_CLOSURE_CACHE: ModuleClosureCache | None = None
+_MODULE_CLOSURE_CACHE_LOCK = threading.Lock()
+
+
+def _flush_module_closure_cache():
+    if _MODULE_CLOSURE_CACHE is not None:
+        _MODULE_CLOSURE_CACHE.close()
+
+
+atexit.register(_flush_module_closure_cache)
+
+
+def configure_module_closure_cache(path: os.PathLike | str | None) -> ModuleClosureCache:
+    """Replace the process-wide module closure cache.
+
+    Args:
+        path: File to persist the cache to (e.g. :func:`default_cache_path`), or None to keep it in memory only
+
+    Returns:
+        The new process-wide cache
+    """
+    global _MODULE_CLOSURE_CACHE  # noqa: PLW0603
+    with _MODULE_CLOSURE_CACHE_LOCK:
+        if _MODULE_CLOSURE_CACHE is not None:
+            _MODULE_CLOSURE_CACHE.close()
+        _MODULE_CLOSURE_CACHE = ModuleClosureCache(path)
+        return _MODULE_CLOSURE_CACHE
+
+
+def get_module_closure_cache() -> ModuleClosureCache:
+    """Returns the process-wide module closure cache.
+
+    Unless :func:`configure_module_closure_cache` was called it is only persisted when ``$PYKOTOR_CACHE_DIR`` is set.
+    """
+    global _MODULE_CLOSURE_CACHE  # noqa: PLW0603
+    with _MODULE_CLOSURE_CACHE_LOCK:
+        if _MODULE_CLOSURE_CACHE is None:
+            _MODULE_CLOSURE_CACHE = ModuleClosureCache(default_cache_path() if os.environ.get("PYKOTOR_CACHE_DIR") else None)
+        return _MODULE_CLOSURE_CACHE
+
+
+def clear_module_closure_cache() -> None:
+    """Clear the process-wide module closure cache, in memory and on disk."""
+    cache: ModuleClosureCache = get_module_closure_cache()
+    cache.invalidate()
+    cache.flush()
@@ -1,18 +1,38 @@
 from __future__ import annotations
 
-import lzma
+import os
 import struct
+import threading
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING, BinaryIO
 
+from pykotor.resource.formats.bif.io_bif import _decompress_bzf_payload
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
+    from typing_extensions import TypeAlias  # pyright: ignore[reportMissingModuleSource]
+
+    from pykotor.extract.file import FileResource
     from pykotor.extract.keyfile import BIFResource, KEYFile
 
+    # (normalized path, st_mtime_ns, st_size, resource index) of a decompressed payload
+    BZFPayloadKey: TypeAlias = tuple[str, int, int, int]
+
 # Constants
 BZF_ID = b"BIFF"
+BZF_IDS: tuple[bytes, ...] = (b"BIFF", b"BZF ")
 VERSION_1 = b"V1  "
 
+# Default upper bound for the decompressed payload cache shared by all BZF archives.
+DEFAULT_BZF_CACHE_BYTES: int = 64 * 1024 * 1024
+
 
 @dataclass
 class IResource:
@@ -129,8 +149,307 @@ class BZFFile:
     def get_resource_size(self, index: int) -> int:
         return self.get_iresource(index).size
 
+    def _cache_key(self, index: int) -> BZFPayloadKey | None:
+        name: str | None = getattr(self._bzf, "name", None)
+        if not isinstance(name, str):
+            return None
+        try:
+            # Stat the open handle rather than the path: it is what the payload is read from.
+            stat: os.stat_result = os.fstat(self._bzf.fileno())
+        except (AttributeError, OSError, ValueError):
+            return None
+        return (os.path.normcase(os.path.abspath(name)), stat.st_mtime_ns, stat.st_size, index)  # noqa: PTH100
+
     def get_resource(self, index: int) -> bytes:
         res = self.get_iresource(index)
+        cache_key: BZFPayloadKey | None = self._cache_key(index)
+        if cache_key is not None:
+            cached: bytes | None = _BZF_PAYLOAD_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
         self._bzf.seek(res.offset)
         compressed_data: bytes = self._bzf.read(res.packed_size)
-        return lzma.decompress(compressed_data, format=lzma.FORMAT_RAW, filters=[{"id": lzma.FILTER_LZMA1}])
+        data: bytes = _decompress_bzf_payload(compressed_data, res.size)
+        if cache_key is not None:
+            _BZF_PAYLOAD_CACHE.put(cache_key, data)
+        return data
+
+
+class BZFPayloadCache:
+    """Thread-safe LRU of decompressed BZF payloads keyed by (bzf path, mtime, size, resource index).
+
+    The file's (st_mtime_ns, st_size) is part of the key, so a rewritten archive never returns the
+    payloads of its previous contents, whoever reads it.
+
+    The cache is bounded by the total number of decompressed bytes it holds rather than by
+    entry count, since BZF payloads range from a few bytes (2DA rows) to several megabytes (textures).
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_BZF_CACHE_BYTES):
+        self.max_bytes: int = max_bytes
+        self._entries: OrderedDict[BZFPayloadKey, bytes] = OrderedDict()
+        self._total_bytes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: BZFPayloadKey) -> bool:
+        return key in self._entries
+
+    def get(self, key: BZFPayloadKey) -> bytes | None:
+        with self._lock:
+            data: bytes | None = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: BZFPayloadKey, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return  # Never let a single payload flush the entire cache.
+        with self._lock:
+            previous: bytes | None = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous)
+            self._entries[key] = data
+            self._total_bytes += len(data)
+            while self._total_bytes > self.max_bytes and self._entries:
+                _evicted_key, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+
+    def discard_path(self, path_key: str) -> None:
+        """Drop every cached payload belonging to the BZF at `path_key` (e.g. after the file changed)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path_key]:
+                self._total_bytes -= len(self._entries.pop(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting least recently used payloads if necessary."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            while self._total_bytes > self.max_bytes and self._entries:
+                _evicted_key, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "total_size_bytes": self._total_bytes,
+                "max_size_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_BZF_PAYLOAD_CACHE: BZFPayloadCache = BZFPayloadCache()
+_BZF_ARCHIVES: dict[str, BZFArchive] = {}
+_BZF_ARCHIVES_LOCK: threading.Lock = threading.Lock()
+_BZF_EXECUTOR: ThreadPoolExecutor | None = None
+_BZF_EXECUTOR_LOCK: threading.Lock = threading.Lock()
+
+
+def _get_bzf_executor() -> ThreadPoolExecutor:
+    # LZMA releases the GIL while decompressing, so threads give real parallelism here.
+    global _BZF_EXECUTOR  # noqa: PLW0603
+    with _BZF_EXECUTOR_LOCK:
+        if _BZF_EXECUTOR is None:
+            _BZF_EXECUTOR = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1),
+                thread_name_prefix="bzf-decompress",
+            )
+        return _BZF_EXECUTOR
+
+
+class BZFArchive:
+    """Random-access reader for a BZF archive on disk.
+
+    Only the variable resource table is read up front. Payloads are decompressed on demand and kept in
+    a shared, size-bounded LRU (see `BZFPayloadCache`), and batches of indices can be decompressed ahead
+    of time on a background thread pool with `prefetch`/`read_many`.
+
+    Use `get_bzf_archive` rather than constructing this directly so that the table is parsed once per file
+    and reloaded when the file's mtime or size changes.
+    """
+
+    def __init__(
+        self,
+        path: os.PathLike | str,
+        cache: BZFPayloadCache | None = None,
+    ):
+        self._path: Path = Path(path)
+        self._path_key: str = os.path.normcase(os.path.abspath(self._path))  # noqa: PTH100
+        self._cache: BZFPayloadCache = _BZF_PAYLOAD_CACHE if cache is None else cache
+        self._entries: list[IResource] = []
+        self._offset_to_index: dict[int, int] = {}
+        self._pending: dict[int, Future[bytes]] = {}
+        self._pending_lock: threading.RLock = threading.RLock()
+        self.signature: tuple[int, int] = (0, 0)  # (st_mtime_ns, st_size) of the loaded table
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def path(self) -> Path:
+        return self._path
+
+    def load(self) -> None:
+        """(Re)read the resource table, dropping any cached payloads for this archive."""
+        with self._path.open("rb") as bzf:
+            stat: os.stat_result = os.fstat(bzf.fileno())
+            file_id: bytes = bzf.read(4)
+            version: bytes = bzf.read(4)
+            if file_id not in BZF_IDS:
+                raise ValueError(f"Not a BZF file ({file_id!r})")
+            if version != VERSION_1:
+                raise ValueError(f"Unsupported BZF file version {version!r}")
+            var_res_count, fix_res_count, off_var_res_table = struct.unpack("<III", bzf.read(12))
+            if fix_res_count != 0:
+                raise NotImplementedError("Fixed BZF resources are not supported yet")
+
+            bzf.seek(off_var_res_table)
+            table: bytes = bzf.read(16 * var_res_count)
+            file_size: int = bzf.seek(0, 2)
+
+        entries: list[IResource] = []
+        for _res_id, offset, size, restype in struct.iter_unpack("<IIII", table):
+            if entries:
+                entries[-1].packed_size = offset - entries[-1].offset
+            entries.append(IResource(offset, size, restype))
+        if entries:
+            entries[-1].packed_size = file_size - entries[-1].offset
+
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+        self._entries = entries
+        self._offset_to_index = {entry.offset: i for i, entry in enumerate(entries)}
+        with self._pending_lock:
+            self._pending.clear()
+        self._cache.discard_path(self._path_key)
+
+    def is_stale(self) -> bool:
+        try:
+            stat: os.stat_result = self._path.stat()
+        except OSError:
+            return True
+        return (stat.st_mtime_ns, stat.st_size) != self.signature
+
+    def get_iresource(self, index: int) -> IResource:
+        if index < 0 or index >= len(self._entries):
+            raise IndexError(f"Resource index out of range ({index}/{len(self._entries)})")
+        return self._entries[index]
+
+    def index_for_offset(self, offset: int) -> int:
+        """Return the table index of the resource whose compressed payload starts at `offset`.
+
+        KEY/chitin derived `FileResource`s only know the offset, so this is how they are mapped back to an index.
+        """
+        index: int | None = self._offset_to_index.get(offset)
+        if index is None:
+            raise KeyError(f"No BZF resource starts at offset {offset} in '{self._path}'")
+        return index
+
+    def _cache_key(self, index: int) -> BZFPayloadKey:
+        return (self._path_key, *self.signature, index)
+
+    def _decompress(self, index: int) -> bytes:
+        entry: IResource = self._entries[index]
+        with self._path.open("rb") as bzf:
+            bzf.seek(entry.offset)
+            compressed: bytes = bzf.read(entry.packed_size)
+        data: bytes = _decompress_bzf_payload(compressed, entry.size)
+        self._cache.put(self._cache_key(index), data)
+        return data
+
+    def read(self, index: int) -> bytes:
+        """Return the decompressed payload of the resource at `index`, using the cache where possible."""
+        self.get_iresource(index)
+        cached: bytes | None = self._cache.get(self._cache_key(index))
+        if cached is not None:
+            return cached
+        with self._pending_lock:
+            future: Future[bytes] | None = self._pending.pop(index, None)
+        if future is not None:
+            return future.result()
+        return self._decompress(index)
+
+    def read_at(self, offset: int) -> bytes:
+        return self.read(self.index_for_offset(offset))
+
+    def prefetch(self, indices: Iterable[int]) -> None:
+        """Schedule background decompression of `indices` that are neither cached nor already scheduled."""
+        executor: ThreadPoolExecutor = _get_bzf_executor()
+        with self._pending_lock:
+            for index in indices:
+                self.get_iresource(index)
+                if index in self._pending or self._cache_key(index) in self._cache:
+                    continue
+                future: Future[bytes] = executor.submit(self._decompress, index)
+                self._pending[index] = future
+                future.add_done_callback(partial(self._forget_pending, index))
+
+    def _forget_pending(self, index: int, future: Future[bytes]) -> None:
+        # Finished payloads live in the LRU; keeping the future around would pin them past eviction.
+        if future.exception() is not None:
+            return  # Leave it for `read` to re-raise.
+        with self._pending_lock:
+            if self._pending.get(index) is future:
+                del self._pending[index]
+
+    def read_many(self, indices: Iterable[int]) -> Iterator[tuple[int, bytes]]:
+        """Yield `(index, data)` in the requested order while the rest of the batch decompresses ahead."""
+        index_list: list[int] = list(indices)
+        self.prefetch(index_list)
+        for index in index_list:
+            yield index, self.read(index)
+
+
+def get_bzf_archive(path: os.PathLike | str) -> BZFArchive:
+    """Return the shared `BZFArchive` for `path`, reloading it if the file changed on disk."""
+    path_key: str = os.path.normcase(os.path.abspath(path))  # noqa: PTH100
+    with _BZF_ARCHIVES_LOCK:
+        archive: BZFArchive | None = _BZF_ARCHIVES.get(path_key)
+        if archive is None:
+            archive = BZFArchive(path)
+            _BZF_ARCHIVES[path_key] = archive
+        elif archive.is_stale():
+            archive.load()
+        return archive
+
+
+def prefetch_bzf_resources(resources: Iterable[FileResource]) -> None:
+    """Start decompressing every BZF-backed resource in `resources` on the background pool.
+
+    Resources that do not live inside a BZF are ignored, so this can be called on any batch before iterating it.
+    """
+    by_archive: dict[Path, list[int]] = {}
+    for resource in resources:
+        if not resource.inside_bzf:
+            continue
+        by_archive.setdefault(resource.filepath(), []).append(resource.offset())
+    for path, offsets in by_archive.items():
+        archive: BZFArchive = get_bzf_archive(path)
+        archive.prefetch(archive.index_for_offset(offset) for offset in offsets)
+
+
+def get_bzf_cache() -> BZFPayloadCache:
+    return _BZF_PAYLOAD_CACHE
+
+
+def clear_bzf_cache() -> None:
+    """Clear decompressed payloads and forget all parsed BZF tables."""
+    with _BZF_ARCHIVES_LOCK:
+        _BZF_ARCHIVES.clear()
+    _BZF_PAYLOAD_CACHE.clear()
@@ -0,0 +1,353 @@
+"""Process-wide, size-bounded cache of decoded resources, keyed by where the resource is stored.
+
+Several editors, renderers and tools often show the same module at the same time, and each used to read and decode
+its own copy of every texture and model. :class:`DecodedResourceCache` holds one decoded copy per resource for the
+whole process:
+
+- Entries are keyed by resource location (container file, offset, size) plus the file's modification time, so an
+  edited file is a new entry and stale data is never served.
+- Users take a :class:`CacheLease` on an entry while they need it; leased entries are never evicted.
+- Every entry records its decoded size. When the cache grows past ``max_bytes``, unleased entries are evicted
+  least-recently-used first.
+- Concurrent requests for a resource that is still being decoded wait for that decode instead of starting another.
+- Entries that refer to memory outside the cache (e.g. shared memory blocks) can be given a ``dispose`` callback, which
+  frees it once the entry is evicted or invalidated and its last lease is released.
+
+:func:`decoded_cache` returns the cache shared by the whole process. :func:`acquire_tpc` and :func:`acquire_mdl` load
+textures and models through it; other decoded data (e.g. the GL layer's render-ready buffers) can be stored with
+:meth:`DecodedResourceCache.acquire` under its own key namespace.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Generic, Hashable, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from pykotor.resource.formats.mdl.mdl_data import MDL
+    from pykotor.resource.formats.tpc.tpc_data import TPC
+
+T = TypeVar("T")
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class ResourceLocation(NamedTuple):
+    """Where a resource's bytes are stored: a file, or a slice of a container (ERF/RIM/BIF)."""
+
+    filepath: str
+    offset: int
+    size: int
+
+    def read(self) -> bytes:
+        with open(self.filepath, "rb") as f:  # noqa: PTH123
+            f.seek(self.offset)
+            return f.read(self.size)
+
+    def cache_key(self, kind: str) -> tuple[Hashable, ...]:
+        """Returns a key for data of `kind` decoded from this location, invalidated when the file changes."""
+        try:
+            mtime: int = os.stat(self.filepath).st_mtime_ns  # noqa: PTH116
+        except OSError:
+            mtime = -1
+        return (kind, os.path.normcase(os.path.abspath(self.filepath)), self.offset, self.size, mtime)  # noqa: PTH100
+
+
+class CacheLease(Generic[T]):
+    """A reference to a cached value; the entry cannot be evicted until the lease is released.
+
+    Leases can be used as context managers and are released at most once.
+    """
+
+    def __init__(self, cache: DecodedResourceCache, key: Hashable, entry: _Entry):
+        self.cache: DecodedResourceCache = cache
+        self.key: Hashable = key
+        self.value: T = entry.value
+        self._entry: _Entry | None = entry
+
+    def __enter__(self) -> CacheLease[T]:
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def release(self):
+        if self._entry is not None:
+            self.cache._release(self._entry)  # noqa: SLF001
+            self._entry = None
+
+
+class _Entry:
+    __slots__ = ("dispose", "dropped", "error", "loaded", "nbytes", "refs", "value")
+
+    def __init__(self):
+        self.value: Any = None
+        self.nbytes: int = 0
+        self.refs: int = 0
+        self.loaded: threading.Event = threading.Event()
+        self.error: BaseException | None = None
+        self.dispose: Callable[[Any], None] | None = None
+        # Removed from the cache; disposed of once its last lease is released
+        self.dropped: bool = False
+
+
+class DecodedResourceCache:
+    """Thread-safe, reference-counted LRU cache of decoded resources with a memory budget.
+
+    Args:
+    ----
+        max_bytes: Decoded bytes kept before unleased entries are evicted
+
+    Attributes:
+    ----------
+        hits: Requests served from the cache (including ones that waited for a concurrent decode)
+        misses: Requests that had to decode
+        evictions: Entries evicted to stay within the budget
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes: int = max(0, max_bytes)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._total_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry: _Entry | None = self._entries.get(key)
+            return entry is not None and entry.loaded.is_set() and entry.error is None
+
+    @property
+    def total_bytes(self) -> int:
+        """Decoded bytes of every cached entry."""
+        with self._lock:
+            return self._total_bytes
+
+    @property
+    def leased_bytes(self) -> int:
+        """Decoded bytes of the entries that currently have leases (and so cannot be evicted)."""
+        with self._lock:
+            return sum(entry.nbytes for entry in self._entries.values() if entry.refs)
+
+    def acquire(
+        self,
+        key: Hashable,
+        loader: Callable[[], T],
+        nbytes: Callable[[T], int],
+        dispose: Callable[[T], None] | None = None,
+    ) -> CacheLease[T]:
+        """Lease the value for `key`, decoding it with `loader` if it is not cached.
+
+        Args:
+        ----
+            key: Identifies the decoded data, e.g. :meth:`ResourceLocation.cache_key`
+            loader: Decodes the value; called without holding the cache lock, at most once per concurrent request
+            nbytes: Returns the memory accounted for a decoded value
+            dispose: Called with the value once it left the cache and is no longer leased (only if `loader` ran)
+
+        Raises:
+        ------
+            Any exception raised by `loader`; failed decodes are not cached.
+        """
+        with self._lock:
+            entry: _Entry | None = self._entries.get(key)
+            owner: bool = entry is None
+            if entry is None:
+                entry = _Entry()
+                self._entries[key] = entry
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            entry.refs += 1
+
+        if owner:
+            try:
+                value: T = loader()
+                size: int = max(0, int(nbytes(value)))
+            except BaseException as e:
+                with self._lock:
+                    entry.error = e
+                    if self._entries.get(key) is entry:
+                        del self._entries[key]
+                entry.loaded.set()
+                raise
+            disposals: list[_Entry] = []
+            with self._lock:
+                entry.value = value
+                entry.nbytes = size
+                entry.dispose = dispose
+                if self._entries.get(key) is entry:
+                    self._total_bytes += size
+                entry.loaded.set()
+                self._evict(disposals)
+            self._dispose(disposals)
+        else:
+            entry.loaded.wait()
+            if entry.error is not None:
+                raise entry.error
+        return CacheLease(self, key, entry)
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        nbytes: int,
+    ):
+        """Store an already decoded value without leasing it, replacing an unleased entry with the same key."""
+        entry = _Entry()
+        entry.value = value
+        entry.nbytes = max(0, nbytes)
+        entry.loaded.set()
+        disposals: list[_Entry] = []
+        with self._lock:
+            previous: _Entry | None = self._entries.get(key)
+            if previous is not None:
+                if previous.refs or not previous.loaded.is_set():
+                    return
+                self._total_bytes -= previous.nbytes
+                self._drop(previous, disposals)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._total_bytes += entry.nbytes
+            self._evict(disposals)
+        self._dispose(disposals)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns a cached value without leasing it (it may be evicted afterwards), or `default`."""
+        with self._lock:
+            entry: _Entry | None = self._entries.get(key)
+            if entry is None or not entry.loaded.is_set() or entry.error is not None:
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def lease(self, key: Hashable) -> CacheLease | None:
+        """Lease the value for `key` if it is cached, without decoding it; returns None otherwise."""
+        with self._lock:
+            entry: _Entry | None = self._entries.get(key)
+            if entry is None or not entry.loaded.is_set() or entry.error is not None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            entry.refs += 1
+        return CacheLease(self, key, entry)
+
+    def _release(self, entry: _Entry):
+        disposals: list[_Entry] = []
+        with self._lock:
+            entry.refs = max(0, entry.refs - 1)
+            if entry.dropped:
+                self._drop(entry, disposals)
+            self._evict(disposals)
+        self._dispose(disposals)
+
+    def invalidate(self, key: Hashable):
+        """Forget a cached value. Existing leases keep their value; new requests decode it again."""
+        disposals: list[_Entry] = []
+        with self._lock:
+            entry: _Entry | None = self._entries.pop(key, None)
+            if entry is not None:
+                if entry.loaded.is_set():
+                    self._total_bytes -= entry.nbytes
+                self._drop(entry, disposals)
+        self._dispose(disposals)
+
+    def clear(self):
+        """Forget every cached value (leased values stay valid for their holders)."""
+        disposals: list[_Entry] = []
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.loaded.is_set():
+                    self._drop(entry, disposals)
+            self._entries = OrderedDict((key, entry) for key, entry in self._entries.items() if not entry.loaded.is_set())
+            self._total_bytes = 0
+        self._dispose(disposals)
+
+    def _evict(self, disposals: list[_Entry]):
+        """Evict unleased entries, least recently used first, until the cache fits its budget. Caller holds the lock."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key in list(self._entries):
+            entry: _Entry = self._entries[key]
+            if entry.refs or not entry.loaded.is_set():
+                continue
+            del self._entries[key]
+            self._total_bytes -= entry.nbytes
+            self.evictions += 1
+            self._drop(entry, disposals)
+            if self._total_bytes <= self.max_bytes:
+                return
+
+    @staticmethod
+    def _drop(entry: _Entry, disposals: list[_Entry]):
+        """Mark an entry removed from the cache, queueing it for disposal if nothing leases it. Caller holds the lock."""
+        entry.dropped = True
+        if not entry.refs and entry.dispose is not None:
+            disposals.append(entry)
+
+    @staticmethod
+    def _dispose(entries: list[_Entry]):
+        """Call the dispose callbacks of dropped entries, outside the cache lock."""
+        for entry in entries:
+            dispose, entry.dispose = entry.dispose, None
+            if dispose is not None:
+                dispose(entry.value)
+
+
+_process_cache: DecodedResourceCache | None = None
+_process_cache_lock = threading.Lock()
+
+
+def decoded_cache() -> DecodedResourceCache:
+    """Returns the cache shared by everything in this process."""
+    global _process_cache  # noqa: PLW0603
+    with _process_cache_lock:
+        if _process_cache is None:
+            _process_cache = DecodedResourceCache()
+        return _process_cache
+
+
+def tpc_nbytes(tpc: TPC) -> int:
+    """Returns the bytes of mip data held by a TPC."""
+    return sum(len(mipmap.data) for layer in tpc.layers for mipmap in layer.mipmaps)
+
+
+def acquire_tpc(
+    location: ResourceLocation,
+    cache: DecodedResourceCache | None = None,
+) -> CacheLease[TPC]:
+    """Lease the decoded texture (TPC, TGA or DDS) stored at `location`. Do not modify the returned TPC."""
+    from pykotor.resource.formats.tpc import read_tpc
+
+    cache = decoded_cache() if cache is None else cache
+    return cache.acquire(location.cache_key("tpc"), lambda: read_tpc(location.read()), tpc_nbytes)
+
+
+def acquire_mdl(
+    mdl_location: ResourceLocation,
+    mdx_location: ResourceLocation,
+    cache: DecodedResourceCache | None = None,
+) -> CacheLease[MDL]:
+    """Lease the parsed model stored at `mdl_location`/`mdx_location`. Do not modify the returned MDL.
+
+    Parsed models are accounted at the size of their MDL and MDX data, which their vertex data dominates.
+    """
+    from pykotor.resource.formats.mdl import read_mdl
+
+    cache = decoded_cache() if cache is None else cache
+    return cache.acquire(
+        ("mdl", mdl_location.cache_key("mdl"), mdx_location.cache_key("mdx")),
+        lambda: read_mdl(mdl_location.read(), source_ext=mdx_location.read()),
+        lambda _mdl: mdl_location.size + mdx_location.size,
+    )
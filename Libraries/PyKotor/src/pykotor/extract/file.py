@@ -15,7 +15,6 @@ if TYPE_CHECKING:
     from typing_extensions import Literal, Self  # pyright: ignore[reportMissingModuleSource]
 
     from pykotor.common.misc import ResRef
-    from pykotor.common.stream import BinaryReader
 
 
 # Global file data cache with modification time tracking
@@ -108,8 +107,8 @@ def _extract_from_nested_capsules(
     Given a real filesystem path to a capsule and a list of nested path components,
     recursively extracts data through each capsule level.
 
-    Note: This function always extracts the complete resource at each level using
-    offset/size information from the capsule headers. The FileResource's stored
+    Note: Only the capsule headers are parsed at each level; intermediate capsules are
+    never copied out of the memory-mapped outer file. The FileResource's stored
     offset/size are not used because they would be redundant (they represent the
     same values we get from parsing the headers).
 
@@ -134,125 +133,11 @@ def _extract_from_nested_capsules(
         - CExoKeyTable::AddEncapsulatedContents @ 0x0040f3c0 - Adds ERF/MOD/SAV contents to key table
         Original BioWare engine binaries (ERF format implementation from swkotor.exe, swkotor2.exe)
     """
-    from pykotor.common.stream import BinaryReader  # Prevent circular imports
-    from pykotor.resource.formats.erf import ERFType
-
-    # Start with the outer capsule data
-    current_data = real_path.read_bytes()
-
-    # Navigate through each nested level
-    for i, part in enumerate(nested_parts):
-        # Parse the current data as a capsule to find the next resource
-        with BinaryReader.from_bytes(current_data) as reader:
-            file_type = reader.read_string(4)
-            reader.skip(4)  # file version
-
-            # Determine capsule type and read resource list
-            # ERF-based formats: ERF, MOD, SAV, HAK (all use similar structure)
-            # NOTE: SAV uses "MOD " signature, HAK may use "ERF " or "HAK "
-            erf_signatures = set(member.value for member in ERFType)
-            erf_signatures.update({"SAV ", "HAK "})  # Add explicit signatures that might be used
-            
-            if file_type in erf_signatures:
-                resources = _read_erf_resources(reader, current_data)
-            elif file_type == "RIM ":
-                resources = _read_rim_resources(reader, current_data)
-            else:
-                msg = f"Nested path component at '{part}' is inside an unknown archive type: '{file_type}'"
-                raise ValueError(msg)
-
-        # Find the requested resource in this capsule
-        res_ident = ResourceIdentifier.from_path(part)
-        target_resource: tuple[int, int] | None = None  # (offset, size)
-        
-        for res_name, res_type, res_offset, res_size in resources:
-            if res_name.lower() == res_ident.resname.lower() and res_type == res_ident.restype:
-                target_resource = (res_offset, res_size)
-                break
-
-        if target_resource is None:
-            import errno
-            msg = f"Resource '{part}' not found in nested capsule"
-            raise FileNotFoundError(errno.ENOENT, msg, str(real_path / "/".join(nested_parts[:i + 1])))
-
-        res_offset, res_size = target_resource
-
-        # Extract the resource data using offset/size from capsule header
-        # We always extract the full resource at each level
-        current_data = current_data[res_offset:res_offset + res_size]
-
-    return current_data
-
-
-def _read_erf_resources(reader: BinaryReader, capsule_data: bytes) -> list[tuple[str, ResourceType, int, int]]:
-    """Read resource entries from ERF capsule data.
-
-    Args:
-    ----
-        reader: BinaryReader positioned after the file type/version header (at offset 8)
-        capsule_data: The full capsule data bytes
-
-    Returns:
-    -------
-        List of (resname, restype, offset, size) tuples
-    """
-    resources: list[tuple[str, ResourceType, int, int]] = []
-
-    reader.skip(8)
-    entry_count = reader.read_uint32()
-    reader.skip(4)
-    offset_to_keys = reader.read_uint32()
-    offset_to_resources = reader.read_uint32()
-
-    resrefs: list[str] = []
-    restypes: list[ResourceType] = []
+    from pykotor.extract.nested_capsule import NestedCapsuleView  # Prevent circular imports
 
-    reader.seek(offset_to_keys)
-    for _ in range(entry_count):
-        resref = reader.read_string(16)
-        resrefs.append(resref)
-        reader.skip(4)  # resid
-        restype = reader.read_uint16()
-        restypes.append(ResourceType.from_id(restype))
-        reader.skip(2)
-
-    reader.seek(offset_to_resources)
-    for i in range(entry_count):
-        res_offset = reader.read_uint32()
-        res_size = reader.read_uint32()
-        resources.append((resrefs[i], restypes[i], res_offset, res_size))
-
-    return resources
-
-
-def _read_rim_resources(reader: BinaryReader, capsule_data: bytes) -> list[tuple[str, ResourceType, int, int]]:
-    """Read resource entries from RIM capsule data.
-
-    Args:
-    ----
-        reader: BinaryReader positioned after the file type/version header (at offset 8)
-        capsule_data: The full capsule data bytes
-
-    Returns:
-    -------
-        List of (resname, restype, offset, size) tuples
-    """
-    resources: list[tuple[str, ResourceType, int, int]] = []
-
-    reader.skip(4)
-    entry_count = reader.read_uint32()
-    offset_to_entries = reader.read_uint32()
-
-    reader.seek(offset_to_entries)
-    for _ in range(entry_count):
-        resref = reader.read_string(16)
-        restype = ResourceType.from_id(reader.read_uint32())
-        reader.skip(4)
-        offset = reader.read_uint32()
-        size = reader.read_uint32()
-        resources.append((resref, restype, offset, size))
-
-    return resources
+    # Map the outer capsule once and walk the resource tables; only the final payload is copied.
+    with NestedCapsuleView(real_path) as view:
+        return view.read_entry(view.resolve(nested_parts))
 
 
 def get_file_data_cache_stats() -> dict[str, int]:
@@ -311,10 +196,11 @@ class FileResource:
         filepath_str = str(self._filepath).lower()
         self.inside_capsule: bool = filepath_str.endswith(_CAPSULE_EXTENSIONS)
         self.inside_bif: bool = filepath_str.endswith(".bif")
+        self.inside_bzf: bool = filepath_str.endswith(".bzf")
 
         self._path_ident_obj: Path = (
             self._filepath / str(self._identifier)
-            if self.inside_capsule or self.inside_bif
+            if self.inside_capsule or self.inside_bif or self.inside_bzf
             else self._filepath
         )
 
@@ -432,7 +318,7 @@ class FileResource:
 
                 self._offset = res.offset()
                 self._size = res.size()
-            elif not self.inside_bif:  # bifs are read-only, offset/data will never change.
+            elif not self.inside_bif and not self.inside_bzf:  # bifs are read-only, offset/data will never change.
                 self._offset = 0
                 self._size = self._filepath.stat().st_size
             return
@@ -466,7 +352,18 @@ class FileResource:
         try:
             # Fast path: check if the file exists directly on the filesystem
             if self._filepath.is_file():
-                if not self.inside_capsule and not self.inside_bif:
+                if not self.inside_capsule and not self.inside_bif and not self.inside_bzf:
+                    return True
+
+                # BZF table offsets point at compressed payloads while the size is the decompressed size,
+                # so the only meaningful check is that a payload starts at the stored offset.
+                if self.inside_bzf:
+                    from pykotor.extract.bzf import get_bzf_archive  # Prevent circular imports
+
+                    try:
+                        get_bzf_archive(self._filepath).index_for_offset(self._offset)
+                    except (KeyError, OSError, ValueError):
+                        return False
                     return True
 
                 # BIF resources are indexed externally (KEY/BIF) and cannot be validated by
@@ -547,6 +444,11 @@ class FileResource:
         # Fast path: try to open the file directly
         # This handles the common case of non-nested paths efficiently
         if self._filepath.is_file():
+            if self.inside_bzf:
+                # BZF payloads are LZMA-compressed; decompression is cached per (bzf, index).
+                from pykotor.extract.bzf import get_bzf_archive  # Prevent circular imports
+
+                return get_bzf_archive(self._filepath).read_at(self._offset)
             with self._filepath.open("rb") as file:
                 file.seek(self._offset)
                 return file.read(self._size)
@@ -19,7 +19,8 @@ from pykotor.common.misc import Game, ResRef
 from pykotor.extract.capsule import Capsule
 from pykotor.extract.chitin import Chitin
 from pykotor.extract.file import FileResource, LocationResult, ResourceIdentifier, ResourceResult
-from pykotor.extract.savedata import SaveFolderEntry
+from pykotor.extract.resource_index import ResourceSearchIndex
+from pykotor.extract.savedata import SaveFolderEntry, SaveSummary, get_save_index
 from pykotor.extract.talktable import TalkTable
 from pykotor.resource.formats.gff import read_gff, GFFFieldType
 from pykotor.resource.formats.tpc import read_tpc, TPC
@@ -211,6 +212,8 @@ class Installation:
         # - texture lookups: per resource_list id -> (first_texture_by_name, first_txi_by_name)
         self._locations_list_cache: dict[int, tuple[dict[ResourceIdentifier, FileResource], set[ResourceIdentifier]]] = {}
         self._texture_list_cache: dict[int, tuple[dict[str, FileResource], dict[str, FileResource]]] = {}
+        # - search_index(): built on first use, updated by the single-file reload/remove methods, dropped by full reloads
+        self._search_index: ResourceSearchIndex | None = None
 
         # Lazy-loading flags
         self._modules_loaded: bool = False
@@ -233,6 +236,7 @@ class Installation:
         # Remove unpicklable objects
         state["_log"] = None
         state["progress_callback"] = None
+        state["_search_index"] = None
         return state
 
     def __setstate__(self, state: dict[str, Any]):
@@ -486,6 +490,7 @@ class Installation:
         elif chitin_exists is None:
             self._log.error("No permissions to the chitin.key file at '%s' when loading the installation, skipping...", self._path)
         self._chitin_loaded = True
+        self._search_index = None
         self._locations_list_cache.clear()
         self._texture_list_cache.clear()
 
@@ -495,6 +500,7 @@ class Installation:
             return
         self._lips_data = self.load_resources_dict(self.lips_path(), capsule_check=is_mod_file)
         self._lips_loaded = True
+        self._search_index = None
 
     def load_modules(self):
         """Reloads the list of modules files in the modules folder linked to the Installation."""
@@ -503,6 +509,7 @@ class Installation:
         self._modules_data = self.load_resources_dict(self.module_path(), capsule_check=is_capsule_file)
         # Clear derived caches that depend on module contents
         self._module_names_cache = None
+        self._search_index = None
         self._locations_list_cache.clear()
         self._texture_list_cache.clear()
         self._modules_loaded = True
@@ -516,10 +523,68 @@ class Installation:
         """
         if not self._modules_loaded or module not in self._modules_data:
             self.load_modules()
+        self._invalidate_list_caches(self._modules_data.get(module))
         self._modules_data[module] = list(Capsule(self.module_path() / module))
         self._module_names_cache = None
-        self._locations_list_cache.clear()
-        self._texture_list_cache.clear()
+        if self._search_index is not None:
+            self._search_index.set_partition(f"module:{module}", self._modules_data[module])
+
+    def remove_module(self, module: str):
+        """Forget a module file that was deleted from the modules folder, without rescanning the folder.
+
+        Args:
+        ----
+            module: The filename of the module, including the extension.
+        """
+        if not self._modules_loaded:
+            return
+        self._invalidate_list_caches(self._modules_data.pop(module, None))
+        self._module_names_cache = None
+        if self._search_index is not None:
+            self._search_index.remove_partition(f"module:{module}")
+
+    def reload_lip(self, filename: str):
+        """Reloads the resources of a single capsule in the lips folder."""
+        if not self._lips_loaded:
+            return
+        self._invalidate_list_caches(self._lips_data.get(filename))
+        self._lips_data[filename] = list(Capsule(self.lips_path() / filename))
+        if self._search_index is not None:
+            self._search_index.set_partition(f"lips:{filename}", self._lips_data[filename])
+
+    def remove_lip(self, filename: str):
+        if not self._lips_loaded:
+            return
+        self._invalidate_list_caches(self._lips_data.pop(filename, None))
+        if self._search_index is not None:
+            self._search_index.remove_partition(f"lips:{filename}")
+
+    def reload_texturepack(self, filename: str):
+        """Reloads the resources of a single ERF in the texturepacks folder."""
+        if not self._texturepacks_loaded:
+            return
+        self._invalidate_list_caches(self._texturepacks_data.get(filename))
+        self._texturepacks_data[filename] = list(Capsule(self.texturepacks_path() / filename))
+        if self._search_index is not None:
+            self._search_index.set_partition(f"texturepack:{filename}", self._texturepacks_data[filename])
+
+    def remove_texturepack(self, filename: str):
+        if not self._texturepacks_loaded:
+            return
+        self._invalidate_list_caches(self._texturepacks_data.pop(filename, None))
+        if self._search_index is not None:
+            self._search_index.remove_partition(f"texturepack:{filename}")
+
+    def _invalidate_list_caches(self, *resource_lists: list[FileResource] | None):
+        """Drop the derived lookup caches built for specific resource lists.
+
+        The caches are keyed by the list's id(), so this must be called before a list is replaced or mutated.
+        """
+        for resource_list in resource_lists:
+            if resource_list is None:
+                continue
+            self._locations_list_cache.pop(id(resource_list), None)
+            self._texture_list_cache.pop(id(resource_list), None)
 
     def load_textures(self):
         """Reloads the list of modules files in the texturepacks folder linked to the Installation."""
@@ -527,6 +592,7 @@ class Installation:
             return
         self._texturepacks_data = self.load_resources_dict(self.texturepacks_path(), capsule_check=is_erf_file)
         self._texturepacks_loaded = True
+        self._search_index = None
         self._locations_list_cache.clear()
         self._texture_list_cache.clear()
 
@@ -536,6 +602,8 @@ class Installation:
         This method loads both:
         1. File resources for each save (for UI display)
         2. SaveFolderEntry objects (for save editing and corruption detection)
+
+        Nothing inside the saves is parsed here; use `save_summaries()` for save-list metadata.
         """
         if self._saves_loaded:
             return
@@ -550,12 +618,16 @@ class Installation:
                 self.saves[save_location][this_save_path] = []
                 
                 # Load file resources for UI display
-                for file in this_save_path.iterdir():
-                    res_ident = ResourceIdentifier.from_path(file)
-                    file_res = FileResource(res_ident.resname, res_ident.restype, file.stat().st_size, 0, file)
-                    self.saves[save_location][this_save_path].append(file_res)
+                with os.scandir(this_save_path) as it:
+                    for entry in it:
+                        if not entry.is_file():
+                            continue
+                        file = this_save_path / entry.name
+                        res_ident = ResourceIdentifier.from_path(entry.name)
+                        file_res = FileResource(res_ident.resname, res_ident.restype, entry.stat().st_size, 0, file)
+                        self.saves[save_location][this_save_path].append(file_res)
                 
-                # Load SaveFolderEntry for save editing and corruption detection
+                # Load SaveFolderEntry for save editing and corruption detection (SAVEGAME.sav is opened on first use)
                 try:
                     save_folder = SaveFolderEntry(str(this_save_path))
                     # Don't fully load the save yet (lazy loading) - just store the path
@@ -608,6 +680,9 @@ class Installation:
 
         if not directory:
             self._override_loaded = True
+            self._search_index = None
+        elif self._search_index is not None:
+            self._search_index.set_partition("override", self._all_override_resources())
         self._locations_list_cache.clear()
         self._texture_list_cache.clear()
 
@@ -644,11 +719,94 @@ class Installation:
             return
         resource = FileResource(*identifier.unpack(), filepath.stat().st_size, 0, filepath)
 
-        override_list: list[FileResource] = self._override_data[rel_folderpath]
-        if resource not in override_list:
-            override_list.append(resource)
-        else:
-            override_list[override_list.index(resource)] = resource
+        # Subfolders are loaded recursively, so every loaded ancestor folder lists this file too.
+        for override_list in self._override_lists_containing(filepath):
+            self._invalidate_list_caches(override_list)
+            if resource not in override_list:
+                override_list.append(resource)
+            else:
+                override_list[override_list.index(resource)] = resource
+        if self._search_index is not None:
+            self._search_index.add("override", resource)
+
+    def remove_override_file(
+        self,
+        file: os.PathLike | str,
+    ):
+        """Forget an override file that was deleted from disk, without rescanning its folder."""
+        filepath: Path = Path(file)
+        resource = FileResource(*ResourceIdentifier.from_path(filepath).unpack(), 0, 0, filepath)
+        for override_list in self._override_lists_containing(filepath):
+            if resource in override_list:
+                self._invalidate_list_caches(override_list)
+                override_list.remove(resource)
+        if self._search_index is not None:
+            self._search_index.discard("override", resource)
+
+    def _override_lists_containing(
+        self,
+        filepath: Path,
+    ) -> list[list[FileResource]]:
+        try:
+            rel_parts: tuple[str, ...] = filepath.parent.relative_to(self.override_path()).parts
+        except ValueError:
+            return []
+        lists: list[list[FileResource]] = []
+        for i in range(len(rel_parts) + 1):
+            key: str = "/".join(rel_parts[:i]) or "."
+            if key in self._override_data:
+                lists.append(self._override_data[key])
+        return lists
+
+    def save_summaries(self) -> dict[Path, list[SaveSummary]]:
+        """Returns listing metadata (name, area, play time, timestamp, screenshot location) for every save.
+
+        Only the header fields of each SAVENFO.res are read, and results are cached by folder mtime in the
+        shared save index, so repeated calls over large save folders mostly cost a directory scan.
+
+        Returns:
+        -------
+            A dict mapping each save location to the summaries of the saves found in it.
+        """
+        index = get_save_index()
+        return {save_location: index.summaries(save_location) for save_location in self.save_locations()}
+
+    def reload_save(
+        self,
+        save_path: os.PathLike | str,
+    ):
+        """Re-index a single save folder (e.g. after the game wrote it) instead of reloading every save."""
+        get_save_index().invalidate(save_path)
+        if not self._saves_loaded:
+            return
+        save_dir: Path = Path(save_path)
+        location: Path | None = next((loc for loc in self.saves if save_dir.parent == loc), None)
+        if location is None:
+            return
+        if not save_dir.is_dir():
+            self.remove_save(save_dir)
+            return
+        # Keys come from iterdir() on the save location and may be CaseAwarePaths, which hash differently to Path.
+        save_dir = next((existing for existing in self.saves[location] if existing == save_dir), save_dir)
+        self.saves[location][save_dir] = [
+            FileResource(*ResourceIdentifier.from_path(file).unpack(), file.stat().st_size, 0, file)
+            for file in save_dir.iterdir()
+            if file.is_file()
+        ]
+        try:
+            self.save_folders[save_dir] = SaveFolderEntry(str(save_dir))
+        except Exception as e:  # noqa: BLE001
+            RobustLogger().warning(f"Failed to create SaveFolderEntry for '{save_dir}': {e}")
+
+    def remove_save(
+        self,
+        save_path: os.PathLike | str,
+    ):
+        save_dir: Path = Path(save_path)
+        get_save_index().invalidate(save_dir)
+        for save_entries in (*self.saves.values(), self.save_folders):
+            for existing in [existing for existing in save_entries if existing == save_dir]:
+                del save_entries[existing]
 
     def load_streammusic(self):
         """Reloads the list of resources in the streammusic folder linked to the Installation."""
@@ -656,6 +814,7 @@ class Installation:
             return
         self._streammusic_data = self.load_resources_list(self.streammusic_path())
         self._streammusic_loaded = True
+        self._search_index = None
 
     def load_streamsounds(self):
         """Reloads the list of resources in the streamsounds folder linked to the Installation."""
@@ -663,6 +822,7 @@ class Installation:
             return
         self._streamsounds_data = self.load_resources_list(self.streamsounds_path())
         self._streamsounds_loaded = True
+        self._search_index = None
 
     def _quicker_load_resources(self, folder_path: Path) -> list[FileResource]:
         """streamwaves/streamvoice have tens of thousands of audio files, offload here for performance reasons.
@@ -705,6 +865,7 @@ class Installation:
             return
         self._streamwaves_data[:] = self._quicker_load_resources(self._find_resource_folderpath(("streamvoice", "streamwaves")))
         self._streamwaves_loaded = True
+        self._search_index = None
 
     def load_streamvoice(self):
         """Reloads the list of resources in the streamvoice folder linked to the Installation."""
@@ -712,6 +873,7 @@ class Installation:
             return
         self._streamwaves_data[:] = self._quicker_load_resources(self._find_resource_folderpath(("streamwaves", "streamvoice")))
         self._streamwaves_loaded = True
+        self._search_index = None
 
     def _load_patch_erf(self):
         """Loads the patch.erf file for K1 installations."""
@@ -724,6 +886,7 @@ class Installation:
                     self.progress_callback("Loading patch.erf...", "update_maintask_text")
                 self._patch_erf_data.extend(Capsule(patch_erf_path))
         self._patch_erf_loaded = True
+        self._search_index = None
 
     # endregion
 
@@ -1078,6 +1241,43 @@ class Installation:
             self._override[directory] if directory else [override_resource for ov_subfolder_name in self._override for override_resource in self._override[ov_subfolder_name]]
         )
 
+    def _all_override_resources(self) -> dict[FileResource, None]:
+        """Every loaded override resource once; subfolders are loaded recursively, so ancestor folders list them too."""
+        return dict.fromkeys(resource for resources in self._override_data.values() for resource in resources)
+
+    def search_index(self) -> ResourceSearchIndex:
+        """Returns the resref search index over the resources of the Installation (saves excluded).
+
+        The index is built on first use. Single-file reloads (reload_module, reload_override_file, ...) update it in place,
+        full reloads of a location drop it so the next call rebuilds it.
+
+        Partitions are named 'core' (chitin and patch.erf), 'override', 'module:<filename>', 'lips:<filename>',
+        'texturepack:<filename>', 'streammusic', 'streamsounds' and 'streamwaves'.
+
+        Returns:
+        -------
+            A ResourceSearchIndex; use its search() method for prefix, substring and glob queries.
+        """
+        index: ResourceSearchIndex | None = self._search_index
+        if index is not None:
+            return index
+        self.override_resources()
+        partitions: dict[str, Iterable[FileResource]] = {
+            "core": self.core_resources(),
+            "override": self._all_override_resources(),
+            **{f"module:{filename}": resources for filename, resources in self._modules.items()},
+            **{f"lips:{filename}": resources for filename, resources in self._lips.items()},
+            **{f"texturepack:{filename}": resources for filename, resources in self._texturepacks.items()},
+            "streammusic": self._streammusic,
+            "streamsounds": self._streamsounds,
+            "streamwaves": self._streamwaves,
+        }
+        index = ResourceSearchIndex()
+        for partition, resources in partitions.items():
+            index.set_partition(partition, resources)
+        self._search_index = index
+        return index
+
     # endregion
 
     @staticmethod
@@ -0,0 +1,413 @@
+"""Filesystem watching for incremental `Installation` refreshes.
+
+`InstallationWatcher` tracks the Override, Modules, Lips, TexturePacks and save folders of an installation
+and applies fine-grained updates (`reload_override_file`, `reload_module`, `reload_save`, ...) instead of
+falling back to `Installation.reload_all`.
+
+On Linux the watcher uses inotify (through ctypes, no extra dependencies); everywhere else, or when inotify
+is unavailable, it falls back to polling directory snapshots.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from loggerplus import RobustLogger  # pyright: ignore[reportMissingModuleSource]
+from pykotor.tools.misc import is_capsule_file, is_erf_file, is_mod_file
+
+if TYPE_CHECKING:
+    from typing_extensions import Literal  # pyright: ignore[reportMissingModuleSource]
+
+    from pykotor.extract.installation import Installation
+
+
+class WatchedLocation(Enum):
+    OVERRIDE = "override"
+    MODULES = "modules"
+    LIPS = "lips"
+    TEXTUREPACKS = "texturepacks"
+    SAVES = "saves"
+
+
+# Override and save folders have meaningful subfolders; the capsule folders are flat.
+_RECURSIVE_LOCATIONS: frozenset[WatchedLocation] = frozenset({WatchedLocation.OVERRIDE, WatchedLocation.SAVES})
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """A single coalesced change to a path inside a watched folder."""
+
+    kind: Literal["created", "modified", "deleted"]
+    path: Path
+    location: WatchedLocation
+    root: Path
+
+
+class _PollingBackend:
+    """Detects changes by diffing `(mtime_ns, size)` snapshots of each watched root."""
+
+    def __init__(self, roots: dict[Path, WatchedLocation]):
+        self._roots: dict[Path, WatchedLocation] = roots
+        self._snapshots: dict[Path, dict[str, tuple[int, int]]] = {root: self._snapshot(root) for root in roots}
+
+    def _snapshot(self, root: Path) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        recursive: bool = self._roots[root] in _RECURSIVE_LOCATIONS
+        stack: list[str] = [str(root)]
+        while stack:
+            current_dir: str = stack.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                if recursive:
+                                    stack.append(entry.path)
+                                continue
+                            stat: os.stat_result = entry.stat()
+                        except OSError as e:  # noqa: PERF203
+                            RobustLogger().debug(f"Skipping '{entry.path}' in the watch snapshot: {e}")
+                            continue
+                        snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError as e:
+                RobustLogger().debug(f"Could not scan '{current_dir}' for changes: {e}")
+                continue
+        return snapshot
+
+    def poll(self, timeout: float) -> list[tuple[str, Path]]:  # noqa: ARG002
+        changed: list[tuple[str, Path]] = []
+        for root, previous in self._snapshots.items():
+            current: dict[str, tuple[int, int]] = self._snapshot(root)
+            changed.extend(("deleted", Path(path)) for path in previous.keys() - current.keys())
+            changed.extend(("created", Path(path)) for path in current.keys() - previous.keys())
+            changed.extend(("modified", Path(path)) for path, info in current.items() if path in previous and previous[path] != info)
+            self._snapshots[root] = current
+        return changed
+
+    def close(self):
+        self._snapshots.clear()
+
+
+class _InotifyBackend:
+    """Linux inotify backend. Raises OSError from `__init__` if inotify is unavailable."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    _WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, roots: dict[Path, WatchedLocation]):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc_name: str | None = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name or "libc.so.6", use_errno=True)
+        self._fd: int = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            errno_value: int = ctypes.get_errno()
+            raise OSError(errno_value, os.strerror(errno_value))
+        self._roots: dict[Path, WatchedLocation] = roots
+        self._watches: dict[int, Path] = {}
+        self._overflowed: bool = False
+        for root, location in roots.items():
+            self._add_watch(root, recursive=location in _RECURSIVE_LOCATIONS)
+
+    def _add_watch(self, directory: Path, *, recursive: bool) -> None:
+        wd: int = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self._WATCH_MASK)
+        if wd < 0:
+            RobustLogger().warning(f"Could not watch '{directory}': {os.strerror(ctypes.get_errno())}")
+            return
+        self._watches[wd] = directory
+        if not recursive:
+            return
+        try:
+            subdirs: list[Path] = [Path(entry.path) for entry in os.scandir(directory) if entry.is_dir()]
+        except OSError:
+            return
+        for subdir in subdirs:
+            self._add_watch(subdir, recursive=True)
+
+    def _is_recursive(self, path: Path) -> bool:
+        return any(location in _RECURSIVE_LOCATIONS and (path == root or root in path.parents) for root, location in self._roots.items())
+
+    def poll(self, timeout: float) -> list[tuple[str, Path]]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        changed: list[tuple[str, Path]] = []
+        while True:
+            try:
+                buffer: bytes = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset: int = 0
+            while offset < len(buffer):
+                wd, mask, _cookie, name_len = self._EVENT_HEADER.unpack_from(buffer, offset)
+                offset += self._EVENT_HEADER.size
+                name: str = os.fsdecode(buffer[offset : offset + name_len].rstrip(b"\0"))
+                offset += name_len
+                if mask & self.IN_Q_OVERFLOW:
+                    self._overflowed = True
+                    continue
+                if mask & self.IN_IGNORED:
+                    self._watches.pop(wd, None)
+                    continue
+                directory: Path | None = self._watches.get(wd)
+                if directory is None or not name:
+                    continue
+                path: Path = directory / name
+                if mask & self.IN_ISDIR:
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO) and self._is_recursive(path):
+                        self._add_watch(path, recursive=True)
+                        # Files may have landed in the new folder before the watch existed.
+                        changed.extend(("created", file) for file in path.rglob("*") if file.is_file())
+                    continue
+                if mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    changed.append(("deleted", path))
+                elif mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    changed.append(("created", path))
+                else:
+                    changed.append(("modified", path))
+        return changed
+
+    def take_overflow(self) -> bool:
+        """Return True (once) if the kernel queue overflowed and events were lost."""
+        overflowed, self._overflowed = self._overflowed, False
+        return overflowed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._watches.clear()
+
+
+class InstallationWatcher:
+    """Watches an installation's mutable folders and incrementally refreshes the `Installation`.
+
+    Use `start()` to watch on a background thread, or call `poll()` from your own loop. Changes are coalesced
+    per path and applied with the installation's fine-grained reload methods, which only invalidate the
+    derived lookup caches of the affected resource lists.
+
+    `on_change` is invoked with each applied batch (from the watcher thread when started).
+
+    `stop()` releases the backend (the inotify descriptor or the polling snapshots). A later `start()` or `poll()`
+    opens a new one and, since changes made while stopped were not observed, marks the watched folders for reload.
+
+    The `Installation` is not thread-safe: when the watcher runs in the background, callers that read from the
+    installation concurrently should hold `watcher.lock`.
+    """
+
+    def __init__(
+        self,
+        installation: Installation,
+        *,
+        backend: Literal["auto", "inotify", "poll"] = "auto",
+        poll_interval: float = 0.5,
+        on_change: Callable[[list[FileChange]], Any] | None = None,
+    ):
+        self.installation: Installation = installation
+        self.poll_interval: float = poll_interval
+        self.on_change: Callable[[list[FileChange]], Any] | None = on_change
+        self.lock: threading.RLock = threading.RLock()
+        self._roots: dict[Path, WatchedLocation] = self._watched_roots()
+        self._backend_kind: Literal["auto", "inotify", "poll"] = backend
+        self._backend: _InotifyBackend | _PollingBackend | None = self._create_backend(backend)
+        self._backend_name: str = "inotify" if isinstance(self._backend, _InotifyBackend) else "poll"
+        self._thread: threading.Thread | None = None
+        self._stop_event: threading.Event = threading.Event()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args: object):
+        self.stop()
+
+    @property
+    def backend_name(self) -> str:
+        return self._backend_name
+
+    def _watched_roots(self) -> dict[Path, WatchedLocation]:
+        installation: Installation = self.installation
+        candidates: list[tuple[Callable[[], Path], WatchedLocation]] = [
+            (installation.override_path, WatchedLocation.OVERRIDE),
+            (installation.module_path, WatchedLocation.MODULES),
+            (installation.lips_path, WatchedLocation.LIPS),
+            (installation.texturepacks_path, WatchedLocation.TEXTUREPACKS),
+        ]
+        roots: dict[Path, WatchedLocation] = {}
+        for get_path, location in candidates:
+            try:
+                path: Path = Path(str(get_path()))
+            except Exception:  # noqa: BLE001
+                RobustLogger().debug(f"No {location.value} folder to watch", exc_info=True)
+                continue
+            if path.is_dir():
+                roots[path] = location
+        try:
+            for save_location in installation.save_locations():
+                roots[Path(str(save_location))] = WatchedLocation.SAVES
+        except Exception:  # noqa: BLE001
+            RobustLogger().debug("Could not determine save locations to watch", exc_info=True)
+        return roots
+
+    def _create_backend(self, backend: Literal["auto", "inotify", "poll"]) -> _InotifyBackend | _PollingBackend:
+        if backend in ("auto", "inotify"):
+            try:
+                return _InotifyBackend(self._roots)
+            except (OSError, AttributeError) as e:
+                if backend == "inotify":
+                    raise
+                RobustLogger().debug(f"inotify unavailable, polling instead: {e}")
+        return _PollingBackend(self._roots)
+
+    def _classify(self, path: Path) -> tuple[Path, WatchedLocation] | None:
+        for root, location in self._roots.items():
+            if root in path.parents:
+                return root, location
+        return None
+
+    def _coalesce(self, raw_changes: list[tuple[str, Path]]) -> list[FileChange]:
+        # Editors typically emit create+modify+close for a single save; keep one change per path.
+        latest: dict[Path, str] = {}
+        for kind, path in raw_changes:
+            previous: str | None = latest.get(path)
+            if previous == "created" and kind == "modified":
+                continue
+            latest[path] = kind
+        changes: list[FileChange] = []
+        for path, kind in latest.items():
+            classified: tuple[Path, WatchedLocation] | None = self._classify(path)
+            if classified is None:
+                continue
+            final_kind: str = "deleted" if not path.is_file() else ("modified" if kind == "deleted" else kind)
+            changes.append(FileChange(final_kind, path, classified[1], classified[0]))  # pyright: ignore[reportArgumentType]
+        return changes
+
+    def _ensure_backend(self) -> _InotifyBackend | _PollingBackend:
+        backend: _InotifyBackend | _PollingBackend | None = self._backend
+        if backend is None:
+            backend = self._backend = self._create_backend(self._backend_kind)
+            self._backend_name = "inotify" if isinstance(backend, _InotifyBackend) else "poll"
+            self._reload_everything()
+        return backend
+
+    def poll(self, timeout: float = 0.0) -> list[FileChange]:
+        """Collect pending filesystem changes, apply them to the installation and return them."""
+        backend: _InotifyBackend | _PollingBackend = self._ensure_backend()
+        raw_changes: list[tuple[str, Path]] = backend.poll(timeout)
+        if isinstance(backend, _InotifyBackend) and backend.take_overflow():
+            RobustLogger().warning("Filesystem event queue overflowed; reloading watched folders")
+            self._reload_everything()
+            return []
+        changes: list[FileChange] = self._coalesce(raw_changes)
+        if changes:
+            self.apply(changes)
+        return changes
+
+    def apply(self, changes: list[FileChange]) -> None:
+        """Apply coalesced changes with the narrowest reload each one needs."""
+        installation: Installation = self.installation
+        with self.lock:
+            for change in changes:
+                try:
+                    self._apply_one(installation, change)
+                except Exception:  # noqa: BLE001
+                    RobustLogger().exception(f"Failed to apply {change.kind} of '{change.path}'")
+        if self.on_change is not None:
+            self.on_change(changes)
+
+    def _apply_one(self, installation: Installation, change: FileChange) -> None:
+        deleted: bool = change.kind == "deleted"
+        filename: str = change.path.name
+        if change.location is WatchedLocation.OVERRIDE:
+            if deleted:
+                installation.remove_override_file(change.path)
+            elif installation._override_loaded:  # noqa: SLF001
+                installation.reload_override_file(change.path)
+        elif change.location is WatchedLocation.MODULES:
+            if not is_capsule_file(filename):
+                return
+            if deleted:
+                installation.remove_module(filename)
+            elif installation._modules_loaded:  # noqa: SLF001
+                installation.reload_module(filename)
+        elif change.location is WatchedLocation.LIPS:
+            if not is_mod_file(filename):
+                return
+            if deleted:
+                installation.remove_lip(filename)
+            else:
+                installation.reload_lip(filename)
+        elif change.location is WatchedLocation.TEXTUREPACKS:
+            if not is_erf_file(filename):
+                return
+            if deleted:
+                installation.remove_texturepack(filename)
+            else:
+                installation.reload_texturepack(filename)
+        elif change.location is WatchedLocation.SAVES:
+            # A save is a folder directly beneath the save location; any file change re-indexes that save.
+            relative: tuple[str, ...] = change.path.relative_to(change.root).parts
+            if len(relative) > 1:
+                installation.reload_save(change.root / relative[0])
+
+    def _reload_everything(self) -> None:
+        installation: Installation = self.installation
+        with self.lock:
+            for attr in ("_override_loaded", "_modules_loaded", "_lips_loaded", "_texturepacks_loaded", "_saves_loaded"):
+                setattr(installation, attr, False)
+            installation._locations_list_cache.clear()  # noqa: SLF001
+            installation._texture_list_cache.clear()  # noqa: SLF001
+            installation._module_names_cache = None  # noqa: SLF001
+
+    def start(self) -> None:
+        """Start watching on a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._ensure_backend()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="installation-watcher", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                if self._backend_name == "poll":
+                    self._stop_event.wait(self.poll_interval)
+                    if self._stop_event.is_set():
+                        break
+                self.poll(self.poll_interval)
+            except Exception:  # noqa: BLE001
+                RobustLogger().exception("Installation watcher iteration failed")
+
+    def stop(self) -> None:
+        """Stop the watcher thread and release the backend; `start()` may be called again afterwards."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(1.0, self.poll_interval * 4))
+            self._thread = None
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
@@ -0,0 +1,394 @@
+"""Zero-copy views over (nested) capsules and an incremental writer for ERF-family archives.
+
+Save games keep every visited module as an ERF inside ``SAVEGAME.sav``. Reading one resource out of
+such a nested capsule used to mean reading the outer file into memory, slicing out the inner capsule
+and parsing it again. `NestedCapsuleView` instead memory-maps the outermost file once and describes
+every resource, at every nesting level, as a window (absolute offset + size) into that mapping.
+
+`write_nested_capsule` is the matching writer: the new payloads of resources whose bytes changed are
+appended to the existing file and only the resource table is rewritten, so changing one cached module
+no longer rewrites a 30 MB save.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pykotor.extract.file import ResourceIdentifier
+from pykotor.resource.type import ResourceType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
+    from typing_extensions import Self  # pyright: ignore[reportMissingModuleSource]
+
+_ERF_SIGNATURES: frozenset[bytes] = frozenset((b"ERF ", b"MOD ", b"SAV ", b"HAK ", b"NWM "))
+_RIM_SIGNATURE: bytes = b"RIM "
+_ERF_HEADER_SIZE: int = 160
+_ERF_KEY_SIZE: int = 24
+_ERF_RESOURCE_SIZE: int = 8
+
+# Fraction of a patched file allowed to be unreachable (superseded payloads) before it is compacted.
+DEFAULT_MAX_WASTE_RATIO: float = 0.5
+
+
+@dataclass(frozen=True)
+class CapsuleEntry:
+    """Location of one resource inside the outermost file of a `NestedCapsuleView`."""
+
+    identifier: ResourceIdentifier
+    offset: int  # Absolute offset of the payload in the outermost file
+    size: int
+    table_offset: int  # Absolute offset of the (offset, size) pair describing this payload
+
+
+class NestedCapsuleView:
+    """Read-only, zero-copy view of an ERF/MOD/SAV/RIM capsule and of capsules nested inside it.
+
+    Only the header and resource tables are parsed. Payloads are exposed as `memoryview` slices of a
+    shared read-only memory map; nested capsules returned by `open_nested` reuse the same mapping.
+    The view keeps the file mapped until `close()` (or the end of a ``with`` block).
+    """
+
+    def __init__(
+        self,
+        path: os.PathLike | str,
+    ):
+        self.path: Path = path if isinstance(path, Path) else Path(path)  # Keep CaseAwarePath resolution
+        self._file = self.path.open("rb")
+        self._mmap: mmap.mmap | None = None
+        size = os.fstat(self._file.fileno()).st_size
+        if size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer: memoryview = memoryview(self._mmap)
+        else:
+            self._buffer = memoryview(b"")
+        self._owner: NestedCapsuleView = self
+        self._children: list[memoryview] = []
+        self.base: int = 0
+        self.size: int = size
+        self.signature: bytes = b""
+        self._entries: list[CapsuleEntry] = []
+        self._lookup: dict[ResourceIdentifier, CapsuleEntry] = {}
+        self._parse()
+
+    @classmethod
+    def _nested(
+        cls,
+        owner: NestedCapsuleView,
+        base: int,
+        size: int,
+    ) -> Self:
+        view = cls.__new__(cls)
+        view.path = owner.path
+        view._file = None
+        view._mmap = None
+        view._buffer = owner._buffer
+        view._owner = owner
+        view._children = []
+        view.base = base
+        view.size = size
+        view.signature = b""
+        view._entries = []
+        view._lookup = {}
+        view._parse()
+        return view
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self) -> Iterator[CapsuleEntry]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, identifier: ResourceIdentifier) -> bool:
+        return identifier in self._lookup
+
+    def close(self):
+        """Release the memory map. Windows previously returned by this view become invalid."""
+        owner = self._owner
+        if owner is not self:
+            return
+        for child in owner._children:
+            child.release()
+        owner._children.clear()
+        owner._buffer.release()
+        if owner._mmap is not None:
+            owner._mmap.close()
+            owner._mmap = None
+        if owner._file is not None:
+            owner._file.close()
+            owner._file = None
+
+    @property
+    def is_erf(self) -> bool:
+        return self.signature in _ERF_SIGNATURES
+
+    def entries(self) -> list[CapsuleEntry]:
+        """Return the entries of this capsule in table order."""
+        return list(self._entries)
+
+    def entry(self, identifier: ResourceIdentifier) -> CapsuleEntry | None:
+        return self._lookup.get(identifier)
+
+    def window(self, identifier: ResourceIdentifier) -> memoryview:
+        """Return the payload of a resource as a memoryview into the mapping (no copy).
+
+        Raises:
+        ------
+            KeyError: If the resource is not in this capsule.
+        """
+        entry = self._lookup[identifier]
+        window = self._buffer[entry.offset:entry.offset + entry.size]
+        self._owner._children.append(window)
+        return window
+
+    def read(self, identifier: ResourceIdentifier) -> bytes:
+        """Return a copy of the payload of a resource.
+
+        Raises:
+        ------
+            KeyError: If the resource is not in this capsule.
+        """
+        return self._payload(identifier).tobytes()
+
+    def read_entry(self, entry: CapsuleEntry) -> bytes:
+        """Return a copy of the payload described by an entry of this view or of a view nested in it."""
+        return self._buffer[entry.offset:entry.offset + entry.size].tobytes()
+
+    def _payload(self, identifier: ResourceIdentifier) -> memoryview:
+        entry = self._lookup[identifier]
+        return self._buffer[entry.offset:entry.offset + entry.size]
+
+    def open_nested(self, identifier: ResourceIdentifier) -> NestedCapsuleView:
+        """Return a view of a capsule stored inside this one, sharing this view's memory map.
+
+        Raises:
+        ------
+            KeyError: If the resource is not in this capsule.
+            ValueError: If the resource is not a supported capsule.
+        """
+        entry = self._lookup[identifier]
+        return self._nested(self._owner, entry.offset, entry.size)
+
+    def resolve(self, parts: Sequence[str]) -> CapsuleEntry:
+        """Follow resource filenames through the nesting levels, e.g. ``["danm13.sav", "module.ifo"]``.
+
+        Raises:
+        ------
+            FileNotFoundError: If a component cannot be found.
+            ValueError: If an intermediate component is not a supported capsule.
+        """
+        if not parts:
+            msg = "At least one nested path component is required."
+            raise ValueError(msg)
+        view: NestedCapsuleView = self
+        for i, part in enumerate(parts):
+            entry = view.entry(ResourceIdentifier.from_path(part))
+            if entry is None:
+                import errno
+
+                msg = f"Resource '{part}' not found in nested capsule"
+                raise FileNotFoundError(errno.ENOENT, msg, str(self.path / "/".join(parts[:i + 1])))
+            if i == len(parts) - 1:
+                return entry
+            view = self._nested(self._owner, entry.offset, entry.size)
+        raise AssertionError  # pragma: no cover
+
+    def _parse(self):
+        buffer, base = self._buffer, self.base
+        if self.size < 8:  # noqa: PLR2004
+            if self.size:
+                msg = f"'{self.path}' is too small to be a capsule."
+                raise ValueError(msg)
+            return
+        self.signature = buffer[base:base + 4].tobytes()
+        if self.signature in _ERF_SIGNATURES:
+            self._parse_erf()
+        elif self.signature == _RIM_SIGNATURE:
+            self._parse_rim()
+        else:
+            msg = f"Nested capsule in '{self.path}' is an unknown archive type: '{self.signature.decode('ascii', 'replace')}'"
+            raise ValueError(msg)
+        self._lookup = {entry.identifier: entry for entry in self._entries}
+
+    def _parse_erf(self):
+        buffer, base = self._buffer, self.base
+        entry_count, _, offset_to_keys, offset_to_resources = struct.unpack_from("<4I", buffer, base + 16)
+        keys = struct.iter_unpack("<16sIHH", buffer[base + offset_to_keys:base + offset_to_keys + _ERF_KEY_SIZE * entry_count])
+        table = base + offset_to_resources
+        resources = struct.iter_unpack("<II", buffer[table:table + _ERF_RESOURCE_SIZE * entry_count])
+        for i, ((resref, _resid, restype, _), (offset, size)) in enumerate(zip(keys, resources)):
+            self._entries.append(
+                CapsuleEntry(
+                    ResourceIdentifier(_decode_resref(resref), ResourceType.from_id(restype)),
+                    base + offset,
+                    size,
+                    table + i * _ERF_RESOURCE_SIZE,
+                )
+            )
+
+    def _parse_rim(self):
+        buffer, base = self._buffer, self.base
+        entry_count, offset_to_entries = struct.unpack_from("<II", buffer, base + 12)
+        table = base + offset_to_entries
+        for i, (resref, restype, _resid, offset, size) in enumerate(struct.iter_unpack("<16sIIII", buffer[table:table + 32 * entry_count])):
+            self._entries.append(
+                CapsuleEntry(
+                    ResourceIdentifier(_decode_resref(resref), ResourceType.from_id(restype)),
+                    base + offset,
+                    size,
+                    table + i * 32 + 24,
+                )
+            )
+
+
+def _decode_resref(raw: bytes) -> str:
+    return raw.split(b"\0", 1)[0].decode("ascii", errors="ignore")
+
+
+def write_nested_capsule(
+    path: os.PathLike | str,
+    changes: Mapping[ResourceIdentifier, bytes | None],
+    *,
+    order: Sequence[ResourceIdentifier] | None = None,
+    max_waste_ratio: float = DEFAULT_MAX_WASTE_RATIO,
+) -> bool:
+    """Apply resource changes to an existing ERF-family capsule (e.g. SAVEGAME.sav) on disk.
+
+    When every changed resource already exists and no resource is removed or reordered, the new payloads
+    are appended to the end of the file and synced, and only then is the resource table rewritten in a
+    single write to point at them. Live payloads are never overwritten, so a crash before the table
+    write leaves the original save intact. Unchanged resources (typically most cached modules) are never
+    touched. Otherwise, or once superseded payloads make up more than `max_waste_ratio` of the file, the
+    capsule is rewritten compactly into a temporary file that replaces the original.
+
+    Args:
+    ----
+        path: The capsule to update.
+        changes: New payloads keyed by resource; ``None`` removes the resource. New resources are appended.
+        order: Optional full resource order for the result. Defaults to the existing order.
+        max_waste_ratio: Compact the file when unreachable bytes exceed this fraction of its size.
+
+    Returns:
+    -------
+        True if the file was patched in place, False if it was rewritten.
+
+    Raises:
+    ------
+        ValueError: If the capsule is not an ERF-family archive.
+    """
+    capsule_path = path if isinstance(path, Path) else Path(path)
+    with NestedCapsuleView(capsule_path) as view:
+        if not view.is_erf:
+            msg = f"Only ERF-family capsules can be written incrementally, '{capsule_path}' is '{view.signature!r}'."
+            raise ValueError(msg)
+        existing: list[ResourceIdentifier] = [entry.identifier for entry in view]
+        target_order: list[ResourceIdentifier] = list(order) if order is not None else existing + [
+            ident for ident in changes if ident not in view and changes[ident] is not None
+        ]
+        target_order = [ident for ident in target_order if changes.get(ident, b"") is not None]
+
+        patches: list[tuple[CapsuleEntry, bytes]] = [
+            (view._lookup[ident], payload)
+            for ident, payload in changes.items()
+            if payload is not None and ident in view and view._payload(ident) != payload
+        ]
+        if target_order == existing:
+            if not patches:
+                return True
+            live = _ERF_HEADER_SIZE + (_ERF_KEY_SIZE + _ERF_RESOURCE_SIZE) * len(existing)
+            live += sum(entry.size for entry in view) + sum(len(payload) - entry.size for entry, payload in patches)
+            file_size = view.size + sum(len(payload) for _entry, payload in patches)
+            if file_size - live <= max_waste_ratio * file_size:
+                table_offset = view._entries[0].table_offset
+                table = bytearray(view._buffer[table_offset:table_offset + _ERF_RESOURCE_SIZE * len(existing)])
+                view.close()
+                _append_patches(capsule_path, table_offset, table, patches)
+                return True
+
+        _rewrite(capsule_path, view, target_order, changes)
+        return False
+
+
+def _append_patches(
+    path: Path,
+    table_offset: int,
+    table: bytearray,
+    patches: list[tuple[CapsuleEntry, bytes]],
+):
+    """Append the patched payloads, sync them, then point the resource table at them in one write.
+
+    If appending fails the file is truncated back to its original size, leaving it as it was.
+    """
+    with path.open("r+b") as f:
+        original_size = end = f.seek(0, os.SEEK_END)
+        try:
+            for entry, payload in patches:
+                f.write(payload)
+                struct.pack_into("<II", table, entry.table_offset - table_offset, end, len(payload))
+                end += len(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.truncate(original_size)
+            raise
+        f.seek(table_offset)
+        f.write(table)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _rewrite(
+    path: Path,
+    view: NestedCapsuleView,
+    order: list[ResourceIdentifier],
+    changes: Mapping[ResourceIdentifier, bytes | None],
+):
+    payloads: list[bytes | memoryview] = [
+        changed if (changed := changes.get(ident)) is not None else view.window(ident)
+        for ident in order
+    ]
+    # Keep the original header (signature, build date, description strref) and localized string block.
+    header = bytearray(view._buffer[:_ERF_HEADER_SIZE])
+    language_count, localized_size, _, offset_to_localized = struct.unpack_from("<4I", header, 8)
+    localized = view._buffer[offset_to_localized:offset_to_localized + localized_size].tobytes() if language_count else b""
+    entry_count = len(order)
+    offset_to_keys = _ERF_HEADER_SIZE + len(localized)
+    offset_to_resources = offset_to_keys + _ERF_KEY_SIZE * entry_count
+    struct.pack_into("<I", header, 16, entry_count)
+    struct.pack_into("<III", header, 20, _ERF_HEADER_SIZE if localized else offset_to_localized, offset_to_keys, offset_to_resources)
+
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(localized)
+            for resid, ident in enumerate(order):
+                f.write(struct.pack("<16sIHH", ident.resname.encode("ascii", errors="ignore")[:16], resid, ident.restype.type_id, 0))
+            data_offset = offset_to_resources + _ERF_RESOURCE_SIZE * entry_count
+            for payload in payloads:
+                f.write(struct.pack("<II", data_offset, len(payload)))
+                data_offset += len(payload)
+            for payload in payloads:
+                f.write(payload)
+        view.close()
+        shutil.copymode(path, temp_name)
+        os.replace(temp_name, path)
+    except BaseException:
+        view.close()
+        Path(temp_name).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,362 @@
+"""In-memory search index over the resource names of an installation or a resource browser.
+
+Filtering a resource list by looping over every :class:`FileResource` and testing ``query in resname`` is linear in
+the size of the installation (tens of thousands of resources), and is repeated on every keystroke of a filter box.
+:class:`ResourceSearchIndex` keeps the lowercased names in a structure that answers the common queries directly:
+
+- A sorted array of distinct names answers prefix queries with a binary search.
+- Trigram postings (name id sets per three-character substring) answer substring queries and the literal parts of
+  glob patterns by intersecting a few small sets.
+- Resources are grouped in named partitions (``"override"``, ``"module:danm13.rim"``, ...) and by resource type,
+  so one changed capsule or override file is re-indexed without touching the rest.
+
+Results are always returned in name order, one page at a time, and the scan stops as soon as a page is full.
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import re
+import threading
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Collection, Iterable, Iterator
+
+from pykotor.extract.file import FileResource
+
+if TYPE_CHECKING:
+    from typing_extensions import Literal  # pyright: ignore[reportMissingModuleSource]
+
+    from pykotor.resource.type import ResourceType
+
+GRAM_SIZE = 3
+_BULK_THRESHOLD = 64
+_SCAN_RATIO = 8
+_GLOB_SPECIAL = re.compile(r"\[[^\]]*\]|[*?]")
+
+
+def _grams(name: str) -> set[str]:
+    return {name[i : i + GRAM_SIZE] for i in range(len(name) - GRAM_SIZE + 1)}
+
+
+@dataclass(frozen=True)
+class ResourceSearchPage:
+    """One page of search results.
+
+    Attributes:
+    ----------
+        items: (partition, resource) pairs, ordered by name, then resource type, then partition
+        offset: Offset of the first item in the full result list
+        next_offset: Offset of the next page, or None if this page is the last one
+    """
+
+    items: list[tuple[str, FileResource]] = field(default_factory=list)
+    offset: int = 0
+    next_offset: int | None = None
+
+    @property
+    def truncated(self) -> bool:
+        return self.next_offset is not None
+
+
+class ResourceSearchIndex:
+    """Prefix, substring and glob search over FileResource names, kept up to date one partition or resource at a time.
+
+    Args:
+    ----
+        key: Function returning the text a resource is searched by. Defaults to the resref; the index stores it lowercased.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[FileResource], str] | None = None,
+    ):
+        self._key: Callable[[FileResource], str] = FileResource.resname if key is None else key
+        self._lock = threading.RLock()
+        self._partitions: dict[str, dict[FileResource, int]] = {}
+        self._name_ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._entries: dict[int, list[tuple[str, FileResource]]] = {}
+        self._sorted_names: list[str] = []
+        self._postings: dict[str, set[int]] = {}
+        self._type_names: dict[ResourceType, dict[int, int]] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(resources) for resources in self._partitions.values())
+
+    def partitions(self) -> list[str]:
+        with self._lock:
+            return list(self._partitions)
+
+    def partition_resources(self, partition: str) -> list[FileResource]:
+        with self._lock:
+            return list(self._partitions.get(partition, ()))
+
+    def partitions_of(self, resource: FileResource) -> list[str]:
+        """Returns the partitions a resource is indexed in, found through its name rather than by scanning every partition."""
+        with self._lock:
+            name_id: int | None = self._name_ids.get(self._key(resource).lower())
+            if name_id is None:
+                return []
+            return [partition for partition, indexed in self._entries[name_id] if indexed == resource]
+
+    def clear(self):
+        with self._lock:
+            self._partitions.clear()
+            self._name_ids.clear()
+            self._names.clear()
+            self._entries.clear()
+            self._sorted_names.clear()
+            self._postings.clear()
+            self._type_names.clear()
+
+    # region Updates
+
+    def set_partition(
+        self,
+        partition: str,
+        resources: Iterable[FileResource],
+    ):
+        """Replace the resources of a partition (e.g. after a capsule was reloaded)."""
+        with self._lock:
+            self.remove_partition(partition)
+            self._partitions[partition] = {}
+            added_names: list[str] = []
+            for resource in resources:
+                self._add(partition, resource, added_names)
+            self._insert_sorted(added_names)
+
+    def remove_partition(
+        self,
+        partition: str,
+    ):
+        with self._lock:
+            removed_names: list[str] = []
+            for resource in list(self._partitions.get(partition, ())):
+                self._discard(partition, resource, removed_names)
+            self._partitions.pop(partition, None)
+            self._remove_sorted(removed_names)
+
+    def add(
+        self,
+        partition: str,
+        resource: FileResource,
+    ):
+        """Index a resource, replacing an equal resource already indexed in the partition."""
+        with self._lock:
+            self.discard(partition, resource)
+            added_names: list[str] = []
+            self._add(partition, resource, added_names)
+            self._insert_sorted(added_names)
+
+    def discard(
+        self,
+        partition: str,
+        resource: FileResource,
+    ):
+        """Remove a resource from a partition if it is indexed there."""
+        with self._lock:
+            removed_names: list[str] = []
+            self._discard(partition, resource, removed_names)
+            self._remove_sorted(removed_names)
+
+    def _add(
+        self,
+        partition: str,
+        resource: FileResource,
+        added_names: list[str],
+    ):
+        members: dict[FileResource, int] = self._partitions.setdefault(partition, {})
+        if members.get(resource) is not None:
+            return
+        name: str = self._key(resource).lower()
+        name_id: int | None = self._name_ids.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names.append(name)
+            self._name_ids[name] = name_id
+            self._entries[name_id] = []
+            added_names.append(name)
+            for gram in _grams(name):
+                self._postings.setdefault(gram, set()).add(name_id)
+        members[resource] = name_id
+        self._entries[name_id].append((partition, resource))
+        type_names: dict[int, int] = self._type_names.setdefault(resource.restype(), {})
+        type_names[name_id] = type_names.get(name_id, 0) + 1
+
+    def _discard(
+        self,
+        partition: str,
+        resource: FileResource,
+        removed_names: list[str],
+    ):
+        members: dict[FileResource, int] | None = self._partitions.get(partition)
+        if members is None or resource not in members:
+            return
+        name_id: int = members.pop(resource)
+        entries: list[tuple[str, FileResource]] = self._entries[name_id]
+        entries.remove((partition, resource))
+        type_names: dict[int, int] = self._type_names[resource.restype()]
+        type_names[name_id] -= 1
+        if not type_names[name_id]:
+            del type_names[name_id]
+        if entries:
+            return
+        name: str = self._names[name_id]
+        del self._entries[name_id]
+        del self._name_ids[name]
+        removed_names.append(name)
+        for gram in _grams(name):
+            posting: set[int] = self._postings[gram]
+            posting.discard(name_id)
+            if not posting:
+                del self._postings[gram]
+
+    def _insert_sorted(self, names: list[str]):
+        # Inserting one by one moves the tail of the array each time; merge big batches with a single (timsort) sort instead
+        if len(names) > _BULK_THRESHOLD:
+            self._sorted_names.extend(names)
+            self._sorted_names.sort()
+            return
+        for name in names:
+            bisect.insort(self._sorted_names, name)
+
+    def _remove_sorted(self, names: list[str]):
+        if len(names) > _BULK_THRESHOLD:
+            removed: set[str] = set(names)
+            self._sorted_names = [name for name in self._sorted_names if name not in removed]
+            return
+        for name in names:
+            del self._sorted_names[bisect.bisect_left(self._sorted_names, name)]
+
+    # endregion
+
+    # region Queries
+
+    def search(
+        self,
+        query: str = "",
+        *,
+        mode: Literal["substring", "prefix", "glob"] = "substring",
+        restypes: Collection[ResourceType] | None = None,
+        partitions: Collection[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> ResourceSearchPage:
+        """Find resources by name.
+
+        Args:
+        ----
+            query: Case-insensitive text to look for. An empty query matches everything.
+            mode: 'substring' (query anywhere in the name), 'prefix' (name starts with query) or 'glob' (fnmatch pattern over the whole name)
+            restypes: Only return resources of these types
+            partitions: Only return resources from these partitions
+            offset: Number of matching resources to skip
+            limit: Maximum number of resources to return, or None for all
+
+        Returns:
+        -------
+            The requested page of matches
+        """
+        offset = max(0, offset)
+        stop: int | None = None if limit is None else offset + max(0, limit)
+        items: list[tuple[str, FileResource]] = []
+        with self._lock:
+            position: int = 0
+            for name in self._candidate_names(query.lower(), mode, restypes):
+                for hit in self._hits(name, restypes, partitions):
+                    if stop is not None and position >= stop:
+                        return ResourceSearchPage(items, offset, position)
+                    if position >= offset:
+                        items.append(hit)
+                    position += 1
+        return ResourceSearchPage(items, offset, None)
+
+    def count(
+        self,
+        query: str = "",
+        *,
+        mode: Literal["substring", "prefix", "glob"] = "substring",
+        restypes: Collection[ResourceType] | None = None,
+        partitions: Collection[str] | None = None,
+    ) -> int:
+        """Returns the total number of resources a search would return."""
+        with self._lock:
+            return sum(1 for name in self._candidate_names(query.lower(), mode, restypes) for _ in self._hits(name, restypes, partitions))
+
+    def _hits(
+        self,
+        name: str,
+        restypes: Collection[ResourceType] | None,
+        partitions: Collection[str] | None,
+    ) -> list[tuple[str, FileResource]]:
+        hits: list[tuple[str, FileResource]] = [
+            (partition, resource)
+            for partition, resource in self._entries[self._name_ids[name]]
+            if (restypes is None or resource.restype() in restypes) and (partitions is None or partition in partitions)
+        ]
+        if len(hits) > 1:
+            hits.sort(key=lambda hit: (hit[1].restype().extension, hit[0], str(hit[1].filepath())))
+        return hits
+
+    def _candidate_names(
+        self,
+        query: str,
+        mode: str,
+        restypes: Collection[ResourceType] | None,
+    ) -> Iterator[str]:
+        """Yield the names matching the query, in sorted order."""
+        if mode == "prefix":
+            yield from self._prefixed(query)
+        elif mode == "substring":
+            if len(query) >= GRAM_SIZE:
+                yield from (name for name in self._by_grams(_grams(query)) if query in name)
+            else:
+                yield from (name for name in self._all_names(restypes) if query in name)
+        elif mode == "glob":
+            pattern: re.Pattern[str] = re.compile(fnmatch.translate(query))
+            literal_prefix: str = _GLOB_SPECIAL.split(query, 1)[0]
+            gram_set: set[str] = set().union(*(_grams(run) for run in _GLOB_SPECIAL.split(query)))
+            if literal_prefix and (len(literal_prefix) >= GRAM_SIZE or not gram_set):
+                names: Iterable[str] = self._prefixed(literal_prefix)
+            elif gram_set:
+                names = self._by_grams(gram_set)
+            else:
+                names = self._all_names(restypes)
+            yield from (name for name in names if pattern.match(name))
+        else:
+            msg = f"Unknown search mode '{mode}', expected 'substring', 'prefix' or 'glob'"
+            raise ValueError(msg)
+
+    def _prefixed(self, prefix: str) -> Iterator[str]:
+        sorted_names: list[str] = self._sorted_names
+        for i in range(bisect.bisect_left(sorted_names, prefix), len(sorted_names)):
+            if not sorted_names[i].startswith(prefix):
+                break
+            yield sorted_names[i]
+
+    def _by_grams(self, grams: set[str]) -> Iterable[str]:
+        """Names containing all the grams (a superset of the matches; callers still test each name)."""
+        postings: list[set[int]] = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        if not postings or not postings[0]:
+            return []
+        name_ids: set[int] = postings[0].intersection(*postings[1:])
+        return self._sorted_subset(name_ids)
+
+    def _all_names(self, restypes: Collection[ResourceType] | None) -> Iterable[str]:
+        if restypes is None:
+            return self._sorted_names
+        name_ids: set[int] = set()
+        for restype in restypes:
+            name_ids.update(self._type_names.get(restype, ()))
+        return self._sorted_subset(name_ids)
+
+    def _sorted_subset(self, name_ids: set[int]) -> Iterable[str]:
+        # Sorting a large candidate set costs more than walking the sorted array, which also stops once a page is full
+        if len(name_ids) * _SCAN_RATIO >= len(self._sorted_names):
+            return self._sorted_names
+        return sorted(self._names[name_id] for name_id in name_ids)
+
+    # endregion
@@ -180,7 +180,11 @@ Author: Enhanced by comprehensive vendor code analysis
 
 from __future__ import annotations
 
+import os
+import threading
+
 from copy import deepcopy
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from pykotor.common.misc import Game, ResRef
@@ -196,9 +200,8 @@ from pykotor.tools.path import CaseAwarePath
 from utility.common.geometry import Vector3, Vector4
 
 if TYPE_CHECKING:
-    import os
-
     from pykotor.common.module import Module
+    from pykotor.extract.nested_capsule import NestedCapsuleView
     from pykotor.resource.formats.gff import GFF
     from pykotor.resource.generics.utc import UTC
     from pykotor.resource.generics.uti import UTI
@@ -1649,18 +1652,20 @@ class SaveNestedCapsule:
     INTERNAL DATA MODEL:
     ====================
     - `resource_order`: Maintains original ERF resource ordering for byte-identical repacks
-    - `resource_data`: Raw bytes for every resource (updated after edits)
+    - `resource_data`: Raw bytes for every resource (updated after edits); untouched payloads are
+      memoryviews into the mapped SAVEGAME.sav until `close()` is called
     - `cached_modules`: Dict[ResourceIdentifier, ERF] for every cached module
     - `cached_characters`: Dict[ResourceIdentifier, UTC] with index mapping for AVAILNPC*.utc
     - `inventory` + `inventory_gff`: Convenience UTI objects + backing GFF for INVENTORY.res
     - `repute`: Parsed GFF for REPUTE.fac
-    - `other_resources`: Raw bytes for every additional resource to guarantee 100% coverage
+    - `other_resources`: Raw bytes (or mapped memoryviews) for every additional resource to guarantee 100% coverage
 
     PUBLIC API:
     ===========
     - `save()`: Rebuild internal byte buffers from edited structures
     - `iter_serialized_resources()`: Yield (identifier, bytes) pairs for ERF assembly
     - `set_resource()` / `remove_resource()`: Explicit resource mutation for custom editors
+    - `close()`: Copy out any still-mapped payloads and release SAVEGAME.sav
     """
     IDENTIFIER: ResourceIdentifier = ResourceIdentifier(resname="savegame", restype=ResourceType.SAV)
     INVENTORY_IDENTIFIER: ResourceIdentifier = ResourceIdentifier(resname="inventory", restype=ResourceType.RES)
@@ -1669,11 +1674,11 @@ class SaveNestedCapsule:
     def __init__(self, path: os.PathLike | str, ident: ResourceIdentifier | None = None):
         ident = self.IDENTIFIER if ident is None else ident
         self.nested_capsule_path = CaseAwarePath(path) / str(ident)
-        self.nested_resources_path = Capsule(self.nested_capsule_path)
+        self._nested_resources_path: Capsule | None = None  # Opened on first use; listing saves never touches SAVEGAME.sav
         
         # Cached game data
         self.resource_order: list[ResourceIdentifier] = []  # Preserve original ERF order
-        self.resource_data: dict[ResourceIdentifier, bytes] = {}  # Raw bytes for every resource
+        self.resource_data: dict[ResourceIdentifier, bytes | memoryview] = {}  # Raw bytes for every resource
         self.cached_modules: dict[ResourceIdentifier, ERF] = {}  # Cached modules (.sav files) inside the save
         self.cached_characters: dict[ResourceIdentifier, UTC] = {}  # Cached AVAILNPC*.utc character files
         self.cached_character_indices: dict[int, ResourceIdentifier] = {}  # Map index -> ResourceIdentifier
@@ -1682,8 +1687,18 @@ class SaveNestedCapsule:
         self.inventory_identifier: ResourceIdentifier | None = None
         self.repute: GFF | None = None  # Faction reputation data (parsed GFF)
         self.repute_identifier: ResourceIdentifier | None = None
-        self.other_resources: dict[ResourceIdentifier, bytes] = {}  # All other resources preserved verbatim
+        self.other_resources: dict[ResourceIdentifier, bytes | memoryview] = {}  # All other resources preserved verbatim
         self.game: Game = Game.K2  # Default to K2 behavior; caller can override after inspection
+        self._baseline: dict[ResourceIdentifier, bytes | memoryview] = {}  # Payloads as last read from/written to disk
+        self._view: NestedCapsuleView | None = None  # Mapping backing the memoryview payloads above
+        self._module_fingerprints: dict[ResourceIdentifier, tuple[tuple[str, ResourceType, int, int], ...] | None] = {}
+
+    @property
+    def nested_resources_path(self) -> Capsule:
+        """The SAVEGAME.sav capsule, parsed lazily so constructing a SaveFolderEntry stays cheap."""
+        if self._nested_resources_path is None:
+            self._nested_resources_path = Capsule(self.nested_capsule_path)
+        return self._nested_resources_path
 
     def load(self):
         """Load all resources from SAVEGAME.sav."""
@@ -1702,10 +1717,16 @@ class SaveNestedCapsule:
     def load_cached(self, *, reload: bool = False):
         """Load cached resources from the SAVEGAME.sav ERF.
         
+        The outer capsule is memory-mapped and stays mapped: resources that are decoded (cached modules,
+        companions, inventory, reputation) are parsed straight from their window into the mapping, and
+        every other payload is kept as a memoryview window rather than copied. Only resources that are
+        edited get new bytes. Call `close()` to copy out the remaining windows and release the file.
+
         Args:
         ----
-            reload: If True, reload the capsule resources.
+            reload: If True, also drop the cached Capsule index used by `nested_resources_path`.
         """
+        from pykotor.extract.nested_capsule import NestedCapsuleView
         from pykotor.resource.formats.erf.erf_auto import read_erf
         from pykotor.resource.formats.gff import read_gff
         from pykotor.resource.generics.utc import read_utc
@@ -1724,9 +1745,18 @@ class SaveNestedCapsule:
         self.repute_identifier = None
         self.other_resources.clear()
 
-        for resource in self.nested_resources_path.resources(reload=reload):
-            identifier = ResourceIdentifier(resname=resource.resname(), restype=resource.restype())
-            data = resource.data()
+        self._baseline.clear()
+        self._module_fingerprints.clear()
+        if reload:
+            self._nested_resources_path = None
+        self._release_view()
+
+        view = NestedCapsuleView(self.nested_capsule_path)
+        self._view = view
+        for entry in view:
+            identifier = entry.identifier
+            data = view.window(identifier)
+            self._baseline[identifier] = data
             self.resource_order.append(identifier)
             self.resource_data[identifier] = data
             
@@ -1734,6 +1764,7 @@ class SaveNestedCapsule:
             if identifier.restype is ResourceType.SAV:
                 sav = read_erf(data)
                 self.cached_modules[identifier] = sav
+                self._module_fingerprints[identifier] = self._erf_fingerprint(sav)
             
             # Load cached companion characters
             elif identifier.restype is ResourceType.UTC:
@@ -1764,8 +1795,44 @@ class SaveNestedCapsule:
                 # Preserve all other resources verbatim
                 self.other_resources[identifier] = data
 
+    def close(self):
+        """Copy every payload still backed by the memory map into bytes, then release SAVEGAME.sav."""
+        for payloads in (self.resource_data, self.other_resources, self._baseline):
+            for identifier, payload in payloads.items():
+                if isinstance(payload, memoryview):
+                    payloads[identifier] = payload.tobytes()
+        self._release_view()
+
+    def _release_view(self):
+        if self._view is not None:
+            self._view.close()
+            self._view = None
+
+    def _remap(self):
+        """Point memoryview payloads (released when the old mapping closed) at a fresh mapping of SAVEGAME.sav."""
+        from pykotor.extract.nested_capsule import NestedCapsuleView
+
+        self._release_view()
+        self._view = view = NestedCapsuleView(self.nested_capsule_path)
+        for payloads in (self.resource_data, self.other_resources, self._baseline):
+            for identifier, payload in payloads.items():
+                if isinstance(payload, memoryview) and identifier in view:
+                    payloads[identifier] = view.window(identifier)
+
+    @staticmethod
+    def _erf_fingerprint(erf: ERF) -> tuple[tuple[str, ResourceType, int, int], ...] | None:
+        """Cheap change detector for a cached module; bytes objects cache their hash, so unchanged payloads cost O(1)."""
+        try:
+            return tuple((str(resource.resref), resource.restype, len(resource.data), hash(resource.data)) for resource in erf)
+        except TypeError:  # Unhashable payload (e.g. bytearray), always treat as modified
+            return None
+
     def save(self):
-        """Serialize all nested resources back into raw byte form."""
+        """Serialize all nested resources back into raw byte form.
+
+        Cached modules that were not modified since loading keep their original bytes rather than
+        being re-serialized, which keeps them byte-identical and lets `write()` skip them.
+        """
         from pykotor.resource.formats.erf.erf_auto import bytes_erf
         from pykotor.resource.formats.gff import bytes_gff
         from pykotor.resource.formats.gff import GFF, GFFContent, GFFList
@@ -1774,7 +1841,11 @@ class SaveNestedCapsule:
 
         # Modules (.sav nested ERFs)
         for identifier, module_erf in self.cached_modules.items():
+            fingerprint = self._erf_fingerprint(module_erf)
+            if fingerprint is not None and identifier in self.resource_data and self._module_fingerprints.get(identifier) == fingerprint:
+                continue
             self.resource_data[identifier] = bytes_erf(module_erf, ResourceType.SAV)
+            self._module_fingerprints[identifier] = fingerprint
 
         # Companion character templates
         for identifier, utc in self.cached_characters.items():
@@ -1799,6 +1870,49 @@ class SaveNestedCapsule:
         for identifier, payload in self.other_resources.items():
             self.resource_data[identifier] = payload
 
+    def write(self) -> bool:
+        """Serialize and write SAVEGAME.sav, rewriting only the resources that changed since it was loaded.
+
+        Unchanged payloads (usually most cached modules) stay where they are on disk; see
+        `pykotor.extract.nested_capsule.write_nested_capsule`. A save that was never loaded from
+        disk is written in full.
+
+        Returns:
+        -------
+            True if the existing file was patched in place, False if it was (re)written in full.
+        """
+        from pykotor.extract.nested_capsule import write_nested_capsule
+        from pykotor.resource.formats.erf.erf_auto import write_erf
+
+        self.save()
+        serialized: list[tuple[ResourceIdentifier, bytes]] = list(self.iter_serialized_resources())
+        patched = False
+        if self._baseline and self.nested_capsule_path.is_file():
+            changes: dict[ResourceIdentifier, bytes | None] = {
+                identifier: payload
+                for identifier, payload in serialized
+                if (original := self._baseline.get(identifier)) is not payload and original != payload
+            }
+            present: set[ResourceIdentifier] = {identifier for identifier, _ in serialized}
+            changes.update((identifier, None) for identifier in self._baseline if identifier not in present)
+            order: list[ResourceIdentifier] = [identifier for identifier, _ in serialized]
+            # Unchanged payloads are still windows into the file being written; drop the mapping first
+            # (Windows refuses to truncate or replace a mapped file) and map the result afterwards.
+            self._release_view()
+            try:
+                patched = write_nested_capsule(self.nested_capsule_path, changes, order=order)
+            finally:
+                self._remap()
+        else:
+            nested_erf: ERF = ERF(ERFType.from_extension(self.nested_capsule_path.suffix))
+            for identifier, payload in serialized:
+                nested_erf.set_data(identifier.resname, identifier.restype, payload)
+            write_erf(nested_erf, self.nested_capsule_path, ResourceType.SAV)
+
+        self._baseline = dict(self.iter_serialized_resources())
+        self._nested_resources_path = None
+        return patched
+
     def iter_serialized_resources(self):
         """Yield resources in original order with any newly added resources appended."""
         seen: set[ResourceIdentifier] = set()
@@ -2360,8 +2474,6 @@ class SaveFolderEntry:
         - Vendor ref: KSE uses temp files + rename for atomicity
         """
         from loggerplus import RobustLogger
-
-        from pykotor.resource.formats.erf.erf_auto import write_erf
         
         logger = RobustLogger()
         logger.info("=== Beginning Save Process ===")
@@ -2429,12 +2541,6 @@ class SaveFolderEntry:
         # ============================================================================
         logger.debug("[4/5] Saving SAVEGAME.sav (Nested Capsule)...")
         
-        # First, serialize all nested resources (modules, characters, inventory, etc.)
-        # This updates self.sav.resource_data with serialized bytes for all resources
-        # Vendor ref: KSE/Functions/Saves.pm SaveSave() line ~520
-        logger.debug("  - Serializing nested resources...")
-        self.sav.save()
-        
         # Count resources by type for status display
         module_count = len(self.sav.cached_modules)
         character_count = len(self.sav.cached_characters)
@@ -2450,17 +2556,12 @@ class SaveFolderEntry:
         logger.debug(f"    • Other Resources: {other_count}")
         logger.debug(f"    • Total Resources: {total_resources}")
         
-        # Create new ERF and populate with all serialized resources
-        # Vendor ref: KSE/Functions/Saves.pm SaveSave() line ~550
-        logger.debug("  - Repacking ERF archive...")
-        nested_erf: ERF = ERF(ERFType.from_extension(self.sav.nested_capsule_path.suffix))
-        
-        for identifier, payload in self.sav.iter_serialized_resources():
-            nested_erf.set_data(identifier.resname, identifier.restype, payload)
-        
-        # Write SAVEGAME.sav to disk
-        write_erf(nested_erf, self.sav.nested_capsule_path, ResourceType.SAV)
-        logger.debug(f"  ✓ Written to: {self.sav.nested_capsule_path}")
+        # Serialize all nested resources (modules, characters, inventory, etc.) and write
+        # SAVEGAME.sav to disk, patching only the resources that changed
+        # Vendor ref: KSE/Functions/Saves.pm SaveSave() lines ~520-550
+        logger.debug("  - Serializing nested resources and writing ERF archive...")
+        patched = self.sav.write()
+        logger.debug(f"  ✓ {'Patched' if patched else 'Written to'}: {self.sav.nested_capsule_path}")
         
         # ============================================================================
         # STEP 5: SAVE SCREEN.TGA - Save screenshot thumbnail
@@ -2496,6 +2597,179 @@ class SaveFolderEntry:
         logger.info("✓ Save game is ready to load in KOTOR")
 
 
+class SaveSummary:
+    """Cheap, listing-only view of a save folder.
+
+    Built by `SaveIndex` from the handful of SAVENFO.res root fields a save browser shows, plus the
+    location of the Screen.tga pixel data, without touching PARTYTABLE.res, GLOBALVARS.res or SAVEGAME.sav.
+    Call `open()` to get a full `SaveFolderEntry` when the user actually picks the save.
+    """
+
+    __slots__ = (
+        "area_name",
+        "last_module",
+        "pc_name",
+        "portrait0",
+        "save_path",
+        "savegame_name",
+        "screenshot_height",
+        "screenshot_offset",
+        "screenshot_path",
+        "screenshot_width",
+        "time_played",
+        "timestamp",
+    )
+
+    def __init__(self, save_path: os.PathLike | str):
+        self.save_path: CaseAwarePath = CaseAwarePath(save_path)
+        self.savegame_name: str = ""
+        self.area_name: str = ""
+        self.last_module: str = ""
+        self.time_played: int = 0
+        self.timestamp: int | None = None
+        self.pc_name: str = ""
+        self.portrait0: ResRef = ResRef.from_blank()
+        self.screenshot_path: Path | None = None
+        self.screenshot_offset: int = 0  # Byte offset of the pixel data inside Screen.tga
+        self.screenshot_width: int = 0
+        self.screenshot_height: int = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.save_path!r}, savegame_name={self.savegame_name!r})"
+
+    def open(self) -> SaveFolderEntry:
+        """Return a SaveFolderEntry for this save; nothing is parsed until its `load()` is called."""
+        return SaveFolderEntry(self.save_path)
+
+
+class SaveIndex:
+    """Metadata index of save folders for fast save-list display.
+
+    Each save is summarised from the few header fields it needs in SAVENFO.res (read through
+    the root-label filter of the binary GFF reader, so lists and structs are never decoded) and the
+    18-byte Screen.tga header. Summaries are cached per folder and reused until the folder's mtime or
+    SAVENFO.res' mtime changes, so re-opening a browser over hundreds of saves costs one `scandir` per save.
+    """
+
+    SUMMARY_FIELDS: frozenset[str] = frozenset(
+        ("SAVEGAMENAME", "AREANAME", "LASTMODULE", "TIMEPLAYED", "TIMESTAMP", "PCNAME", "PORTRAIT0")
+    )
+    _SAVENFO_NAME: str = str(SaveInfo.IDENTIFIER)
+    _SCREENSHOT_NAME: str = "screen.tga"
+
+    def __init__(self):
+        self._entries: dict[str, tuple[tuple[int, int], SaveSummary]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def summary(self, save_path: os.PathLike | str) -> SaveSummary | None:
+        """Return the summary of a single save folder, or None if it has no readable SAVENFO.res."""
+        folder = str(save_path)
+        key = os.path.normcase(os.path.abspath(folder))  # noqa: PTH100
+        try:
+            folder_mtime = os.stat(folder).st_mtime_ns  # noqa: PTH116
+            with os.scandir(folder) as it:
+                files: dict[str, os.DirEntry[str]] = {entry.name.lower(): entry for entry in it if entry.is_file()}
+        except OSError:
+            self.invalidate(folder)
+            return None
+        nfo_entry = files.get(self._SAVENFO_NAME)
+        if nfo_entry is None:
+            self.invalidate(folder)
+            return None
+        stamp = (folder_mtime, nfo_entry.stat().st_mtime_ns)
+
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        summary = SaveSummary(folder)
+        try:
+            self._read_savenfo(summary, nfo_entry.path)
+        except (OSError, ValueError) as e:
+            from loggerplus import RobustLogger
+
+            RobustLogger().warning(f"Failed to read save summary from '{nfo_entry.path}': {e}")
+            self.invalidate(folder)
+            return None
+        screen_entry = files.get(self._SCREENSHOT_NAME)
+        if screen_entry is not None:
+            self._read_screenshot_header(summary, screen_entry.path)
+
+        with self._lock:
+            self._entries[key] = (stamp, summary)
+        return summary
+
+    def summaries(self, save_location: os.PathLike | str) -> list[SaveSummary]:
+        """Summarise every save folder directly inside `save_location`, dropping cache entries for vanished saves."""
+        location = str(save_location)
+        try:
+            with os.scandir(location) as it:
+                folders: list[str] = [entry.path for entry in it if entry.is_dir()]
+        except OSError:
+            return []
+        result: list[SaveSummary] = [summary for folder in folders if (summary := self.summary(folder)) is not None]
+
+        prefix = os.path.join(os.path.normcase(os.path.abspath(location)), "")  # noqa: PTH100, PTH118
+        alive = {os.path.normcase(os.path.abspath(folder)) for folder in folders}  # noqa: PTH100
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix) and key not in alive]:
+                del self._entries[key]
+        return result
+
+    def invalidate(self, save_path: os.PathLike | str):
+        with self._lock:
+            self._entries.pop(os.path.normcase(os.path.abspath(save_path)), None)  # noqa: PTH100
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _read_savenfo(self, summary: SaveSummary, path: str):
+        from pykotor.resource.formats.gff.io_gff import GFFBinaryReader
+
+        root = GFFBinaryReader(path, root_labels=self.SUMMARY_FIELDS).load().root
+        summary.savegame_name = root.acquire("SAVEGAMENAME", "")
+        summary.area_name = root.acquire("AREANAME", "")
+        summary.last_module = root.acquire("LASTMODULE", "")
+        summary.time_played = root.acquire("TIMEPLAYED", 0)
+        summary.timestamp = root.acquire("TIMESTAMP", None)
+        summary.pc_name = root.acquire("PCNAME", "")
+        summary.portrait0 = root.acquire("PORTRAIT0", ResRef.from_blank())
+
+    @staticmethod
+    def _read_screenshot_header(summary: SaveSummary, path: str):
+        try:
+            with open(path, "rb") as f:  # noqa: PTH123
+                header = f.read(18)
+        except OSError:
+            return
+        if len(header) < 18:  # noqa: PLR2004
+            return
+        id_length, colormap_type = header[0], header[1]
+        colormap_length, colormap_entry_bits = int.from_bytes(header[5:7], "little"), header[7]
+        colormap_bytes = colormap_length * ((colormap_entry_bits + 7) // 8) if colormap_type else 0
+        summary.screenshot_path = Path(path)
+        summary.screenshot_offset = 18 + id_length + colormap_bytes
+        summary.screenshot_width = int.from_bytes(header[12:14], "little")
+        summary.screenshot_height = int.from_bytes(header[14:16], "little")
+
+
+_SAVE_INDEX: SaveIndex = SaveIndex()
+
+
+def get_save_index() -> SaveIndex:
+    """Return the process-wide save summary index."""
+    return _SAVE_INDEX
+
+
+def clear_save_index():
+    _SAVE_INDEX.clear()
+
+
 if __name__ == "__main__":
     # Example usage - demonstrating the complete load/modify/save workflow
     # This shows how to load a save, modify it, and save changes back
@@ -59,7 +59,7 @@ from utility.common.geometry import Vector3
 
 if TYPE_CHECKING:
     from pykotor.gl.scene import Scene
-    from pykotor.gl.shader import Shader
+    from pykotor.gl.shader import Shader, Texture
 
 
 logger = logging.getLogger(__name__)
@@ -291,6 +291,7 @@ class Mesh:
         self.mdx_lightmap: int = lightmap_offset
         self._index_data: bytes = bytes(element_data)
         self._vertex_blob_cache: bytes | None = None
+        self._bounding_radius: float | None = None
 
         if HAS_PYOPENGL:
             self._vao: int = glGenVertexArrays(1)
@@ -342,8 +343,26 @@ class Mesh:
         shader.use()
         shader.set_matrix4("model", transform)
 
+        self.bind_material(
+            shader,
+            self._scene.texture(override_texture or self.texture),
+            self._scene.texture(self.lightmap, lightmap=True),
+        )
+        self.draw_elements()
+        Mesh.reset_material(shader)
+
+    @staticmethod
+    def bind_material(
+        shader: Shader,
+        diffuse_tex: Texture,
+        lightmap_tex: Texture,
+    ):
+        """Bind a mesh's textures and the blend/depth state their TXI hints ask for.
+
+        Meshes sharing textures can be drawn with one bind_material and a draw_elements each;
+        call reset_material afterwards.
+        """
         glActiveTexture(GL_TEXTURE0)
-        diffuse_tex = self._scene.texture(override_texture or self.texture)
         diffuse_tex.use()
 
         # Material hints (TXI blending) influence how we draw “effect” meshes (e.g. light shafts).
@@ -369,16 +388,29 @@ class Mesh:
             shader.set_float("alphaCutoff", 0.0)
 
         glActiveTexture(GL_TEXTURE1)
-        self._scene.texture(self.lightmap, lightmap=True).use()
+        lightmap_tex.use()
 
+    def draw_elements(self):
+        """Issue the draw call for this mesh with whatever material and "model" matrix are bound."""
         glBindVertexArray(self._vao)
         glDrawElements(GL_TRIANGLES, self._face_count, GL_UNSIGNED_SHORT, None)
 
-        # Restore conservative defaults for the next draw.
+    @staticmethod
+    def reset_material(shader: Shader):
+        """Restore conservative blend/depth defaults for the next draw."""
         glDepthMask(True)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         shader.set_float("alphaCutoff", 0.0)
 
+    def bounding_radius(self) -> float:
+        """Returns the distance of the mesh's farthest vertex from its node's origin."""
+        if self._bounding_radius is None:
+            import numpy as np
+
+            positions = np.frombuffer(self.vertex_blob(), dtype=np.float32).reshape(-1, 7)[:, 0:3]
+            self._bounding_radius = float(np.sqrt((positions * positions).sum(axis=1).max()))
+        return self._bounding_radius
+
     def vertex_blob(self) -> bytes:
         """Generate an interleaved vertex blob for rendering.
         
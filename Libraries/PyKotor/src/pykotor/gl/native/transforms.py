@@ -0,0 +1,76 @@
+"""Batched transform math over NumPy arrays.
+
+:mod:`pykotor.common.geometry_utils` and :mod:`pykotor.gl.glm_compat` compute one matrix per call with Python
+objects. The scene's hot paths use these functions instead: :class:`~pykotor.gl.scene.draw_list.DrawList` stacks
+the node transforms of each model into one array and flattens an object with a single matrix product, the frustum
+extracts all six planes in one pass and picking unprojects with one batched inverse.
+
+Matrices are ``(..., 4, 4)`` arrays laid out like GLM and OpenGL, column-major: ``m[i]`` is column ``i`` and
+``m[3, :3]`` is the translation. This means:
+
+- An array can be passed straight to ``glUniformMatrix4fv`` without transposing.
+- Points are transformed as homogeneous row vectors, ``points @ m``.
+- The GLM product ``a * b`` is ``b @ a``.
+
+``tests/gl/benchmark_transforms.py`` compares the batched flattening with the per-node GLM products it replaced.
+
+Object world matrices are deliberately not batched: :class:`~pykotor.gl.scene.render_object.RenderObject` only
+recomputes its matrix when its position or rotation actually changes, and
+:class:`~pykotor.gl.scene.culling.CullingIndex` only refreshes the spheres of objects that reported a change, so no
+per-frame pass over every instance is left to vectorize. A batched result would also have to be copied back into a
+GLM matrix per object for the renderer, which costs about as much as computing it there.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pykotor.gl.glm_compat import mat4
+
+# Replaces a degenerate frustum plane; it has every point in front of it, so it culls nothing
+_OPEN_PLANE = (0.0, 0.0, 1.0, 1e10)
+
+
+def matrix_array(matrix: mat4, dtype: type = np.float64) -> np.ndarray:
+    """Returns a (4, 4) column-major array of a GLM-style matrix."""
+    return np.array([tuple(matrix[column]) for column in range(4)], dtype=dtype)
+
+
+def invert(matrices: np.ndarray) -> np.ndarray:
+    """Returns the inverses of (..., 4, 4) matrices."""
+    return np.linalg.inv(matrices)
+
+
+def frustum_planes(view_projection: np.ndarray) -> np.ndarray:
+    """Returns the six normalized (nx, ny, nz, d) frustum planes of a view-projection matrix (Gribb/Hartmann).
+
+    Planes are ordered left, right, bottom, top, near, far, like :class:`~pykotor.gl.scene.frustum.FrustumPlane`.
+    """
+    rows = np.asarray(view_projection, dtype=np.float64).T
+    planes = np.stack((rows[3] + rows[0], rows[3] - rows[0], rows[3] + rows[1], rows[3] - rows[1], rows[3] + rows[2], rows[3] - rows[2]))
+    lengths = np.sqrt((planes[:, :3] ** 2).sum(axis=1))
+    degenerate = lengths <= 1e-10
+    planes /= np.where(degenerate, 1.0, lengths)[:, None]
+    planes[degenerate] = _OPEN_PLANE
+    return planes
+
+
+def unproject(
+    window_points: np.ndarray,
+    view: np.ndarray,
+    projection: np.ndarray,
+    viewport: tuple[float, float, float, float],
+) -> np.ndarray:
+    """Returns the (N, 3) world positions of (N, 3) window coordinates with depth, like ``unProject``."""
+    window = np.asarray(window_points, dtype=np.float64).reshape(-1, 3)
+    x, y, width, height = viewport
+    ndc = np.empty((len(window), 4))
+    ndc[:, 0] = (window[:, 0] - x) / width * 2.0 - 1.0
+    ndc[:, 1] = (window[:, 1] - y) / height * 2.0 - 1.0
+    ndc[:, 2] = window[:, 2] * 2.0 - 1.0
+    ndc[:, 3] = 1.0
+    world = ndc @ invert(view @ projection)
+    return world[:, :3] / world[:, 3:4]
@@ -2,18 +2,29 @@ from __future__ import annotations
 
 import multiprocessing
 import struct
+import threading
 import traceback
 
-from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import Future, InvalidStateError, ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Protocol
 
 from loggerplus import RobustLogger
-
 from pykotor.common.stream import BinaryReader
+from pykotor.extract.decoded_cache import ResourceLocation, decoded_cache
+from pykotor.gl.scene.shared_buffers import SharedBlockWriter, SharedBufferHandle, SharedBufferPool, shared_buffer_pool, shared_memory_available
 from pykotor.resource.formats.tpc.tpc_auto import read_tpc
 
 if TYPE_CHECKING:
-    from pykotor.resource.formats.tpc.tpc_data import TPC
+    from collections.abc import Hashable
+
+    from pykotor.extract.decoded_cache import CacheLease, DecodedResourceCache
+    from pykotor.gl.scene.shared_buffers import SharedBlockLease, SharedOrBytes
+    from pykotor.resource.formats.tpc.tpc_data import TPC, TPCMipmap
+
+# Slack added to shared memory leases on top of the estimated decoded size
+_LEASE_SLACK = 4096
+# Worst-case growth from the stored texture to RGBA pixels (DXT1 stores 4 bits per pixel)
+_TEXTURE_EXPANSION = 8
 
 
 class ResourceLoader(Protocol):
@@ -28,24 +39,31 @@ class ResourceLoader(Protocol):
         ...
 
 
-# Intermediate data structures that can be pickled and sent between processes
+# Intermediate data structures that can be pickled and sent between processes.
+# Large buffers are SharedBufferHandle objects when the worker wrote them into shared memory.
 class IntermediateTexture(NamedTuple):
-    """Parsed texture data without OpenGL objects."""
-    width: int
-    height: int
-    rgba_data: bytes  # RGBA pixel data
-    mipmap_count: int
+    """Parsed texture data without OpenGL objects.
+
+    Only the mip levels from `base_level` on are decoded (all of them unless a texture far from the camera asked
+    for fewer): `rgba_data` is level `base_level`, level 0 by default, and `mip_data` holds the levels after it.
+    """
+    width: int  # of level 0
+    height: int  # of level 0
+    rgba_data: SharedOrBytes  # RGBA pixel data of level `base_level`
+    mipmap_count: int  # levels in the whole mip chain
     blend_mode: int  # 0=default, 1=additive, 2=punchthrough
     alpha_cutoff: float  # 0 disables cutout
     has_alpha: bool
+    mip_data: SharedOrBytes = b""  # RGBA pixel data of the decoded levels after `base_level`, largest first
+    base_level: int = 0
 
 
 class IntermediateMesh(NamedTuple):
     """Parsed mesh data without OpenGL objects."""
     texture: str
     lightmap: str
-    vertex_data: bytes
-    element_data: bytes
+    vertex_data: SharedOrBytes
+    element_data: SharedOrBytes
     block_size: int
     data_bitflags: int
     vertex_offset: int
@@ -81,6 +99,9 @@ def _load_and_parse_texture(
     filepath: str,
     offset: int,
     size: int,
+    shared_block: SharedBlockLease | None = None,
+    base_level: int = 0,
+    stop_level: int | None = None,
 ) -> tuple[str, IntermediateTexture | None, str | None]:
     """Load texture bytes from file AND parse in child process.
     
@@ -90,6 +111,9 @@ def _load_and_parse_texture(
         filepath: Absolute path to file
         offset: Byte offset in file
         size: Number of bytes to read
+        shared_block: Shared memory block to write the pixels into instead of returning them as bytes
+        base_level: Largest mip level to decode
+        stop_level: Mip level to stop decoding at (default: the end of the chain)
     
     Returns:
     -------
@@ -97,6 +121,7 @@ def _load_and_parse_texture(
     """
     try:
         from pathlib import Path
+
         from pykotor.resource.type import ResourceType
         
         # IO: Read raw bytes from file
@@ -109,7 +134,10 @@ def _load_and_parse_texture(
             tpc_bytes = f.read(size)
         
         # Parsing: Convert bytes to intermediate texture
-        return _parse_texture_data(name, tpc_bytes, ResourceType.from_id(restype_id))
+        result = _parse_texture_data(name, tpc_bytes, ResourceType.from_id(restype_id), base_level, stop_level)
+        if shared_block is None or result[1] is None:
+            return result
+        return (name, _share_texture(result[1], shared_block), None)
     except Exception as e:  # noqa: BLE001
         return (name, None, f"IO+parse error for texture '{name}': {e!s}\n{traceback.format_exc()}")
 
@@ -122,6 +150,7 @@ def _load_and_parse_model(
     mdx_filepath: str,
     mdx_offset: int,
     mdx_size: int,
+    shared_block: SharedBlockLease | None = None,
 ) -> tuple[str, IntermediateModel | None, str | None]:
     """Load model bytes from files AND parse in child process.
     
@@ -134,6 +163,7 @@ def _load_and_parse_model(
         mdx_filepath: Absolute path to MDX file
         mdx_offset: Byte offset in MDX file
         mdx_size: Number of bytes to read from MDX
+        shared_block: Shared memory block to write the mesh buffers into instead of returning them as bytes
     
     Returns:
     -------
@@ -161,18 +191,176 @@ def _load_and_parse_model(
             mdx_bytes = f.read(mdx_size)
         
         # Parsing: Convert bytes to intermediate model
-        return _parse_model_data(name, mdl_bytes, mdx_bytes)
+        result = _parse_model_data(name, mdl_bytes, mdx_bytes)
+        if shared_block is None or result[1] is None:
+            return result
+        return (name, _share_model(result[1], shared_block), None)
     except Exception as e:  # noqa: BLE001
         return (name, None, f"IO+parse error for model '{name}': {e!s}\n{traceback.format_exc()}")
 
 
+# ===== Shared Memory Transport =====
+def _share_texture(
+    texture: IntermediateTexture,
+    lease: SharedBlockLease,
+) -> IntermediateTexture:
+    """Move the pixels of a parsed texture into a leased shared memory block (child process)."""
+    with SharedBlockWriter(lease) as writer:
+        return texture._replace(
+            rgba_data=writer.write(texture.rgba_data),  # pyright: ignore[reportArgumentType]
+            mip_data=writer.write(texture.mip_data),  # pyright: ignore[reportArgumentType]
+        )
+
+
+def _share_model(
+    model: IntermediateModel,
+    lease: SharedBlockLease,
+) -> IntermediateModel:
+    """Move the mesh buffers of a parsed model into a leased shared memory block (child process)."""
+
+    def share_node(node: IntermediateNode) -> IntermediateNode:
+        mesh: IntermediateMesh | None = node.mesh
+        if mesh is not None:
+            mesh = mesh._replace(
+                vertex_data=writer.write(mesh.vertex_data),  # pyright: ignore[reportArgumentType]
+                element_data=writer.write(mesh.element_data),  # pyright: ignore[reportArgumentType]
+            )
+        return node._replace(mesh=mesh, children=[share_node(child) for child in node.children])
+
+    with SharedBlockWriter(lease) as writer:
+        return model._replace(root=share_node(model.root))
+
+
+def _intermediate_buffers(intermediate: IntermediateTexture | IntermediateModel | None) -> list[SharedOrBytes]:
+    if isinstance(intermediate, IntermediateTexture):
+        return [intermediate.rgba_data, intermediate.mip_data]
+    buffers: list[SharedOrBytes] = []
+    nodes: list[IntermediateNode] = [] if intermediate is None else [intermediate.root]
+    while nodes:
+        node = nodes.pop()
+        if node.mesh is not None:
+            buffers.extend((node.mesh.vertex_data, node.mesh.element_data))
+        nodes.extend(node.children)
+    return buffers
+
+
+def shared_blocks(intermediate: IntermediateTexture | IntermediateModel | None) -> set[str]:
+    """Returns the names of the shared memory blocks an intermediate texture or model refers to."""
+    return {data.block for data in _intermediate_buffers(intermediate) if isinstance(data, SharedBufferHandle)}
+
+
+def intermediate_nbytes(
+    intermediate: IntermediateTexture | IntermediateModel,
+    buffers: SharedBufferPool | None = None,
+) -> int:
+    """Returns the memory held by an intermediate texture or model.
+
+    A buffer in shared memory keeps its whole block alive, so with the pool the blocks come from (`buffers`), each
+    block is counted at its capacity rather than by the bytes written to it.
+    """
+    data_buffers: list[SharedOrBytes] = _intermediate_buffers(intermediate)
+    if buffers is None:
+        return sum(_buffer_size(data) for data in data_buffers)
+    return sum(len(data) for data in data_buffers if not isinstance(data, SharedBufferHandle)) + sum(
+        buffers.capacity(block) for block in shared_blocks(intermediate)
+    )
+
+
+def _release_blocks(
+    buffers: SharedBufferPool | None,
+    intermediate: IntermediateTexture | IntermediateModel | None,
+):
+    if buffers is not None:
+        for block in shared_blocks(intermediate):
+            buffers.release(block)
+
+
+def _texture_cache_key(
+    location: ResourceLocation,
+    base_level: int,
+    stop_level: int | None,
+) -> Hashable:
+    return (*location.cache_key("gl.texture"), base_level, stop_level)
+
+
+def _model_cache_key(
+    mdl_location: ResourceLocation,
+    mdx_location: ResourceLocation,
+) -> Hashable:
+    return ("gl.model", mdl_location.cache_key("mdl"), mdx_location.cache_key("mdx"))
+
+
+def _buffer_size(data: SharedOrBytes) -> int:
+    return data.nbytes if isinstance(data, SharedBufferHandle) else len(data)
+
+
+def _resolve_buffer(
+    data: SharedOrBytes,
+    buffers: SharedBufferPool | None,
+) -> bytes | memoryview:
+    if not isinstance(data, SharedBufferHandle):
+        return data
+    if buffers is None:
+        msg = f"Buffer is in shared memory block '{data.block}' but no SharedBufferPool was given"
+        raise ValueError(msg)
+    return buffers.view(data)
+
+
 # ===== Parsing Functions =====
+def _rgba_mip_levels(
+    tpc: TPC,
+    base_level: int = 0,
+    stop_level: int | None = None,
+) -> tuple[list[bytes], int, int]:
+    """Decode the levels [base_level, stop_level) of the first layer's mip chain to RGBA, and no others.
+
+    The chain ends at the first level that is missing or not half the size of the previous one, so it always
+    matches :func:`pykotor.gl.scene.texture_streaming.mip_chain`. `base_level` is clamped to the chain.
+
+    Returns:
+    -------
+        tuple[rgba_levels, mip_count, base_level]
+    """
+    from pykotor.resource.formats.tpc.tpc_data import TPCTextureFormat
+
+    base: TPCMipmap = tpc.get(0, 0)
+    mipmaps: list[TPCMipmap] = [base]
+    for level in range(1, max(base.width, base.height).bit_length()):
+        try:
+            mm: TPCMipmap = tpc.get(0, level)
+        except IndexError:
+            break
+        if (mm.width, mm.height) != (max(1, base.width >> level), max(1, base.height >> level)):
+            break
+        mipmaps.append(mm)
+
+    first: int = min(max(0, base_level), len(mipmaps) - 1)
+    stop: int = len(mipmaps) if stop_level is None else min(max(first + 1, stop_level), len(mipmaps))
+    levels: list[bytes] = []
+    for mm in mipmaps[first:stop]:
+        if mm.tpc_format != TPCTextureFormat.RGBA:
+            mm.convert(TPCTextureFormat.RGBA)
+        if len(mm.data) != mm.width * mm.height * 4:
+            break
+        levels.append(bytes(mm.data))
+    if not levels:
+        msg = f"Mip level {first} could not be decoded to RGBA"
+        raise ValueError(msg)
+    # A level that did not decode ends the chain
+    mip_count: int = len(mipmaps) if first + len(levels) == stop else first + len(levels)
+    return levels, mip_count, first
+
+
 def _parse_texture_data(
     name: str,
     tex_bytes: bytes,
     restype,
+    base_level: int = 0,
+    stop_level: int | None = None,
 ) -> tuple[str, IntermediateTexture | None, str | None]:
     """Parse TPC bytes into intermediate texture data.
+
+    Only the mip levels [base_level, stop_level) of TPC and DDS textures are decoded.
     
     Returns:
     -------
@@ -203,21 +391,19 @@ def _parse_texture_data(
                 alphamean = getattr(txi_features, "alphamean", None) if txi_features is not None else None
                 alpha_cutoff = max(alpha_cutoff, float(alphamean) if alphamean is not None else 0.1)
 
-            if mm.tpc_format != TPCTextureFormat.RGBA:
-                tpc.convert(TPCTextureFormat.RGBA)
-                mm = tpc.get(0, 0)
-
-            rgba_data = bytes(mm.data)
+            levels, mipmap_count, first = _rgba_mip_levels(tpc, base_level, stop_level)
             return (
                 name,
                 IntermediateTexture(
                     width=width,
                     height=height,
-                    rgba_data=rgba_data,
-                    mipmap_count=1,
+                    rgba_data=levels[0],
+                    mipmap_count=mipmap_count,
                     blend_mode=blend_mode,
                     alpha_cutoff=alpha_cutoff,
                     has_alpha=has_alpha,
+                    mip_data=b"".join(levels[1:]),
+                    base_level=first,
                 ),
                 None,
             )
@@ -244,26 +430,24 @@ def _parse_texture_data(
         # DDS (rare, but supported by Installation.TEXTURES_TYPES)
         if restype == ResourceType.DDS:
             from pykotor.resource.formats.tpc.io_dds import TPCDDSReader
-            from pykotor.resource.formats.tpc.tpc_data import TPCTextureFormat
 
             tpc_from_dds = TPCDDSReader(tex_bytes).load()
             mm = tpc_from_dds.get(0, 0)
             width = mm.width
             height = mm.height
-            if mm.tpc_format != TPCTextureFormat.RGBA:
-                tpc_from_dds.convert(TPCTextureFormat.RGBA)
-                mm = tpc_from_dds.get(0, 0)
-            rgba_data = bytes(mm.data)
+            levels, mipmap_count, first = _rgba_mip_levels(tpc_from_dds, base_level, stop_level)
             return (
                 name,
                 IntermediateTexture(
                     width=width,
                     height=height,
-                    rgba_data=rgba_data,
-                    mipmap_count=1,
+                    rgba_data=levels[0],
+                    mipmap_count=mipmap_count,
                     blend_mode=0,
                     alpha_cutoff=0.01,
                     has_alpha=True,
+                    mip_data=b"".join(levels[1:]),
+                    base_level=first,
                 ),
                 None,
             )
@@ -453,6 +637,16 @@ class AsyncResourceLoader:
     NOTE: This class does NOT use Installation directly. The caller provides
     loader functions that handle resource loading using whatever mechanism they want
     (Installation, HTInstallation, direct file access, etc.)
+    
+    Decoded pixels and mesh buffers come back in shared memory blocks from `buffer_pool`
+    (see pykotor.gl.scene.shared_buffers). Pass the pool to create_texture_from_intermediate /
+    create_model_from_intermediate, then call release_buffers() once the result was used or dropped.
+    
+    Results are also kept in a DecodedResourceCache (by default the one shared by the whole process, see
+    pykotor.extract.decoded_cache) keyed by resource location, so scenes in other windows showing the same
+    resources get them without reading or decoding them again. The cache keeps the worker's shared memory blocks
+    (from the process-wide pool, which every loader can map) and frees them when the entry is evicted; each result
+    handed out holds a lease on its entry until release_buffers() is called for it.
     """
     
     def __init__(
@@ -460,6 +654,10 @@ class AsyncResourceLoader:
         texture_location_resolver: Callable[[str], tuple[str, int, int, int] | None] | None = None,
         model_location_resolver: Callable[[str], tuple[tuple[str, int, int] | None, tuple[str, int, int] | None]] | None = None,
         max_workers: int | None = None,
+        *,
+        shared_buffers: bool = True,
+        cache: DecodedResourceCache | None = None,
+        share_decoded: bool = True,
     ):
         """Initialize the async loader with ProcessPoolExecutor.
         
@@ -468,9 +666,20 @@ class AsyncResourceLoader:
             texture_location_resolver: Function that resolves texture name to (filepath, offset, size) in MAIN process
             model_location_resolver: Function that resolves model name to ((mdl_path, offset, size), (mdx_path, offset, size)) in MAIN process
             max_workers: Max workers for process pool (default: CPU count)
+            shared_buffers: Return large buffers through shared memory instead of pickling them (if the platform supports it)
+            cache: Cache for decoded results (default: the process-wide cache)
+            share_decoded: Look up and store decoded results in `cache`; False decodes every request
         """
         self.texture_location_resolver = texture_location_resolver
         self.model_location_resolver = model_location_resolver
+        self.shared_buffers: bool = shared_buffers and shared_memory_available()
+        self.buffer_pool: SharedBufferPool | None = None
+        self.cache: DecodedResourceCache | None = (decoded_cache() if cache is None else cache) if share_decoded else None
+        # Cache leases of the results handed out, by id of the result (kept alive here), until they are released
+        self._result_leases: dict[int, tuple[IntermediateTexture | IntermediateModel, CacheLease]] = {}
+        self._result_leases_lock = threading.Lock()
+        # (width, height, mip count) of the textures decoded so far, by location, to size later leases exactly
+        self._texture_shapes: dict[ResourceLocation, tuple[int, int, int]] = {}
         
         cpu_count = multiprocessing.cpu_count()
         self.max_workers = max_workers or max(1, cpu_count // 2)
@@ -496,6 +705,9 @@ class AsyncResourceLoader:
                 mp_context=multiprocessing.get_context("spawn"),
             )
             self.logger.debug(f"Started ProcessPoolExecutor with {self.max_workers} workers for async IO")
+        if self.shared_buffers and self.buffer_pool is None:
+            # Cached results outlive this loader and are read by other loaders, so they go in the process-wide pool
+            self.buffer_pool = shared_buffer_pool() if self.cache is not None else SharedBufferPool()
     
     def shutdown(self, *, wait: bool = True):
         """Shutdown ProcessPoolExecutor and cleanup pending futures."""
@@ -515,17 +727,154 @@ class AsyncResourceLoader:
             self.process_pool = None
             self.logger.debug("Shutdown ProcessPoolExecutor")
         
+        with self._result_leases_lock:
+            leases: list[CacheLease] = [lease for _result, lease in self._result_leases.values()]
+            self._result_leases.clear()
+        for lease in leases:
+            lease.release()
+        
+        if self.buffer_pool is not None:
+            if self.cache is None:
+                self.buffer_pool.close()
+            self.buffer_pool = None
+        
         self.logger.debug("Async loader shutdown complete")
     
+    def release_buffers(self, intermediate: IntermediateTexture | IntermediateModel | None):
+        """Let go of a result once its GL objects were created (or it was dropped).
+
+        Cached results give back their cache lease; the others recycle their shared memory blocks.
+        """
+        with self._result_leases_lock:
+            held = self._result_leases.pop(id(intermediate), None)
+        if held is not None:
+            held[1].release()
+            return
+        _release_blocks(self.buffer_pool, intermediate)
+    
+    def _lease_result(self, lease: CacheLease) -> IntermediateTexture | IntermediateModel:
+        """Returns a cached result for one consumer, holding `lease` until release_buffers() is called with it."""
+        # Each consumer gets its own tuple (sharing the buffers), so its lease can be found by identity
+        intermediate: IntermediateTexture | IntermediateModel = lease.value._replace()
+        with self._result_leases_lock:
+            self._result_leases[id(intermediate)] = (intermediate, lease)
+        return intermediate
+    
+    def _cache_result(
+        self,
+        cache_key: Hashable,
+        intermediate: IntermediateTexture | IntermediateModel,
+    ) -> IntermediateTexture | IntermediateModel:
+        """Hand a worker result over to the cache, keeping its shared memory blocks; returns a leased result."""
+        assert self.cache is not None
+        buffers: SharedBufferPool | None = self.buffer_pool
+        lease: CacheLease = self.cache.acquire(
+            cache_key,
+            lambda: intermediate,
+            lambda value: intermediate_nbytes(value, buffers),
+            dispose=None if buffers is None else lambda value: _release_blocks(buffers, value),
+        )
+        if lease.value is not intermediate:
+            # Another request decoded the same resource first; use its copy
+            _release_blocks(buffers, intermediate)
+        return self._lease_result(lease)
+    
+    def _lease(self, nbytes: int) -> SharedBlockLease | None:
+        if self.buffer_pool is None:
+            return None
+        return self.buffer_pool.acquire(nbytes + _LEASE_SLACK)
+    
+    def _forward_result(
+        self,
+        name: str,
+        worker_future: Future,
+        result_future: Future,
+        lease: SharedBlockLease | None,
+        cache_key: Hashable | None = None,
+    ):
+        """Pass a worker result on to the caller's future, recycling the lease if the result does not use it.
+
+        Results with a cache key are handed over to the cache as they are (still in shared memory), and passed on
+        with a lease on their cache entry.
+        """
+        try:
+            result = worker_future.result()
+        except Exception as e:  # noqa: BLE001
+            result = (name, None, f"IO+parse error: {e!s}")
+        
+        if lease is not None and lease.name not in shared_blocks(result[1]):
+            self._release_lease(lease)
+        
+        if cache_key is not None and self.cache is not None and result[1] is not None:
+            try:
+                result = (result[0], self._cache_result(cache_key, result[1]), result[2])
+            except Exception:  # noqa: BLE001
+                self.logger.exception(f"Could not cache the decoded resource '{name}'")
+        
+        if not result_future.cancelled():
+            try:
+                result_future.set_result(result)
+            except InvalidStateError:
+                self.logger.debug(f"Dropping the result for '{name}', its future was cancelled or set in the meantime")
+            else:
+                return
+        self.release_buffers(result[1])
+    
+    def _texture_lease_size(
+        self,
+        location: ResourceLocation,
+        base_level: int,
+        stop_level: int | None,
+    ) -> int:
+        """Returns the RGBA bytes the levels [base_level, stop_level) of a texture decode to, or an upper estimate.
+
+        Once a texture was decoded its mip chain is known and the size is exact. Before that, the stored size is
+        scaled by the worst-case expansion and by the quarter each level drops; a texture with a shorter chain than
+        `base_level` assumes may not fit, and then comes back as bytes (see `SharedBlockWriter.write`).
+        """
+        from pykotor.gl.scene.texture_streaming import mip_chain
+
+        shape: tuple[int, int, int] | None = self._texture_shapes.get(location)
+        if shape is None:
+            return (location.size * _TEXTURE_EXPANSION) >> (2 * max(0, base_level))
+        levels = mip_chain(*shape)
+        first: int = min(max(0, base_level), len(levels) - 1)
+        stop: int = len(levels) if stop_level is None else min(max(first + 1, stop_level), len(levels))
+        return sum(level.nbytes for level in levels[first:stop])
+
+    def _remember_texture_shape(
+        self,
+        location: ResourceLocation,
+        worker_future: Future,
+    ):
+        if worker_future.cancelled() or worker_future.exception() is not None:
+            return
+        texture: IntermediateTexture | None = worker_future.result()[1]
+        if texture is not None:
+            self._texture_shapes[location] = (texture.width, texture.height, texture.mipmap_count)
+
+    def _release_lease(self, lease: SharedBlockLease):
+        if self.buffer_pool is not None:
+            self.buffer_pool.release(lease.name)
+    
     def load_texture_async(
         self,
         name: str,
+        *,
+        base_level: int = 0,
+        stop_level: int | None = None,
     ) -> Future[tuple[str, IntermediateTexture | None, str | None]]:
         """Load and parse texture asynchronously.
         
         Main process: Resolve file location
         Child process: Do raw file IO + parsing
         
+        Args:
+        ----
+            name: Texture name
+            base_level: Largest mip level to decode (clamped to the texture's chain); larger levels are skipped
+            stop_level: Mip level to stop decoding at (default: the end of the chain)
+        
         Returns:
         -------
             Future that resolves to (name, intermediate_texture, error)
@@ -541,6 +890,7 @@ class AsyncResourceLoader:
         
         # Resolve file location in main process
         result_future: Future = Future()
+        lease: SharedBlockLease | None = None
         
         try:
             location = self.texture_location_resolver(name)
@@ -550,26 +900,26 @@ class AsyncResourceLoader:
                 result_future.set_result((name, None, f"Texture '{name}' not found"))
             else:
                 filepath, offset, size, restype_id = location
-                # Submit IO + parsing to child process
+                resource_location = ResourceLocation(filepath, offset, size)
+                cache_key: Hashable | None = None
+                if self.cache is not None:
+                    cache_key = _texture_cache_key(resource_location, base_level, stop_level)
+                    cached: CacheLease | None = self.cache.lease(cache_key)
+                    if cached is not None:
+                        result_future.set_result((name, self._lease_result(cached), None))
+                        self.pending_textures[name] = result_future
+                        return result_future
+                # Lease a block big enough for the requested levels, then submit IO + parsing to child process
+                lease = self._lease(self._texture_lease_size(resource_location, base_level, stop_level))
                 assert self.process_pool is not None
-                io_parse_future = self.process_pool.submit(_load_and_parse_texture, name, restype_id, filepath, offset, size)
-                    
-                def on_complete(pf: Future):
-                    # Check if result_future was cancelled before trying to set result
-                    if result_future.cancelled():
-                        return
-                    try:
-                        result_future.set_result(pf.result())
-                    except Exception as e:  # noqa: BLE001
-                        if not result_future.cancelled():
-                            try:
-                                result_future.set_result((name, None, f"IO+parse error: {e!s}"))
-                            except Exception:  # noqa: BLE001, S110
-                                pass  # Future was already cancelled or set
-                    
-                io_parse_future.add_done_callback(on_complete)
+                io_parse_future = self.process_pool.submit(_load_and_parse_texture, name, restype_id, filepath, offset, size, lease, base_level, stop_level)
+                # Callbacks run in order, so the chain is known by the time the caller sees the result
+                io_parse_future.add_done_callback(lambda pf: self._remember_texture_shape(resource_location, pf))
+                io_parse_future.add_done_callback(lambda pf: self._forward_result(name, pf, result_future, lease, cache_key))
         except Exception as e:  # noqa: BLE001
             self.logger.error(f"Resolution exception for texture '{name}': {e!s}")
+            if lease is not None:
+                self._release_lease(lease)
             if not result_future.cancelled():
                 result_future.set_result((name, None, f"Resolution error: {e!s}"))
         
@@ -600,6 +950,7 @@ class AsyncResourceLoader:
         
         # Resolve file locations in main process
         result_future: Future = Future()
+        lease: SharedBlockLease | None = None
         
         try:
             mdl_loc, mdx_loc = self.model_location_resolver(name)
@@ -610,6 +961,19 @@ class AsyncResourceLoader:
             else:
                 mdl_filepath, mdl_offset, mdl_size = mdl_loc
                 mdx_filepath, mdx_offset, mdx_size = mdx_loc
+                cache_key: Hashable | None = None
+                if self.cache is not None:
+                    cache_key = _model_cache_key(
+                        ResourceLocation(mdl_filepath, mdl_offset, mdl_size),
+                        ResourceLocation(mdx_filepath, mdx_offset, mdx_size),
+                    )
+                    cached: CacheLease | None = self.cache.lease(cache_key)
+                    if cached is not None:
+                        result_future.set_result((name, self._lease_result(cached), None))
+                        self.pending_models[name] = result_future
+                        return result_future
+                # Mesh buffers are slices of the MDL/MDX data, so their combined size bounds the lease
+                lease = self._lease(mdl_size + mdx_size)
                 # Submit IO + parsing to child process
                 assert self.process_pool is not None
                 io_parse_future = self.process_pool.submit(
@@ -617,58 +981,135 @@ class AsyncResourceLoader:
                     name,
                     mdl_filepath, mdl_offset, mdl_size,
                     mdx_filepath, mdx_offset, mdx_size,
+                    lease,
                 )
-                    
-                def on_complete(pf: Future):
-                    # Check if result_future was cancelled before trying to set result
-                    if result_future.cancelled():
-                        return
-                    try:
-                        result_future.set_result(pf.result())
-                    except Exception as e:  # noqa: BLE001
-                        if not result_future.cancelled():
-                            try:
-                                result_future.set_result((name, None, f"IO+parse error: {e!s}"))
-                            except Exception:  # noqa: BLE001, S110
-                                pass  # Future was already cancelled or set
-                io_parse_future.add_done_callback(on_complete)
+                io_parse_future.add_done_callback(lambda pf: self._forward_result(name, pf, result_future, lease, cache_key))
         except Exception as e:  # noqa: BLE001
             self.logger.error(f"Resolution exception for model '{name}': {e!s}")
+            if lease is not None:
+                self._release_lease(lease)
             if not result_future.cancelled():
                 try:
                     result_future.set_result((name, None, f"Resolution error: {e!s}"))
-                except Exception:  # noqa: BLE001, S110
-                    pass  # Future was already cancelled or set
+                except InvalidStateError:
+                    self.logger.debug(f"Not reporting the resolution error for model '{name}', its future was already cancelled or set")
         
         self.pending_models[name] = result_future
         return result_future
 
 
+def acquire_intermediate_model(
+    name: str,
+    mdl_location: ResourceLocation,
+    mdx_location: ResourceLocation,
+    cache: DecodedResourceCache | None = None,
+) -> CacheLease[IntermediateModel]:
+    """Lease the render-ready model `name` stored at `mdl_location`/`mdx_location`, parsing it here if not cached.
+
+    For synchronous loads. Entries are shared with AsyncResourceLoader.load_model_async, so the buffers of a
+    leased model may be in shared memory; read them with the process-wide pool (`shared_buffer_pool()`).
+    """
+    cache = decoded_cache() if cache is None else cache
+
+    def parse() -> IntermediateModel:
+        _name, model, error = _parse_model_data(name, mdl_location.read(), mdx_location.read())
+        if model is None:
+            raise ValueError(error)
+        return model
+
+    return cache.acquire(_model_cache_key(mdl_location, mdx_location), parse, intermediate_nbytes)
+
+
 # ===== OpenGL Object Creation (Main Process Only) =====
 def create_texture_from_intermediate(
     intermediate: IntermediateTexture,
+    buffers: SharedBufferPool | None = None,
 ) -> Any:  # Returns Texture but avoid circular import
-    """Create OpenGL Texture from intermediate data in main process."""
+    """Create OpenGL Texture from intermediate data in main process.
+    
+    Pixels in shared memory are uploaded straight from `buffers`' mapping; release the result afterwards (see
+    AsyncResourceLoader.release_buffers). Textures with a mip chain are created with only their smallest levels; the rest is streamed in by the scene.
+    """
     from pykotor.gl.shader.texture import Texture
     
-    tex = Texture.from_rgba(
-        intermediate.width,
-        intermediate.height,
-        intermediate.rgba_data,
-    )
+    rgba_data = _resolve_buffer(intermediate.rgba_data, buffers)
+    mip_data = _resolve_buffer(intermediate.mip_data, buffers)
+    levels: list[bytes | memoryview] = _texture_levels(intermediate, rgba_data, mip_data)
+    try:
+        if intermediate.mipmap_count > 1:
+            tex = Texture.from_rgba_mips(
+                intermediate.width,
+                intermediate.height,
+                levels,
+                intermediate.mipmap_count,
+                base_level=intermediate.base_level,
+            )
+        else:
+            tex = Texture.from_rgba(
+                intermediate.width,
+                intermediate.height,
+                rgba_data,  # pyright: ignore[reportArgumentType]
+            )
+    finally:
+        _release_views(levels, rgba_data, mip_data)
     tex.blend_mode = int(getattr(intermediate, "blend_mode", 0))
     tex.alpha_cutoff = float(getattr(intermediate, "alpha_cutoff", 0.0))
     tex.has_alpha = bool(getattr(intermediate, "has_alpha", True))
     return tex
 
 
+def add_texture_levels(
+    texture: Any,  # Texture but avoid circular import
+    intermediate: IntermediateTexture,
+    buffers: SharedBufferPool | None = None,
+):
+    """Hand the mip levels of a fetch (see `load_texture_async`'s `base_level`) to an existing streamed texture.
+
+    The texture keeps a copy of each level until it is uploaded, so the result can be released at once.
+    """
+    rgba_data = _resolve_buffer(intermediate.rgba_data, buffers)
+    mip_data = _resolve_buffer(intermediate.mip_data, buffers)
+    levels: list[bytes | memoryview] = _texture_levels(intermediate, rgba_data, mip_data)
+    try:
+        texture.add_levels(intermediate.base_level, levels)
+    finally:
+        _release_views(levels, rgba_data, mip_data)
+
+
+def _texture_levels(
+    intermediate: IntermediateTexture,
+    rgba_data: bytes | memoryview,
+    mip_data: bytes | memoryview,
+) -> list[bytes | memoryview]:
+    """Split the decoded levels of a texture into one buffer per level, starting at its base level."""
+    from pykotor.gl.scene.texture_streaming import mip_chain
+
+    levels: list[bytes | memoryview] = [rgba_data]
+    offset: int = 0
+    for mip in mip_chain(intermediate.width, intermediate.height, intermediate.mipmap_count)[intermediate.base_level + 1 :]:
+        if offset + mip.nbytes > len(mip_data):
+            break
+        levels.append(mip_data[offset : offset + mip.nbytes])
+        offset += mip.nbytes
+    return levels
+
+
+def _release_views(*buffers: bytes | memoryview | list[bytes | memoryview]):
+    for data in buffers:
+        for view in data if isinstance(data, list) else (data,):
+            if isinstance(view, memoryview):
+                view.release()
+
+
 def create_model_from_intermediate(
     scene: Any,  # Scene type but avoid circular import
     intermediate: IntermediateModel,
+    buffers: SharedBufferPool | None = None,
 ) -> Any:  # Returns Model but avoid circular import
     """Create OpenGL Model from intermediate data in main process.
     
     MUST be called in main process with active OpenGL context.
+    Mesh buffers in shared memory are read from `buffers`' mapping; release the result afterwards.
     """
     import glm
 
@@ -691,8 +1132,8 @@ def create_model_from_intermediate(
                 node,
                 imesh.texture,
                 imesh.lightmap,
-                bytearray(imesh.vertex_data),
-                bytearray(imesh.element_data),
+                _copy_buffer(imesh.vertex_data),
+                _copy_buffer(imesh.element_data),
                 imesh.block_size,
                 imesh.data_bitflags,
                 imesh.vertex_offset,
@@ -707,6 +1148,14 @@ def create_model_from_intermediate(
         
         return node
     
-    root_node = build_node(None, intermediate.root)
-    return Model(scene, root_node)
+    def _copy_buffer(data: SharedOrBytes) -> bytearray:
+        # Meshes keep their vertex data for picking and bounds, so this is the one copy out of shared memory
+        resolved = _resolve_buffer(data, buffers)
+        try:
+            return bytearray(resolved)
+        finally:
+            if isinstance(resolved, memoryview):
+                resolved.release()
+    
+    return Model(scene, build_node(None, intermediate.root))
 
@@ -0,0 +1,279 @@
+"""Material-sorted draw lists for the scene's render objects.
+
+Drawing render objects one at a time walks every model's node tree each frame, multiplying transforms on the way,
+and rebinds the diffuse texture, lightmap and blend state for every mesh even when consecutive meshes share them.
+:class:`DrawList` flattens each object (its model's meshes and its child objects) into draw items with precomputed
+world transforms, and groups the items of all visible objects into batches that share a diffuse texture and
+lightmap, so a frame binds each material once and then only sets the "model" matrix per mesh.
+
+The node-to-model transforms of each model's meshes are stacked into one array the first time the model is drawn,
+so flattening an object is a single batched matrix product (see :mod:`pykotor.gl.native.transforms`).
+
+Flattened items are cached per object and only rebuilt when the object moved, its model finished loading (the
+placeholder returned by :meth:`SceneBase.model` was replaced) or its override texture changed. The batches
+themselves are reused as long as the same set of objects is visible and none of them was rebuilt.
+
+:meth:`DrawList.texture_distances` reports how close the camera is to the nearest mesh using each texture, which
+drives mip streaming (see :mod:`pykotor.gl.scene.texture_streaming`).
+"""
+
+from __future__ import annotations
+
+import weakref
+
+from typing import TYPE_CHECKING, Any, Collection, Hashable, NamedTuple, Sequence
+
+import numpy as np
+
+from pykotor.gl.native.transforms import matrix_array
+
+if TYPE_CHECKING:
+    from pykotor.gl.models.mdl import Mesh, Model, Node
+    from pykotor.gl.scene import Scene
+    from pykotor.gl.scene.render_object import RenderObject
+    from pykotor.gl.shader import Shader
+
+ADDITIVE_BLEND_MODE = 1
+_IDENTITY = np.identity(4)
+
+
+class DrawItem(NamedTuple):
+    """One mesh to draw, with its world transform (a column-major float32 array) and the textures it samples."""
+
+    mesh: Mesh
+    transform: np.ndarray
+    texture: str
+    lightmap: str
+
+
+class DrawBatch(NamedTuple):
+    """Draw items sharing a diffuse texture and lightmap, drawn after a single material bind."""
+
+    texture: str
+    lightmap: str
+    items: list[DrawItem]
+
+
+class _Entry:
+    """Flattened draw items of one render object and the state they were built from."""
+
+    __slots__ = ("items", "key", "obj")
+
+    def __init__(self, obj: RenderObject, key: tuple[Any, ...], items: list[DrawItem]):
+        self.obj: RenderObject = obj
+        self.key: tuple[Any, ...] = key
+        self.items: list[DrawItem] = items
+
+
+class DrawList:
+    """Per-frame list of material batches for a set of render objects.
+
+    Attributes:
+    ----------
+        batches: The batches built by the last update, sorted by texture and lightmap
+        rebuilt: Number of objects whose draw items were rebuilt by the last update
+    """
+
+    def __init__(self):
+        self.batches: list[DrawBatch] = []
+        self.rebuilt: int = 0
+        self._entries: dict[int, _Entry] = {}
+        self._visible_ids: list[int] = []
+        self._state: Hashable = None
+        self._spheres: dict[int, np.ndarray] = {}
+        self._model_meshes: weakref.WeakKeyDictionary[Model, tuple[list[Mesh], np.ndarray]] = weakref.WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        return sum(len(batch.items) for batch in self.batches)
+
+    def clear(self):
+        """Drop every cached entry, forcing the next update to rebuild all draw items."""
+        self._entries.clear()
+        self._visible_ids = []
+        self.batches = []
+        self._spheres.clear()
+
+    def update(
+        self,
+        objects: Sequence[RenderObject],
+        visible: Sequence[bool] | None,
+        scene: Scene,
+        state: Hashable = None,
+    ):
+        """Rebuild the batches for the visible objects.
+
+        Args:
+        ----
+            objects: The objects to draw
+            visible: Per-object culling results, parallel to `objects`, or None to draw every object
+            scene: Scene providing models and the hidden-object filter
+            state: Scene settings the draw items depend on (e.g. the hide flags); a change rebuilds everything
+        """
+        if state != self._state:
+            self.clear()
+            self._state = state
+
+        entries: dict[int, _Entry] = {}
+        visible_ids: list[int] = []
+        self.rebuilt = 0
+        for index, obj in enumerate(objects):
+            if visible is not None and not visible[index]:
+                continue
+            if scene.should_hide_obj(obj):
+                continue
+            obj_id: int = id(obj)
+            key: tuple[Any, ...] = self._entry_key(obj, scene)
+            entry: _Entry | None = self._entries.get(obj_id)
+            if entry is None or entry.obj is not obj or entry.key != key:
+                entry = _Entry(obj, key, self._flatten(obj, scene, _IDENTITY, []))
+                self.rebuilt += 1
+            entries[obj_id] = entry
+            visible_ids.append(obj_id)
+
+        # Entries of objects culled this frame are kept, so panning the camera back does not rebuild them.
+        # Entries of objects that left the list are dropped.
+        if len(entries) != len(objects):
+            for obj in objects:
+                obj_id = id(obj)
+                entry = self._entries.get(obj_id)
+                if obj_id not in entries and entry is not None and entry.obj is obj:
+                    entries[obj_id] = entry
+        self._entries = entries
+
+        if not self.rebuilt and visible_ids == self._visible_ids:
+            return
+        self._visible_ids = visible_ids
+
+        items: list[DrawItem] = [item for obj_id in visible_ids for item in self._entries[obj_id].items]
+        items.sort(key=lambda item: (item.texture, item.lightmap))
+        batches: list[DrawBatch] = []
+        for item in items:
+            if batches and batches[-1].texture == item.texture and batches[-1].lightmap == item.lightmap:
+                batches[-1].items.append(item)
+            else:
+                batches.append(DrawBatch(item.texture, item.lightmap, [item]))
+        self.batches = batches
+        self._spheres.clear()
+
+    def texture_distances(
+        self,
+        eye: tuple[float, float, float],
+        names: Collection[str],
+    ) -> list[tuple[str, float]]:
+        """Returns, for each of `names` (lowercase) used by a batch, the distance from `eye` to its nearest mesh.
+
+        Meshes are bounded by spheres around their node origins; the distance is 0 when `eye` is inside one.
+        """
+        if not names or not self.batches:
+            return []
+        point = np.array(eye, dtype=np.float32)
+        nearest: dict[str, float] = {}
+        for index, batch in enumerate(self.batches):
+            used: list[str] = [name for name in (batch.texture.lower(), batch.lightmap.lower()) if name in names]
+            if not used:
+                continue
+            spheres: np.ndarray | None = self._spheres.get(index)
+            if spheres is None:
+                spheres = np.empty((len(batch.items), 4), dtype=np.float32)
+                spheres[:, 0:3] = [item.transform[3, 0:3] for item in batch.items]
+                spheres[:, 3] = [item.mesh.bounding_radius() for item in batch.items]
+                self._spheres[index] = spheres
+            offsets: np.ndarray = spheres[:, 0:3] - point
+            distance: float = max(0.0, float((np.sqrt((offsets * offsets).sum(axis=1)) - spheres[:, 3]).min()))
+            for name in used:
+                nearest[name] = min(distance, nearest.get(name, distance))
+        return list(nearest.items())
+
+    def draw(
+        self,
+        shader: Shader,
+        scene: Scene,
+    ):
+        """Draw every batch, binding each material once. Additively blended batches are drawn last."""
+        if not self.batches:
+            return
+        from pykotor.gl.models.mdl import Mesh
+
+        shader.use()
+        deferred: list[tuple[DrawBatch, Any, Any]] = []
+        for batch in self.batches:
+            diffuse_tex = scene.texture(batch.texture)
+            lightmap_tex = scene.texture(batch.lightmap, lightmap=True)
+            if int(getattr(diffuse_tex, "blend_mode", 0)) == ADDITIVE_BLEND_MODE:
+                deferred.append((batch, diffuse_tex, lightmap_tex))
+                continue
+            self._draw_batch(shader, batch, diffuse_tex, lightmap_tex)
+        for batch, diffuse_tex, lightmap_tex in deferred:
+            self._draw_batch(shader, batch, diffuse_tex, lightmap_tex)
+        Mesh.reset_material(shader)
+
+    @staticmethod
+    def _draw_batch(
+        shader: Shader,
+        batch: DrawBatch,
+        diffuse_tex: Any,
+        lightmap_tex: Any,
+    ):
+        batch.items[0].mesh.bind_material(shader, diffuse_tex, lightmap_tex)
+        for item in batch.items:
+            shader.set_matrix4("model", item.transform)
+            item.mesh.draw_elements()
+
+    def _entry_key(
+        self,
+        obj: RenderObject,
+        scene: Scene,
+    ) -> tuple[Any, ...]:
+        """Everything an object's draw items were built from.
+
+        Transforms are replaced rather than mutated when objects move, so an unchanged object compares by identity.
+        Holding the objects (not their ids) keeps a new transform or model from reusing the id of a freed one.
+        """
+        key: list[Any] = [obj.transform(), scene.model(obj.model), obj.override_texture]
+        for child in obj.children:
+            key.append(self._entry_key(child, scene))
+        return tuple(key)
+
+    def _flatten(
+        self,
+        obj: RenderObject,
+        scene: Scene,
+        transform: np.ndarray,
+        items: list[DrawItem],
+    ) -> list[DrawItem]:
+        obj_transform: np.ndarray = matrix_array(obj.transform()) @ transform
+        meshes, node_transforms = self._meshes(scene.model(obj.model))
+        if meshes:
+            world: np.ndarray = (node_transforms @ obj_transform).astype(np.float32)
+            override_texture: str | None = obj.override_texture
+            items.extend(DrawItem(mesh, world[index], override_texture or mesh.texture, mesh.lightmap) for index, mesh in enumerate(meshes))
+        for child in obj.children:
+            if not scene.should_hide_obj(child):
+                self._flatten(child, scene, obj_transform, items)
+        return items
+
+    def _meshes(self, model: Model) -> tuple[list[Mesh], np.ndarray]:
+        """Returns a model's rendered meshes and their (K, 4, 4) node-to-model transforms, computed once per model."""
+        cached: tuple[list[Mesh], np.ndarray] | None = self._model_meshes.get(model)
+        if cached is None:
+            meshes: list[Mesh] = []
+            transforms: list[np.ndarray] = []
+            self._collect_meshes(model.root, _IDENTITY, meshes, transforms)
+            cached = (meshes, np.array(transforms).reshape(-1, 4, 4))
+            self._model_meshes[model] = cached
+        return cached
+
+    def _collect_meshes(
+        self,
+        node: Node,
+        transform: np.ndarray,
+        meshes: list[Mesh],
+        transforms: list[np.ndarray],
+    ):
+        transform = matrix_array(node._transform) @ transform  # noqa: SLF001
+        mesh: Mesh | None = node.mesh
+        if mesh and node.render:
+            meshes.append(mesh)
+            transforms.append(transform)
+        for child in node.children:
+            self._collect_meshes(child, transform, meshes, transforms)
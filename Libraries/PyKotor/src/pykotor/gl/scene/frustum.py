@@ -10,15 +10,15 @@ Reference implementations:
 
 from __future__ import annotations
 
-import math
-
 from enum import IntEnum
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from pykotor.gl.glm_compat import vec3, vec4
+from pykotor.gl.native.transforms import frustum_planes, matrix_array
 
 if TYPE_CHECKING:
-    from pykotor.gl.glm_compat import mat4
     from pykotor.gl.scene import Camera
 
 
@@ -61,107 +61,16 @@ class Frustum:
         Args:
             camera: The camera to extract frustum from.
         """
-        view: mat4 = camera.view()
-        proj: mat4 = camera.projection()
-        vp: mat4 = proj * view
-
-        # Check if matrices changed (simple hash check)
-        vp_hash = hash(
-            (
-                vp[0][0],
-                vp[0][1],
-                vp[0][2],
-                vp[0][3],
-                vp[1][0],
-                vp[1][1],
-                vp[1][2],
-                vp[1][3],
-                vp[2][0],
-                vp[2][1],
-                vp[2][2],
-                vp[2][3],
-                vp[3][0],
-                vp[3][1],
-                vp[3][2],
-                vp[3][3],
-            )
-        )
+        view_projection: np.ndarray = matrix_array(camera.view()) @ matrix_array(camera.projection())
+
+        # Skip the extraction when the camera did not move
+        vp_hash = hash(view_projection.tobytes())
         if vp_hash == self._cached_vp_hash:
             return
         self._cached_vp_hash = vp_hash
 
-        # Extract planes using Gribb/Hartmann method
-        # Left plane: row3 + row0
-        self.planes[FrustumPlane.LEFT] = vec4(
-            vp[0][3] + vp[0][0],
-            vp[1][3] + vp[1][0],
-            vp[2][3] + vp[2][0],
-            vp[3][3] + vp[3][0],
-        )
-
-        # Right plane: row3 - row0
-        self.planes[FrustumPlane.RIGHT] = vec4(
-            vp[0][3] - vp[0][0],
-            vp[1][3] - vp[1][0],
-            vp[2][3] - vp[2][0],
-            vp[3][3] - vp[3][0],
-        )
-
-        # Bottom plane: row3 + row1
-        self.planes[FrustumPlane.BOTTOM] = vec4(
-            vp[0][3] + vp[0][1],
-            vp[1][3] + vp[1][1],
-            vp[2][3] + vp[2][1],
-            vp[3][3] + vp[3][1],
-        )
-
-        # Top plane: row3 - row1
-        self.planes[FrustumPlane.TOP] = vec4(
-            vp[0][3] - vp[0][1],
-            vp[1][3] - vp[1][1],
-            vp[2][3] - vp[2][1],
-            vp[3][3] - vp[3][1],
-        )
-
-        # Near plane: row3 + row2
-        self.planes[FrustumPlane.NEAR] = vec4(
-            vp[0][3] + vp[0][2],
-            vp[1][3] + vp[1][2],
-            vp[2][3] + vp[2][2],
-            vp[3][3] + vp[3][2],
-        )
-
-        # Far plane: row3 - row2
-        self.planes[FrustumPlane.FAR] = vec4(
-            vp[0][3] - vp[0][2],
-            vp[1][3] - vp[1][2],
-            vp[2][3] - vp[2][2],
-            vp[3][3] - vp[3][2],
-        )
-
-        # Normalize all planes
-        for i in range(6):
-            self._normalize_plane(i)
-
-    def _normalize_plane(self, index: int) -> None:
-        """Normalize a frustum plane.
-
-        Args:
-            index: Index of the plane to normalize.
-        """
-        plane = self.planes[index]
-        length = math.sqrt(plane.x * plane.x + plane.y * plane.y + plane.z * plane.z)
-        if length > 1e-10:  # Use smaller epsilon for better precision
-            inv_length = 1.0 / length
-            self.planes[index] = vec4(
-                plane.x * inv_length,
-                plane.y * inv_length,
-                plane.z * inv_length,
-                plane.w * inv_length,
-            )
-        else:
-            # Degenerate plane - set to a default that won't cull anything
-            self.planes[index] = vec4(0.0, 0.0, 1.0, 1e10)
+        # Extract and normalize all six planes at once (Gribb/Hartmann: row3 +/- row0, row1, row2)
+        self.planes = [vec4(*plane) for plane in frustum_planes(view_projection).tolist()]
 
     def point_in_frustum(self, point: vec3) -> bool:
         """Test if a point is inside the frustum.
@@ -229,6 +138,44 @@ class Frustum:
 
         return True
 
+    def plane_array(self) -> np.ndarray:
+        """Get the frustum planes as a (6, 4) array of (nx, ny, nz, d) rows for batched tests."""
+        return np.array([(plane.x, plane.y, plane.z, plane.w) for plane in self.planes], dtype=np.float64)
+
+    def spheres_in_frustum(
+        self,
+        centers: np.ndarray,
+        radii: np.ndarray,
+    ) -> np.ndarray:
+        """Batched sphere_in_frustum: test many bounding spheres against all six planes at once.
+
+        Args:
+            centers: (N, 3) array of sphere centers.
+            radii: (N,) array of sphere radii.
+
+        Returns:
+            (N,) boolean array, True where the sphere is at least partially inside the frustum.
+        """
+        planes = self.plane_array()
+        # Plane-major (6, N) distances keep the reduction over contiguous rows
+        distances = planes[:, :3] @ np.asarray(centers).T
+        distances += planes[:, 3:4]
+        return distances.min(axis=0) >= -np.asarray(radii)
+
+    def aabbs_in_frustum(
+        self,
+        min_points: np.ndarray,
+        max_points: np.ndarray,
+    ) -> np.ndarray:
+        """Batched aabb_in_frustum for (N, 3) arrays of box corners; returns an (N,) boolean array."""
+        planes = self.plane_array()
+        # Distance of each box's positive vertex: center distance plus the extent projected on the normal
+        centers = (np.asarray(min_points) + max_points).T / 2.0
+        extents = (np.asarray(max_points) - min_points).T / 2.0
+        distances = planes[:, :3] @ centers + np.abs(planes[:, :3]) @ extents
+        distances += planes[:, 3:4]
+        return distances.min(axis=0) >= 0
+
     def sphere_in_frustum_distance(self, center: vec3, radius: float) -> float:
         """Get the minimum distance from sphere to any frustum plane.
 
@@ -280,6 +227,17 @@ class CullingStats:
         else:
             self.culled_objects += 1
 
+    def record_batch(self, *, visible: int, culled: int) -> None:
+        """Record the visibility results of many objects at once.
+
+        Args:
+            visible: Number of visible objects.
+            culled: Number of culled objects.
+        """
+        self.total_objects += visible + culled
+        self.visible_objects += visible
+        self.culled_objects += culled
+
     def end_frame(self) -> None:
         """Mark end of frame for statistics."""
         self.frame_count += 1
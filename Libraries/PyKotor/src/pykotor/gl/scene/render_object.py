@@ -18,6 +18,7 @@ from pykotor.gl.glm_compat import (
 from pykotor.gl.models.mdl import Cube, Empty
 
 if TYPE_CHECKING:
+    from pykotor.extract.file import ResourceIdentifier
     from pykotor.gl.models.mdl import Boundary
     from pykotor.gl.scene.scene import Scene
 
@@ -27,7 +28,8 @@ class RenderObject:
 
     Performance optimization: Bounding sphere radius and center are cached to avoid
     expensive recalculation during frustum culling. The cache is invalidated when
-    position changes or cube is reset.
+    position changes or cube is reset, and the scene's CullingIndex (if any) is told
+    through `_bounds_listener` so it only refreshes objects that actually changed.
 
     Reference: Standard game engine practice (Unity BoundingSphere, UE4 FBoundingSphere)
     """
@@ -42,10 +44,12 @@ class RenderObject:
         "_boundary",
         "gen_boundary",
         "data",
+        "identifier",
         "override_texture",
         "_cached_radius",
         "_cached_center",
         "_bounds_dirty",
+        "_bounds_listener",
     )
 
     def __init__(
@@ -67,12 +71,15 @@ class RenderObject:
         self._boundary: Boundary | Empty | None = None
         self.gen_boundary: Callable[[], Boundary] | None = gen_boundary
         self.data: Any = data
+        # The blueprint `data` was built from, so an edit to it can be told apart from a move (set by SceneCache)
+        self.identifier: ResourceIdentifier | None = None
         self.override_texture: str | None = override_texture
 
         # Cached bounding sphere for frustum culling
         self._cached_radius: float = -1.0  # -1 means not computed
         self._cached_center: vec3 | None = None
         self._bounds_dirty: bool = True
+        self._bounds_listener: Callable[[RenderObject], None] | None = None
 
         self._recalc_transform()
 
@@ -90,7 +97,7 @@ class RenderObject:
         perspective = vec4()
         decompose(transform, scale, rotation, self._position, skew, perspective)  # pyright: ignore[reportArgumentType, reportCallIssue]
         self._rotation = eulerAngles(rotation)
-        self._bounds_dirty = True
+        self._bounds_changed()
 
     def _recalc_transform(self):
         self._transform = mat4() * translate(self._position)
@@ -110,7 +117,7 @@ class RenderObject:
 
         self._position = vec3(x, y, z)
         self._recalc_transform()
-        self._bounds_dirty = True
+        self._bounds_changed()
 
     def rotation(self) -> vec3:
         return copy(self._rotation)
@@ -126,13 +133,18 @@ class RenderObject:
 
         self._rotation = vec3(x, y, z)
         self._recalc_transform()
+        self._bounds_changed()
+
+    def _bounds_changed(self):
         self._bounds_dirty = True
+        if self._bounds_listener is not None:
+            self._bounds_listener(self)
 
     def reset_cube(self):
         self._cube = None
-        self._bounds_dirty = True
         self._cached_radius = -1.0
         self._cached_center = None
+        self._bounds_changed()
 
     def cube(
         self,
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TypeVar, cast
 
+import numpy as np
+
 from pykotor.common.module import Module
 from pykotor.extract.installation import Installation, SearchLocation
 from pykotor.gl.compat import (
@@ -26,8 +28,11 @@ from pykotor.gl.compat import (
     glEnable,
     glReadPixels,
 )
-from pykotor.gl.glm_compat import mat4, vec3, vec4, unProject
+from pykotor.gl.glm_compat import mat4, vec3, vec4
+from pykotor.gl.native.transforms import matrix_array, unproject
 from pykotor.gl.models.mdl import Model
+from pykotor.gl.scene.culling import CullingIndex
+from pykotor.gl.scene.draw_list import DrawList
 from pykotor.gl.scene.frustum import CullingStats, Frustum
 from pykotor.gl.scene.scene_base import RenderObject, SceneBase
 from pykotor.gl.scene.scene_cache import SceneCache
@@ -66,7 +71,8 @@ class Scene(SceneBase):
     Performance optimizations:
     - Cached object categorization (avoids list comprehensions every frame)
     - Cached view/projection matrices (set once per frame, not per object)
-    - Cached bounding spheres for frustum culling
+    - Cached bounding spheres for frustum culling, tested in one batch per frame (CullingIndex)
+    - Meshes drawn from cached per-object draw lists, batched by texture/lightmap (DrawList)
     - Incremental cache building (only rebuilds when dirty)
     - Lazy cursor position calculation
 
@@ -113,6 +119,12 @@ class Scene(SceneBase):
         self.enable_frustum_culling: bool = True
         # Default bounding sphere radius for objects without computed bounds
         self.default_cull_radius: float = 5.0
+        # Bounding spheres of the regular + special objects, culled in one batch per frame
+        self.culling_index: CullingIndex = CullingIndex()
+        self._cached_cull_objects: list[RenderObject] = []
+        # Material-batched draw lists for the regular (models) and special (icons) objects
+        self.draw_list: DrawList = DrawList()
+        self.special_draw_list: DrawList = DrawList()
 
         # Cached object lists for render batching (rebuilt when objects change)
         self._cached_regular_objects: list[RenderObject] | None = None
@@ -167,6 +179,7 @@ class Scene(SceneBase):
         self._cached_sound_objects = sounds
         self._cached_encounter_objects = encounters
         self._cached_trigger_objects = triggers
+        self._cached_cull_objects = regular + special
         self._objects_dirty = False
         self._last_objects_count = len(self.objects)
 
@@ -181,6 +194,20 @@ class Scene(SceneBase):
         self._cached_view = self.camera.view()
         self._cached_projection = self.camera.projection()
 
+    def _texture_base_level(self, name: str) -> int:
+        """Request a new texture from the mip level the distance to its nearest drawn mesh needs."""
+        eye = self.camera.true_position()
+        distances = self.draw_list.texture_distances((eye.x, eye.y, eye.z), {name.lower()})
+        return self.texture_streamer.first_level(distances[0][1] if distances else None)
+
+    def _stream_textures(self):
+        """Upload the next mip levels of the textures the camera has come close to, within the frame's budget."""
+        if not len(self.texture_streamer):
+            return
+        eye = self.camera.true_position()
+        self.texture_streamer.observe(self.draw_list.texture_distances((eye.x, eye.y, eye.z), self.texture_streamer.pending))
+        self.texture_streamer.update()
+
     def render(self):
         if not HAS_PYOPENGL:
             from pykotor.gl.compat import MissingPyOpenGLError
@@ -210,26 +237,35 @@ class Scene(SceneBase):
             # Update camera matrices once per frame
             self._update_camera_matrices()
 
-            # Update frustum for culling
+            # Update frustum and cull every object in one batch
+            visible: list[bool] | None = None
             if self.enable_frustum_culling:
                 self.frustum.update_from_camera(self.camera)
-
-            if self.enable_frustum_culling:
                 self.culling_stats.reset()
+                self.culling_index.sync(self._cached_cull_objects, self, self.default_cull_radius)
+                visible = self.culling_index.cull(self.frustum).tolist()
+                visible_count = sum(visible)
+                self.culling_stats.record_batch(visible=visible_count, culled=len(visible) - visible_count)
+            else:
+                self.culling_stats.record_batch(visible=len(self._cached_cull_objects), culled=0)
 
             # Prepare GL state and main shader
             self._prepare_gl_and_shader_optimized()
             self.shader.set_bool("enableLightmap", self.use_lightmap)
 
-            # Render regular objects (models)
+            # Render regular objects (models), batched by material
             assert self._cached_regular_objects is not None
-            identity = mat4()  # Create once, reuse
-            for obj in self._cached_regular_objects:
-                if self.enable_frustum_culling and not self._is_object_visible(obj):
-                    self.culling_stats.record_object(visible=False)
-                    continue
-                self.culling_stats.record_object(visible=True)
-                self._render_object(self.shader, obj, identity)
+            assert self._cached_special_objects is not None
+            regular_count = len(self._cached_regular_objects)
+            hide_state = self._hide_state()
+            self.draw_list.update(
+                self._cached_regular_objects,
+                None if visible is None else visible[:regular_count],
+                self,
+                hide_state,
+            )
+            self.draw_list.draw(self.shader, self)
+            self._stream_textures()
 
             # Setup plain shader for special objects (once)
             glEnable(GL_BLEND)
@@ -240,13 +276,13 @@ class Scene(SceneBase):
             self.plain_shader.set_vector4("color", vec4(0.0, 0.0, 1.0, 0.4))
 
             # Render special objects (icons)
-            assert self._cached_special_objects is not None
-            for obj in self._cached_special_objects:
-                if self.enable_frustum_culling and not self._is_object_visible(obj):
-                    self.culling_stats.record_object(visible=False)
-                    continue
-                self.culling_stats.record_object(visible=True)
-                self._render_object(self.plain_shader, obj, identity)
+            self.special_draw_list.update(
+                self._cached_special_objects,
+                None if visible is None else visible[regular_count:],
+                self,
+                hide_state,
+            )
+            self.special_draw_list.draw(self.plain_shader, self)
 
             # Draw bounding box for selected objects
             self.plain_shader.set_vector4("color", vec4(1.0, 0.0, 0.0, 0.4))
@@ -263,24 +299,24 @@ class Scene(SceneBase):
             if not self.hide_sound_boundaries:
                 assert self._cached_sound_objects is not None
                 for obj in self._cached_sound_objects:
-                    if not self.enable_frustum_culling or self._is_object_visible(obj):
+                    if visible is None or self.culling_index.is_visible(obj):
                         obj.boundary(self).draw(self.plain_shader, obj.transform())
 
             if not self.hide_encounter_boundaries:
                 assert self._cached_encounter_objects is not None
                 for obj in self._cached_encounter_objects:
-                    if not self.enable_frustum_culling or self._is_object_visible(obj):
+                    if visible is None or self.culling_index.is_visible(obj):
                         obj.boundary(self).draw(self.plain_shader, obj.transform())
 
             if not self.hide_trigger_boundaries:
                 assert self._cached_trigger_objects is not None
                 for obj in self._cached_trigger_objects:
-                    if not self.enable_frustum_culling or self._is_object_visible(obj):
+                    if visible is None or self.culling_index.is_visible(obj):
                         obj.boundary(self).draw(self.plain_shader, obj.transform())
 
             if self.show_cursor:
                 self.plain_shader.set_vector4("color", vec4(1.0, 0.0, 0.0, 0.4))
-                self._render_object(self.plain_shader, self.cursor, identity)
+                self._render_object(self.plain_shader, self.cursor, mat4())
 
             # End frame statistics
             if self.enable_frustum_culling:
@@ -328,7 +364,8 @@ class Scene(SceneBase):
     def _is_object_visible(self, obj: RenderObject) -> bool:
         """Check if an object is visible within the frustum.
 
-        Uses cached bounding sphere from RenderObject for efficiency.
+        Uses cached bounding sphere from RenderObject for efficiency. `render` culls all objects
+        at once through `culling_index`; this is the per-object equivalent.
 
         Args:
             obj: The render object to test.
@@ -365,6 +402,19 @@ class Scene(SceneBase):
             result = True
         return result
 
+    def _hide_state(self) -> tuple[bool, ...]:
+        """The hide flags `should_hide_obj` reads, so draw lists can tell when hidden children changed."""
+        return (
+            self.hide_creatures,
+            self.hide_placeables,
+            self.hide_doors,
+            self.hide_triggers,
+            self.hide_encounters,
+            self.hide_waypoints,
+            self.hide_sounds,
+            self.hide_cameras,
+        )
+
     def _render_object(
         self,
         shader: Shader,
@@ -510,13 +560,13 @@ class Scene(SceneBase):
             GL_FLOAT,
         )[0][0]  # type: ignore[]
 
-        cursor: vec3 = unProject(
-            vec3(x, self.camera.height - y, zpos),
-            view,
-            projection,
-            vec4(0, 0, self.camera.width, self.camera.height),
-        )
-        return Vector3(cursor.x, cursor.y, cursor.z)
+        cursor_x, cursor_y, cursor_z = unproject(
+            np.array([(x, self.camera.height - y, zpos)]),
+            matrix_array(view),
+            matrix_array(projection),
+            (0, 0, self.camera.width, self.camera.height),
+        )[0].tolist()
+        return Vector3(cursor_x, cursor_y, cursor_z)
 
     def _prepare_gl_and_shader(self):
         """Legacy method for backward compatibility."""
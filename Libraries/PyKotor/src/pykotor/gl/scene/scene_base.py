@@ -9,6 +9,7 @@ HAS_PYOPENGL = has_pyopengl()
 
 from pykotor.common.module import Module, ModuleResource
 from pykotor.common.stream import BinaryReader
+from pykotor.extract.decoded_cache import ResourceLocation, acquire_tpc
 from pykotor.extract.file import ResourceIdentifier, ResourceResult
 from pykotor.extract.installation import SearchLocation
 from pykotor.gl.models.mdl import Model, Node
@@ -36,7 +37,15 @@ from pykotor.gl.models.predefined_mdl import (
 )
 from pykotor.gl.models.read_mdl import gl_load_stitched_model
 from pykotor.gl.scene import Camera, RenderObject
-from pykotor.gl.scene.async_loader import AsyncResourceLoader, create_model_from_intermediate, create_texture_from_intermediate
+from pykotor.gl.scene.async_loader import (
+    AsyncResourceLoader,
+    acquire_intermediate_model,
+    add_texture_levels,
+    create_model_from_intermediate,
+    create_texture_from_intermediate,
+)
+from pykotor.gl.scene.shared_buffers import shared_buffer_pool
+from pykotor.gl.scene.texture_streaming import TextureStreamer
 from pykotor.gl.shader import Texture
 from pykotor.resource.formats.lyt.lyt_data import LYT
 from pykotor.resource.formats.tpc.tpc_data import TPC
@@ -52,14 +61,17 @@ from utility.common.more_collections import CaseInsensitiveDict
 if TYPE_CHECKING:
 
     from collections.abc import Callable
+    from concurrent.futures import Future
 
     from typing_extensions import Literal  # pyright: ignore[reportMissingModuleSource]
 
-    from pykotor.common.module import Module, ModulePieceResource, ModuleResource
+    from pykotor.common.module import Module, ModuleResource
     from pykotor.extract.capsule import Capsule
+    from pykotor.extract.decoded_cache import CacheLease
     from pykotor.extract.file import ResourceIdentifier, ResourceResult
     from pykotor.extract.installation import Installation
     from pykotor.gl.models.mdl import Model, Node
+    from pykotor.gl.scene.shared_buffers import SharedBufferPool
     from pykotor.resource.formats.tpc import TPC
     from pykotor.resource.generics.git import GITCreature, GITInstance
     from pykotor.resource.generics.utc import UTC
@@ -98,6 +110,8 @@ class SceneBase:
 
         self.textures: CaseInsensitiveDict[Texture] = CaseInsensitiveDict()
         self.textures["NULL"] = Texture.from_color()
+        # Uploads (and fetches) the larger mip levels of asynchronously loaded textures as the camera gets close to them
+        self.texture_streamer: TextureStreamer = TextureStreamer(fetch=self._fetch_texture_levels)
         self.models: CaseInsensitiveDict[Model] = CaseInsensitiveDict()
 
         self.cursor: RenderObject = RenderObject("cursor")
@@ -264,6 +278,10 @@ class SceneBase:
             
             return (mdl_loc, mdx_loc)
         
+        # Synchronous loads resolve the same locations, so they share decoded resources with the async loader
+        self._resolve_texture_location: Callable[[str], tuple[str, int, int, int] | None] = _resolve_texture_location
+        self._resolve_model_location: Callable[[str], tuple[tuple[str, int, int] | None, tuple[str, int, int] | None]] = _resolve_model_location
+        
         # Now assign the actual AsyncResourceLoader instance
         self.async_loader = AsyncResourceLoader(
             texture_location_resolver=_resolve_texture_location,
@@ -274,6 +292,7 @@ class SceneBase:
         self.async_loader.start()
         self._pending_texture_futures: dict[str, Any] = {}  # name -> Future
         self._pending_model_futures: dict[str, Any] = {}  # name -> Future
+        self._pending_level_futures: dict[str, Any] = {}  # name -> Future of larger mip levels of a streamed texture
 
         self.hide_creatures: bool = False
         self.hide_placeables: bool = False
@@ -530,20 +549,42 @@ class SceneBase:
         """Invalidate resource caches and cancel pending async operations."""
         # Cancel pending operations
         for future in self._pending_texture_futures.values():
-            future.cancel()
+            self._discard_future(future)
         for future in self._pending_model_futures.values():
-            future.cancel()
+            self._discard_future(future)
+        for future in self._pending_level_futures.values():
+            self._discard_future(future)
         
         self._pending_texture_futures.clear()
         self._pending_model_futures.clear()
+        self._pending_level_futures.clear()
         
         # Clear caches (but keep predefined models/textures)
         predefined_models = {"waypoint", "sound", "store", "entry", "encounter", "trigger", "camera", "empty", "cursor", "unknown"}
         self.models = CaseInsensitiveDict({k: v for k, v in self.models.items() if k in predefined_models})
         self.textures = CaseInsensitiveDict({"NULL": self.textures.get("NULL", Texture.from_color())})
+        self.texture_streamer.clear()
         
         RobustLogger().debug("Invalidated resource cache")
     
+    def _shared_buffers(self) -> SharedBufferPool | None:
+        return None if self.async_loader is None else self.async_loader.buffer_pool
+
+    def _discard_future(self, future: Future):
+        """Cancel a pending async load, or recycle the shared buffers of one that already finished."""
+        if future.cancel() or not future.done() or self.async_loader is None:
+            return
+        try:
+            _name, intermediate, _error = future.result()
+        except Exception:  # noqa: BLE001
+            return
+        self.async_loader.release_buffers(intermediate)
+
+    def _release_result(self, intermediate: Any):
+        """Let go of an async result whose GL objects were created."""
+        if self.async_loader is not None:
+            self.async_loader.release_buffers(intermediate)
+    
     def poll_async_resources(self, *, max_textures_per_frame: int = 8, max_models_per_frame: int = 4):
         """Poll for completed async resource loading and create OpenGL objects.
         
@@ -555,9 +596,11 @@ class SceneBase:
             max_models_per_frame: Max models to upload to GPU per frame (prevents frame spikes)
         """
         # Fast path: nothing to poll
-        if not self._pending_texture_futures and not self._pending_model_futures:
+        if not self._pending_texture_futures and not self._pending_model_futures and not self._pending_level_futures:
             return
         
+        self._poll_texture_levels()
+        
         # Check completed texture futures (limited per frame to prevent stuttering)
         completed_textures: list[str] = []
         textures_processed = 0
@@ -583,7 +626,11 @@ class SceneBase:
                             error,
                         )
                     elif intermediate:
-                        self.textures[resource_name] = create_texture_from_intermediate(intermediate)
+                        try:
+                            self.textures[resource_name] = create_texture_from_intermediate(intermediate, self._shared_buffers())
+                        finally:
+                            self._release_result(intermediate)
+                        self.texture_streamer.register(resource_name, self.textures[resource_name])
                         info = self.texture_lookup_info.setdefault(resource_name, {})
                         info.update({"loaded": True, "load_error": None})
                         RobustLogger().debug("SceneBase: texture async complete '%s' (loaded=True)", resource_name)
@@ -622,7 +669,10 @@ class SceneBase:
                             BinaryReader.from_bytes(EMPTY_MDX_DATA),
                         )
                     elif intermediate:
-                        self.models[resource_name] = create_model_from_intermediate(self, intermediate)
+                        try:
+                            self.models[resource_name] = create_model_from_intermediate(self, intermediate, self._shared_buffers())
+                        finally:
+                            self._release_result(intermediate)
                     completed_models.append(name)
                     models_processed += 1
                 except Exception:  # noqa: BLE001
@@ -638,6 +688,38 @@ class SceneBase:
         for name in completed_models:
             del self._pending_model_futures[name]
 
+    def _texture_base_level(self, name: str) -> int:  # noqa: ARG002
+        """Returns the largest mip level a newly requested texture needs; scenes that know where it is drawn go lower."""
+        return 0
+
+    def _fetch_texture_levels(self, name: str, first_level: int, stop_level: int):
+        """Start decoding the mip levels [first_level, stop_level) of a streamed texture the camera came close to."""
+        if self.async_loader is None or self.async_loader.texture_location_resolver is None:
+            self.texture_streamer.forget(name)
+            return
+        self._pending_level_futures[name] = self.async_loader.load_texture_async(name, base_level=first_level, stop_level=stop_level)
+
+    def _poll_texture_levels(self):
+        """Hand finished mip level fetches to their textures; a texture whose fetch fails stays at its level."""
+        for name in [name for name, future in self._pending_level_futures.items() if future.done()]:
+            future = self._pending_level_futures.pop(name)
+            self.texture_streamer.fetched(name)
+            try:
+                _resource_name, intermediate, error = future.result()
+                texture: Texture | None = self.textures.get(name)
+                held: int = -1 if texture is None else texture.held_level
+                try:
+                    if intermediate is not None and texture is not None:
+                        add_texture_levels(texture, intermediate, self._shared_buffers())
+                finally:
+                    self._release_result(intermediate)
+                if texture is None or texture.held_level == held:
+                    RobustLogger().debug(f"Could not fetch larger mip levels of texture '{name}': {error}")
+                    self.texture_streamer.forget(name)
+            except Exception:  # noqa: BLE001
+                RobustLogger().exception(f"Error processing fetched mip levels of texture '{name}'")
+                self.texture_streamer.forget(name)
+
     def texture(
         self,
         name: str,
@@ -661,7 +743,7 @@ class SceneBase:
             # Track requests for UI/debugging (names only). Resolution details are stored by the resolver.
             self.requested_texture_names.add(name)
             RobustLogger().debug("SceneBase: requesting texture '%s' (lightmap=%s)", name, lightmap)
-            future = self.async_loader.load_texture_async(name)
+            future = self.async_loader.load_texture_async(name, base_level=self._texture_base_level(name))
             self._pending_texture_futures[name] = future
             # Return gray placeholder immediately
             return self._loading_texture
@@ -669,6 +751,7 @@ class SceneBase:
         # Fallback to synchronous loading (e.g., if process pools unavailable)
         type_name: Literal["lightmap", "texture"] = "lightmap" if lightmap else "texture"
         tpc: TPC | None = None
+        tpc_lease: CacheLease[TPC] | None = None
         try:
             # Check the textures linked to the module first
             if self._module is not None:
@@ -681,7 +764,11 @@ class SceneBase:
             # Otherwise just search through all relevant game files
             if tpc is None and self.installation is not None:
                 RobustLogger().debug(f"Locating and loading {type_name} '{name}' from override/bifs/texturepacks...")
-                tpc = self.installation.texture(name, [SearchLocation.OVERRIDE, SearchLocation.TEXTURES_TPA, SearchLocation.CHITIN])
+                location: tuple[str, int, int, int] | None = self._resolve_texture_location(name)
+                if location is not None:
+                    # Leased from the process-wide decoded resource cache, so other scenes decode it only once
+                    tpc_lease = acquire_tpc(ResourceLocation(*location[:3]))
+                    tpc = tpc_lease.value
             if tpc is None:
                 RobustLogger().warning(f"MISSING {type_name.upper()}: '{name}'")
         except Exception:  # noqa: BLE001
@@ -691,9 +778,34 @@ class SceneBase:
             self.textures[name] = self._missing_texture
             return self._missing_lightmap if lightmap else self._missing_texture
         
-        self.textures[name] = Texture.from_tpc(tpc)
+        try:
+            self.textures[name] = Texture.from_tpc(tpc)
+        finally:
+            if tpc_lease is not None:
+                tpc_lease.release()
         return self.textures[name]
 
+    def _load_model_sync(self, name: str) -> Model:
+        """Load a model from the installation now, leasing it from the process-wide decoded resource cache.
+
+        The cache entries are the async loader's, so a model another scene (or an async load) already decoded is not
+        read or parsed again. Missing or unreadable models load as the empty model.
+        """
+        mdl_loc, mdx_loc = self._resolve_model_location(name)
+        if mdl_loc is None or mdx_loc is None:
+            RobustLogger().warning(f"Model '{name}' not found in installation (MDL: {mdl_loc is not None}, MDX: {mdx_loc is not None})")
+        else:
+            try:
+                with acquire_intermediate_model(name, ResourceLocation(*mdl_loc), ResourceLocation(*mdx_loc)) as lease:
+                    return create_model_from_intermediate(self, lease.value, shared_buffer_pool())
+            except Exception:  # noqa: BLE001
+                RobustLogger().warning(f"Could not load model '{name}'.")
+        return gl_load_stitched_model(
+            self,  # pyright: ignore[reportArgumentType]
+            BinaryReader.from_bytes(EMPTY_MDL_DATA, 12),
+            BinaryReader.from_bytes(EMPTY_MDX_DATA),
+        )
+
     def model_sync(
         self,
         name: str,
@@ -715,8 +827,7 @@ class SceneBase:
         
         # Cancel any pending async load for this model
         if name in self._pending_model_futures:
-            self._pending_model_futures[name].cancel()
-            del self._pending_model_futures[name]
+            self._discard_future(self._pending_model_futures.pop(name))
         
         # Handle predefined models
         predefined_models = {
@@ -744,31 +855,7 @@ class SceneBase:
                 RobustLogger().exception(f"Could not load predefined model '{name}'.")
         
         # Synchronous loading from installation
-        fallback_mdl_data: bytes = EMPTY_MDL_DATA
-        fallback_mdx_data: bytes = EMPTY_MDX_DATA
-        
-        if self.installation is not None:
-            capsules: list[ModulePieceResource] = [] if self._module is None else self.module.capsules()
-            mdl_search: ResourceResult | None = self.installation.resource(name, ResourceType.MDL, SEARCH_ORDER, capsules=capsules)
-            mdx_search: ResourceResult | None = self.installation.resource(name, ResourceType.MDX, SEARCH_ORDER, capsules=capsules)
-            if mdl_search is not None and mdx_search is not None:
-                fallback_mdl_data = mdl_search.data
-                fallback_mdx_data = mdx_search.data
-            else:
-                RobustLogger().warning(f"Model '{name}' not found in installation (MDL: {mdl_search is not None}, MDX: {mdx_search is not None})")
-
-        try:
-            mdl_reader = BinaryReader.from_bytes(fallback_mdl_data, 12)
-            mdx_reader = BinaryReader.from_bytes(fallback_mdx_data)
-            model = gl_load_stitched_model(self, mdl_reader, mdx_reader)  # pyright: ignore[reportArgumentType]
-        except Exception:  # noqa: BLE001
-            RobustLogger().warning(f"Could not load model '{name}'.")
-            model = gl_load_stitched_model(
-                self,  # pyright: ignore[reportArgumentType]
-                BinaryReader.from_bytes(EMPTY_MDL_DATA, 12),
-                BinaryReader.from_bytes(EMPTY_MDX_DATA),
-            )
-
+        model = self._load_model_sync(name)
         self.models[name] = model
         return model
 
@@ -833,28 +920,6 @@ class SceneBase:
             return self.models["empty"]
         
         # Fallback to synchronous loading
-        fallback_mdl_data: bytes = EMPTY_MDL_DATA
-        fallback_mdx_data: bytes = EMPTY_MDX_DATA
-        
-        if self.installation is not None:
-            capsules: list[ModulePieceResource] = [] if self._module is None else self.module.capsules()
-            mdl_search: ResourceResult | None = self.installation.resource(name, ResourceType.MDL, SEARCH_ORDER, capsules=capsules)
-            mdx_search: ResourceResult | None = self.installation.resource(name, ResourceType.MDX, SEARCH_ORDER, capsules=capsules)
-            if mdl_search is not None and mdx_search is not None:
-                fallback_mdl_data = mdl_search.data
-                fallback_mdx_data = mdx_search.data
-
-        try:
-            mdl_reader = BinaryReader.from_bytes(fallback_mdl_data, 12)
-            mdx_reader = BinaryReader.from_bytes(fallback_mdx_data)
-            model = gl_load_stitched_model(self, mdl_reader, mdx_reader)  # pyright: ignore[reportArgumentType]
-        except Exception:  # noqa: BLE001
-            RobustLogger().warning(f"Could not load model '{name}'.")
-            model = gl_load_stitched_model(
-                self,  # pyright: ignore[reportArgumentType]
-                BinaryReader.from_bytes(EMPTY_MDL_DATA, 12),
-                BinaryReader.from_bytes(EMPTY_MDX_DATA),
-            )
-
+        model = self._load_model_sync(name)
         self.models[name] = model
         return model
@@ -2,15 +2,14 @@ from __future__ import annotations
 
 import math
 
-from copy import copy
-from typing import TYPE_CHECKING, ClassVar, TypeVar
+from typing import TYPE_CHECKING, ClassVar, Iterable, TypeVar
 
 from loggerplus import RobustLogger
 from pykotor.extract.installation import SearchLocation
 from pykotor.gl.glm_compat import eulerAngles, quat, vec3
 from pykotor.gl.models.mdl import Boundary
 from pykotor.gl.scene import RenderObject
-from pykotor.resource.generics.git import GIT, GITCamera, GITCreature, GITDoor, GITEncounter, GITPlaceable, GITSound, GITStore, GITTrigger, GITWaypoint
+from pykotor.resource.generics.git import GIT, GITCamera, GITCreature, GITDoor, GITEncounter, GITInstance, GITPlaceable, GITSound, GITStore, GITTrigger, GITWaypoint
 from pykotor.resource.generics.utd import UTD
 from pykotor.resource.generics.utp import UTP
 from pykotor.resource.generics.uts import UTS
@@ -19,7 +18,6 @@ from pykotor.resource.type import ResourceType
 if TYPE_CHECKING:
     from pykotor.gl.scene.scene import Scene
     from pykotor.resource.formats.lyt import LYTRoom
-    from pykotor.resource.generics.git import GIT, GITInstance
 
 T = TypeVar("T")
 SEARCH_ORDER_2DA: list[SearchLocation] = [SearchLocation.OVERRIDE, SearchLocation.CHITIN]
@@ -33,6 +31,8 @@ class SceneCache:
     - Only rebuilds when cache buffer has changes or clear_cache is True
     - Tracks last GIT/LYT state to detect changes without full iteration
     - Position/rotation updates are O(1) for existing objects
+    - Removed instances are detected with one set lookup per object (not a scan of the GIT's lists)
+    - Editors can apply an edit to a few instances with update_instances, instead of waiting for a full sweep
 
     Reference: Standard game engine practice - incremental scene graph updates
     """
@@ -94,221 +94,256 @@ class SceneCache:
 
         for door in scene.git.doors:
             if door not in scene.objects:
-                model_name: str = "unknown"  # If failed to load door models, use an empty model instead
-                utd: UTD | None = None
-                try:
-                    utd = scene._resource_from_gitinstance(door, scene._module.door)
-                    if utd is not None:
-                        # Check if the row exists before accessing it to avoid IndexError
-                        if scene.table_doors.has_row(utd.appearance_id):
-                            row = scene.table_doors.get_row(utd.appearance_id)
-                            if row.has_string("modelname"):
-                                model_name = row.get_string("modelname")
-                            else:
-                                RobustLogger().warning(
-                                    f"Door '{door.resref}.utd' references appearance_id {utd.appearance_id} "
-                                    f"which exists in doors.2da but lacks 'modelname' header. Using default model 'unknown'."
-                                )
-                        else:
-                            RobustLogger().warning(
-                                f"Door '{door.resref}.utd' references appearance_id {utd.appearance_id} " f"which does not exist in doors.2da. Using default model 'unknown'."
-                            )
-                except (IndexError, KeyError) as e:
-                    RobustLogger().warning(f"Could not get the model name from the UTD '{door.resref}.utd' " f"and/or the doors.2da: {e}. Using default model 'unknown'.")
-                except Exception:  # noqa: BLE001
-                    RobustLogger().exception(f"Could not get the model name from the UTD '{door.resref}.utd' and/or the appearance.2da")
-                if utd is None:
-                    utd = UTD()
-
-                scene.objects[door] = RenderObject(
-                    model_name,
-                    vec3(),
-                    vec3(),
-                    data=door,
-                )
-
-            scene.objects[door].set_position(door.position.x, door.position.y, door.position.z)
-            scene.objects[door].set_rotation(0, 0, door.bearing)
+                scene.objects[door] = SceneCache._create_render_object(scene, door)
+            SceneCache._sync_transform(scene.objects[door], door)
 
         for placeable in scene.git.placeables:
             if placeable not in scene.objects:
-                model_name = "unknown"  # If failed to load a placeable models, use an empty model instead
-                utp: UTP | None = None
-                try:
-                    utp = scene._resource_from_gitinstance(placeable, scene._module.placeable)
-                    if utp is not None:
-                        # Check if the row exists before accessing it to avoid IndexError
-                        if scene.table_placeables.has_row(utp.appearance_id):
-                            row = scene.table_placeables.get_row(utp.appearance_id)
-                            if row.has_string("modelname"):
-                                model_name = row.get_string("modelname")
-                            else:
-                                RobustLogger().warning(
-                                    f"Placeable '{placeable.resref}.utp' references appearance_id {utp.appearance_id} "
-                                    f"which exists in placeables.2da but lacks 'modelname' header. Using default model 'unknown'."
-                                )
-                        else:
-                            RobustLogger().warning(
-                                f"Placeable '{placeable.resref}.utp' references appearance_id {utp.appearance_id} "
-                                f"which does not exist in placeables.2da. Using default model 'unknown'."
-                            )
-                except (IndexError, KeyError) as e:
-                    RobustLogger().warning(
-                        f"Could not get the model name from the UTP '{placeable.resref}.utp' " f"and/or the placeables.2da: {e}. Using default model 'unknown'."
-                    )
-                except Exception:  # noqa: BLE001
-                    RobustLogger().exception(f"Could not get the model name from the UTP '{placeable.resref}.utp' and/or the appearance.2da")
-                if utp is None:
-                    utp = UTP()
-
-                scene.objects[placeable] = RenderObject(
-                    model_name,
-                    vec3(),
-                    vec3(),
-                    data=placeable,
-                )
-
-            scene.objects[placeable].set_position(placeable.position.x, placeable.position.y, placeable.position.z)
-            scene.objects[placeable].set_rotation(0, 0, placeable.bearing)
+                scene.objects[placeable] = SceneCache._create_render_object(scene, placeable)
+            SceneCache._sync_transform(scene.objects[placeable], placeable)
 
         for git_creature in scene.git.creatures:
             if git_creature in scene.objects:
                 continue
-            scene.objects[git_creature] = scene.get_creature_render_object(git_creature)
-
-            scene.objects[git_creature].set_position(git_creature.position.x, git_creature.position.y, git_creature.position.z)
-            scene.objects[git_creature].set_rotation(0, 0, git_creature.bearing)
+            scene.objects[git_creature] = SceneCache._create_render_object(scene, git_creature)
+            SceneCache._sync_transform(scene.objects[git_creature], git_creature)
 
         for waypoint in scene.git.waypoints:
             if waypoint in scene.objects:
                 continue
-            obj = RenderObject(
-                "waypoint",
-                vec3(),
-                vec3(),
-                data=waypoint,
-            )
-            scene.objects[waypoint] = obj
-
-            scene.objects[waypoint].set_position(waypoint.position.x, waypoint.position.y, waypoint.position.z)
-            scene.objects[waypoint].set_rotation(0, 0, waypoint.bearing)
+            scene.objects[waypoint] = SceneCache._create_render_object(scene, waypoint)
+            SceneCache._sync_transform(scene.objects[waypoint], waypoint)
 
         for store in scene.git.stores:
             if store not in scene.objects:
-                obj = RenderObject(
-                    "store",
-                    vec3(),
-                    vec3(),
-                    data=store,
-                )
-                scene.objects[store] = obj
-
-            scene.objects[store].set_position(store.position.x, store.position.y, store.position.z)
-            scene.objects[store].set_rotation(0, 0, store.bearing)
+                scene.objects[store] = SceneCache._create_render_object(scene, store)
+            SceneCache._sync_transform(scene.objects[store], store)
 
         for sound in scene.git.sounds:
             if sound in scene.objects:
                 continue
-            uts = None
+            scene.objects[sound] = SceneCache._create_render_object(scene, sound)
+            SceneCache._sync_transform(scene.objects[sound], sound)
+
+        for encounter in scene.git.encounters:
+            if encounter in scene.objects:
+                continue
+            scene.objects[encounter] = SceneCache._create_render_object(scene, encounter)
+            SceneCache._sync_transform(scene.objects[encounter], encounter)
+
+        for trigger in scene.git.triggers:
+            if trigger not in scene.objects:
+                scene.objects[trigger] = SceneCache._create_render_object(scene, trigger)
+            SceneCache._sync_transform(scene.objects[trigger], trigger)
+
+        for camera in scene.git.cameras:
+            if camera not in scene.objects:
+                scene.objects[camera] = SceneCache._create_render_object(scene, camera)
+            SceneCache._sync_transform(scene.objects[camera], camera)
+
+        # Detect if GIT objects still exist; if they do not then remove them from the render list
+        SceneCache._del_git_objects(scene.git, scene.objects)
+
+    @staticmethod
+    def update_instances(
+        scene: Scene,
+        *,
+        added: Iterable[GITInstance] = (),
+        changed: Iterable[GITInstance] = (),
+        removed: Iterable[GITInstance] = (),
+    ):
+        """Apply an edit of the scene's GIT to its render objects, without rebuilding the whole cache.
+
+        Only the given instances are touched: removed instances lose their render object, added instances get one,
+        and changed instances are moved/rotated to their current position and bearing. Loaded models and textures
+        are kept, so an added instance using an already-loaded model costs no resource loading at all.
+
+        A changed instance whose resref was edited is recreated, since its render object may need another model.
+
+        Args:
+        ----
+            scene: The scene whose render objects are updated
+            added: Instances that were added to the GIT
+            changed: Instances that were moved, rotated or otherwise edited
+            removed: Instances that were removed from the GIT
+        """
+        membership_changed: bool = False
+        for instance in removed:
+            membership_changed |= SceneCache._pop_render_object(scene.objects, instance) is not None
+
+        for instance in (*added, *changed):
+            # Instances hash by resref, so an edited one may sit under a stale hash: take it out by identity and
+            # put it back under its current one
+            render_obj: RenderObject | None = SceneCache._pop_render_object(scene.objects, instance)
+            if render_obj is None or render_obj.identifier != instance.identifier():
+                # New, or its blueprint changed (and with it, possibly its model)
+                render_obj = SceneCache._create_render_object(scene, instance)
+                membership_changed = True
+            scene.objects[instance] = render_obj
+            SceneCache._sync_transform(render_obj, instance)
+
+        if membership_changed:
+            scene._invalidate_object_cache()  # noqa: SLF001
+
+    @staticmethod
+    def _pop_render_object(
+        objects: dict[GITInstance | LYTRoom, RenderObject],
+        instance: GITInstance,
+    ) -> RenderObject | None:
+        """Remove and return the render object keyed by `instance` itself (instances compare by identity)."""
+        render_obj: RenderObject | None = objects.pop(instance, None)
+        if render_obj is not None:
+            return render_obj
+        # The instance was re-hashed after being inserted (e.g. its resref changed) and its old slot was not on the
+        # new hash's probe path, so the dict cannot find it by key anymore: rebuild the dict without it
+        for key, render_obj in objects.items():
+            if key is instance:
+                remaining = [(other, value) for other, value in objects.items() if other is not instance]
+                objects.clear()
+                objects.update(remaining)
+                return render_obj
+        return None
+
+    @staticmethod
+    def _create_render_object(
+        scene: Scene,
+        instance: GITInstance,
+    ) -> RenderObject:
+        """Create the render object for a GIT instance, remembering which blueprint it was built from."""
+        render_obj: RenderObject = SceneCache._build_render_object(scene, instance)
+        render_obj.identifier = instance.identifier()
+        return render_obj
+
+    @staticmethod
+    def _build_render_object(  # noqa: C901, PLR0911, PLR0912
+        scene: Scene,
+        instance: GITInstance,
+    ) -> RenderObject:
+        """Build the render object for a GIT instance, resolving its model from the instance's blueprint."""
+        assert scene._module is not None
+        if isinstance(instance, GITDoor):
+            model_name: str = "unknown"  # If failed to load door models, use an empty model instead
             try:
-                uts: UTS | None = scene._resource_from_gitinstance(sound, scene._module.sound)
+                utd: UTD | None = scene._resource_from_gitinstance(instance, scene._module.door)
+                if utd is not None:
+                    # Check if the row exists before accessing it to avoid IndexError
+                    if scene.table_doors.has_row(utd.appearance_id):
+                        row = scene.table_doors.get_row(utd.appearance_id)
+                        if row.has_string("modelname"):
+                            model_name = row.get_string("modelname")
+                        else:
+                            RobustLogger().warning(
+                                f"Door '{instance.resref}.utd' references appearance_id {utd.appearance_id} "
+                                f"which exists in doors.2da but lacks 'modelname' header. Using default model 'unknown'."
+                            )
+                    else:
+                        RobustLogger().warning(
+                            f"Door '{instance.resref}.utd' references appearance_id {utd.appearance_id} " f"which does not exist in doors.2da. Using default model 'unknown'."
+                        )
+            except (IndexError, KeyError) as e:
+                RobustLogger().warning(f"Could not get the model name from the UTD '{instance.resref}.utd' " f"and/or the doors.2da: {e}. Using default model 'unknown'.")
             except Exception:  # noqa: BLE001
-                RobustLogger().exception(f"Could not get the sound resource '{sound.resref}.uts' and/or the appearance.2da")
+                RobustLogger().exception(f"Could not get the model name from the UTD '{instance.resref}.utd' and/or the appearance.2da")
+            return RenderObject(model_name, vec3(), vec3(), data=instance)
+
+        if isinstance(instance, GITPlaceable):
+            model_name = "unknown"  # If failed to load a placeable models, use an empty model instead
+            try:
+                utp: UTP | None = scene._resource_from_gitinstance(instance, scene._module.placeable)
+                if utp is not None:
+                    # Check if the row exists before accessing it to avoid IndexError
+                    if scene.table_placeables.has_row(utp.appearance_id):
+                        row = scene.table_placeables.get_row(utp.appearance_id)
+                        if row.has_string("modelname"):
+                            model_name = row.get_string("modelname")
+                        else:
+                            RobustLogger().warning(
+                                f"Placeable '{instance.resref}.utp' references appearance_id {utp.appearance_id} "
+                                f"which exists in placeables.2da but lacks 'modelname' header. Using default model 'unknown'."
+                            )
+                    else:
+                        RobustLogger().warning(
+                            f"Placeable '{instance.resref}.utp' references appearance_id {utp.appearance_id} "
+                            f"which does not exist in placeables.2da. Using default model 'unknown'."
+                        )
+            except (IndexError, KeyError) as e:
+                RobustLogger().warning(
+                    f"Could not get the model name from the UTP '{instance.resref}.utp' " f"and/or the placeables.2da: {e}. Using default model 'unknown'."
+                )
+            except Exception:  # noqa: BLE001
+                RobustLogger().exception(f"Could not get the model name from the UTP '{instance.resref}.utp' and/or the appearance.2da")
+            return RenderObject(model_name, vec3(), vec3(), data=instance)
+
+        if isinstance(instance, GITCreature):
+            return scene.get_creature_render_object(instance)
+
+        if isinstance(instance, GITSound):
+            uts: UTS | None = None
+            try:
+                uts = scene._resource_from_gitinstance(instance, scene._module.sound)
+            except Exception:  # noqa: BLE001
+                RobustLogger().exception(f"Could not get the sound resource '{instance.resref}.uts' and/or the appearance.2da")
             if uts is None:
                 uts = UTS()
-
-            obj = RenderObject(
+            return RenderObject(
                 "sound",
                 vec3(),
                 vec3(),
-                data=sound,
+                data=instance,
                 gen_boundary=lambda uts=uts: Boundary.from_circle(scene, uts.max_distance),
             )
-            scene.objects[sound] = obj
 
-            scene.objects[sound].set_position(sound.position.x, sound.position.y, sound.position.z)
-            scene.objects[sound].set_rotation(0, 0, 0)
-
-        for encounter in scene.git.encounters:
-            if encounter in scene.objects:
-                continue
-            obj = RenderObject(
-                "encounter",
+        if isinstance(instance, (GITEncounter, GITTrigger)):
+            return RenderObject(
+                "encounter" if isinstance(instance, GITEncounter) else "trigger",
                 vec3(),
                 vec3(),
-                data=encounter,
-                gen_boundary=lambda encounter=encounter: Boundary(scene, encounter.geometry.points),
-            )
-            scene.objects[encounter] = obj
-
-            scene.objects[encounter].set_position(
-                encounter.position.x,
-                encounter.position.y,
-                encounter.position.z,
+                data=instance,
+                gen_boundary=lambda instance=instance: Boundary(scene, instance.geometry.points),
             )
-            scene.objects[encounter].set_rotation(0, 0, 0)
 
-        for trigger in scene.git.triggers:
-            if trigger not in scene.objects:
-                obj = RenderObject(
-                    "trigger",
-                    vec3(),
-                    vec3(),
-                    data=trigger,
-                    gen_boundary=lambda trigger=trigger: Boundary(scene, trigger.geometry.points),
-                )
-                scene.objects[trigger] = obj
+        if isinstance(instance, GITWaypoint):
+            return RenderObject("waypoint", vec3(), vec3(), data=instance)
+        if isinstance(instance, GITStore):
+            return RenderObject("store", vec3(), vec3(), data=instance)
+        if isinstance(instance, GITCamera):
+            return RenderObject("camera", vec3(), vec3(), data=instance)
 
-            scene.objects[trigger].set_position(
-                trigger.position.x,
-                trigger.position.y,
-                trigger.position.z,
-            )
-            scene.objects[trigger].set_rotation(0, 0, 0)
+        msg = f"Unsupported GIT instance type: {instance.__class__.__name__}"
+        raise TypeError(msg)
 
-        for camera in scene.git.cameras:
-            if camera not in scene.objects:
-                obj = RenderObject(
-                    "camera",
-                    vec3(),
-                    vec3(),
-                    data=camera,
-                )
-                scene.objects[camera] = obj
-
-            scene.objects[camera].set_position(camera.position.x, camera.position.y, camera.position.z + camera.height)
-            euler: vec3 = eulerAngles(quat(camera.orientation.w, camera.orientation.x, camera.orientation.y, camera.orientation.z))
-            scene.objects[camera].set_rotation(
+    @staticmethod
+    def _sync_transform(
+        render_obj: RenderObject,
+        instance: GITInstance,
+    ):
+        """Move/rotate a render object to its instance's position and bearing (unchanged values are no-ops)."""
+        if isinstance(instance, GITCamera):
+            render_obj.set_position(instance.position.x, instance.position.y, instance.position.z + instance.height)
+            euler: vec3 = eulerAngles(quat(instance.orientation.w, instance.orientation.x, instance.orientation.y, instance.orientation.z))
+            render_obj.set_rotation(
                 euler.y,
-                euler.z - math.pi / 2 + math.radians(camera.pitch),
+                euler.z - math.pi / 2 + math.radians(instance.pitch),
                 -euler.x + math.pi / 2,
             )
-
-        # Detect if GIT objects still exist; if they do not then remove them from the render list
-        for obj in copy(scene.objects):
-            SceneCache._del_git_objects(obj, scene.git, scene.objects)
+            return
+        render_obj.set_position(instance.position.x, instance.position.y, instance.position.z)
+        if isinstance(instance, (GITSound, GITEncounter, GITTrigger)):
+            render_obj.set_rotation(0, 0, 0)
+        else:
+            render_obj.set_rotation(0, 0, instance.bearing)  # pyright: ignore[reportAttributeAccessIssue]
 
     @staticmethod
     def _del_git_objects(
-        obj: GITInstance | LYTRoom,
         git: GIT,
         objects: dict[GITInstance | LYTRoom, RenderObject],
     ):
-        if isinstance(obj, GITCreature) and obj not in git.creatures:
-            del objects[obj]
-        if isinstance(obj, GITPlaceable) and obj not in git.placeables:
-            del objects[obj]
-        if isinstance(obj, GITDoor) and obj not in git.doors:
-            del objects[obj]
-        if isinstance(obj, GITTrigger) and obj not in git.triggers:
-            del objects[obj]
-        if isinstance(obj, GITStore) and obj not in git.stores:
-            del objects[obj]
-        if isinstance(obj, GITCamera) and obj not in git.cameras:
-            del objects[obj]
-        if isinstance(obj, GITWaypoint) and obj not in git.waypoints:
-            del objects[obj]
-        if isinstance(obj, GITEncounter) and obj not in git.encounters:
-            del objects[obj]
-        if isinstance(obj, GITSound) and obj not in git.sounds:
-            del objects[obj]
+        """Remove the render objects of GIT instances that are no longer in the GIT.
+
+        Instances compare by identity, so membership is checked against one set of ids instead of scanning the
+        GIT's lists once per object.
+        """
+        live: set[int] = {id(instance) for instance in git.instances()}
+        stale: list[GITInstance | LYTRoom] = [key for key in objects if isinstance(key, GITInstance) and id(key) not in live]
+        for key in stale:
+            del objects[key]
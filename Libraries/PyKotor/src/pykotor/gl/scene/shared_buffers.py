@@ -0,0 +1,276 @@
+"""Shared-memory transport for the buffers produced by the async loader's worker processes.
+
+Decoded texture pixels and mesh vertex/element buffers are by far the largest part of a worker's result. Returning
+them as ``bytes`` means pickling them in the worker, pushing them through the result pipe and unpickling them on the
+main (UI) thread. Instead, the main process leases each request a block of shared memory from a :class:`SharedBufferPool`,
+the worker writes its buffers into that block and returns :class:`SharedBufferHandle` objects in their place, and the
+main process reads them straight out of its own mapping of the block.
+
+Blocks come in power-of-two size classes and are recycled once their contents were consumed, so a module load maps a
+handful of blocks instead of creating one per resource. When shared memory is unavailable, everything falls back to
+plain ``bytes``.
+
+Results kept in the process-wide decoded resource cache stay in their blocks; those blocks come from
+:func:`shared_buffer_pool`, so every loader in the process can map them.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import sys
+import threading
+
+from typing import TYPE_CHECKING, NamedTuple, Union
+
+from loggerplus import RobustLogger
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - platforms without _posixshmem/_winapi support
+    shared_memory = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+    from typing_extensions import Self  # pyright: ignore[reportMissingModuleSource]
+
+MIN_BLOCK_SIZE = 256 * 1024
+DEFAULT_MAX_IDLE_BYTES = 256 * 1024 * 1024
+ALIGNMENT = 16
+
+
+class SharedBufferHandle(NamedTuple):
+    """A buffer written into a shared memory block, in place of its bytes."""
+
+    block: str
+    offset: int
+    nbytes: int
+
+
+class SharedBlockLease(NamedTuple):
+    """A shared memory block leased to one worker request."""
+
+    name: str
+    capacity: int
+
+
+SharedOrBytes = Union[bytes, SharedBufferHandle]
+
+
+def shared_memory_available() -> bool:
+    return shared_memory is not None
+
+
+def _attach(name: str) -> SharedMemory:
+    assert shared_memory is not None
+    if sys.version_info >= (3, 13):
+        # Only the owning pool may unlink the block, so the attaching side must not be tracked
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedBlockWriter:
+    """Worker-side writer that appends buffers to a leased block.
+
+    Args:
+    ----
+        lease: The block leased by the main process for this request
+
+    Buffers that do not fit in the remaining capacity are returned unchanged, so the caller always gets something
+    it can send back.
+    """
+
+    def __init__(self, lease: SharedBlockLease):
+        self.lease: SharedBlockLease = lease
+        self.used: int = 0
+        self._block: SharedMemory | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write(self, data: bytes | bytearray | memoryview) -> SharedOrBytes:
+        nbytes: int = len(data)
+        offset: int = -(-self.used // ALIGNMENT) * ALIGNMENT
+        if not nbytes or offset + nbytes > self.lease.capacity:
+            return bytes(data)
+        if self._block is None:
+            self._block = _attach(self.lease.name)
+        self._block.buf[offset : offset + nbytes] = data
+        self.used = offset + nbytes
+        return SharedBufferHandle(self.lease.name, offset, nbytes)
+
+    def close(self):
+        if self._block is not None:
+            self._block.close()
+            self._block = None
+
+
+class SharedBufferPool:
+    """Main-process pool of shared memory blocks leased to worker requests and recycled after use.
+
+    Args:
+    ----
+        min_block_size: Smallest block size; larger leases are rounded up to a power of two
+        max_idle_bytes: Idle blocks beyond this many bytes are unlinked instead of being kept for reuse
+
+    Attributes:
+    ----------
+        created: Blocks created over the pool's lifetime
+        reused: Leases served by a recycled block
+
+    A block dropped while views into it are still alive is only unlinked once they were released; the pool retries
+    on every release and on close.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_block_size: int = MIN_BLOCK_SIZE,
+        max_idle_bytes: int = DEFAULT_MAX_IDLE_BYTES,
+    ):
+        if shared_memory is None:
+            msg = "multiprocessing.shared_memory is not available on this platform"
+            raise RuntimeError(msg)
+        self.min_block_size: int = max(ALIGNMENT, min_block_size)
+        self.max_idle_bytes: int = max(0, max_idle_bytes)
+        self._lock = threading.Lock()
+        self._blocks: dict[str, SharedMemory] = {}
+        self._sizes: dict[str, int] = {}
+        self._idle: dict[int, list[str]] = {}
+        self._idle_bytes: int = 0
+        self._leased: set[str] = set()
+        self._unlinking: dict[str, SharedMemory] = {}
+        self.created: int = 0
+        self.reused: int = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def leased_count(self) -> int:
+        with self._lock:
+            return len(self._leased)
+
+    @property
+    def idle_bytes(self) -> int:
+        with self._lock:
+            return self._idle_bytes
+
+    @property
+    def unlinking_count(self) -> int:
+        """Dropped blocks whose unlink waits for their views to be released."""
+        with self._lock:
+            return len(self._unlinking)
+
+    def block_size(self, nbytes: int) -> int:
+        """Returns the size class a lease of `nbytes` is served from."""
+        size: int = self.min_block_size
+        while size < nbytes:
+            size <<= 1
+        return size
+
+    def acquire(self, nbytes: int) -> SharedBlockLease | None:
+        """Lease a block of at least `nbytes`; returns None if no shared memory could be created."""
+        size: int = self.block_size(nbytes)
+        with self._lock:
+            idle: list[str] = self._idle.get(size, [])
+            if idle:
+                name: str = idle.pop()
+                self._idle_bytes -= size
+                self._leased.add(name)
+                self.reused += 1
+                return SharedBlockLease(name, size)
+        assert shared_memory is not None
+        try:
+            block: SharedMemory = shared_memory.SharedMemory(create=True, size=size)
+        except OSError as e:
+            RobustLogger().debug(f"Could not create a {size} byte shared memory block, falling back to pickled buffers: {e}")
+            return None
+        with self._lock:
+            self._blocks[block.name] = block
+            self._sizes[block.name] = size
+            self._leased.add(block.name)
+            self.created += 1
+        return SharedBlockLease(block.name, size)
+
+    def release(self, name: str):
+        """Return a leased block to the pool. All views into it must have been released."""
+        with self._lock:
+            self._unlink_released()
+            if name not in self._leased:
+                return
+            self._leased.discard(name)
+            size: int = self._sizes[name]
+            if self._idle_bytes + size > self.max_idle_bytes:
+                self._destroy(name)
+                return
+            self._idle.setdefault(size, []).append(name)
+            self._idle_bytes += size
+
+    def capacity(self, name: str) -> int:
+        """Returns the size of a block of this pool, or 0 if the block is not (or no longer) in it."""
+        with self._lock:
+            return self._sizes.get(name, 0)
+
+    def view(self, handle: SharedBufferHandle) -> memoryview:
+        """Map a buffer written by a worker, without copying it. Release the view before the block is released."""
+        with self._lock:
+            block: SharedMemory | None = self._blocks.get(handle.block)
+        if block is None:
+            msg = f"Shared memory block '{handle.block}' does not belong to this pool"
+            raise KeyError(msg)
+        return block.buf[handle.offset : handle.offset + handle.nbytes]
+
+    def close(self):
+        """Unlink every block, leased or idle. Blocks that still have views are unlinked once those were released."""
+        with self._lock:
+            for name in list(self._blocks):
+                self._destroy(name)
+            self._idle.clear()
+            self._idle_bytes = 0
+            self._leased.clear()
+            if self._unlinking:
+                RobustLogger().warning(f"{len(self._unlinking)} shared memory block(s) still have views; they are unlinked once the views are released")
+
+    def _destroy(self, name: str):
+        self._sizes.pop(name, None)
+        self._unlinking[name] = self._blocks.pop(name)
+        self._unlink_released()
+
+    def _unlink_released(self):
+        """Unmap and unlink the dropped blocks nothing views anymore."""
+        for name, block in list(self._unlinking.items()):
+            try:
+                block.close()
+            except BufferError as e:
+                RobustLogger().debug(f"Shared memory block '{name}' still has views, deferring its unlink: {e}")
+                continue
+            del self._unlinking[name]
+            with contextlib.suppress(FileNotFoundError):  # already unlinked, e.g. by the resource tracker
+                block.unlink()
+
+
+_process_pool: SharedBufferPool | None = None
+_process_pool_lock = threading.Lock()
+
+
+def shared_buffer_pool() -> SharedBufferPool | None:
+    """Returns the pool shared by everything in this process, or None if shared memory is unavailable.
+
+    Its blocks are unlinked when the process exits.
+    """
+    global _process_pool  # noqa: PLW0603
+    if shared_memory is None:
+        return None
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = SharedBufferPool()
+            atexit.register(_process_pool.close)
+        return _process_pool
@@ -0,0 +1,276 @@
+"""Level-of-detail mip selection and progressive texture upload.
+
+Decoding and uploading every texture's full mip chain as soon as it is requested makes the first frames of a big
+module wait on (and fill memory with) full-resolution levels of textures that may only ever be seen from far
+away. Instead:
+
+- A texture is requested from the level its first on-screen distance needs (:meth:`TextureStreamer.first_level`),
+  so the worker decodes and ships only that level and the smaller ones.
+- It is created with its smallest levels, up to a small byte budget, so it shows up at once; the other shipped
+  levels are kept until they are uploaded, and dropped as soon as they are.
+- Every frame, :class:`TextureStreamer` works out which mip level each texture needs from the distance of the
+  nearest object using it (:func:`desired_mip_level`), and uploads the next larger level of the textures that are
+  short of it, nearest first, until the frame's byte budget is spent. Levels larger than anything shipped so far
+  are fetched (decoded again, only those levels) when the camera first comes close enough to need them.
+- Textures that stay far away never get their largest levels decoded, shipped or uploaded.
+
+Everything here is plain Python over a small texture protocol, so the policy can be tested without a GPU.
+"""
+
+from __future__ import annotations
+
+import math
+
+from typing import TYPE_CHECKING, Callable, NamedTuple, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+RGBA_BYTES_PER_PIXEL = 4
+DEFAULT_BYTES_PER_FRAME = 4 * 1024 * 1024
+DEFAULT_INITIAL_BYTES = 64 * 1024
+# Distance (in world units) up to which a texture is wanted at full resolution; each doubling drops one level
+DEFAULT_FULL_DETAIL_DISTANCE = 16.0
+# More levels than any texture has (a 32768 pixel wide one has 16)
+MAX_MIP_COUNT = 16
+
+
+class MipLevel(NamedTuple):
+    """Where one mip level sits in a packed mip chain (largest level first)."""
+
+    level: int
+    width: int
+    height: int
+    offset: int
+    nbytes: int
+
+
+class StreamableTexture(Protocol):
+    """A texture whose mip levels can be made resident one at a time, from the smallest up."""
+
+    @property
+    def mip_count(self) -> int: ...
+
+    @property
+    def resident_level(self) -> int:
+        """The largest (lowest-numbered) mip level uploaded so far; levels below it are missing."""
+        ...
+
+    @property
+    def held_level(self) -> int:
+        """The largest level uploaded or held in memory for upload; levels below it have to be fetched first."""
+        ...
+
+    def level_nbytes(self, level: int) -> int: ...
+
+    def upload_level(self, level: int) -> None:
+        """Upload `level`, which is always ``resident_level - 1`` and held in memory."""
+        ...
+
+
+# Fetches the levels [first, stop) of a streamed texture; its holder hands them to the texture once decoded
+FetchLevels = Callable[[str, int, int], None]
+
+
+def mip_chain(
+    width: int,
+    height: int,
+    mip_count: int,
+    bytes_per_pixel: int = RGBA_BYTES_PER_PIXEL,
+) -> list[MipLevel]:
+    """Returns the layout of a packed mip chain of `mip_count` levels, each half the size of the previous one."""
+    levels: list[MipLevel] = []
+    offset: int = 0
+    for level in range(max(1, mip_count)):
+        level_width: int = max(1, width >> level)
+        level_height: int = max(1, height >> level)
+        nbytes: int = level_width * level_height * bytes_per_pixel
+        levels.append(MipLevel(level, level_width, level_height, offset, nbytes))
+        offset += nbytes
+    return levels
+
+
+def initial_mip_level(
+    levels: list[MipLevel],
+    max_bytes: int = DEFAULT_INITIAL_BYTES,
+) -> int:
+    """Returns the largest of `levels` such that it and every smaller one fit in `max_bytes` (at least the smallest)."""
+    total: int = 0
+    first: int = levels[-1].level
+    for level in reversed(levels):
+        total += level.nbytes
+        if total > max_bytes:
+            break
+        first = level.level
+    return max(0, first)
+
+
+def desired_mip_level(
+    mip_count: int,
+    distance: float,
+    full_detail_distance: float = DEFAULT_FULL_DETAIL_DISTANCE,
+) -> int:
+    """Returns the mip level a texture needs when its nearest user is `distance` away from the camera.
+
+    Up to `full_detail_distance` the full-resolution level is wanted; every doubling of the distance after that
+    halves the on-screen size, so one level less is needed.
+    """
+    if mip_count <= 1 or distance <= full_detail_distance or full_detail_distance <= 0:
+        return 0
+    return min(mip_count - 1, int(math.log2(distance / full_detail_distance)))
+
+
+class TextureStreamer:
+    """Schedules mip level uploads (and fetches) for streamed textures under a per-frame byte budget.
+
+    Args:
+    ----
+        bytes_per_frame: Upload budget per :meth:`update`; at least one level is uploaded per frame regardless
+        full_detail_distance: Distance up to which textures are streamed to full resolution
+        fetch: Called with (name, first_level, stop_level) when a texture needs levels it does not hold; the caller
+            hands them to the texture with ``add_levels`` and then calls :meth:`fetched`
+
+    Attributes:
+    ----------
+        uploaded_bytes: Bytes uploaded by the last update
+    """
+
+    def __init__(
+        self,
+        *,
+        bytes_per_frame: int = DEFAULT_BYTES_PER_FRAME,
+        full_detail_distance: float = DEFAULT_FULL_DETAIL_DISTANCE,
+        fetch: FetchLevels | None = None,
+    ):
+        self.bytes_per_frame: int = max(0, bytes_per_frame)
+        self.full_detail_distance: float = full_detail_distance
+        self.fetch: FetchLevels | None = fetch
+        self.uploaded_bytes: int = 0
+        self._textures: dict[str, StreamableTexture] = {}
+        self._distances: dict[str, float] = {}
+        self._fetching: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+    @property
+    def pending(self) -> set[str]:
+        """Lowercase names of the streamed textures that do not have all their levels uploaded yet."""
+        return set(self._textures)
+
+    def first_level(self, distance: float | None) -> int:
+        """Returns the level to request a new texture from, when its nearest user is `distance` away (None: unknown).
+
+        The texture's mip count is not known before it is decoded, so the loader clamps the result to its chain.
+        """
+        if distance is None:
+            return 0
+        return desired_mip_level(MAX_MIP_COUNT, distance, self.full_detail_distance)
+
+    def register(
+        self,
+        name: str,
+        texture: StreamableTexture,
+    ):
+        """Stream the missing levels of a texture created with only its smallest levels.
+
+        Texture names are case-insensitive, like the scene's texture cache.
+        """
+        if texture.resident_level > 0:
+            self._textures[name.lower()] = texture
+        else:
+            self.forget(name)
+
+    def forget(self, name: str):
+        self._textures.pop(name.lower(), None)
+        self._distances.pop(name.lower(), None)
+        self._fetching.discard(name.lower())
+
+    def fetched(self, name: str):
+        """Note that a fetch for `name` finished (its levels, if any, were given to the texture)."""
+        self._fetching.discard(name.lower())
+
+    def clear(self):
+        self._textures.clear()
+        self._distances.clear()
+        self._fetching.clear()
+
+    def observe(self, distances: Iterable[tuple[str, float]]):
+        """Record how far from the camera the nearest user of each texture is this frame.
+
+        Textures not observed keep their last distance; textures never observed are not streamed.
+        """
+        for name, distance in distances:
+            key: str = name.lower()
+            if key in self._textures:
+                self._distances[key] = distance
+
+    def _targets(self) -> list[tuple[float, str, int]]:
+        """Returns (distance, name, desired level) of the textures short of their desired level, nearest first."""
+        targets: list[tuple[float, str, int]] = []
+        for name, distance in self._distances.items():
+            texture: StreamableTexture | None = self._textures.get(name)
+            if texture is None:
+                continue
+            target: int = desired_mip_level(texture.mip_count, distance, self.full_detail_distance)
+            if texture.resident_level > target:
+                targets.append((distance, name, target))
+        targets.sort()
+        return targets
+
+    def plan(self) -> list[tuple[str, int]]:
+        """Returns the (texture, level) uploads for this frame, in order.
+
+        Textures short of their desired level are served nearest first, one level at a time (so every texture
+        moves up a level before any moves up two), until the frame's budget is spent. Only levels the textures
+        hold are planned; see :meth:`fetches` for the others.
+        """
+        wanted: list[tuple[float, str, int, int]] = [
+            (distance, name, self._textures[name].resident_level, target) for distance, name, target in self._targets()
+        ]
+        uploads: list[tuple[str, int]] = []
+        budget: int = self.bytes_per_frame
+        while wanted:
+            next_round: list[tuple[float, str, int, int]] = []
+            for distance, name, resident, target in wanted:
+                texture: StreamableTexture = self._textures[name]
+                level: int = resident - 1
+                if level < texture.held_level:
+                    continue
+                nbytes: int = texture.level_nbytes(level)
+                if uploads and nbytes > budget:
+                    return uploads
+                uploads.append((name, level))
+                budget -= nbytes
+                if level > target:
+                    next_round.append((distance, name, level, target))
+            wanted = next_round
+        return uploads
+
+    def fetches(self) -> list[tuple[str, int, int]]:
+        """Returns the (texture, first_level, stop_level) fetches needed for the levels the textures do not hold.
+
+        Textures with a fetch in flight are skipped. Fetches are planned while held levels are still being
+        uploaded, so the larger levels are usually ready by the time they are needed.
+        """
+        fetches: list[tuple[str, int, int]] = []
+        for _distance, name, target in self._targets():
+            held: int = self._textures[name].held_level
+            if target < held and name not in self._fetching:
+                fetches.append((name, target, held))
+        return fetches
+
+    def update(self) -> int:
+        """Upload this frame's planned levels and start the needed fetches; returns the number of bytes uploaded."""
+        self.uploaded_bytes = 0
+        for name, level in self.plan():
+            texture: StreamableTexture = self._textures[name]
+            texture.upload_level(level)
+            self.uploaded_bytes += texture.level_nbytes(level)
+            if texture.resident_level == 0:
+                self.forget(name)
+        if self.fetch is not None:
+            for name, first_level, stop_level in self.fetches():
+                self._fetching.add(name)
+                self.fetch(name, first_level, stop_level)
+        return self.uploaded_bytes
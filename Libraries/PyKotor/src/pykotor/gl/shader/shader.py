@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from pykotor.gl.glm_compat import mat4, vec3, vec4, value_ptr
 
 from pykotor.gl.compat import (
@@ -209,9 +211,11 @@ class Shader:
     def set_matrix4(
         self,
         uniform: str,
-        matrix: mat4,
+        matrix: mat4 | np.ndarray,
     ):
-        glUniformMatrix4fv(self.uniform(uniform), 1, GL_FALSE, value_ptr(matrix))
+        """Set a mat4 uniform from a GLM-style matrix or a column-major (4, 4) float32 array (see gl.native.transforms)."""
+        data = matrix if isinstance(matrix, np.ndarray) else value_ptr(matrix)
+        glUniformMatrix4fv(self.uniform(uniform), 1, GL_FALSE, data)
 
     def set_vector4(
         self,
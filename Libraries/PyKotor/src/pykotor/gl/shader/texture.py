@@ -38,6 +38,7 @@ if HAS_PYOPENGL:
         glTexParameteri,
     )
     from OpenGL.raw.GL.VERSION.GL_1_1 import glBindTexture  # pyright: ignore[reportMissingImports]
+    from OpenGL.raw.GL.VERSION.GL_1_2 import GL_TEXTURE_BASE_LEVEL, GL_TEXTURE_MAX_LEVEL  # pyright: ignore[reportMissingImports]
     from OpenGL.raw.GL.VERSION.GL_1_3 import glCompressedTexImage2D  # pyright: ignore[reportMissingImports]
 else:
     glGenTextures = missing_gl_func("glGenTextures")
@@ -59,6 +60,8 @@ else:
     GL_RGB = missing_constant("GL_RGB")
     GL_RGBA = missing_constant("GL_RGBA")
     GL_TEXTURE_2D = missing_constant("GL_TEXTURE_2D")
+    GL_TEXTURE_BASE_LEVEL = missing_constant("GL_TEXTURE_BASE_LEVEL")
+    GL_TEXTURE_MAX_LEVEL = missing_constant("GL_TEXTURE_MAX_LEVEL")
     GL_TEXTURE_MAG_FILTER = missing_constant("GL_TEXTURE_MAG_FILTER")
     GL_TEXTURE_MIN_FILTER = missing_constant("GL_TEXTURE_MIN_FILTER")
     GL_TEXTURE_WRAP_S = missing_constant("GL_TEXTURE_WRAP_S")
@@ -73,6 +76,9 @@ from pykotor.resource.formats.tpc.convert.dxt.decompress_dxt import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pykotor.gl.scene.texture_streaming import MipLevel
     from pykotor.resource.formats.tpc import TPC, TPCMipmap
 
 
@@ -95,6 +101,12 @@ class Texture:
         self.alpha_cutoff: float = 0.0
         self.has_alpha: bool = False
 
+        # Mip streaming state (see from_rgba_mips); a texture created any other way is fully resident.
+        # _mip_data holds only the levels waiting for upload, and each is dropped once uploaded.
+        self._mip_levels: list[MipLevel] = []
+        self._mip_data: dict[int, bytes] = {}
+        self._resident_level: int = 0
+
     @classmethod
     def from_tpc(
         cls,
@@ -187,6 +199,120 @@ class Texture:
         
         return Texture(gl_id, width, height, bytes(rgba_data))
 
+    @classmethod
+    def from_rgba_mips(
+        cls,
+        width: int,
+        height: int,
+        levels: Sequence[bytes | memoryview],
+        mip_count: int,
+        *,
+        base_level: int = 0,
+        max_initial_bytes: int | None = None,
+    ) -> Texture:
+        """Create a texture from the RGBA levels of a mip chain, uploading only its smallest levels.
+
+        `levels` are the levels from `base_level` to the end of the chain: levels larger than `base_level` were not
+        decoded, and are fetched later if the texture is needed closer (see
+        :class:`~pykotor.gl.scene.texture_streaming.TextureStreamer`). Of the given levels, those that fit in
+        `max_initial_bytes` are uploaded now; the others are kept and uploaded one at a time with
+        :meth:`upload_level`.
+
+        Args:
+        ----
+            width: Width of level 0 in pixels
+            height: Height of level 0 in pixels
+            levels: RGBA pixel data of levels `base_level` to ``mip_count - 1``, largest first
+            mip_count: Number of levels in the whole chain
+            base_level: Level of ``levels[0]``
+            max_initial_bytes: Upload budget for the levels created immediately (defaults to 64 KiB)
+
+        Returns:
+        -------
+            Texture: OpenGL texture object
+        """
+        from pykotor.gl.scene.texture_streaming import DEFAULT_INITIAL_BYTES, initial_mip_level, mip_chain
+
+        chain: list[MipLevel] = mip_chain(width, height, mip_count)
+        shipped: list[MipLevel] = chain[base_level : base_level + len(levels)]
+        if mip_count <= 1 or not shipped or shipped[-1].level != mip_count - 1 or any(len(data) != mip.nbytes for mip, data in zip(shipped, levels)):
+            if base_level == 0 and levels and len(levels[0]) >= chain[0].nbytes:
+                # Not a complete chain: use the largest level with generated mipmaps
+                return cls.from_rgba(width, height, levels[0][: chain[0].nbytes])  # pyright: ignore[reportArgumentType]
+            msg = f"Mip levels {base_level}-{base_level + len(levels) - 1} do not complete a {width}x{height} chain of {mip_count} levels"
+            raise ValueError(msg)
+
+        first: int = initial_mip_level(shipped, DEFAULT_INITIAL_BYTES if max_initial_bytes is None else max_initial_bytes)
+        gl_id: int = 0
+        if HAS_PYOPENGL:
+            gl_id = glGenTextures(1)
+            glBindTexture(GL_TEXTURE_2D, gl_id)
+            for mip in chain[first:]:
+                glTexImage2D(GL_TEXTURE_2D, mip.level, GL_RGBA, mip.width, mip.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, levels[mip.level - base_level])
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+            # Sampling is clamped to the uploaded levels, so the texture is complete while larger levels are missing.
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_BASE_LEVEL, first)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, mip_count - 1)
+
+        texture = Texture(gl_id, width, height, bytes(levels[0]) if first == 0 else None)
+        texture._mip_levels = chain
+        texture._resident_level = first
+        texture.add_levels(base_level, levels[: first - base_level])
+        return texture
+
+    @property
+    def mip_count(self) -> int:
+        return max(1, len(self._mip_levels))
+
+    @property
+    def resident_level(self) -> int:
+        """The largest mip level uploaded so far (0 once the texture is fully resident)."""
+        return self._resident_level
+
+    @property
+    def held_level(self) -> int:
+        """The largest mip level uploaded or waiting for upload; larger levels have to be added first."""
+        return min(self._mip_data, default=self._resident_level)
+
+    def level_nbytes(self, level: int) -> int:
+        return self._mip_levels[level].nbytes
+
+    def add_levels(
+        self,
+        first_level: int,
+        levels: Sequence[bytes | memoryview],
+    ):
+        """Keep the RGBA pixels of levels `first_level`, ``first_level + 1``... for upload with :meth:`upload_level`.
+
+        Levels that are already uploaded or held are skipped, as are levels that do not adjoin the held ones.
+        """
+        held: int = self.held_level
+        if first_level + len(levels) < held:
+            return
+        for level in range(held - 1, first_level - 1, -1):
+            data = levels[level - first_level]
+            if len(data) != self._mip_levels[level].nbytes:
+                break
+            self._mip_data[level] = bytes(data)
+
+    def upload_level(self, level: int):
+        """Upload the next larger mip level of a texture created by :meth:`from_rgba_mips`, then drop its pixels."""
+        if level != self._resident_level - 1 or level not in self._mip_data:
+            msg = f"Cannot upload mip level {level} of a texture whose resident level is {self._resident_level} (held from {self.held_level})"
+            raise ValueError(msg)
+        data: bytes = self._mip_data.pop(level)
+        mip: MipLevel = self._mip_levels[level]
+        if HAS_PYOPENGL:
+            glBindTexture(GL_TEXTURE_2D, self._id)
+            glTexImage2D(GL_TEXTURE_2D, level, GL_RGBA, mip.width, mip.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, data)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_BASE_LEVEL, level)
+        self._resident_level = level
+        if level == 0:
+            self._rgba_cache = data
+
     @classmethod
     def from_color(
         cls,
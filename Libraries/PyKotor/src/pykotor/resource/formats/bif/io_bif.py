@@ -18,7 +18,10 @@ _LZMA_RAW_FILTERS: list[dict[str, int]] = [{"id": lzma.FILTER_LZMA1}]
 def _decompress_bzf_payload(payload: bytes, expected_size: int) -> bytes:
     """Handle both raw and containerised LZMA payloads, tolerating 4-byte padding."""
     try:
-        data = lzma.decompress(payload, format=lzma.FORMAT_RAW, filters=_LZMA_RAW_FILTERS)
+        # A single-stream decompressor stops at the end-of-stream marker and leaves the
+        # alignment padding in `unused_data`, where `lzma.decompress` would try to parse it
+        # as another stream.
+        data = lzma.LZMADecompressor(format=lzma.FORMAT_RAW, filters=_LZMA_RAW_FILTERS).decompress(payload)
     except lzma.LZMAError:
         cleaned_payload = payload
         while True:
@@ -33,8 +33,9 @@ References:
 from __future__ import annotations
 
 import difflib
+import hashlib
 import math
-import sys
+import weakref
 
 from contextlib import contextmanager
 from copy import copy, deepcopy
@@ -423,9 +424,6 @@ class GFF(ComparableMixin):
             - Collect statistics about field usage and mismatches
             - Return comprehensive comparison results
         """
-        # Debug: check if this method is called 
-        print(f"DEBUG: GFF.compare called for {path}, len(self.root)={len(self.root)}", file=sys.stderr)
-        print(f"DEBUG: self.root: {self.root}", file=sys.stderr)
         # For unified diff format, skip structured logging and just return comparison result
         if format_type == "unified":
             if not isinstance(other, GFF):
@@ -562,6 +560,7 @@ class GFFStruct(ComparableMixin, dict):
     """
 
     COMPARABLE_FIELDS = ("struct_id", "_fields")
+    COMPARE_IGNORED_LABELS: frozenset[str] = frozenset({"KTInfoDate", "KTGameVerIndex", "KTInfoVersion", "EditorInfo"})
 
     def __init__(
         self,
@@ -570,12 +569,25 @@ class GFFStruct(ComparableMixin, dict):
         # Initialize dict first
         super().__init__()
 
+        # Cached digest of this subtree and the structs/lists it was hashed into (see `content_hash`)
+        self._content_hash: bytes | None = None
+        self._hash_parents: dict[int, weakref.ReferenceType] = {}
+
         # User-defined struct type identifier (uint32 in binary)
         self.struct_id: int = struct_id
 
         # Ordered dictionary of field labels to field instances
         self._fields: dict[str, _GFFField] = {}
 
+    @property
+    def struct_id(self) -> int:
+        return self._struct_id
+
+    @struct_id.setter
+    def struct_id(self, value: int):
+        self._struct_id = value
+        self.invalidate_content_hash()
+
     def __copy__(self) -> Self:
         """Support `copy.copy(GFFStruct)` without going through `dict` reconstruction.
 
@@ -628,6 +640,7 @@ class GFFStruct(ComparableMixin, dict):
         if isinstance(key, str):
             if key in self._fields:
                 del self._fields[key]
+                self.invalidate_content_hash()
         else:
             raise TypeError("GFFStruct keys must be strings")
 
@@ -729,6 +742,42 @@ class GFFStruct(ComparableMixin, dict):
         """
         if label in self._fields:
             self._fields.pop(label)
+            self.invalidate_content_hash()
+
+    def content_hash(self) -> bytes:
+        """Returns a digest of the struct ID and fields of this struct, including every nested struct and list.
+
+        Identical subtrees have identical digests, so comparisons can skip them without walking them. The digest
+        is cached and dropped when this struct or anything nested in it is changed through the GFFStruct/GFFList
+        API. Field values changed in place (e.g. a LocalizedString returned by `get_locstring`) are not tracked;
+        call `invalidate_content_hash` after doing so.
+
+        Returns:
+        -------
+            A 16-byte digest.
+        """
+        if self._content_hash is None:
+            digest = hashlib.blake2b(str(self._struct_id).encode(), digest_size=16)
+            for label in sorted(self._fields):
+                field: _GFFField = self._fields[label]
+                digest.update(repr((label, int(field.field_type()), _content_hash_value(self, field.value()))).encode(errors="backslashreplace"))
+            self._content_hash = digest.digest()
+        return self._content_hash
+
+    def invalidate_content_hash(self):
+        """Drops the cached `content_hash` of this struct and of every struct/list it is nested in."""
+        if self._content_hash is not None:
+            _invalidate_content_hashes(self)
+
+    def _set_field(
+        self,
+        label: str,
+        field_type: GFFFieldType,
+        value: Any,
+    ):
+        self._fields[label] = _GFFField(field_type, value)
+        if self._content_hash is not None:
+            _invalidate_content_hashes(self)
 
     def exists(
         self,
@@ -781,25 +830,16 @@ class GFFStruct(ComparableMixin, dict):
 
             log_func = noop_log_func
 
-        ignore_labels: set[str] = {
-            "KTInfoDate",
-            "KTGameVerIndex",
-            "KTInfoVersion",
-            "EditorInfo",
-        }
+        ignore_labels: frozenset[str] = self.COMPARE_IGNORED_LABELS
         ignore_values = ignore_values or {}
         comparison_result = comparison_result or GFFComparisonResult()
 
-        def is_ignorable_value(label: str, v: Any) -> bool:
-            """Check if a value is ignorable for a specific label."""
-            return not v or str(v) in {"0", "-1"} or (label in ignore_values and v in ignore_values[label])
-
         def is_ignorable_comparison(
             label: str,
             old_value: object,
             new_value: object,
         ) -> bool:
-            return is_ignorable_value(label, old_value) and is_ignorable_value(label, new_value)
+            return _is_ignorable_value(label, old_value, ignore_values) and _is_ignorable_value(label, new_value, ignore_values)
 
         current_path = PureWindowsPath(current_path or "GFFRoot")
         if not isinstance(other, GFFStruct):
@@ -807,6 +847,10 @@ class GFFStruct(ComparableMixin, dict):
             log_func("", message_type="diff")
             is_same = False
             return is_same
+        if self.content_hash() == other.content_hash():
+            # Identical subtrees (including ignored labels) cannot contribute any differences, only "used" stats
+            self._add_unchanged_field_stats(comparison_result, ignore_default_changes=ignore_default_changes, ignore_values=ignore_values)
+            return bool(comparison_result)
         if len(self) != len(other) and not ignore_default_changes:
             log_func("", message_type="diff")
             log_func(f"GFFStruct: number of fields have changed at '{current_path}': '{len(self)}' --> '{len(other)}'", message_type="diff")
@@ -911,6 +955,26 @@ class GFFStruct(ComparableMixin, dict):
 
         return bool(comparison_result)
 
+    def _add_unchanged_field_stats(
+        self,
+        comparison_result: GFFComparisonResult,
+        *,
+        ignore_default_changes: bool = False,
+        ignore_values: dict[str, set[Any]] | None = None,
+    ):
+        """Records the "used" field stats a full `compare` of this struct against an identical one would record."""
+        ignore_values = ignore_values or {}
+        for idx, (label, field_type, value) in enumerate(self):
+            if label in self.COMPARE_IGNORED_LABELS:
+                continue
+            if ignore_default_changes and _is_ignorable_value(label, value, ignore_values):
+                continue
+            if field_type == GFFFieldType.Struct:
+                value._add_unchanged_field_stats(comparison_result, ignore_default_changes=ignore_default_changes, ignore_values=ignore_values)
+            elif field_type == GFFFieldType.List:
+                value._add_unchanged_field_stats(comparison_result, ignore_default_changes=ignore_default_changes)
+            comparison_result.add_field_stat("used", label or f"gffstruct({idx})")
+
     def what_type(
         self,
         label: str,
@@ -1042,7 +1106,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.UInt8, value)
+        self._set_field(label, GFFFieldType.UInt8, value)
 
     def set_uint16(
         self,
@@ -1056,7 +1120,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.UInt16, value)
+        self._set_field(label, GFFFieldType.UInt16, value)
 
     def set_uint32(
         self,
@@ -1070,7 +1134,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.UInt32, value)
+        self._set_field(label, GFFFieldType.UInt32, value)
 
     def set_uint64(
         self,
@@ -1084,7 +1148,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.UInt64, value)
+        self._set_field(label, GFFFieldType.UInt64, value)
 
     def set_int8(
         self,
@@ -1098,7 +1162,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.Int8, value)
+        self._set_field(label, GFFFieldType.Int8, value)
 
     def set_int16(
         self,
@@ -1112,7 +1176,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.Int16, value)
+        self._set_field(label, GFFFieldType.Int16, value)
 
     def set_int32(
         self,
@@ -1126,7 +1190,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.Int32, value)
+        self._set_field(label, GFFFieldType.Int32, value)
 
     def set_int64(
         self,
@@ -1140,7 +1204,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.Int64, value)
+        self._set_field(label, GFFFieldType.Int64, value)
 
     def set_single(
         self,
@@ -1154,7 +1218,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.Single, value)
+        self._set_field(label, GFFFieldType.Single, value)
 
     def set_double(
         self,
@@ -1168,7 +1232,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.Double, value)
+        self._set_field(label, GFFFieldType.Double, value)
 
     def set_resref(
         self,
@@ -1182,7 +1246,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.ResRef, value)
+        self._set_field(label, GFFFieldType.ResRef, value)
 
     def set_string(
         self,
@@ -1196,7 +1260,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.String, value)
+        self._set_field(label, GFFFieldType.String, value)
 
     def set_locstring(
         self,
@@ -1210,7 +1274,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.LocalizedString, value)
+        self._set_field(label, GFFFieldType.LocalizedString, value)
 
     def set_binary(
         self,
@@ -1224,7 +1288,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.Binary, value)
+        self._set_field(label, GFFFieldType.Binary, value)
 
     def set_vector3(
         self,
@@ -1238,7 +1302,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.Vector3, value)
+        self._set_field(label, GFFFieldType.Vector3, value)
 
     def set_vector4(
         self,
@@ -1252,7 +1316,7 @@ class GFFStruct(ComparableMixin, dict):
             label: The field label.
             value: The new field value.
         """
-        self._fields[label] = _GFFField(GFFFieldType.Vector4, value)
+        self._set_field(label, GFFFieldType.Vector4, value)
 
     def set_struct(
         self,
@@ -1270,7 +1334,7 @@ class GFFStruct(ComparableMixin, dict):
         -------
             The value that was passed to the method.
         """
-        self._fields[label] = _GFFField(GFFFieldType.Struct, value)
+        self._set_field(label, GFFFieldType.Struct, value)
         return value
 
     def set_list(
@@ -1289,7 +1353,7 @@ class GFFStruct(ComparableMixin, dict):
         -------
             The value that was passed to the method.
         """
-        self._fields[label] = _GFFField(GFFFieldType.List, value)
+        self._set_field(label, GFFFieldType.List, value)
         return value
 
     def get_uint8(
@@ -1725,6 +1789,7 @@ class GFFStruct(ComparableMixin, dict):
         except Exception:
             # Rollback on error
             self._fields = original_fields
+            self.invalidate_content_hash()
             raise
 
     def get_nested_struct(
@@ -1912,6 +1977,8 @@ class GFFList(ComparableMixin, list):
         # Initialize list first
         super().__init__()
         self._structs: list[GFFStruct] = []
+        self._content_hash: bytes | None = None
+        self._hash_parents: dict[int, weakref.ReferenceType] = {}
 
     def __copy__(self) -> "GFFList":
         """Support `copy.copy(GFFList)` safely.
@@ -1950,10 +2017,12 @@ class GFFList(ComparableMixin, list):
         if not isinstance(value, GFFStruct):
             raise TypeError("GFFList elements must be GFFStruct instances")
         self._structs[index] = value
+        self.invalidate_content_hash()
 
     def __delitem__(self, index: int) -> None:
         """Remove struct at specified index."""
         del self._structs[index]
+        self.invalidate_content_hash()
 
     def __iter__(self):
         """Iterate through structs."""
@@ -1981,6 +2050,7 @@ class GFFList(ComparableMixin, list):
             raise TypeError(msg)
 
         self._structs.append(struct)
+        self.invalidate_content_hash()
         RobustLogger().debug(f"Appended Struct#{struct.struct_id} to GFFList; list_length={len(self._structs)}.")
 
     def extend(self, other):
@@ -1993,6 +2063,7 @@ class GFFList(ComparableMixin, list):
         if not isinstance(struct, GFFStruct):
             raise TypeError("GFFList elements must be GFFStruct instances")
         self._structs.insert(index, struct)
+        self.invalidate_content_hash()
 
     def __repr__(self) -> str:
         """Returns a detailed string representation of the GFFList."""
@@ -2046,6 +2117,7 @@ class GFFList(ComparableMixin, list):
         """
         new_struct = GFFStruct(struct_id)
         self._structs.append(new_struct)
+        self.invalidate_content_hash()
         return new_struct
 
     def at(
@@ -2075,6 +2147,36 @@ class GFFList(ComparableMixin, list):
             index: The index of the desired struct.
         """
         self._structs.pop(index)
+        self.invalidate_content_hash()
+
+    def content_hash(self) -> bytes:
+        """Returns a digest of the structs in this list, in order. See `GFFStruct.content_hash`.
+
+        Returns:
+        -------
+            A 16-byte digest.
+        """
+        if self._content_hash is None:
+            digest = hashlib.blake2b(b"list", digest_size=16)
+            for struct in self._structs:
+                digest.update(_content_hash_value(self, struct))
+            self._content_hash = digest.digest()
+        return self._content_hash
+
+    def invalidate_content_hash(self):
+        """Drops the cached `content_hash` of this list and of every struct/list it is nested in."""
+        if self._content_hash is not None:
+            _invalidate_content_hashes(self)
+
+    def _add_unchanged_field_stats(
+        self,
+        comparison_result: GFFComparisonResult,
+        *,
+        ignore_default_changes: bool = False,
+    ):
+        """Records the "used" field stats that comparing each struct of this list against itself would record."""
+        for struct in self._structs:
+            struct._add_unchanged_field_stats(comparison_result, ignore_default_changes=ignore_default_changes)  # noqa: SLF001
 
     def compare(
         self,
@@ -2130,71 +2232,20 @@ class GFFList(ComparableMixin, list):
             is_same_result = False
             return is_same_result
 
-        # Build content-based lookup to detect moved/reordered structs
-        def _hashable_value(value: Any) -> Any:
-            """Convert a GFF field value into a hashable, comparable representation."""
-            from pykotor.common.language import LocalizedString
-            from pykotor.common.misc import ResRef
-            from utility.common.geometry import Vector3, Vector4  # Local import to avoid circular deps
-
-            if value is None or isinstance(value, (int, float, str, bool, bytes)):
-                return value
-            if isinstance(value, ResRef):
-                return ("ResRef", str(value))
-            if isinstance(value, Vector3):
-                return ("Vector3", value.x, value.y, value.z)
-            if isinstance(value, Vector4):
-                return ("Vector4", value.x, value.y, value.z, value.w)
-            if isinstance(value, LocalizedString):
-                return (
-                    "LocalizedString",
-                    value.stringref,
-                    tuple((lang, gender, text) for lang, gender, text in value),
-                )
-            if isinstance(value, GFFStruct):
-                return struct_key(value)
-            if isinstance(value, GFFList):
-                return tuple(struct_key(child_struct) for child_struct in value)
-            if isinstance(value, (list, tuple, set)):
-                return tuple(_hashable_value(item) for item in value)
-            if isinstance(value, dict):
-                return tuple(sorted((key, _hashable_value(val)) for key, val in value.items()))
-
-            # Fallback: use repr for deterministic but comparable form
-            return ("repr", repr(value))
-
-        def struct_key(struct: GFFStruct) -> tuple[int, tuple[tuple[str, GFFFieldType, Any], ...]]:
-            """Create a hashable key for a struct based on struct_id and field contents.
-
-            This allows us to detect when structs have been moved/reordered.
-            """
-            fields_tuple: tuple[tuple[str, GFFFieldType, Any], ...] = tuple(
-                sorted(
-                    (
-                        label,
-                        field_type,
-                        _hashable_value(value),
-                    )
-                    for label, field_type, value in struct
-                )
-            )
-            return (struct.struct_id, fields_tuple)
+        if self.content_hash() == other.content_hash():
+            if comparison_result is not None:
+                self._add_unchanged_field_stats(comparison_result, ignore_default_changes=ignore_default_changes)
+            return is_same_result
 
-        # Build maps of content to indices
-        old_structs_map: dict[tuple[int, tuple[tuple[str, GFFFieldType, Any], ...]], list[int]] = {}  # content -> list of indices
-        new_structs_map: dict[tuple[int, tuple[tuple[str, GFFFieldType, Any], ...]], list[int]] = {}  # content -> list of indices
+        # Build maps of content to indices to detect moved/reordered structs
+        old_structs_map: dict[bytes, list[int]] = {}  # content -> list of indices
+        new_structs_map: dict[bytes, list[int]] = {}  # content -> list of indices
 
         for idx, struct in enumerate(self):
-            key = struct_key(struct)
-            if key not in old_structs_map:
-                old_structs_map[key] = []
-            old_structs_map[key].append(idx)
+            old_structs_map.setdefault(struct.content_hash(), []).append(idx)
 
         for idx, struct in enumerate(other):
-            key = struct_key(struct)
-            if key not in new_structs_map:
-                new_structs_map[key] = []
-            new_structs_map[key].append(idx)
+            new_structs_map.setdefault(struct.content_hash(), []).append(idx)
 
         # Find structs that exist in both (at any index) vs truly added/removed
         added_keys = set(new_structs_map.keys()) - set(old_structs_map.keys())
@@ -2259,9 +2310,6 @@ class GFFList(ComparableMixin, list):
                 if moved_count == 0:
                     log_func("", message_type="diff")
                 moved_count += 1
-                struct_id = key[0]
-                old_indices_str = ", ".join(str(i) for i in sorted(old_indices))
-                new_indices_str = ", ".join(str(i) for i in sorted(new_indices))
                 log_func("", message_type="diff")
                 # Mark these indices as reported so we don't double-report them
                 reported_indices_old.update(old_indices)
@@ -2284,10 +2332,7 @@ class GFFList(ComparableMixin, list):
             new_struct = other[idx]
 
             # Compare structs at same index
-            old_key = struct_key(old_struct)
-            new_key = struct_key(new_struct)
-
-            if old_key != new_key:
+            if old_struct.content_hash() != new_struct.content_hash():
                 # This is a genuine content change at the same index
                 if modified_count == 0:
                     log_func("", message_type="diff")
@@ -2306,27 +2351,13 @@ class GFFList(ComparableMixin, list):
                 reported_indices_old.add(idx)
                 reported_indices_new.add(idx)
 
-        # For structs at same index with same content (not moved, not modified), still do comparison
-        # to catch any nested differences
-        for idx in range(max_index):
-            if idx in reported_indices_old or idx in reported_indices_new:
-                continue
-
-            old_struct = self[idx]
-            new_struct = other[idx]
-
-            # These should be identical at the top level, but check nested structures
-            if not old_struct.compare(
-                new_struct,
-                log_func,
-                current_path / str(idx),
-                ignore_default_changes,
-                comparison_result=comparison_result,
-            ):
-                is_same_result = False
-
         if modified_count > 0 and comparison_result is not None:
             comparison_result.add_field_stat("mismatched", str(current_path))
+        if comparison_result is not None:
+            # Structs left at their index unchanged still count towards the "used" stats
+            for idx in range(max_index):
+                if idx not in reported_indices_old and idx not in reported_indices_new:
+                    self[idx]._add_unchanged_field_stats(comparison_result, ignore_default_changes=ignore_default_changes)
 
         # Summary
         has_differences = bool(added_keys or removed_keys or moved_count or modified_count)
@@ -2334,3 +2365,44 @@ class GFFList(ComparableMixin, list):
             log_func(f"\nGFFList Summary at '{current_path}': {len(added_keys)} added, {len(removed_keys)} removed, {moved_count} moved/reordered, {modified_count} modified")
 
         return not has_differences
+
+
+def _is_ignorable_value(
+    label: str,
+    value: Any,
+    ignore_values: dict[str, set[Any]],
+) -> bool:
+    """Returns True if a value counts as a default (or listed as ignorable for `label`) when default changes are ignored."""
+    return not value or str(value) in {"0", "-1"} or (label in ignore_values and value in ignore_values[label])
+
+
+def _content_hash_value(
+    parent: GFFStruct | GFFList,
+    value: Any,
+) -> Any:
+    """Returns a hashable stand-in for a field value, registering `parent` with nested structs/lists so it is invalidated with them."""
+    if isinstance(value, (GFFStruct, GFFList)):
+        value._hash_parents[id(parent)] = weakref.ref(parent)  # noqa: SLF001
+        return value.content_hash()
+    if isinstance(value, LocalizedString):
+        return (value.stringref, sorted((LocalizedString.substring_id(lang, gender), text) for lang, gender, text in value))
+    if isinstance(value, ResRef):
+        return str(value)
+    if isinstance(value, Vector4):
+        return (value.x, value.y, value.z, value.w)
+    if isinstance(value, Vector3):
+        return (value.x, value.y, value.z)
+    return value
+
+
+def _invalidate_content_hashes(node: GFFStruct | GFFList):
+    """Drops the cached content hash of a struct/list and of every struct/list it was hashed into."""
+    pending: list[GFFStruct | GFFList] = [node]
+    while pending:
+        current: GFFStruct | GFFList = pending.pop()
+        if current._content_hash is None:  # noqa: SLF001
+            continue  # parents are only hashed after their children, so theirs are already gone
+        current._content_hash = None  # noqa: SLF001
+        parents: dict[int, weakref.ReferenceType] = current._hash_parents  # noqa: SLF001
+        current._hash_parents = {}  # noqa: SLF001
+        pending.extend(parent for parent in (ref() for ref in parents.values()) if parent is not None)
@@ -8,6 +8,8 @@ from pykotor.resource.formats.gff.gff_data import GFF, GFFContent, GFFFieldType,
 from pykotor.resource.type import ResourceReader, ResourceWriter, autoclose
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from pykotor.resource.type import SOURCE_TYPES, TARGET_TYPES
 
 _COMPLEX_FIELD: set[GFFFieldType] = {
@@ -54,15 +56,22 @@ class GFFBinaryReader(ResourceReader):
     ----------------
         - GFF V3.3, V4.0, V4.1 support (xoreos-tools supports these, KotOR likely does not)
         - StrRef field type (reone supports this at gffreader.cpp:141-142, 199-204)
+
+    Passing ``root_labels`` restricts loading to those fields of the root struct; every other root
+    field (including its nested structs and lists) is skipped without being decoded. This is the
+    cheap path used for listing screens that only need a handful of header values.
     """
     def __init__(
         self,
         source: SOURCE_TYPES,
         offset: int = 0,
         size: int = 0,
+        *,
+        root_labels: Collection[str] | None = None,
     ):
         super().__init__(source, offset, size)
         self._gff: GFF | None = None
+        self._root_labels: frozenset[str] | None = None if root_labels is None else frozenset(root_labels)
 
         self._labels: list[str] = []
         self._field_data_offset: int = 0
@@ -121,7 +130,7 @@ class GFFBinaryReader(ResourceReader):
         self._labels.clear()
         self._reader.seek(label_offset)
         self._labels.extend(self._reader.read_string(16) for _ in range(label_count))
-        self._load_struct(self._gff.root, 0)
+        self._load_struct(self._gff.root, 0, self._root_labels)
 
         return self._gff
 
@@ -129,6 +138,7 @@ class GFFBinaryReader(ResourceReader):
         self,
         gff_struct: GFFStruct,
         struct_index: int,
+        wanted: frozenset[str] | None = None,
     ):
         
         # Read struct header (12 bytes: struct_id, data/offset, field_count)
@@ -144,27 +154,30 @@ class GFFBinaryReader(ResourceReader):
         
         # Handle empty structs (field_count == 0), single field (field_count == 1), or multiple fields
         if field_count == 1:
-            self._load_field(gff_struct, data)
+            self._load_field(gff_struct, data, wanted)
         elif field_count > 1:
             
             # Read field indices array
             self._reader.seek(self._field_indices_offset + data)
             indices: list[int] = [self._reader.read_uint32() for _ in range(field_count)]
             for index in indices:
-                self._load_field(gff_struct, index)
+                self._load_field(gff_struct, index, wanted)
 
     def _load_field(
         self,
         gff_struct: GFFStruct,
         field_index: int,
+        wanted: frozenset[str] | None = None,
     ):
         # Read field header (12 bytes: field_type, label_index, data/offset)
         self._reader.seek(self._field_offset + field_index * 12)
         field_type_id = self._reader.read_uint32()
         label_id = self._reader.read_uint32()
 
-        field_type = GFFFieldType(field_type_id)
         label = self._labels[label_id]
+        if wanted is not None and label not in wanted:
+            return
+        field_type = GFFFieldType(field_type_id)
 
         # Handle complex fields (stored in field data section) vs simple fields (inline)
         if field_type in _COMPLEX_FIELD:
@@ -84,7 +84,7 @@ class GFFJSONReader(ResourceReader):
         for field_name, field_data in data.get("fields", {}).items():
             field_type = GFFFieldType(field_data.get("type", 0))
             field_value = self._parse_field_value(field_type=field_type, value=field_data.get("value"))
-            struct._fields[field_name] = _GFFField(field_type, field_value)
+            struct._set_field(field_name, field_type, field_value)  # noqa: SLF001
 
         return struct
 
@@ -129,7 +129,7 @@ class GFFJSONReader(ResourceReader):
         gff_list = GFFList()
         for item in data:
             struct = self._parse_struct(item)
-            gff_list._structs.append(struct)
+            gff_list.append(struct)
         return gff_list
 
     def _parse_locstring(
@@ -0,0 +1,417 @@
+"""Incremental document state for the NSS language server.
+
+Re-parsing a whole script on every keystroke is what makes large TSL scripts lag in
+the editor. NSS is a flat sequence of top-level declarations (functions, structs,
+globals, forward declarations and ``#include`` directives), so a document can be
+split into independent chunks with a cheap brace/comment/string aware scan and each
+chunk parsed on its own. Between two edits, only chunks whose text changed are
+parsed again; unchanged chunks keep their AST and only have their line numbers
+shifted.
+
+Included scripts are parsed once into symbol tables that are shared between all
+open documents and invalidated when the include file (or library entry) changes.
+"""
+from __future__ import annotations
+
+import os
+import re
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
+
+from pykotor.resource.formats.ncs.compiler.classes import FunctionDefinition, IncludeScript
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pykotor.resource.formats.ncs.compiler.classes import TopLevelObject
+
+
+class AnalysisCancelledError(Exception):
+    """Raised when an analysis is abandoned because a newer request superseded it."""
+
+
+@dataclass(frozen=True)
+class TopLevelChunk:
+    """The source text of a single top-level declaration.
+
+    Leading whitespace and comments belong to the chunk that follows them, so the
+    chunks of a document always concatenate back to the full text.
+    """
+    text: str
+    start_line: int  # 0-indexed line of the first character of the chunk
+    start_offset: int
+    has_code: bool
+
+
+# Everything the splitter has to look at; identifiers, numbers and operators are skipped in bulk.
+_SPLIT_TOKENS = re.compile(r'//[^\n]*|/\*.*?(?:\*/|\Z)|"(?:\\.|[^"\\])*(?:"|\Z)|[{}();#\n]', re.DOTALL)
+
+
+def split_top_level(text: str) -> list[TopLevelChunk]:  # noqa: C901, PLR0912
+    """Split NSS source into top-level declaration chunks.
+
+    A chunk ends at a ``;`` or a function body's closing ``}`` at brace depth 0,
+    after a struct definition's trailing ``;``, or at the end of a ``#`` directive
+    line. Braces, semicolons and newlines inside comments and string literals are
+    ignored. Unbalanced input simply leaves the remainder in the last chunk.
+
+    Args:
+        text: NSS source code
+
+    Returns:
+        The chunks in document order
+    """
+    chunks: list[TopLevelChunk] = []
+    chunk_start = 0
+    chunk_line = 0
+    line = 0
+    depth = 0
+    has_code = False
+    is_directive = False
+    saw_paren = False
+    saw_brace = False
+    is_struct_body = False
+    last_end = 0
+
+    def close(end: int):
+        nonlocal chunk_start, chunk_line, has_code, is_directive, saw_paren, saw_brace, is_struct_body
+        chunks.append(TopLevelChunk(text[chunk_start:end], chunk_line, chunk_start, has_code))
+        chunk_start = end
+        chunk_line = line
+        has_code = is_directive = saw_paren = saw_brace = is_struct_body = False
+
+    for match in _SPLIT_TOKENS.finditer(text):
+        token = match.group()
+        if not has_code and text[last_end:match.start()].strip():
+            has_code = True
+        last_end = match.end()
+
+        c = token[0]
+        if c == "\n":
+            line += 1
+            if is_directive and depth == 0:
+                close(last_end)
+            continue
+        if c == "/":
+            line += token.count("\n")
+            continue
+
+        if not has_code:
+            has_code = True
+            is_directive = c == "#"
+
+        if c == '"':
+            line += token.count("\n")
+        elif c == "(" and depth == 0 and not saw_brace:
+            saw_paren = True
+        elif c == "{":
+            if depth == 0 and not saw_brace:
+                saw_brace = True
+                is_struct_body = not saw_paren
+            depth += 1
+        elif c == "}":
+            depth = max(depth - 1, 0)
+            if depth == 0 and saw_brace and not is_struct_body:
+                close(last_end)
+        elif c == ";" and depth == 0:
+            close(last_end)
+
+    if chunk_start < len(text):
+        if not has_code and text[last_end:].strip():
+            has_code = True
+        close(len(text))
+    return chunks
+
+
+@dataclass
+class ParsedChunk:
+    """A chunk together with the result of parsing it."""
+    chunk: TopLevelChunk
+    objects: list[TopLevelObject] = field(default_factory=list)
+    error: Exception | None = None
+    parsed_start_line: int = -1  # start line when parsed; line numbers in ``error`` refer to this position
+
+    def __post_init__(self):
+        if self.parsed_start_line < 0:
+            self.parsed_start_line = self.chunk.start_line
+
+
+@dataclass
+class DocumentUpdate:
+    """Statistics for a single incremental update of a document."""
+    chunks: int = 0
+    reparsed: int = 0
+    reused: int = 0
+
+
+ChunkParser = Callable[[TopLevelChunk], "tuple[list[TopLevelObject], Exception | None]"]
+
+
+class IncrementalDocument:
+    """Per-document parse state that is updated chunk by chunk.
+
+    Args:
+        uri: Key identifying the document (usually its file path)
+    """
+
+    def __init__(self, uri: str):
+        self.uri: str = uri
+        self.text: str = ""
+        self.chunks: list[ParsedChunk] = []
+
+    @property
+    def objects(self) -> list[TopLevelObject]:
+        return [obj for parsed in self.chunks for obj in parsed.objects]
+
+    @property
+    def errors(self) -> list[tuple[TopLevelChunk, Exception]]:
+        return [(parsed.chunk, parsed.error) for parsed in self.chunks if parsed.error is not None]
+
+    def update(
+        self,
+        text: str,
+        parse_chunk: ChunkParser,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> DocumentUpdate:
+        """Bring the document up to date with ``text``, re-parsing only changed chunks.
+
+        The document is left untouched if the update is cancelled.
+
+        Args:
+            text: The new document text
+            parse_chunk: Parses one chunk, numbering lines from the chunk's position in the document
+            is_cancelled: Polled between chunk parses; returning True abandons the update
+
+        Returns:
+            Statistics about the update
+
+        Raises:
+            AnalysisCancelledError: If ``is_cancelled`` returned True
+        """
+        stats = DocumentUpdate()
+        if text == self.text and self.chunks:
+            stats.chunks = stats.reused = len(self.chunks)
+            return stats
+
+        previous: dict[str, deque[ParsedChunk]] = {}
+        for parsed in self.chunks:
+            previous.setdefault(parsed.chunk.text, deque()).append(parsed)
+
+        planned: list[tuple[TopLevelChunk, ParsedChunk | None]] = []
+        for chunk in split_top_level(text):
+            candidates = previous.get(chunk.text)
+            planned.append((chunk, candidates.popleft() if candidates else None))
+
+        fresh: dict[int, ParsedChunk] = {}
+        for index, (chunk, reused) in enumerate(planned):
+            if reused is not None:
+                continue
+            if is_cancelled is not None and is_cancelled():
+                raise AnalysisCancelledError(self.uri)
+            if chunk.has_code:
+                objects, error = parse_chunk(chunk)
+            else:
+                objects, error = [], None
+            fresh[index] = ParsedChunk(chunk, objects, error)
+
+        # Commit: nothing above mutated the previous state, so a cancellation leaves it consistent.
+        chunks: list[ParsedChunk] = []
+        for index, (chunk, reused) in enumerate(planned):
+            if reused is None:
+                chunks.append(fresh[index])
+                continue
+            delta = chunk.start_line - reused.chunk.start_line
+            if delta:
+                for obj in reused.objects:
+                    if isinstance(obj, FunctionDefinition):
+                        obj.line_num += delta
+            reused.chunk = chunk
+            chunks.append(reused)
+
+        self.text = text
+        self.chunks = chunks
+        stats.chunks = len(chunks)
+        stats.reparsed = len(fresh)
+        stats.reused = stats.chunks - stats.reparsed
+        return stats
+
+    def includes(self) -> list[tuple[TopLevelChunk, str]]:
+        """Return the ``#include`` directives of the document with the chunk they appear in."""
+        return [
+            (parsed.chunk, obj.file.value)
+            for parsed in self.chunks
+            for obj in parsed.objects
+            if isinstance(obj, IncludeScript)
+        ]
+
+
+def parse_objects(text: str, parse_chunk: ChunkParser) -> list[TopLevelObject]:
+    """Parse a whole script chunk by chunk, keeping every declaration that parses cleanly."""
+    return [obj for chunk in split_top_level(text) if chunk.has_code for obj in parse_chunk(chunk)[0]]
+
+
+def _stat(path: Path) -> os.stat_result | None:
+    try:
+        return os.stat(path)  # noqa: PTH116
+    except OSError:  # not in this lookup folder
+        return None
+
+
+@dataclass
+class IncludeSymbols:
+    """The parsed top-level declarations of an included script."""
+    name: str
+    source_key: tuple[Any, ...]
+    objects: list[TopLevelObject]
+
+    @property
+    def includes(self) -> list[str]:
+        return [obj.file.value for obj in self.objects if isinstance(obj, IncludeScript)]
+
+
+class IncludeSymbolCache:
+    """Symbol tables of included scripts, shared across documents.
+
+    Entries are keyed by where the include was found (file path with size and mtime,
+    or library name with content hash), so an edited include file is parsed again
+    while unchanged ones are reused by every document that includes them.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple[Any, ...], IncludeSymbols] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    @staticmethod
+    def _locate(
+        name: str,
+        lookup_paths: list[Path],
+        library: dict[str, bytes],
+    ) -> tuple[tuple[Any, ...], Callable[[], str]] | None:
+        # Same search order as IncludeScript._get_script: lookup folders first, then the library.
+        for folder in lookup_paths:
+            filepath = folder / f"{name}.nss"
+            stat: os.stat_result | None = _stat(filepath)
+            if stat is None:
+                continue
+            return ("file", str(filepath), stat.st_mtime_ns, stat.st_size), lambda: filepath.read_bytes().decode(errors="ignore")
+        for key in (name, name.lower()):
+            source = library.get(key)
+            if source is not None:
+                return ("library", key, hash(source)), lambda: source.decode(errors="ignore")
+        return None
+
+    def resolve(
+        self,
+        name: str,
+        lookup_paths: list[Path],
+        library: dict[str, bytes],
+        parse_chunk: ChunkParser,
+    ) -> IncludeSymbols | None:
+        """Return the symbols of an included script, or None if it cannot be found.
+
+        Args:
+            name: Include name as written in the ``#include`` directive
+            lookup_paths: Folders to search for ``<name>.nss``
+            library: Built-in script library
+            parse_chunk: Parser used for include files that are not cached yet
+
+        Returns:
+            The include's symbols, or None if it was not found
+        """
+        located = self._locate(name, lookup_paths, library)
+        if located is None:
+            return None
+        source_key, read_source = located
+        entry = self._entries.get(source_key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        try:
+            source = read_source()
+        except OSError:
+            return None
+        entry = IncludeSymbols(name, source_key, parse_objects(source, parse_chunk))
+        self._entries[source_key] = entry
+        return entry
+
+    def resolve_all(
+        self,
+        names: list[str],
+        lookup_paths: list[Path],
+        library: dict[str, bytes],
+        parse_chunk: ChunkParser,
+    ) -> tuple[list[IncludeSymbols], list[str]]:
+        """Resolve includes and everything they include in turn.
+
+        Returns:
+            The resolved include symbol tables and the names that could not be found
+        """
+        resolved: list[IncludeSymbols] = []
+        missing: list[str] = []
+        seen: set[str] = set()
+        queue: deque[str] = deque(names)
+        while queue:
+            name = queue.popleft()
+            if name.lower() in seen:
+                continue
+            seen.add(name.lower())
+            entry = self.resolve(name, lookup_paths, library, parse_chunk)
+            if entry is None:
+                missing.append(name)
+                continue
+            resolved.append(entry)
+            queue.extend(entry.includes)
+        return resolved, missing
+
+
+@dataclass
+class AnalysisMetrics:
+    """Timing and reuse statistics of a single analysis."""
+    duration_ms: float = 0.0
+    chunks: int = 0
+    reparsed_chunks: int = 0
+    include_hits: int = 0
+    include_misses: int = 0
+
+
+class LatencyTracker:
+    """Rolling latency statistics over the most recent analyses."""
+
+    def __init__(self, window: int = 200):
+        self._durations: deque[float] = deque(maxlen=window)
+        self.total: int = 0
+        self.cancelled: int = 0
+        self.last: AnalysisMetrics | None = None
+
+    def record(self, metrics: AnalysisMetrics):
+        self._durations.append(metrics.duration_ms)
+        self.total += 1
+        self.last = metrics
+
+    def record_cancelled(self):
+        self.cancelled += 1
+
+    def summary(self) -> dict[str, Any]:
+        durations = sorted(self._durations)
+        if not durations:
+            return {"count": self.total, "cancelled": self.cancelled}
+        return {
+            "count": self.total,
+            "cancelled": self.cancelled,
+            "last_ms": self.last.duration_ms if self.last is not None else 0.0,
+            "mean_ms": sum(durations) / len(durations),
+            "p50_ms": durations[len(durations) // 2],
+            "p95_ms": durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+            "max_ms": durations[-1],
+        }
@@ -9,6 +9,13 @@ The PLY YACC parser generation takes ~900ms on first initialization.
 This module caches the parser instance so this cost is paid only once
 per subprocess lifetime, not on every keystroke.
 
+Documents are analyzed incrementally (see ``incremental.py``): each open
+document keeps its per-declaration parse state, so an edit only re-parses
+the top-level declarations whose text changed. Included scripts are parsed
+once into symbol tables shared by all documents. The subprocess loop
+coalesces queued analysis requests for the same document and abandons an
+in-flight analysis as soon as a newer one for that document arrives.
+
 Usage:
     # Start language server in subprocess
     from multiprocessing import Process, Queue
@@ -30,6 +37,9 @@ Usage:
     # Get responses
     response = response_queue.get(timeout=5.0)
 
+    # Cancel a queued request (answered with a REQUEST_CANCELLED error)
+    request_queue.put({'id': 2, 'method': 'cancel', 'params': {'id': 1}})
+
 References:
 ----------
         Based on swkotor.exe NWScript structure:
@@ -45,16 +55,21 @@ References:
 from __future__ import annotations
 
 import re
+import time
 import traceback
 
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from enum import IntEnum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from queue import Empty
+from typing import TYPE_CHECKING, Any, Callable
 
 from ply import yacc
 
+from pykotor.common.script import DataType
 from pykotor.resource.formats.ncs.compiler.classes import (
+    CodeRoot,
     CompileError,
     FunctionDefinition,
     FunctionForwardDeclaration,
@@ -62,6 +77,16 @@ from pykotor.resource.formats.ncs.compiler.classes import (
     GlobalVariableInitialization,
     StructDefinition,
 )
+from pykotor.resource.formats.ncs.compiler.incremental import (
+    AnalysisCancelledError,
+    AnalysisMetrics,
+    IncludeSymbolCache,
+    IncludeSymbols,
+    IncrementalDocument,
+    LatencyTracker,
+    ParsedChunk,
+    TopLevelChunk,
+)
 from pykotor.resource.formats.ncs.compiler.lexer import NssLexer
 from pykotor.resource.formats.ncs.compiler.parser import NssParser
 
@@ -69,7 +94,18 @@ if TYPE_CHECKING:
     from multiprocessing import Queue
 
     from pykotor.common.script import ScriptConstant, ScriptFunction
-    from pykotor.resource.formats.ncs.compiler.classes import CodeRoot
+    from pykotor.resource.formats.ncs.compiler.classes import DynamicDataType, TopLevelObject
+
+# LSP error code for requests abandoned because they were superseded or cancelled
+REQUEST_CANCELLED = -32800
+
+# Maximum number of documents whose incremental parse state is kept
+MAX_OPEN_DOCUMENTS = 32
+
+UNTITLED_DOCUMENT = "<untitled>"
+
+_STRING_LITERAL_PATTERN = re.compile(r'"[^"\\]*(\\.[^"\\]*)*"')
+_VOID_TYPO_PATTERN = re.compile(r'\bvodi\b', re.IGNORECASE)
 
 
 class DiagnosticSeverity(IntEnum):
@@ -141,6 +177,7 @@ class AnalysisResult:
     symbols: list[DocumentSymbol] = field(default_factory=list)
     parse_successful: bool = False
     ast: CodeRoot | None = None
+    metrics: AnalysisMetrics | None = None
 
 
 class NSSLanguageServer:
@@ -183,6 +220,12 @@ class NSSLanguageServer:
         self.is_tsl = is_tsl
         self._current_filepath: Path | None = None
         
+        # Incremental per-document parse state (most recently used last) and shared include symbols
+        self._documents: OrderedDict[str, IncrementalDocument] = OrderedDict()
+        self._document_includes: dict[str, list[IncludeSymbols]] = {}
+        self._include_cache = IncludeSymbolCache()
+        self.latency = LatencyTracker()
+        
         # Initialize parser on first use (expensive, ~900ms)
         self._ensure_parser_initialized()
     
@@ -223,61 +266,189 @@ class NSSLanguageServer:
         """Create a fresh lexer for each parse (lexer state needs reset)."""
         return NssLexer()
     
+    def _parse_chunk(self, chunk: TopLevelChunk) -> tuple[list[TopLevelObject], Exception | None]:
+        """Parse a single top-level chunk with document-absolute line numbers."""
+        assert NSSLanguageServer._parser is not None
+        assert NSSLanguageServer._lexer is not None
+        # Cloning the shared lexer is far cheaper than rebuilding its master regex per chunk
+        lexer = NSSLanguageServer._lexer.lexer.clone()
+        lexer.begin("INITIAL")
+        lexer.lineno = chunk.start_line + 1
+        try:
+            root = NSSLanguageServer._parser.parser.parse(chunk.text, lexer=lexer)
+        except Exception as e:  # noqa: BLE001
+            return [], e
+        return list(root.objects), None
+    
+    def _get_document(self, uri: str) -> IncrementalDocument:
+        """Get (or create) the incremental state of a document, evicting the least recently used."""
+        document = self._documents.pop(uri, None)
+        if document is None:
+            document = IncrementalDocument(uri)
+        self._documents[uri] = document
+        while len(self._documents) > MAX_OPEN_DOCUMENTS:
+            evicted, _ = self._documents.popitem(last=False)
+            self._document_includes.pop(evicted, None)
+        return document
+    
+    def close_document(self, filepath: str | Path | None = None):
+        """Drop the incremental state kept for a document."""
+        uri = str(filepath) if filepath else UNTITLED_DOCUMENT
+        self._documents.pop(uri, None)
+        self._document_includes.pop(uri, None)
+    
+    def clear_caches(self):
+        """Drop all document and include state (e.g. after the functions or library changed)."""
+        self._documents.clear()
+        self._document_includes.clear()
+        self._include_cache.clear()
+    
     def analyze(
         self,
         text: str,
         filepath: str | Path | None = None,
+        *,
+        is_cancelled: Callable[[], bool] | None = None,
     ) -> AnalysisResult:
         """Analyze NSS source code and return diagnostics and symbols.
         
         This is the main entry point for document analysis. It parses the
         source code and extracts diagnostics (errors/warnings) and document
-        symbols (functions, structs, variables).
+        symbols (functions, structs, variables). Only the top-level
+        declarations that changed since the previous analysis of the same
+        document are parsed again.
         
         Args:
             text: NSS source code to analyze
             filepath: Optional file path for include resolution
+            is_cancelled: Optional callback polled between declaration parses;
+                returning True abandons the analysis
             
         Returns:
             AnalysisResult with diagnostics and symbols
+            
+        Raises:
+            AnalysisCancelledError: If ``is_cancelled`` returned True
         """
+        start_time = time.perf_counter()
         self._current_filepath = Path(filepath) if filepath else None
+        uri = str(filepath) if filepath else UNTITLED_DOCUMENT
         result = AnalysisResult()
         
         if not text.strip():
+            self.close_document(filepath)
             return result
         
-        # Parse the document
+        parser = self._get_parser()
+        document = self._get_document(uri)
         try:
-            parser = self._get_parser()
-            lexer = self._create_lexer()
-            ast = parser.parser.parse(text, lexer=lexer.lexer)
+            update = document.update(text, self._parse_chunk, is_cancelled)
+        except AnalysisCancelledError:
+            self.latency.record_cancelled()
+            raise
+        
+        ast = CodeRoot(
+            constants=self.constants,
+            functions=self.functions,
+            library_lookup=parser.library_lookup,
+            library=self.library,
+        )
+        ast.objects = document.objects
+        
+        # Symbols of the declarations that parsed keep the outline useful while other declarations are mid-edit
+        end_lines = {
+            id(obj): parsed.chunk.start_line + parsed.chunk.text.rstrip().count("\n")
+            for parsed in document.chunks
+            for obj in parsed.objects
+        }
+        try:
+            result.symbols = self._extract_symbols(ast, text, end_lines)
+        except Exception as e:  # noqa: BLE001
+            result.diagnostics.append(self._exception_to_diagnostic(e, text))
+        
+        for parsed in document.chunks:
+            if parsed.error is not None:
+                result.diagnostics.append(self._chunk_error_to_diagnostic(parsed, text))
+        
+        if not document.errors:
             result.parse_successful = True
             result.ast = ast
-            
-            # Extract symbols from AST
-            result.symbols = self._extract_symbols(ast, text)
-            
-            # Perform semantic analysis
-            semantic_diagnostics = self._semantic_analysis(ast, text)
-            result.diagnostics.extend(semantic_diagnostics)
-            
-        except CompileError as e:
-            # Extract line number from error
-            diagnostic = self._compile_error_to_diagnostic(e, text)
-            result.diagnostics.append(diagnostic)
-            
-        except Exception as e:
-            # Generic parse error
-            diagnostic = self._exception_to_diagnostic(e, text)
-            result.diagnostics.append(diagnostic)
+            result.diagnostics.extend(self._semantic_analysis(ast, text))
+        
+        # Resolve includes through the shared symbol cache
+        hits, misses = self._include_cache.hits, self._include_cache.misses
+        includes = document.includes()
+        resolved, missing = self._include_cache.resolve_all(
+            [name for _chunk, name in includes],
+            parser.library_lookup,
+            self.library,
+            self._parse_chunk,
+        )
+        self._document_includes[uri] = resolved
+        missing_names = {name.lower() for name in missing}
+        lines = text.split("\n")
+        for chunk, name in includes:
+            if name.lower() in missing_names:
+                line = chunk.start_line + chunk.text.count("\n", 0, max(chunk.text.find("#include"), 0))
+                result.diagnostics.append(Diagnostic(
+                    range=Range(
+                        start=Position(line=line, character=0),
+                        end=Position(line=line, character=len(lines[line]) if line < len(lines) else 0),
+                    ),
+                    message=f"Could not find included script '{name}.nss'",
+                    severity=DiagnosticSeverity.WARNING,
+                    code="missing-include",
+                ))
         
         # Add syntax-based diagnostics (fast, regex-based)
         syntax_diagnostics = self._syntax_diagnostics(text)
         result.diagnostics.extend(syntax_diagnostics)
         
+        result.metrics = AnalysisMetrics(
+            duration_ms=(time.perf_counter() - start_time) * 1000.0,
+            chunks=update.chunks,
+            reparsed_chunks=update.reparsed,
+            include_hits=self._include_cache.hits - hits,
+            include_misses=self._include_cache.misses - misses,
+        )
+        self.latency.record(result.metrics)
         return result
     
+    def _chunk_error_to_diagnostic(
+        self,
+        parsed: ParsedChunk,
+        text: str,
+    ) -> Diagnostic:
+        """Convert the parse error of a declaration to a Diagnostic on the right line."""
+        error = parsed.error
+        assert error is not None
+        # Reused declarations may have moved since they were parsed; their messages carry the old line numbers.
+        delta = parsed.chunk.start_line - parsed.parsed_start_line
+        message = str(error)
+        if delta:
+            message = re.sub(r"(line )(\d+)", lambda m: f"{m.group(1)}{int(m.group(2)) + delta}", message, flags=re.IGNORECASE)
+        
+        if isinstance(error, CompileError) or re.search(r"line \d+", message, re.IGNORECASE):
+            line_match = re.search(r"line (\d+)", message, re.IGNORECASE)
+            line = int(line_match.group(1)) - 1 if line_match else parsed.chunk.start_line
+        else:
+            # Errors without a location (e.g. unexpected end of input) belong at the end of the declaration
+            message = "Syntax error: unexpected end of declaration" if isinstance(error, AttributeError) else f"Parse error: {message}"
+            line = parsed.chunk.start_line + parsed.chunk.text.rstrip().count("\n")
+        
+        lines = text.split("\n")
+        end_col = len(lines[line]) if 0 <= line < len(lines) else 0
+        return Diagnostic(
+            range=Range(
+                start=Position(line=line, character=0),
+                end=Position(line=line, character=end_col),
+            ),
+            message=message,
+            severity=DiagnosticSeverity.ERROR,
+            code="compile-error" if isinstance(error, CompileError) else "parse-error",
+            source="nss",
+        )
+    
     def _compile_error_to_diagnostic(
         self,
         error: CompileError,
@@ -375,7 +546,7 @@ class NSSLanguageServer:
                 continue
             
             # Remove string literals for analysis
-            line_no_strings = re.sub(r'"[^"\\]*(\\.[^"\\]*)*"', '""', stripped)
+            line_no_strings = _STRING_LITERAL_PATTERN.sub('""', stripped) if '"' in stripped else stripped
             
             # Track balance
             brace_balance += line_no_strings.count('{') - line_no_strings.count('}')
@@ -394,19 +565,18 @@ class NSSLanguageServer:
                 ))
             
             # Check for common typos
-            if re.search(r'\bvodi\b', stripped, re.IGNORECASE):
-                match = re.search(r'\bvodi\b', stripped, re.IGNORECASE)
-                if match:
-                    diagnostics.append(Diagnostic(
-                        range=Range(
-                            start=Position(line=line_num, character=match.start()),
-                            end=Position(line=line_num, character=match.end()),
-                        ),
-                        message="Did you mean 'void'?",
-                        severity=DiagnosticSeverity.ERROR,
-                        code="unknown-type",
-                        suggestions=["void"],
-                    ))
+            match = _VOID_TYPO_PATTERN.search(stripped)
+            if match:
+                diagnostics.append(Diagnostic(
+                    range=Range(
+                        start=Position(line=line_num, character=match.start()),
+                        end=Position(line=line_num, character=match.end()),
+                    ),
+                    message="Did you mean 'void'?",
+                    severity=DiagnosticSeverity.ERROR,
+                    code="unknown-type",
+                    suggestions=["void"],
+                ))
         
         # Check for unbalanced braces
         if brace_balance > 0:
@@ -446,9 +616,9 @@ class NSSLanguageServer:
         
         for obj in ast.objects:
             if isinstance(obj, FunctionDefinition):
-                if obj.identifier.identifier == "main":
+                if obj.identifier.label == "main":
                     has_main = True
-                elif obj.identifier.identifier == "StartingConditional":
+                elif obj.identifier.label == "StartingConditional":
                     has_starting_conditional = True
         
         # Only warn about missing entry point if there are no forward declarations
@@ -476,12 +646,31 @@ class NSSLanguageServer:
         
         return diagnostics
     
+    @staticmethod
+    def _type_name(data_type: DynamicDataType | None) -> str:
+        """Format a parsed data type the way it is written in NSS."""
+        builtin = getattr(data_type, 'builtin', None)
+        if not isinstance(builtin, DataType):
+            return '?'
+        struct_name = getattr(data_type, '_struct', None)
+        if builtin == DataType.STRUCT and struct_name:
+            return f"struct {struct_name}"
+        return builtin.value
+    
     def _extract_symbols(
         self,
         ast: CodeRoot,
         text: str,
+        end_lines: dict[int, int] | None = None,
     ) -> list[DocumentSymbol]:
-        """Extract document symbols from the AST."""
+        """Extract document symbols from the AST.
+        
+        Args:
+            ast: Parsed document
+            text: Document text
+            end_lines: Optional last line of each top-level object, keyed by ``id()``;
+                function ranges are found by scanning for the closing brace otherwise
+        """
         symbols: list[DocumentSymbol] = []
         lines = text.split('\n')
         
@@ -492,26 +681,28 @@ class NSSLanguageServer:
             
             if isinstance(obj, FunctionDefinition):
                 # Get function details
-                return_type = str(getattr(obj.return_type, 'builtin', 'void')).split('.')[-1]
+                return_type = self._type_name(obj.return_type)
                 params = getattr(obj, 'parameters', [])
-                param_str = ', '.join(
-                    f"{getattr(p.datatype, 'builtin', '?').name if hasattr(getattr(p.datatype, 'builtin', '?'), 'name') else str(getattr(p.datatype, 'builtin', '?')).split('.')[-1]} {p.identifier}"
-                    for p in params
-                )
+                param_str = ', '.join(f"{self._type_name(p.data_type)} {p.identifier}" for p in params)
                 
                 # Calculate range
                 end_line = line_num
-                # Find the closing brace
-                brace_count = 0
-                for i in range(line_num, len(lines)):
-                    brace_count += lines[i].count('{') - lines[i].count('}')
-                    if brace_count == 0 and '{' in ''.join(lines[line_num:i+1]):
-                        end_line = i
-                        break
+                if end_lines is not None and id(obj) in end_lines:
+                    end_line = end_lines[id(obj)]
+                else:
+                    # Find the closing brace
+                    brace_count = 0
+                    seen_open_brace = False
+                    for i in range(line_num, len(lines)):
+                        brace_count += lines[i].count('{') - lines[i].count('}')
+                        seen_open_brace = seen_open_brace or '{' in lines[i]
+                        if brace_count == 0 and seen_open_brace:
+                            end_line = i
+                            break
                 
                 # Create symbol with children for parameters
                 func_symbol = DocumentSymbol(
-                    name=obj.identifier.identifier,
+                    name=obj.identifier.label,
                     kind='function',
                     range=Range(
                         start=Position(line=line_num, character=0),
@@ -521,17 +712,15 @@ class NSSLanguageServer:
                         start=Position(line=line_num, character=0),
                         end=Position(line=line_num, character=len(lines[line_num]) if line_num < len(lines) else 0),
                     ),
-                    detail=f"{return_type} {obj.identifier.identifier}({param_str})",
+                    detail=f"{return_type} {obj.identifier.label}({param_str})",
                     children=[],
                 )
                 
                 # Add parameters as children
                 for param in params:
-                    param_type = str(getattr(param.datatype, 'builtin', '?'))
-                    if '.' in param_type:
-                        param_type = param_type.split('.')[-1]
+                    param_type = self._type_name(param.data_type)
                     func_symbol.children.append(DocumentSymbol(
-                        name=param.identifier.identifier,
+                        name=param.identifier.label,
                         kind='parameter',
                         range=Range(
                             start=Position(line=line_num, character=0),
@@ -550,7 +739,7 @@ class NSSLanguageServer:
                 members = getattr(obj, 'members', [])
                 
                 struct_symbol = DocumentSymbol(
-                    name=obj.identifier.identifier,
+                    name=obj.identifier.label,
                     kind='struct',
                     range=Range(
                         start=Position(line=line_num, character=0),
@@ -566,11 +755,9 @@ class NSSLanguageServer:
                 
                 # Add members
                 for member in members:
-                    member_type = str(getattr(member.datatype, 'builtin', '?'))
-                    if '.' in member_type:
-                        member_type = member_type.split('.')[-1]
+                    member_type = self._type_name(member.datatype)
                     struct_symbol.children.append(DocumentSymbol(
-                        name=member.identifier.identifier,
+                        name=member.identifier.label,
                         kind='variable',
                         range=Range(
                             start=Position(line=line_num, character=0),
@@ -586,12 +773,10 @@ class NSSLanguageServer:
                 symbols.append(struct_symbol)
             
             elif isinstance(obj, (GlobalVariableDeclaration, GlobalVariableInitialization)):
-                var_type = str(getattr(obj.data_type, 'builtin', '?'))
-                if '.' in var_type:
-                    var_type = var_type.split('.')[-1]
+                var_type = self._type_name(obj.data_type)
                 
                 symbols.append(DocumentSymbol(
-                    name=obj.identifier.identifier,
+                    name=obj.identifier.label,
                     kind='variable',
                     range=Range(
                         start=Position(line=line_num, character=0),
@@ -611,6 +796,7 @@ class NSSLanguageServer:
         text: str,
         line: int,
         character: int,
+        filepath: str | Path | None = None,
     ) -> list[CompletionItem]:
         """Get completion suggestions at a position.
         
@@ -618,6 +804,8 @@ class NSSLanguageServer:
             text: Document text
             line: 0-indexed line number
             character: 0-indexed character position
+            filepath: Document whose declarations (and includes) are offered,
+                as of its last analysis
             
         Returns:
             List of completion items
@@ -658,6 +846,17 @@ class NSSLanguageServer:
                     sort_text=f"0_{func.name}",  # Functions first
                 ))
         
+        # Add declarations of the document and its includes
+        for name, kind, detail in self._user_declarations(filepath):
+            if not prefix or name.lower().startswith(prefix):
+                completions.append(CompletionItem(
+                    label=name,
+                    kind=kind,
+                    detail=detail,
+                    insert_text=f"{name}($0)" if kind == 'function' else name,
+                    sort_text=f"0_{name}",
+                ))
+        
         # Add constants
         for const in self.constants:
             if not prefix or const.name.lower().startswith(prefix):
@@ -698,6 +897,7 @@ class NSSLanguageServer:
         text: str,
         line: int,
         character: int,
+        filepath: str | Path | None = None,
     ) -> HoverInfo | None:
         """Get hover information at a position.
         
@@ -705,6 +905,8 @@ class NSSLanguageServer:
             text: Document text
             line: 0-indexed line number
             character: 0-indexed character position
+            filepath: Document whose declarations (and includes) are offered,
+                as of its last analysis
             
         Returns:
             HoverInfo or None if nothing to show
@@ -778,18 +980,60 @@ class NSSLanguageServer:
                     ),
                 )
         
+        # Search declarations of the document and its includes
+        for name, _kind, detail in self._user_declarations(filepath):
+            if name.lower() == word_lower:
+                return HoverInfo(
+                    contents=f"```nwscript\n{detail}\n```",
+                    range=Range(
+                        start=Position(line=line, character=word_start),
+                        end=Position(line=line, character=word_end),
+                    ),
+                )
+        
         return None
     
-    def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+    def _user_declarations(self, filepath: str | Path | None) -> list[tuple[str, str, str]]:
+        """Return (name, kind, detail) of the declarations in a document and everything it includes."""
+        uri = str(filepath) if filepath else UNTITLED_DOCUMENT
+        objects: list[TopLevelObject] = []
+        document = self._documents.get(uri)
+        if document is not None:
+            objects.extend(document.objects)
+        for include in self._document_includes.get(uri, []):
+            objects.extend(include.objects)
+        
+        declarations: dict[str, tuple[str, str, str]] = {}
+        for obj in objects:
+            if isinstance(obj, (FunctionDefinition, FunctionForwardDeclaration)):
+                name = obj.identifier.label
+                params = ', '.join(f"{self._type_name(p.data_type)} {p.identifier}" for p in obj.parameters)
+                declarations.setdefault(name, (name, 'function', f"{self._type_name(obj.return_type)} {name}({params})"))
+            elif isinstance(obj, StructDefinition):
+                name = obj.identifier.label
+                declarations.setdefault(name, (name, 'struct', f"struct {name}"))
+            elif isinstance(obj, (GlobalVariableDeclaration, GlobalVariableInitialization)):
+                name = obj.identifier.label
+                declarations.setdefault(name, (name, 'variable', f"{self._type_name(obj.data_type)} {name}"))
+        return list(declarations.values())
+    
+    def handle_request(
+        self,
+        request: dict[str, Any],
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> dict[str, Any]:
         """Handle a language server request.
         
         Request format:
         {
             'id': <unique request id>,
-            'method': 'analyze' | 'completions' | 'hover' | 'shutdown',
+            'method': 'analyze' | 'completions' | 'hover' | 'close' | 'metrics' | 'cancel' | 'shutdown',
             'params': {...}  # method-specific parameters
         }
         
+        An analysis abandoned through ``is_cancelled`` is answered with a
+        ``REQUEST_CANCELLED`` error.
+        
         Response format:
         {
             'id': <same as request>,
@@ -806,6 +1050,7 @@ class NSSLanguageServer:
                 result = self.analyze(
                     text=params.get('text', ''),
                     filepath=params.get('filepath'),
+                    is_cancelled=is_cancelled,
                 )
                 return {
                     'id': request_id,
@@ -818,6 +1063,7 @@ class NSSLanguageServer:
                     text=params.get('text', ''),
                     line=params.get('line', 0),
                     character=params.get('character', 0),
+                    filepath=params.get('filepath'),
                 )
                 return {
                     'id': request_id,
@@ -830,6 +1076,7 @@ class NSSLanguageServer:
                     text=params.get('text', ''),
                     line=params.get('line', 0),
                     character=params.get('character', 0),
+                    filepath=params.get('filepath'),
                 )
                 return {
                     'id': request_id,
@@ -837,6 +1084,29 @@ class NSSLanguageServer:
                     'error': None,
                 }
             
+            elif method == 'close':
+                self.close_document(params.get('filepath'))
+                return {
+                    'id': request_id,
+                    'result': {'status': 'closed'},
+                    'error': None,
+                }
+            
+            elif method == 'metrics':
+                return {
+                    'id': request_id,
+                    'result': self.latency.summary(),
+                    'error': None,
+                }
+            
+            elif method == 'cancel':
+                # Queued requests are cancelled by run_server; by the time we get here the target already finished
+                return {
+                    'id': request_id,
+                    'result': {'status': 'not-found'},
+                    'error': None,
+                }
+            
             elif method == 'shutdown':
                 return {
                     'id': request_id,
@@ -856,6 +1126,8 @@ class NSSLanguageServer:
                     self.is_tsl = params['is_tsl']
                     # May need to reinitialize parser if game type changed
                     self._ensure_parser_initialized()
+                # Cached parses resolved engine calls and includes against the old configuration
+                self.clear_caches()
                 
                 return {
                     'id': request_id,
@@ -870,6 +1142,9 @@ class NSSLanguageServer:
                     'error': {'code': -32601, 'message': f'Unknown method: {method}'},
                 }
         
+        except AnalysisCancelledError:
+            return self._cancelled_response(request_id)
+        
         except Exception as e:
             return {
                 'id': request_id,
@@ -877,12 +1152,27 @@ class NSSLanguageServer:
                 'error': {'code': -32603, 'message': str(e), 'traceback': traceback.format_exc()},
             }
     
+    @staticmethod
+    def _cancelled_response(request_id: Any) -> dict[str, Any]:
+        return {
+            'id': request_id,
+            'result': None,
+            'error': {'code': REQUEST_CANCELLED, 'message': 'Request cancelled'},
+        }
+    
     def _analysis_result_to_dict(self, result: AnalysisResult) -> dict[str, Any]:
         """Convert AnalysisResult to dictionary for JSON serialization."""
         return {
             'diagnostics': [self._diagnostic_to_dict(d) for d in result.diagnostics],
             'symbols': [self._symbol_to_dict(s) for s in result.symbols],
             'parse_successful': result.parse_successful,
+            'metrics': None if result.metrics is None else {
+                'duration_ms': result.metrics.duration_ms,
+                'chunks': result.metrics.chunks,
+                'reparsed_chunks': result.metrics.reparsed_chunks,
+                'include_hits': result.metrics.include_hits,
+                'include_misses': result.metrics.include_misses,
+            },
         }
     
     def _diagnostic_to_dict(self, diagnostic: Diagnostic) -> dict[str, Any]:
@@ -945,6 +1235,7 @@ class NSSLanguageServer:
         functions: list[ScriptFunction] | None = None,
         constants: list[ScriptConstant] | None = None,
         library: dict[str, bytes] | None = None,
+        debounce: float = 0.03,
     ):
         """Run the language server in a subprocess.
         
@@ -958,6 +1249,7 @@ class NSSLanguageServer:
             functions: Built-in script functions
             constants: Built-in script constants
             library: Script library for includes
+            debounce: Seconds to wait for newer edits before analyzing a document
         """
         # Load default functions/constants if not provided
         if functions is None or constants is None or library is None:
@@ -989,21 +1281,79 @@ class NSSLanguageServer:
             'error': None,
         })
         
+        # Requests are drained into a local backlog so that a queued analysis can be superseded by a newer
+        # one for the same document (or cancelled) before it starts, and abandoned while it is running.
+        backlog: deque[dict[str, Any] | None] = deque()
+        
+        def drain():
+            while True:
+                try:
+                    backlog.append(request_queue.get_nowait())
+                except Empty:
+                    return
+        
+        def is_superseded(request: dict[str, Any]) -> bool:
+            """Whether a newer analysis of the same document, a cancel for the request, or a shutdown is queued."""
+            filepath = request.get('params', {}).get('filepath')
+            for queued in backlog:
+                if queued is None or queued.get('method') == 'shutdown':
+                    return True
+                queued_params = queued.get('params', {})
+                if queued.get('method') == 'cancel' and queued_params.get('id') == request.get('id'):
+                    return True
+                if queued.get('method') == 'analyze' and queued_params.get('filepath') == filepath:
+                    return True
+            return False
+        
         # Process requests
         while True:
-            try:
-                request = request_queue.get(timeout=1.0)
-            except Exception:
-                # Timeout - check if parent process is still alive
-                continue
+            if not backlog:
+                try:
+                    backlog.append(request_queue.get(timeout=1.0))
+                except Exception:
+                    # Timeout - check if parent process is still alive
+                    continue
             
+            request = backlog.popleft()
             if request is None:
                 # Shutdown signal
                 break
             
-            response = server.handle_request(request)
+            method = request.get('method')
+            if method == 'analyze':
+                # Debounce: let a burst of edits arrive, then only analyze the newest text of each document
+                if debounce > 0 and not backlog:
+                    time.sleep(debounce)
+                drain()
+                if is_superseded(request):
+                    server.latency.record_cancelled()
+                    response_queue.put(server._cancelled_response(request.get('id')))
+                    continue
+                
+                def is_cancelled(request: dict[str, Any] = request) -> bool:
+                    drain()
+                    return is_superseded(request)
+                
+                response = server.handle_request(request, is_cancelled=is_cancelled)
+            
+            elif method == 'cancel':
+                target_id = request.get('params', {}).get('id')
+                drain()
+                cancelled = [queued for queued in backlog if queued is not None and queued.get('id') == target_id]
+                for queued in cancelled:
+                    backlog.remove(queued)
+                    response_queue.put(server._cancelled_response(target_id))
+                response = {
+                    'id': request.get('id'),
+                    'result': {'status': 'cancelled' if cancelled else 'not-found'},
+                    'error': None,
+                }
+            
+            else:
+                response = server.handle_request(request)
+            
             response_queue.put(response)
             
-            if request.get('method') == 'shutdown':
+            if method == 'shutdown':
                 break
 
@@ -1134,7 +1134,7 @@ def dismantle_gui(  # noqa: C901, PLR0915
             controls_list = GFFList()
             for child in control.children:
                 child_struct: GFFStruct = dismantle_control(child)
-                controls_list._structs.append(child_struct)  # noqa: SLF001
+                controls_list.append(child_struct)
             struct.set_list("CONTROLS", controls_list)
 
         return struct
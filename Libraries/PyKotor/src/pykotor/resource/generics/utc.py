@@ -665,7 +665,7 @@ def construct_utc(
     if not root.exists("SkillList") or root.what_type("SkillList") != GFFFieldType.List:
         if root.exists("SkillList"):
             RobustLogger().error("SkillList in UTC's must be a GFFList, recreating now...")
-            del root._fields["SkillList"]
+            root.remove("SkillList")
         else:
             RobustLogger().error("SkillList must exist in UTC's, creating now...")
         
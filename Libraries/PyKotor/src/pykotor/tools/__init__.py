@@ -89,11 +89,24 @@ def __getattr__(name: str):
         "check_2da_file",
         "get_module_referenced_resources",
         "check_missing_resources_referenced",
+        "find_missing_model_textures",
         "investigate_module_structure",
         "validate_installation",
     ):
         from pykotor.tools import validation
         return getattr(validation, name)
+    # Validation engine
+    if name in ("ValidationCache", "ValidationReport", "register_checker", "run_validation"):
+        from pykotor.tools import validation_engine
+        return getattr(validation_engine, name)
+    # Translation pipeline
+    if name in ("TranslationCache", "TranslationPipeline"):
+        from pykotor.tools import translation
+        return getattr(translation, name)
+    # Thumbnails
+    if name in ("ThumbnailCache", "get_thumbnail_cache", "make_thumbnail"):
+        from pykotor.tools import thumbnails
+        return getattr(thumbnails, name)
     # Patching functions
     if name in (
         "PatchingConfig",
@@ -106,6 +119,8 @@ def __getattr__(name: str):
         "patch_and_save_noncapsule",
         "patch_capsule_file",
         "patch_erf_or_rim",
+        "batch_patch_capsules",
+        "batch_patch_resources",
         "patch_file",
         "patch_folder",
         "patch_install",
@@ -266,8 +281,21 @@ __all__ = [
     "check_2da_file",
     "get_module_referenced_resources",
     "check_missing_resources_referenced",
+    "find_missing_model_textures",
     "investigate_module_structure",
     "validate_installation",
+    # Validation engine (imported from validation_engine module)
+    "ValidationCache",
+    "ValidationReport",
+    "register_checker",
+    "run_validation",
+    # Translation pipeline (imported from translation module)
+    "TranslationCache",
+    "TranslationPipeline",
+    # Thumbnails (imported from thumbnails module)
+    "ThumbnailCache",
+    "get_thumbnail_cache",
+    "make_thumbnail",
     # Patching functions (imported from patching module)
     "PatchingConfig",
     "patch_nested_gff",
@@ -279,6 +307,8 @@ __all__ = [
     "patch_and_save_noncapsule",
     "patch_capsule_file",
     "patch_erf_or_rim",
+    "batch_patch_capsules",
+    "batch_patch_resources",
     "patch_file",
     "patch_folder",
     "patch_install",
@@ -19,19 +19,26 @@ References:
 from __future__ import annotations
 
 import math
+import mmap
+import multiprocessing
+import os
 import struct
 
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, NamedTuple
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple
 
+from loggerplus import RobustLogger
 from pykotor.common.misc import Game
 from pykotor.common.stream import BinaryReader
+from pykotor.resource.type import ResourceType
 from utility.common.geometry import Vector4
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from pykotor.extract.file import FileResource
     from utility.common.geometry import Vector3
 
 _GEOM_ROOT_FP0_K1: int = 4273776
@@ -86,6 +93,22 @@ _LIGHT_HEADER_SIZE: int = 92
 _NODE_TYPE_EMITTER: int = 4
 _EMITTER_HEADER_SIZE: int = 224
 
+_NODE_TYPE_REFERENCE: int = 16
+_REFERENCE_MODEL_OFFSET: int = 80
+
+# Offsets used by the reference scanner, relative to the model data following the 12-byte file header.
+_MODEL_DATA_OFFSET: int = 12
+_SUPERMODEL_OFFSET: int = 136
+_ROOT_NODE_OFFSET: int = 168
+_NODE_CHILDREN_OFFSET: int = 44
+_MESH_TEXTURE_OFFSET: int = 168
+_MESH_LIGHTMAP_OFFSET: int = 200
+_NAME_SIZE: int = 32
+_UINT32 = struct.Struct("<I")
+_UINT32_PAIR = struct.Struct("<II")
+
+_LOOSE_MODELS_PER_SHARD: int = 256
+
 
 class MDLMDXTuple(NamedTuple):
     mdl: bytes | bytearray
@@ -197,6 +220,186 @@ def iterate_lightmaps(
                     yield lightmap
 
 
+class ModelReferences(NamedTuple):
+    """Resources referenced by a binary model, lowercased and in node traversal order."""
+
+    textures: tuple[str, ...]
+    lightmaps: tuple[str, ...]
+    models: tuple[str, ...]  # The supermodel followed by the models of any reference nodes
+
+
+def _read_name(view: memoryview, offset: int) -> str:
+    raw: bytes = bytes(view[offset : offset + _NAME_SIZE])
+    if len(raw) != _NAME_SIZE:
+        raise struct.error(f"name at offset {offset} exceeds the model data")
+    return raw.split(b"\0", 1)[0].decode("ascii", errors="ignore").strip().lower()
+
+
+def scan_model_references(
+    data: bytes | bytearray | memoryview,
+) -> ModelReferences:
+    """Collects the textures, lightmaps and child models of a binary model in one pass over its node tree.
+
+    Gives the same textures and lightmaps as `iterate_textures`/`iterate_lightmaps` (lowercased), but reads
+    each node with `struct.unpack_from` instead of seeking a stream, and accepts a memoryview so models
+    can be scanned in place inside a memory-mapped capsule or BIF.
+
+    Args:
+    ----
+        data: The MDL data, including its 12-byte file header.
+
+    Raises:
+    ------
+        struct.error: If the node tree points outside of the data.
+    """
+    view = memoryview(data)[_MODEL_DATA_OFFSET:]
+    textures: dict[str, None] = {}
+    lightmaps: dict[str, None] = {}
+    models: dict[str, None] = {}
+
+    supermodel: str = _read_name(view, _SUPERMODEL_OFFSET)
+    if supermodel and supermodel != "null":
+        models[supermodel] = None
+
+    visited: set[int] = set()
+    nodes: list[int] = [_UINT32.unpack_from(view, _ROOT_NODE_OFFSET)[0]]
+    while nodes:
+        node_offset: int = nodes.pop()
+        if node_offset in visited:
+            continue
+        visited.add(node_offset)
+        node_type: int = _UINT32.unpack_from(view, node_offset)[0]
+        child_offsets_offset, child_offsets_count = _UINT32_PAIR.unpack_from(view, node_offset + _NODE_CHILDREN_OFFSET)
+        nodes.extend(struct.unpack_from(f"<{child_offsets_count}I", view, child_offsets_offset))
+
+        if node_type & _NODE_TYPE_MESH:
+            texture: str = _read_name(view, node_offset + _MESH_TEXTURE_OFFSET)
+            if texture and texture not in ("null", "dirt"):
+                textures[texture] = None
+            lightmap: str = _read_name(view, node_offset + _MESH_LIGHTMAP_OFFSET)
+            if lightmap and lightmap != "null":
+                lightmaps[lightmap] = None
+        elif node_type & _NODE_TYPE_REFERENCE and not node_type & (_NODE_TYPE_LIGHT | _NODE_TYPE_EMITTER):
+            model: str = _read_name(view, node_offset + _REFERENCE_MODEL_OFFSET)
+            if model and model != "null":
+                models[model] = None
+
+    return ModelReferences(tuple(textures), tuple(lightmaps), tuple(models))
+
+
+def _scan_model_shard(
+    entries: list[tuple[str, int, int]],
+) -> list[ModelReferences | None]:
+    """Scan the models of one shard, mapping each file once and scanning the models in place.
+
+    Runs in a worker process: only (filepath, offset, size) tuples are sent to the worker and only the
+    reference names are sent back. None marks a model that could not be read or parsed.
+    """
+    results: list[ModelReferences | None] = [None] * len(entries)
+    by_file: dict[str, list[int]] = {}
+    for index, (filepath, _offset, _size) in enumerate(entries):
+        by_file.setdefault(filepath, []).append(index)
+
+    for filepath, indices in by_file.items():
+        try:
+            with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:  # noqa: PTH123
+                view = memoryview(mapped)
+                try:
+                    for index in indices:
+                        _filepath, offset, size = entries[index]
+                        try:
+                            results[index] = scan_model_references(view[offset : offset + size])
+                        except (struct.error, ValueError) as e:
+                            RobustLogger().debug(f"Could not scan the model at offset {offset} of '{filepath}': {e}")
+                finally:
+                    view.release()
+        except (OSError, ValueError) as e:  # missing or empty file
+            RobustLogger().debug(f"Could not map '{filepath}' to scan its models: {e}")
+    return results
+
+
+def _partition_models(
+    resources: Iterable[FileResource],
+) -> tuple[list[list[FileResource]], list[FileResource]]:
+    """Group MDL resources into scan shards: one per capsule/BIF, loose files batched per folder.
+
+    Returns:
+    -------
+        The shards, and the resources that must be extracted to be scanned (compressed BIFs, nested capsules).
+    """
+    containers: dict[str, list[FileResource]] = {}
+    loose: dict[str, list[FileResource]] = {}
+    for resource in resources:
+        if resource.restype() is not ResourceType.MDL:
+            continue
+        if resource.inside_capsule or resource.inside_bif or resource.inside_bzf:
+            containers.setdefault(str(resource.filepath()), []).append(resource)
+        else:
+            loose.setdefault(str(resource.filepath().parent), []).append(resource)
+
+    shards: list[list[FileResource]] = []
+    extract: list[FileResource] = []
+    for filepath, members in containers.items():
+        if members[0].inside_bzf or not os.path.isfile(filepath):  # noqa: PTH113
+            extract.extend(members)
+        else:
+            shards.append(members)
+    for members in loose.values():
+        shards.extend(members[i : i + _LOOSE_MODELS_PER_SHARD] for i in range(0, len(members), _LOOSE_MODELS_PER_SHARD))
+    return shards, extract
+
+
+def batch_model_references(
+    resources: Iterable[FileResource],
+    *,
+    max_workers: int | None = None,
+) -> dict[FileResource, ModelReferences]:
+    """Collect the textures, lightmaps and child models referenced by many models at once.
+
+    The MDL resources are grouped by the capsule, BIF or folder they are stored in and each group is scanned
+    in a worker process that memory-maps its files once and parses every model in place with
+    `scan_model_references`. Resources that are not MDLs are ignored.
+
+    Args:
+    ----
+        resources: The resources to scan, e.g. all resources of an installation.
+        max_workers: Number of worker processes (default: CPU count, 1 scans in-process).
+
+    Returns:
+    -------
+        The references of every model that could be read and parsed.
+    """
+    shards, extract = _partition_models(resources)
+    entries: list[list[tuple[str, int, int]]] = [
+        [(str(resource.filepath()), resource.offset(), resource.size()) for resource in shard]
+        for shard in shards
+    ]
+    if max_workers is None:
+        max_workers = multiprocessing.cpu_count()
+    max_workers = max(1, min(max_workers, len(shards)))
+
+    scanned: list[list[ModelReferences | None]] | None = None
+    if max_workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                scanned = list(executor.map(_scan_model_shard, entries))
+        except (OSError, RuntimeError) as e:
+            # Worker processes unavailable (frozen build, sandbox, broken pool): fall back to scanning in-process.
+            RobustLogger().warning(f"Parallel model scan failed ({e.__class__.__name__}: {e}), scanning in-process")
+    if scanned is None:
+        scanned = [_scan_model_shard(shard_entries) for shard_entries in entries]
+
+    results: dict[FileResource, ModelReferences] = {}
+    for shard, shard_results in zip(shards, scanned):
+        results.update((resource, references) for resource, references in zip(shard, shard_results) if references is not None)
+    for resource in extract:
+        try:
+            results[resource] = scan_model_references(resource.data())
+        except (OSError, ValueError, struct.error) as e:
+            RobustLogger().debug(f"Could not scan the model '{resource.filename()}': {e}")
+    return results
+
+
 def change_textures(
     data: bytes | bytearray,
     textures: dict[str, str],
@@ -22,11 +22,16 @@ References:
 from __future__ import annotations
 
 import concurrent.futures
+import copy
+import multiprocessing
+import time
+
 from collections.abc import Callable
 from copy import deepcopy
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
+from loggerplus import RobustLogger
 from pykotor.common.alien_sounds import ALIEN_SOUNDS
 from pykotor.common.language import Language, LocalizedString
 from pykotor.common.misc import Game, ResRef
@@ -71,11 +76,13 @@ from pykotor.resource.type import ResourceType
 from pykotor.tools.encoding import decode_bytes_with_fallbacks
 from pykotor.tools.misc import is_any_erf_type_file, is_capsule_file
 from pykotor.tools.path import CaseAwarePath
+from pykotor.tools.translation import TranslationCache, TranslationPipeline, prefetch_gff_translations
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.tlk import TLK
-    from pykotor.resource.formats.tlk.tlk_data import TLKEntry
 
+# Resources per worker task when batch patching; capsules with more patchable resources are split.
+_PATCH_RESOURCES_PER_TASK = 64
 
 class PatchingConfig:
     """Configuration for batch patching operations."""
@@ -88,8 +95,11 @@ class PatchingConfig:
         self.tsl_convert_gffs: bool = False
         self.always_backup: bool = True
         self.max_threads: int = 2
+        self.max_workers: int | None = None  # Batch patching workers (None: CPU count, 1: in-process)
         self.translator: Any = None  # Translator instance
+        self.translation_cache: TranslationCache | None = None  # Persistent translations (default: in-memory)
         self.log_callback: Callable[[str], None] | None = None
+        self._translation_pipeline: TranslationPipeline | None = None
 
     def is_patching(self) -> bool:
         """Check if any patching operation is enabled."""
@@ -101,6 +111,19 @@ class PatchingConfig:
             or self.tsl_convert_gffs
         )
 
+    def translation_pipeline(self) -> TranslationPipeline:
+        """Returns the deduplicating, cached pipeline all translations of this configuration go through."""
+        if self._translation_pipeline is None or self._translation_pipeline.translator is not self.translator:
+            if self.translation_cache is None:
+                self.translation_cache = TranslationCache()
+            self._translation_pipeline = TranslationPipeline(
+                self.translator,
+                self.translation_cache,
+                max_threads=self.max_threads,
+                log=self.log_callback,
+            )
+        return self._translation_pipeline
+
 
 def log_message(config: PatchingConfig, message: str) -> None:
     """Log a message using the configured callback."""
@@ -225,10 +248,13 @@ def translate_locstring(locstring: LocalizedString, config: PatchingConfig) -> b
         return False
 
     made_change = False
+    pipeline: TranslationPipeline = config.translation_pipeline()
     new_substrings: dict[int, str] = deepcopy(locstring._substrings)  # noqa: SLF001
     for lang, gender, text in locstring:
         if text is not None and text.strip():
-            translated_text = config.translator.translate(text, from_lang=lang)
+            translated_text = pipeline.translate(text, lang)
+            if not translated_text:
+                continue
             log_message(config, f"Translated {text} --> {translated_text}")
             substring_id = LocalizedString.substring_id(config.translator.to_lang, gender)
             new_substrings[substring_id] = str(translated_text)
@@ -371,6 +397,9 @@ def process_translations(
 ) -> None:
     """Process translations for a TLK file.
 
+    Identical entries are translated once and translations are reused from ``config.translation_cache``,
+    so re-translating an updated TLK only sends the new or changed entries to the translator.
+
     Args:
     ----
         tlk: The TLK file to translate
@@ -380,37 +409,36 @@ def process_translations(
     if not config.translator:
         return
 
-    def translate_entry(tlkentry: TLKEntry, from_lang: Language) -> tuple[str, str]:
+    passthrough: dict[int, str] = {}
+    pending: dict[int, str] = {}
+    for strref, tlkentry in tlk:
         text = tlkentry.text
         if not text.strip() or text.isdigit():
-            return text, ""
-        if "Do not translate this text" in text:
-            return text, text
-        if "actual text to be translated" in text:
-            return text, text
-        return text, config.translator.translate(text, from_lang=from_lang)
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=config.max_threads) as executor:
-        future_to_strref: dict[concurrent.futures.Future[tuple[str, str]], int] = {
-            executor.submit(translate_entry, tlkentry, from_lang): strref for strref, tlkentry in tlk
-        }
-
-        for future in concurrent.futures.as_completed(future_to_strref):
-            strref: int = future_to_strref[future]
-            try:
-                original_text, translated_text = future.result()
-                if translated_text.strip():
-                    translated_text = fix_encoding(translated_text, config.translator.to_lang.get_encoding())
-                    tlk.replace(strref, translated_text)
-                    log_message(config, f"#{strref} Translated {original_text} --> {translated_text}")
-            except Exception as exc:  # pylint: disable=W0718  # noqa: BLE001
-                log_message(config, f"tlk strref {strref} generated an exception: {exc}")
+            continue
+        if "Do not translate this text" in text or "actual text to be translated" in text:
+            passthrough[strref] = text
+        else:
+            pending[strref] = text
+
+    translations: dict[tuple[str, Language], str] = config.translation_pipeline().translate_many((text, from_lang) for text in pending.values())
+    for strref in sorted({*passthrough, *pending}):
+        original_text: str = passthrough.get(strref, pending.get(strref, ""))
+        translated_text: str = passthrough[strref] if strref in passthrough else translations.get((original_text, from_lang), "")
+        if not translated_text.strip():
+            log_message(config, f"tlk strref {strref} could not be translated")
+            continue
+        translated_text = fix_encoding(translated_text, config.translator.to_lang.get_encoding())
+        tlk.replace(strref, translated_text)
+        log_message(config, f"#{strref} Translated {original_text} --> {translated_text}")
 
 
 def patch_resource(
     resource: FileResource,
     config: PatchingConfig,
     processed_files: set[Path] | None = None,
+    *,
+    data: bytes | None = None,
+    gff: GFF | None = None,
 ) -> GFF | TPC | None:
     """Patch a single resource (GFF, TPC, TLK).
 
@@ -419,6 +447,8 @@ def patch_resource(
         resource: The resource to patch
         config: Patching configuration
         processed_files: Set to track processed files (optional)
+        data: The resource data, if already read (default: read from the resource's file)
+        gff: The resource parsed as a GFF, if already parsed; it is patched in place
 
     Returns:
     -------
@@ -427,12 +457,15 @@ def patch_resource(
     if processed_files is None:
         processed_files = set()
 
+    def resource_data() -> bytes:
+        return resource.data() if data is None else data
+
     # Handle TLK translation
     if resource.restype().extension.lower() == "tlk" and config.translate and config.translator:
         tlk: TLK | None = None
         log_message(config, f"Loading TLK '{resource.filepath()}'")
         try:
-            tlk = read_tlk(resource.data())
+            tlk = read_tlk(resource_data())
         except Exception:  # pylint: disable=W0718  # noqa: BLE001
             log_message(config, f"[Error] loading TLK '{resource.identifier()}' at '{resource.filepath()}'!")
             return None
@@ -450,7 +483,7 @@ def patch_resource(
     if resource.restype().extension.lower() == "tga" and config.convert_tga == "TGA to TPC":
         log_message(config, f"Converting TGA at {resource.path_ident()} to TPC...")
         try:
-            return TPCTGAReader(resource.data()).load()
+            return TPCTGAReader(resource_data()).load()
         except Exception:  # pylint: disable=W0718  # noqa: BLE001
             log_message(config, f"[Error] loading TGA '{resource.identifier()}' at '{resource.filepath()}'!")
             return None
@@ -459,7 +492,7 @@ def patch_resource(
     if resource.restype().extension.lower() == "tpc" and config.convert_tga == "TPC to TGA":
         log_message(config, f"Converting TPC at {resource.path_ident()} to TGA...")
         try:
-            return TPCBinaryReader(resource.data()).load()
+            return TPCBinaryReader(resource_data()).load()
         except Exception:  # pylint: disable=W0718  # noqa: BLE001
             log_message(config, f"[Error] loading TPC '{resource.identifier()}' at '{resource.filepath()}'!")
             return None
@@ -471,9 +504,9 @@ def patch_resource(
         if config.tsl_convert_gffs and not resource.inside_capsule:
             convert_gff_game(Game.K1, resource, config)
 
-        gff: GFF | None = None
         try:
-            gff = read_gff(resource.data())
+            if gff is None:
+                gff = read_gff(resource_data())
             alien_owner: str | None = None
             if gff.content is GFFContent.DLG and config.set_unskippable:
                 skippable = gff.root.acquire("Skippable", None)
@@ -520,6 +553,9 @@ def patch_and_save_noncapsule(
     resource: FileResource,
     config: PatchingConfig,
     savedir: Path | None = None,
+    *,
+    data: bytes | None = None,
+    gff: GFF | None = None,
 ) -> None:
     """Patch and save a non-capsule resource.
 
@@ -528,8 +564,10 @@ def patch_and_save_noncapsule(
         resource: The resource to patch
         config: Patching configuration
         savedir: Optional directory to save to
+        data: The resource data, if already read (default: read from the resource's file)
+        gff: The resource parsed as a GFF, if already parsed
     """
-    patched_data: GFF | TPC | None = patch_resource(resource, config)
+    patched_data: GFF | TPC | None = patch_resource(resource, config, data=data, gff=gff)
     if patched_data is None:
         return
 
@@ -583,6 +621,8 @@ def patch_capsule_file(
 ) -> None:
     """Patch a capsule file (ERF/RIM).
 
+    The capsule is read and written once; its resources are patched in parallel, see `batch_patch_capsules`.
+
     Args:
     ----
         c_file: Path to the capsule file
@@ -592,52 +632,16 @@ def patch_capsule_file(
     if processed_files is None:
         processed_files = set()
 
-    log_message(config, f"Load {c_file.name}")
-    try:
-        file_capsule = Capsule(c_file)
-    except ValueError as e:
-        log_message(config, f"Could not load '{c_file}'. Reason: {e}")
+    if not config.is_patching():
         return
+    batch_patch_capsules({c_file: _patched_capsule_path(c_file, config)}, config)
 
-    new_filepath: Path = c_file
-    if config.translate and config.translator:
-        new_filepath = c_file.parent / f"{c_file.stem}_{config.translator.to_lang.get_bcp47_code()}{c_file.suffix}"
-
-    new_resources: list[tuple[str, ResourceType, bytes]] = []
-    omitted_resources: list[ResourceIdentifier] = []
-    for resource in file_capsule:
-        if config.is_patching():
-            patched_data: GFF | TPC | None = patch_resource(resource, config, processed_files)
-            if isinstance(patched_data, GFF):
-                new_data = bytes_gff(patched_data) if patched_data else resource.data()
-                log_message(config, f"Adding patched GFF resource '{resource.identifier()}' to capsule {new_filepath.name}")
-                new_resources.append((resource.resname(), resource.restype(), new_data))
-                omitted_resources.append(resource.identifier())
-
-            elif isinstance(patched_data, TPC):
-                txi_resource = file_capsule.resource(resource.resname(), ResourceType.TXI)
-                if txi_resource is not None:
-                    patched_data.txi = txi_resource.decode("ascii", errors="ignore")
-                    omitted_resources.append(ResourceIdentifier(resource.resname(), ResourceType.TXI))
-
-        new_data = bytes_tpc(patched_data)
-        log_message(config, f"Adding patched TPC resource '{resource.identifier()}' to capsule {new_filepath.name}")
-        new_resources.append((resource.resname(), ResourceType.TPC, bytes(new_data)))
-        omitted_resources.append(resource.identifier())
-
-    if config.is_patching():
-        erf_or_rim: ERF | RIM = ERF(ERFType.from_extension(new_filepath)) if is_any_erf_type_file(c_file) else RIM()
-        for resource in file_capsule:
-            if resource.identifier() not in omitted_resources:
-                erf_or_rim.set_data(resource.resname(), resource.restype(), resource.data())
-        for resinfo in new_resources:
-            erf_or_rim.set_data(*resinfo)
 
-        log_message(config, f"Saving back to {new_filepath.name}")
-        if is_any_erf_type_file(c_file):
-            write_erf(erf_or_rim, new_filepath)  # type: ignore[arg-type]
-        else:
-            write_rim(erf_or_rim, new_filepath)  # type: ignore[arg-type]
+def _patched_capsule_path(c_file: Path, config: PatchingConfig) -> Path:
+    """Returns where the patched version of a capsule is saved: next to it when translating, over it otherwise."""
+    if config.translate and config.translator:
+        return c_file.parent / f"{c_file.stem}_{config.translator.to_lang.get_bcp47_code()}{c_file.suffix}"
+    return c_file
 
 
 def patch_erf_or_rim(
@@ -698,6 +702,356 @@ def patch_erf_or_rim(
     return new_filename
 
 
+def _is_patchable(restype: ResourceType, config: PatchingConfig) -> bool:
+    """Returns True if `patch_resource` can change resources of this type under the given configuration."""
+    extension: str = restype.extension.lower()
+    if extension == "tlk":
+        return bool(config.translate and config.translator)
+    if extension in ("tga", "tpc"):
+        return config.convert_tga == ("TGA to TPC" if extension == "tga" else "TPC to TGA")
+    if restype.name.upper() not in {x.name for x in GFFContent}:
+        return False
+    if config.translate or config.k1_convert_gffs or config.tsl_convert_gffs:
+        return True
+    return config.set_unskippable and restype is ResourceType.DLG  # only dialogs are changed by set_unskippable
+
+
+def _worker_config(config: PatchingConfig, messages: list[str]) -> PatchingConfig:
+    """Copy of a configuration whose log messages are collected instead of emitted."""
+    worker_config: PatchingConfig = copy.copy(config)
+    worker_config.log_callback = messages.append
+    return worker_config
+
+
+def _read_shard(entries: list[tuple[str, str, str, int, int]]) -> list[bytes | None]:
+    """Read the data of every entry of a shard, opening each file once and reading in offset order.
+
+    None marks entries that must be read through `FileResource.data` (compressed BIFs, unreadable files).
+    """
+    data: list[bytes | None] = [None] * len(entries)
+    by_file: dict[str, list[int]] = {}
+    for index, entry in enumerate(entries):
+        if not entry[0].lower().endswith(".bzf"):
+            by_file.setdefault(entry[0], []).append(index)
+    for filepath, indices in by_file.items():
+        try:
+            with open(filepath, "rb") as f:  # noqa: PTH123
+                for index in sorted(indices, key=lambda i: entries[i][3]):
+                    f.seek(entries[index][3])
+                    data[index] = f.read(entries[index][4])
+        except OSError as e:
+            RobustLogger().debug(f"Could not read '{filepath}' in one pass, its resources are read on their own: {e}")
+    return data
+
+
+def _patch_noncapsule_shard(
+    entries: list[tuple[str, str, str, int, int]],
+    config: PatchingConfig,
+    savedir: str | None,
+) -> list[tuple[float, list[str]]]:
+    """Patch and save the resources of one shard with `patch_and_save_noncapsule`.
+
+    Runs in a worker: returns the time spent on and the log messages of every resource.
+    """
+    results: list[tuple[float, list[str]]] = []
+    resources: list[FileResource] = [
+        FileResource(resname, ResourceType.__members__[restype_name], size, offset, filepath)
+        for filepath, resname, restype_name, offset, size in entries
+    ]
+    shard_data: list[bytes | None] = _read_shard(entries)
+    for resource, data, gff in zip(resources, shard_data, _translate_shard_gffs(resources, shard_data, config)):
+        messages: list[str] = []
+        start: float = time.perf_counter()
+        try:
+            patch_and_save_noncapsule(resource, _worker_config(config, messages), None if savedir is None else Path(savedir), data=data, gff=gff)
+        except Exception as e:  # pylint: disable=W0718  # noqa: BLE001
+            messages.append(f"[Error] patching '{resource.path_ident()}': {e.__class__.__name__}: {e}")
+        results.append((time.perf_counter() - start, messages))
+    return results
+
+
+def _patch_capsule_shard(
+    entries: list[tuple[str, str, str, int, int, int, int]],
+    config: PatchingConfig,
+) -> list[tuple[str | None, bytes | None, bool, float, list[str]]]:
+    """Patch the resources of one capsule shard and return their new data instead of saving it.
+
+    Runs in a worker. Each entry is (capsule path, resname, restype name, offset, size, TXI offset, TXI size), the TXI
+    offset being -1 when the capsule has no TXI for the resource. Each result is (new restype name, new data, whether the
+    TXI was embedded, seconds, log messages); the restype and data are None for resources that were not changed.
+    """
+    results: list[tuple[str | None, bytes | None, bool, float, list[str]]] = []
+    resources: list[FileResource] = [
+        FileResource(resname, ResourceType.__members__[restype_name], size, offset, filepath)
+        for filepath, resname, restype_name, offset, size, _txi_offset, _txi_size in entries
+    ]
+    shard_data: list[bytes | None] = _read_shard([entry[:5] for entry in entries])
+    shard_gffs: list[GFF | None] = _translate_shard_gffs(resources, shard_data, config)
+    for (filepath, resname, restype_name, _offset, _size, txi_offset, txi_size), resource, data, gff in zip(entries, resources, shard_data, shard_gffs):
+        messages: list[str] = []
+        start: float = time.perf_counter()
+        new_restype: str | None = None
+        new_data: bytes | None = None
+        embedded_txi: bool = False
+        try:
+            patched_data: GFF | TPC | None = patch_resource(resource, _worker_config(config, messages), data=data, gff=gff)
+            if isinstance(patched_data, GFF):
+                new_restype, new_data = restype_name, bytes(bytes_gff(patched_data))
+            elif isinstance(patched_data, TPC):
+                if txi_offset >= 0:
+                    txi_data: bytes = FileResource(resname, ResourceType.TXI, txi_size, txi_offset, filepath).data()
+                    patched_data.txi = txi_data.decode("ascii", errors="ignore")
+                    embedded_txi = True
+                new_restype, new_data = ResourceType.TPC.name, bytes(bytes_tpc(patched_data))
+        except Exception as e:  # pylint: disable=W0718  # noqa: BLE001
+            messages.append(f"[Error] patching '{resource.path_ident()}': {e.__class__.__name__}: {e}")
+        results.append((new_restype, new_data, embedded_txi, time.perf_counter() - start, messages))
+    return results
+
+
+def _translate_shard_gffs(
+    resources: list[FileResource],
+    data: list[bytes | None],
+    config: PatchingConfig,
+) -> list[GFF | None]:
+    """Parse the GFFs of a shard and translate all of their LocalizedStrings in one deduplicated, batched pass.
+
+    Runs in a worker before the shard is patched, so the per-field translations of `patch_nested_gff` are answered from
+    the pipeline's cache and each GFF is only parsed once. Returns the parsed GFFs to patch, None for everything else
+    (including GFFs that fail to parse, which `patch_resource` reports when it reads them itself).
+    """
+    gffs: list[GFF | None] = [None] * len(resources)
+    if not (config.translate and config.translator):
+        return gffs
+    gff_names: set[str] = {x.name for x in GFFContent}
+    for index, (resource, resource_data) in enumerate(zip(resources, data)):
+        if resource.restype().name.upper() not in gff_names:
+            continue
+        try:
+            gffs[index] = read_gff(resource.data() if resource_data is None else resource_data)
+        except (OSError, ValueError) as e:  # noqa: PERF203
+            RobustLogger().debug(f"Not prefetching translations of '{resource.path_ident()}': {e}")
+    prefetch_gff_translations(config.translation_pipeline(), (gff for gff in gffs if gff is not None))
+    return gffs
+
+
+def _run_patch_tasks(
+    function: Callable[..., Any],
+    tasks: list[tuple[Any, ...]],
+    config: PatchingConfig,
+) -> Iterator[Any]:
+    """Run patch tasks in a worker pool and yield their results in task order.
+
+    Translation is network-bound and translators are not generally picklable, so it runs in threads; every other
+    patch runs in a process pool. Tasks run in-process with ``max_workers=1`` or when worker processes are unavailable.
+    """
+    max_workers: int = max(1, min(config.max_workers or multiprocessing.cpu_count(), len(tasks)))
+    if max_workers == 1:
+        yield from (function(*task) for task in tasks)
+        return
+    if config.translate:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(function, *zip(*tasks))
+        return
+
+    done: int = 0
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            for result in executor.map(function, *zip(*tasks)):
+                done += 1
+                yield result
+    except (OSError, RuntimeError) as e:
+        # Worker processes unavailable (frozen build, sandbox, broken pool): patch the remaining tasks in-process.
+        RobustLogger().warning(f"Parallel patching failed ({e.__class__.__name__}: {e}), patching in-process")
+        yield from (function(*task) for task in tasks[done:])
+
+
+def _pool_config(config: PatchingConfig) -> PatchingConfig:
+    """Copy of a configuration that can be sent to worker processes (the log callback stays in the parent).
+
+    Translating runs in worker threads, which share the translation pipeline created here.
+    """
+    if config.translate and config.translator:
+        config.translation_pipeline()
+    pool_config: PatchingConfig = copy.copy(config)
+    pool_config.log_callback = None
+    return pool_config
+
+
+def _log_results(config: PatchingConfig, identifiers: list[str], results: list[tuple[float, list[str]]]) -> None:
+    """Replay the log messages of patched resources, each followed by the time spent on it."""
+    for identifier, (seconds, messages) in zip(identifiers, results):
+        for message in messages:
+            log_message(config, message)
+        if messages:
+            log_message(config, f"Patched '{identifier}' in {seconds * 1000:.1f} ms")
+
+
+def batch_patch_resources(
+    resources: Iterable[FileResource],
+    config: PatchingConfig,
+    *,
+    savedir: Path | None = None,
+) -> None:
+    """Patch and save many non-capsule resources (loose files, BIF contents) in parallel.
+
+    Resources are grouped by the BIF or folder they are stored in, each group is patched in a worker that
+    opens its files once, and every patched resource is saved as `patch_and_save_noncapsule` would.
+
+    Args:
+    ----
+        resources: The resources to patch; those the configuration cannot change are skipped
+        config: Patching configuration (``config.max_workers`` sets the number of workers)
+        savedir: Optional directory to save to
+    """
+    groups: dict[str, list[FileResource]] = {}
+    for resource in resources:
+        if _is_patchable(resource.restype(), config):
+            key: str = str(resource.filepath() if resource.inside_bif or resource.inside_bzf else resource.filepath().parent)
+            groups.setdefault(key, []).append(resource)
+
+    shards: list[list[FileResource]] = [
+        members[i : i + _PATCH_RESOURCES_PER_TASK]
+        for members in groups.values()
+        for i in range(0, len(members), _PATCH_RESOURCES_PER_TASK)
+    ]
+    pool_config: PatchingConfig = _pool_config(config)
+    tasks: list[tuple[Any, ...]] = [
+        (
+            [(str(resource.filepath()), resource.resname(), resource.restype().name, resource.offset(), resource.size()) for resource in shard],
+            pool_config,
+            None if savedir is None else str(savedir),
+        )
+        for shard in shards
+    ]
+    total: int = sum(len(shard) for shard in shards)
+    done: int = 0
+    start: float = time.perf_counter()
+    for shard, results in zip(shards, _run_patch_tasks(_patch_noncapsule_shard, tasks, config)):
+        _log_results(config, [str(resource.path_ident()) for resource in shard], results)
+        done += len(shard)
+        container: Path = shard[0].filepath() if shard[0].inside_bif or shard[0].inside_bzf else shard[0].filepath().parent
+        log_message(config, f"[{done}/{total}] Patched resources in '{container.name}'")
+    if total:
+        log_message(config, f"Patched {total} resources in {time.perf_counter() - start:.2f}s")
+
+
+def batch_patch_capsules(
+    capsules: dict[Path, Path],
+    config: PatchingConfig,
+) -> list[Path]:
+    """Patch many ERF/RIM capsules in parallel, reading and writing each capsule once.
+
+    The patchable resources of every capsule are split into tasks that run in a worker pool; once all tasks of a
+    capsule are done it is rebuilt from its original data and the patched resources and written in one go.
+    Capsules without changes are not rewritten when they would be saved over themselves.
+
+    Args:
+    ----
+        capsules: Mapping of capsule path -> path to save the patched capsule to
+        config: Patching configuration (``config.max_workers`` sets the number of workers)
+
+    Returns:
+    -------
+        The paths of the capsules that were written
+    """
+    loaded: list[tuple[Path, Path, list[FileResource], list[int]]] = []
+    shards: list[list[tuple[str, str, str, int, int, int, int]]] = []
+    task_capsules: list[int] = []
+    for c_file, new_filepath in capsules.items():
+        log_message(config, f"Load {c_file.name}")
+        try:
+            resources: list[FileResource] = list(Capsule(c_file))
+        except (OSError, ValueError) as e:
+            log_message(config, f"Could not load '{c_file}'. Reason: {e}")
+            continue
+
+        txis: dict[str, FileResource] = {resource.resname().lower(): resource for resource in resources if resource.restype() is ResourceType.TXI}
+        patchable: list[int] = [index for index, resource in enumerate(resources) if _is_patchable(resource.restype(), config)]
+        entries: list[tuple[str, str, str, int, int, int, int]] = []
+        for index in patchable:
+            resource = resources[index]
+            txi: FileResource | None = txis.get(resource.resname().lower())
+            entries.append(
+                (
+                    str(c_file),
+                    resource.resname(),
+                    resource.restype().name,
+                    resource.offset(),
+                    resource.size(),
+                    -1 if txi is None else txi.offset(),
+                    0 if txi is None else txi.size(),
+                ),
+            )
+        for i in range(0, len(entries), _PATCH_RESOURCES_PER_TASK):
+            shards.append(entries[i : i + _PATCH_RESOURCES_PER_TASK])
+            task_capsules.append(len(loaded))
+        loaded.append((c_file, new_filepath, resources, patchable))
+
+    pool_config: PatchingConfig = _pool_config(config)
+    tasks: list[tuple[Any, ...]] = [(shard, pool_config) for shard in shards]
+    pending: list[list[tuple[str | None, bytes | None, bool, float, list[str]]]] = [[] for _ in loaded]
+    written: list[Path] = []
+    start: float = time.perf_counter()
+
+    def finish(capsule_index: int):
+        c_file, new_filepath, resources, patchable = loaded[capsule_index]
+        results = pending[capsule_index]
+        _log_results(config, [str(resources[index].path_ident()) for index in patchable], [(seconds, messages) for *_patched, seconds, messages in results])
+        if _save_patched_capsule(c_file, new_filepath, resources, dict(zip(patchable, results)), config):
+            written.append(new_filepath)
+        log_message(config, f"[{capsule_index + 1}/{len(loaded)}] Patched {sum(result[1] is not None for result in results)} of {len(resources)} resources in '{c_file.name}'")
+
+    next_capsule: int = 0
+    for capsule_index, results in zip(task_capsules, _run_patch_tasks(_patch_capsule_shard, tasks, config)):
+        # Capsules are finished in order, as soon as all of their tasks are done.
+        while next_capsule < capsule_index:
+            finish(next_capsule)
+            next_capsule += 1
+        pending[capsule_index].extend(results)
+    while next_capsule < len(loaded):
+        finish(next_capsule)
+        next_capsule += 1
+    if loaded:
+        log_message(config, f"Patched {len(loaded)} capsules in {time.perf_counter() - start:.2f}s")
+    return written
+
+
+def _save_patched_capsule(
+    c_file: Path,
+    new_filepath: Path,
+    resources: list[FileResource],
+    patched: dict[int, tuple[str | None, bytes | None, bool, float, list[str]]],
+    config: PatchingConfig,
+) -> bool:
+    """Rebuild a capsule from its original data and the patched resources. Returns True if it was written."""
+    changed: dict[int, tuple[str | None, bytes | None, bool, float, list[str]]] = {index: result for index, result in patched.items() if result[1] is not None}
+    if not changed and new_filepath == c_file:
+        return False
+
+    omitted: set[ResourceIdentifier] = {resources[index].identifier() for index in changed}
+    omitted.update(ResourceIdentifier(resources[index].resname(), ResourceType.TXI) for index, result in changed.items() if result[2])
+    erf_or_rim: ERF | RIM = ERF(ERFType.from_extension(c_file)) if is_any_erf_type_file(c_file) else RIM()
+    if isinstance(erf_or_rim, ERF) and c_file.suffix.lower() == ".sav":
+        erf_or_rim.is_save = True
+
+    capsule_data: bytes = c_file.read_bytes()
+    for resource in resources:
+        if resource.identifier() not in omitted:
+            erf_or_rim.set_data(resource.resname(), resource.restype(), capsule_data[resource.offset() : resource.offset() + resource.size()])
+    for index, (restype_name, new_data, _embedded_txi, _seconds, _messages) in changed.items():
+        assert restype_name is not None and new_data is not None  # noqa: S101
+        log_message(config, f"Adding patched resource '{resources[index].identifier()}' to capsule {new_filepath.name}")
+        erf_or_rim.set_data(resources[index].resname(), ResourceType.__members__[restype_name], new_data)
+
+    log_message(config, f"Saving back to {new_filepath.name}")
+    if isinstance(erf_or_rim, ERF):
+        write_erf(erf_or_rim, new_filepath)
+    else:
+        write_rim(erf_or_rim, new_filepath)
+    return True
+
+
 def patch_file(
     file: Path | str,
     config: PatchingConfig,
@@ -742,8 +1096,14 @@ def patch_folder(
 
     c_folderpath = Path(folder_path)
     log_message(config, f"Recursing through resources in the '{c_folderpath.name}' folder...")
-    for file_path in c_folderpath.rglob("*"):
-        patch_file(file_path, config, processed_files)
+    files: list[Path] = [file_path for file_path in c_folderpath.rglob("*") if file_path not in processed_files and file_path.is_file()]
+    processed_files.update(files)
+    if not config.is_patching():
+        return
+
+    capsules: dict[Path, Path] = {file_path: _patched_capsule_path(file_path, config) for file_path in files if is_capsule_file(file_path)}
+    batch_patch_capsules(capsules, config)
+    batch_patch_resources((FileResource.from_path(file_path) for file_path in files if not is_capsule_file(file_path)), config)
 
 
 def is_kotor_install_dir(path: Path) -> bool:
@@ -796,44 +1156,36 @@ def patch_install(
                     log_message(config, f"Unknown ERF/RIM: '{module_path.relative_to(k_install.path().parent)}'")
 
         k_install.load_modules()
-        for module_name, resources in k_install._modules.items():  # noqa: SLF001
+        capsules: dict[Path, Path] = {}
+        for module_name in k_install._modules:  # noqa: SLF001
             res_ident = ResourceIdentifier.from_path(module_name)
-            filename = str(res_ident)
-            filepath = k_install.path().joinpath("Modules", filename)
-            if res_ident.restype is ResourceType.RIM:
-                if filepath.with_suffix(".mod").is_file():
-                    log_message(config, f"Skipping {filepath}, a .mod already exists at this path.")
-                    continue
-                new_rim = RIM()
-                new_rim_filename = patch_erf_or_rim(resources, module_name, new_rim, config)
-                log_message(config, f"Saving '{new_rim_filename}'")
-                write_rim(new_rim, filepath.parent / new_rim_filename, res_ident.restype)
-
-            elif res_ident.restype.name in (ResourceType.ERF, ResourceType.MOD, ResourceType.SAV):
-                new_erf = ERF(ERFType.from_extension(filepath.suffix))
-                if res_ident.restype is ResourceType.SAV:
-                    new_erf.is_save = True
-                new_erf_filename = patch_erf_or_rim(resources, module_name, new_erf, config)
-                log_message(config, f"Saving '{new_erf_filename}'")
-                write_erf(new_erf, filepath.parent / new_erf_filename, res_ident.restype)
-
-            else:
+            filepath = k_install.module_path().joinpath(module_name)
+            if res_ident.restype is ResourceType.RIM and filepath.with_suffix(".mod").is_file():
+                log_message(config, f"Skipping {filepath}, a .mod already exists at this path.")
+                continue
+            if res_ident.restype not in (ResourceType.RIM, ResourceType.ERF, ResourceType.MOD, ResourceType.SAV):
                 log_message(config, f"Unsupported module: {module_name} - cannot patch")
+                continue
+            new_filename = filepath.name
+            if config.translate and config.translator:
+                new_filename = f"{filepath.stem}_{config.translator.to_lang.name}{filepath.suffix}"
+            capsules[filepath] = filepath.parent / new_filename
+        batch_patch_capsules(capsules, config)
 
     if config.is_patching():
         log_message(config, "Patching Override...")
     override_path = k_install.override_path()
     override_path.mkdir(exist_ok=True, parents=True)
-    for folder in k_install.override_list():
-        for resource in k_install.override_resources(folder):
-            if config.is_patching():
-                patch_and_save_noncapsule(resource, config)
+    if config.is_patching():
+        batch_patch_resources(
+            (resource for folder in k_install.override_list() for resource in k_install.override_resources(folder)),
+            config,
+        )
 
     if config.is_patching():
         log_message(config, "Extract and patch BIF data, saving to Override (will not overwrite)")
-    for resource in k_install.core_resources():
-        if config.translate or config.set_unskippable:
-            patch_and_save_noncapsule(resource, savedir=override_path, config=config)
+    if config.translate or config.set_unskippable:
+        batch_patch_resources(k_install.core_resources(), config, savedir=override_path)
 
     patch_file(k_install.path().joinpath("dialog.tlk"), config, processed_files)
 
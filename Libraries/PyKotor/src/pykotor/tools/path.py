@@ -9,7 +9,10 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 
+from collections import OrderedDict
 from functools import lru_cache
 from typing import TYPE_CHECKING
 
@@ -107,17 +110,12 @@ if _fuse_available:
                 # This shouldn't happen but handle it safely
                 return (path, False) if ret_found else path
 
-        try:
-            files = os.listdir(d)  # noqa: PTH208
-        except Exception as e:
-            print(f"Failed to list directory {d}: {e}")
+        matches = _CASE_FOLD_INDEX.entries(d, f)
+        if matches is None:
+            print(f"Failed to list directory {d}")
             return (path, False) if ret_found else path
 
-        f_low = f.lower()
-        try:
-            f_nocase = next(fl for fl in files if fl.lower() == f_low)
-        except StopIteration:
-            f_nocase = None
+        f_nocase = matches[0][0] if matches else None
 
         if f_nocase:
             return (
@@ -447,6 +445,101 @@ def _get_or_create_fuse_mount(root_path: str) -> str | None:
         return mount_point
 
 
+class CaseFoldDirectoryIndex:
+    """Bounded cache of case-folded directory listings used to resolve paths case-insensitively.
+
+    Each cached directory maps `name.lower()` to the real entry names (and whether each is a directory),
+    so resolving one component is a dict lookup instead of a listdir plus linear scan.
+
+    Entries are validated against the directory's `st_mtime_ns` on every lookup. Because some filesystems
+    only store mtimes with coarse resolution, a listing taken within `racy_window` seconds of the directory's
+    mtime is treated as unverified: a miss in such a listing triggers one re-list before being reported.
+    """
+
+    def __init__(
+        self,
+        max_dirs: int = 4096,
+        racy_window: float = 2.0,
+    ):
+        self.max_dirs: int = max_dirs
+        self.racy_window: float = racy_window
+        # dir path -> (mtime_ns, racy, {lower name: ((real name, is_dir), ...)})
+        self._listings: OrderedDict[str, tuple[int, bool, dict[str, tuple[tuple[str, bool], ...]]]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._listings.clear()
+
+    def invalidate(self, directory: os.PathLike | str) -> None:
+        with self._lock:
+            self._listings.pop(os.fspath(directory), None)
+
+    def resize(self, max_dirs: int) -> None:
+        with self._lock:
+            self.max_dirs = max_dirs
+            while len(self._listings) > self.max_dirs:
+                self._listings.popitem(last=False)
+
+    def _scan(
+        self,
+        directory: str,
+        mtime_ns: int,
+    ) -> dict[str, tuple[tuple[str, bool], ...]] | None:
+        folded: dict[str, list[tuple[str, bool]]] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir: bool = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    folded.setdefault(entry.name.lower(), []).append((entry.name, is_dir))
+        except OSError:
+            return None
+        listing: dict[str, tuple[tuple[str, bool], ...]] = {key: tuple(value) for key, value in folded.items()}
+        racy: bool = (time.time_ns() - mtime_ns) < self.racy_window * 1_000_000_000
+        with self._lock:
+            self._listings[directory] = (mtime_ns, racy, listing)
+            self._listings.move_to_end(directory)
+            while len(self._listings) > self.max_dirs:
+                self._listings.popitem(last=False)
+        return listing
+
+    def entries(
+        self,
+        directory: str,
+        name: str,
+    ) -> tuple[tuple[str, bool], ...] | None:
+        """Return the `(real name, is_dir)` entries of `directory` matching `name` case-insensitively.
+
+        Returns None if `directory` is not a listable directory, or an empty tuple if nothing matches.
+        """
+        try:
+            mtime_ns: int = os.stat(directory).st_mtime_ns  # noqa: PTH116
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._listings.get(directory)
+            if cached is not None:
+                self._listings.move_to_end(directory)
+        if cached is None or cached[0] != mtime_ns:
+            listing = self._scan(directory, mtime_ns)
+            return None if listing is None else listing.get(name.lower(), ())
+        _mtime_ns, racy, listing = cached
+        matches: tuple[tuple[str, bool], ...] = listing.get(name.lower(), ())
+        if racy and (not matches or not all(os.path.lexists(os.path.join(directory, real)) for real, _ in matches)):  # noqa: PTH110, PTH118
+            listing = self._scan(directory, mtime_ns)
+            return None if listing is None else listing.get(name.lower(), ())
+        return matches
+
+
+_CASE_FOLD_INDEX: CaseFoldDirectoryIndex = CaseFoldDirectoryIndex()
+
+
 def simple_wrapper(fn_name: str, wrapped_class_type: type[CaseAwarePath]) -> Callable[..., Any]:
     """Wraps a function to handle case-sensitive pathlib.PurePath arguments.
 
@@ -622,8 +715,7 @@ class CaseAwarePath(InternalWindowsPath if os.name == "nt" else InternalPosixPat
 
     __slots__: tuple[str] = ("_tail_cached",)
     _original_methods: ClassVar[dict[str, Callable[..., Any]]] = {}
-    _dir_cache: ClassVar[dict[str, tuple[InternalPath, ...]]] = {}
-    _dir_cache_max_size: ClassVar[int] = 1000
+    _dir_index: ClassVar[CaseFoldDirectoryIndex] = _CASE_FOLD_INDEX
 
     if sys.version_info < (3, 13):
         def as_posix(self) -> str:
@@ -1189,44 +1281,91 @@ class CaseAwarePath(InternalWindowsPath if os.name == "nt" else InternalPosixPat
                 # Fall through to standard implementation
 
         # Standard implementation (fallback or when FUSE not available)
-        parts = list(pathlib_abspath.parts)
-        # Cache directory listings **within this call only**.
-        #
-        # A cross-call cache can go stale when tests (and real usage) create/rename/delete entries,
-        # and directory mtime can have coarse resolution on some filesystems. Per-call caching
-        # preserves the performance benefit (avoid repeated iterdir()) without breaking correctness.
-        dir_cache_local: dict[str, tuple[InternalPath, ...]] = {}
+        parts = cls._resolve_parts(list(pathlib_abspath.parts), {})
 
+        # Return a CaseAwarePath instance
+        return cls._create_instance(*parts[num_differing_parts:], called_from_getcase=True)
+
+    @classmethod
+    def _resolve_parts(
+        cls,
+        parts: list[str],
+        memo: dict[tuple[str, ...], tuple[str, bool]],
+    ) -> list[str]:
+        """Resolve each component of an absolute `parts` list against the case-fold directory index.
+
+        `memo` maps an unresolved prefix to `(resolved dir path, exists)` and may be shared across calls,
+        which is how `get_case_sensitive_paths` resolves many paths with common prefixes in one pass.
+        """
+        directory: str = parts[0]
+        exists: bool = True
+        original_parts: tuple[str, ...] = tuple(parts)
         for i in range(1, len(parts)):  # ignore the root (/, C:\\, etc)
-            base_path: InternalPath = InternalPath(*parts[:i])
-            next_path: InternalPath = InternalPath(*parts[: i + 1])
-
-            if not next_path.is_dir() and base_path.is_dir():
-                # Find the first non-existent case-sensitive file/folder in hierarchy
-                # if multiple are found, use the one that most closely matches our case
-                # A closest match is defined, in this context, as the file/folder's name that contains the most case-sensitive positional character matches
-                # If two closest matches are identical (e.g. we're looking for TeST and we find TeSt and TesT), it's probably random.
-                last_part: bool = i == len(parts) - 1
-                
-                # Cache directory listings to avoid repeated iterdir() calls - massive performance improvement
-                base_path_str = str(base_path)
-                if base_path_str not in dir_cache_local:
-                    try:
-                        dir_cache_local[base_path_str] = tuple(base_path.iterdir())
-                    except (OSError, PermissionError):
-                        dir_cache_local[base_path_str] = ()
-                cached_items = dir_cache_local[base_path_str]
+            last_part: bool = i == len(parts) - 1
+            # Only directory prefixes are memoized: the final component may legitimately resolve to a file.
+            key: tuple[str, ...] = original_parts[: i + 1]
+            cached: tuple[str, bool] | None = None if last_part else memo.get(key)
+            if cached is not None:
+                directory, exists = cached
+                parts[i] = os.path.basename(directory)  # noqa: PTH119
+                if not exists:
+                    break
+                continue
 
+            matches = cls._dir_index.entries(directory, parts[i]) if exists else None
+            if matches is None:
+                # `directory` does not exist or is not a directory, so nothing beneath it can be resolved.
+                if not last_part:
+                    memo[key] = (os.path.join(directory, parts[i]), False)  # noqa: PTH118
+                break
+
+            # Find the first non-existent case-sensitive file/folder in hierarchy
+            # if multiple are found, use the one that most closely matches our case
+            # A closest match is defined, in this context, as the file/folder's name that contains the most case-sensitive positional character matches
+            # If two closest matches are identical (e.g. we're looking for TeST and we find TeSt and TesT), it's probably random.
+            if not any(real == parts[i] and is_dir for real, is_dir in matches):
                 parts[i] = cls.find_closest_match(
                     parts[i],
-                    (item for item in cached_items if last_part or item.is_dir()),
+                    (InternalPath(real) for real, is_dir in matches if last_part or is_dir),
                 )
+            directory = os.path.join(directory, parts[i])  # noqa: PTH118
+            exists = bool(matches)
+            if not last_part:
+                memo[key] = (directory, exists)
+        return parts
 
-            elif not next_path.exists():
-                break
+    @classmethod
+    def get_case_sensitive_paths(
+        cls,
+        paths: Iterable[os.PathLike | str],
+    ) -> list[Self]:
+        """Resolve many paths at once, sharing the work for common prefixes.
 
-        # Return a CaseAwarePath instance
-        return cls._create_instance(*parts[num_differing_parts:], called_from_getcase=True)
+        Equivalent to `[cls.get_case_sensitive_path(p) for p in paths]`, but each distinct directory prefix
+        (e.g. an install's `Override` folder) is only resolved once, which makes resolving thousands of
+        resource paths under the same few folders cheap.
+        """
+        memo: dict[tuple[str, ...], tuple[str, bool]] = {}
+        results: list[Self] = []
+        for path in paths:
+            pathlib_path = pathlib.Path(path)
+            pathlib_abspath = pathlib_path.absolute()
+            num_differing_parts = len(pathlib_abspath.parts) - len(pathlib_path.parts)  # keeps the path relative if it already was.
+            parts: list[str] = cls._resolve_parts(list(pathlib_abspath.parts), memo)
+            results.append(cls._create_instance(*parts[num_differing_parts:], called_from_getcase=True))
+        return results
+
+    @classmethod
+    def configure_dir_cache(
+        cls,
+        max_dirs: int,
+    ) -> None:
+        """Set how many directory listings the case-fold index keeps before evicting the least recently used."""
+        cls._dir_index.resize(max_dirs)
+
+    @classmethod
+    def clear_dir_cache(cls) -> None:
+        cls._dir_index.clear()
 
     @classmethod
     def find_closest_match(
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import multiprocessing
 import os
+import struct
+import sys
 import traceback
+import zlib
 
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Sequence, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Sequence, Union
 
 from loggerplus import RobustLogger
 
 from pykotor.common.language import LocalizedString
 from pykotor.common.stream import BinaryReader
-from pykotor.extract.file import FileResource  # noqa: PLC0415
+from pykotor.extract.file import FileResource, ResourceIdentifier  # noqa: PLC0415
 
 # Runtime import for find_tlk_entry_references
 from pykotor.extract.installation import SearchLocation  # noqa: PLC0415
@@ -29,7 +35,6 @@ if TYPE_CHECKING:
 
     from pykotor.common.misc import Game
     from pykotor.extract.capsule import Capsule
-    from pykotor.extract.file import ResourceIdentifier
     from pykotor.extract.installation import Installation
     from pykotor.resource.formats.gff import GFF
     from pykotor.resource.formats.ncs.ncs_data import NCS
@@ -85,6 +90,89 @@ def _log_verbose(msg: str) -> None:
         print(f"[VERBOSE] {msg}")
 
 
+# Binary cache format shared by StrRefReferenceCache and TwoDAMemoryReferenceCache.
+#
+# Header: magic, format version, cache kind, game (uncompressed), followed by a zlib-compressed body.
+# Body: string table (count, byte length, NUL-joined UTF-8) and a flat little-endian int32 postings
+# array. Each posting is the key (1 int for StrRefs, 2 for 2DA rows), the number of referencing
+# resources, then for each resource its resname/restype string indices, location count and
+# location string indices. Resnames and field paths repeat heavily, so interning them keeps
+# shards and saved caches a fraction of the size of the to_dict()/YAML form.
+_BINARY_MAGIC = b"PKRC"
+_BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct("<4sBBH")
+_BINARY_STRINGS = struct.Struct("<II")
+_KIND_STRREF = 0
+_KIND_TWODA = 1
+
+
+def _pack_postings(
+    kind: int,
+    game: Game,
+    postings: dict[Any, dict[ResourceIdentifier, list[str]]],
+    key_ints: Callable[[Any, Callable[[str], int]], tuple[int, ...]],
+) -> bytes:
+    strings: dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    ints: array[int] = array("i")
+    for key, references in postings.items():
+        ints.extend(key_ints(key, intern))
+        ints.append(len(references))
+        for identifier, locations in references.items():
+            ints.extend((intern(identifier.resname), intern(identifier.restype.extension), len(locations)))
+            ints.extend(intern(location) for location in locations)
+    if sys.byteorder == "big":
+        ints.byteswap()
+
+    string_blob: bytes = "\0".join(strings).encode("utf-8")
+    body: bytes = _BINARY_STRINGS.pack(len(strings), len(string_blob)) + string_blob + ints.tobytes()
+    return _BINARY_HEADER.pack(_BINARY_MAGIC, _BINARY_VERSION, kind, int(game)) + zlib.compress(body, 6)
+
+
+def _unpack_postings(
+    data: bytes,
+    kind: int,
+    key_size: int,
+) -> tuple[int, Iterator[tuple[tuple[int, ...], list[tuple[str, str, list[str]]]]], list[str]]:
+    magic, version, data_kind, game_value = _BINARY_HEADER.unpack_from(data)
+    if magic != _BINARY_MAGIC or version != _BINARY_VERSION or data_kind != kind:
+        msg = f"Not a reference cache of kind {kind} (magic={magic!r}, version={version}, kind={data_kind})"
+        raise ValueError(msg)
+
+    body: bytes = zlib.decompress(data[_BINARY_HEADER.size :])
+    string_count, blob_size = _BINARY_STRINGS.unpack_from(body)
+    blob_start: int = _BINARY_STRINGS.size
+    strings: list[str] = body[blob_start : blob_start + blob_size].decode("utf-8").split("\0") if string_count else []
+    ints: array[int] = array("i")
+    ints.frombytes(body[blob_start + blob_size :])
+    if sys.byteorder == "big":
+        ints.byteswap()
+
+    def iter_postings() -> Iterator[tuple[tuple[int, ...], list[tuple[str, str, list[str]]]]]:
+        pos = 0
+        end: int = len(ints)
+        while pos < end:
+            key = tuple(ints[pos : pos + key_size])
+            pos += key_size
+            reference_count: int = ints[pos]
+            pos += 1
+            references: list[tuple[str, str, list[str]]] = []
+            for _ in range(reference_count):
+                resname_idx, restype_idx, location_count = ints[pos], ints[pos + 1], ints[pos + 2]
+                pos += 3
+                references.append((strings[resname_idx], strings[restype_idx], [strings[i] for i in ints[pos : pos + location_count]]))
+                pos += location_count
+            yield key, references
+
+    return game_value, iter_postings(), strings
+
+
 # Location dataclasses for StrRef references
 @dataclass
 class TwoDARefLocation:
@@ -478,6 +566,46 @@ class StrRefReferenceCache:
 
         return cache
 
+    def merge(self, other: StrRefReferenceCache) -> None:
+        """Merge the references of another cache (e.g. a per-container shard) into this one."""
+        for strref, references in other._cache.items():
+            target = self._cache.setdefault(strref, {})
+            for identifier, locations in references.items():
+                target.setdefault(identifier, []).extend(locations)
+        self._total_references_found += other._total_references_found
+        self._files_with_strrefs.update(other._files_with_strrefs)
+
+    def to_bytes(self) -> bytes:
+        """Serialize cache to the compact binary format (see ``from_bytes``)."""
+        return _pack_postings(_KIND_STRREF, self.game, self._cache, lambda strref, _intern: (strref,))
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        game: Game | None = None,
+    ) -> StrRefReferenceCache:
+        """Restore cache from data produced by ``to_bytes``.
+
+        Args:
+            data: Serialized cache data
+            game: Optional Game instance (defaults to the game the cache was built for)
+
+        Returns:
+            Restored StrRefReferenceCache instance
+        """
+        from pykotor.common.misc import Game  # noqa: PLC0415
+
+        game_value, postings, _strings = _unpack_postings(data, _KIND_STRREF, 1)
+        cache = cls(Game(game_value) if game is None else game)
+        for (strref,), references in postings:
+            target = cache._cache.setdefault(strref, {})
+            for resname, restype_ext, locations in references:
+                target.setdefault(ResourceIdentifier(resname, ResourceType.from_extension(restype_ext)), []).extend(locations)
+                cache._total_references_found += len(locations)
+                cache._files_with_strrefs.add(f"{resname}.{restype_ext}")
+        return cache
+
 
 class TwoDAMemoryReferenceCache:
     """Cache of 2DA memory token references found during resource scanning.
@@ -754,12 +882,206 @@ class TwoDAMemoryReferenceCache:
 
         return cache
 
+    def merge(self, other: TwoDAMemoryReferenceCache) -> None:
+        """Merge the references of another cache (e.g. a per-container shard) into this one."""
+        for key, references in other._cache.items():
+            target = self._cache.setdefault(key, {})
+            for identifier, locations in references.items():
+                target.setdefault(identifier, []).extend(locations)
+        self._total_references_found += other._total_references_found
+        self._files_with_2da_refs.update(other._files_with_2da_refs)
+
+    def to_bytes(self) -> bytes:
+        """Serialize cache to the compact binary format (see ``from_bytes``)."""
+        return _pack_postings(_KIND_TWODA, self.game, self._cache, lambda key, intern: (intern(key[0]), key[1]))
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        game: Game | None = None,
+    ) -> TwoDAMemoryReferenceCache:
+        """Restore cache from data produced by ``to_bytes``.
+
+        Args:
+            data: Serialized cache data
+            game: Optional Game instance (defaults to the game the cache was built for)
+
+        Returns:
+            Restored TwoDAMemoryReferenceCache
+        """
+        from pykotor.common.misc import Game  # noqa: PLC0415
+
+        game_value, postings, strings = _unpack_postings(data, _KIND_TWODA, 2)
+        cache = cls(Game(game_value) if game is None else game)
+        for (filename_idx, row_index), references in postings:
+            target = cache._cache.setdefault((strings[filename_idx], row_index), {})
+            for resname, restype_ext, locations in references:
+                target.setdefault(ResourceIdentifier(resname, ResourceType.from_extension(restype_ext)), []).extend(locations)
+                cache._total_references_found += len(locations)
+                cache._files_with_2da_refs.add(f"{resname}.{restype_ext}")
+        return cache
+
+
+# Loose files (Override, streamed audio, ...) are one container each; group them so every
+# worker task carries a useful amount of work.
+_LOOSE_FILES_PER_SHARD = 256
+
+_SHARD_CACHE_TYPES: dict[int, type[StrRefReferenceCache | TwoDAMemoryReferenceCache]] = {
+    _KIND_STRREF: StrRefReferenceCache,
+    _KIND_TWODA: TwoDAMemoryReferenceCache,
+}
+
+
+def _scan_shard(
+    kind: int,
+    game: Game,
+    entries: list[tuple[str, str, str, int, int]],
+) -> bytes:
+    """Scan one partition of an installation and return the resulting cache shard as bytes.
+
+    Runs in a worker process: the arguments and the return value are plain data so that only the
+    resource locations are sent to the worker and only the compact binary shard is sent back.
+    """
+    cache = _SHARD_CACHE_TYPES[kind](game)
+    for filepath, resname, restype_ext, offset, size in entries:
+        resource = FileResource(resname, ResourceType.from_extension(restype_ext), size, offset, filepath)
+        try:
+            cache.scan_resource(resource, resource.data())
+        except Exception as e:  # noqa: BLE001
+            RobustLogger().debug(f"Skipping '{resource.filename()}' in '{filepath}' while scanning references: {e}")
+    return cache.to_bytes()
+
+
+def _partition_by_container(
+    resources: Iterable[FileResource],
+) -> list[list[tuple[str, str, str, int, int]]]:
+    """Group resources into scan shards: one per capsule/BIF, loose files batched per folder."""
+    containers: dict[str, list[tuple[str, str, str, int, int]]] = {}
+    loose: dict[str, list[tuple[str, str, str, int, int]]] = {}
+    for resource in resources:
+        filepath = resource.filepath()
+        entry = (str(filepath), resource.resname(), resource.restype().extension, resource.offset(), resource.size())
+        if resource.inside_capsule or resource.inside_bif or resource.inside_bzf:
+            containers.setdefault(entry[0], []).append(entry)
+        else:
+            loose.setdefault(str(filepath.parent), []).append(entry)
+
+    shards: list[list[tuple[str, str, str, int, int]]] = list(containers.values())
+    for entries in loose.values():
+        shards.extend(entries[i : i + _LOOSE_FILES_PER_SHARD] for i in range(0, len(entries), _LOOSE_FILES_PER_SHARD))
+    return shards
+
+
+def _build_cache(
+    kind: int,
+    game: Game,
+    resources: Iterable[FileResource],
+    *,
+    max_workers: int | None = None,
+    logger: Callable[[str], None] | None = None,
+) -> StrRefReferenceCache | TwoDAMemoryReferenceCache:
+    """Scan resources in a process pool, one shard per container, and merge the shards in order."""
+    cache_type = _SHARD_CACHE_TYPES[kind]
+    cache = cache_type(game)
+    shards = _partition_by_container(resources)
+    if max_workers is None:
+        max_workers = multiprocessing.cpu_count()
+    max_workers = max(1, min(max_workers, len(shards)))
+
+    def merge_all(shard_bytes: Iterable[bytes]) -> None:
+        for done, data in enumerate(shard_bytes, start=1):
+            cache.merge(cache_type.from_bytes(data, game))  # type: ignore[arg-type]
+            if logger is not None and done % 50 == 0:
+                logger(f"  Merged {done}/{len(shards)} reference cache shards")
+
+    if max_workers == 1:
+        merge_all(_scan_shard(kind, game, entries) for entries in shards)
+        return cache
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            merge_all(executor.map(_scan_shard, [kind] * len(shards), [game] * len(shards), shards))
+    except (OSError, RuntimeError) as e:
+        # Worker processes unavailable (frozen build, sandbox, broken pool): fall back to scanning in-process.
+        RobustLogger().warning(f"Parallel reference scan failed ({e.__class__.__name__}: {e}), scanning in-process")
+        cache = cache_type(game)
+        merge_all(_scan_shard(kind, game, entries) for entries in shards)
+    return cache
+
+
+def _is_in_rims_folder(installation: Installation, resource: FileResource) -> bool:
+    """RIM files in the 'rims' folder are not used at runtime."""
+    try:
+        path_parts = resource.filepath().relative_to(installation.path()).parts
+    except ValueError:
+        return "rims" in resource.filepath().parts
+    return bool(path_parts) and path_parts[0].lower() == "rims"
+
+
+def build_strref_cache(
+    installation: Installation,
+    *,
+    max_workers: int | None = None,
+    logger: Callable[[str], None] | None = None,
+) -> StrRefReferenceCache:
+    """Build a StrRefReferenceCache for an installation, scanning containers in parallel.
+
+    Args:
+        installation: The game installation to scan
+        max_workers: Number of worker processes (default: CPU count, 1 scans in-process)
+        logger: Optional logging function
+
+    Returns:
+        The merged StrRefReferenceCache
+    """
+    resources: list[FileResource] = []
+    skipped_count = 0
+    for resource in installation:
+        restype = resource.restype()
+        # StrRefs can only exist in: GFF files, 2DA files, SSF files, NCS files
+        if _is_in_rims_folder(installation, resource) or not (
+            restype.is_gff() or restype in (ResourceType.TwoDA, ResourceType.SSF, ResourceType.NCS)
+        ):
+            skipped_count += 1
+            continue
+        resources.append(resource)
+
+    cache = _build_cache(_KIND_STRREF, installation.game(), resources, max_workers=max_workers, logger=logger)
+    if logger:
+        logger(f"Cache built: scanned {len(resources)} resources (skipped {skipped_count} files) for installation {installation.path()}")
+    return cache  # type: ignore[return-value]
+
+
+def build_twoda_memory_cache(
+    installation: Installation,
+    *,
+    max_workers: int | None = None,
+    logger: Callable[[str], None] | None = None,
+) -> TwoDAMemoryReferenceCache:
+    """Build a TwoDAMemoryReferenceCache for an installation, scanning containers in parallel.
+
+    Args:
+        installation: The game installation to scan
+        max_workers: Number of worker processes (default: CPU count, 1 scans in-process)
+        logger: Optional logging function
+
+    Returns:
+        The merged TwoDAMemoryReferenceCache
+    """
+    resources: list[FileResource] = [resource for resource in installation if resource.restype().is_gff()]
+    cache = _build_cache(_KIND_TWODA, installation.game(), resources, max_workers=max_workers, logger=logger)
+    if logger:
+        logger(f"Cache built: scanned {len(resources)} GFF resources")
+    return cache  # type: ignore[return-value]
+
 
 def find_all_strref_references(
     installation: Installation,
     strrefs: list[int],
     cache: StrRefReferenceCache | None = None,
     logger: Callable[[str], None] | None = None,
+    max_workers: int | None = None,
 ) -> tuple[dict[int, list[StrRefSearchResult]], StrRefReferenceCache]:
     """Find all references to multiple StrRefs in an installation using batch processing.
 
@@ -772,6 +1094,7 @@ def find_all_strref_references(
         strrefs: List of StrRef IDs to find references for
         cache: Optional pre-built StrRefReferenceCache (will build if not provided)
         logger: Optional logging function
+        max_workers: Worker processes used to build the cache (default: CPU count, 1 scans in-process)
 
     Returns:
     -------
@@ -786,58 +1109,7 @@ def find_all_strref_references(
     if cache is None:
         if logger:
             logger(f"Building StrRef cache for {len(strrefs)} StrRefs for installation {installation.path()}...")
-        cache = StrRefReferenceCache(installation.game())
-
-        # Scan all resources to build the cache
-        resource_count = 0
-        skipped_count = 0
-        last_logged_count = 0
-        log_interval = 500  # Log progress every 500 resources
-
-        for resource in installation:
-            try:
-                # Skip RIM files - they're not used at runtime
-                try:
-                    relative_path = resource.filepath().relative_to(installation.path())
-                    path_parts = relative_path.parts
-                    if path_parts and path_parts[0].lower() == "rims":
-                        skipped_count += 1
-                        continue
-                except ValueError:
-                    abs_path = resource.filepath()
-                    if "rims" in abs_path.parts:
-                        skipped_count += 1
-                        continue
-
-                # Filter by resource type: Only scan types that can contain StrRefs
-                # This dramatically improves performance by skipping textures, models, audio, etc.
-                restype = resource.restype()
-                # StrRefs can only exist in: GFF files, 2DA files, SSF files, NCS files
-                can_contain_strref = (
-                    restype.is_gff()
-                    or restype is ResourceType.TwoDA
-                    or restype is ResourceType.SSF
-                    or restype is ResourceType.NCS
-                )
-                if not can_contain_strref:
-                    skipped_count += 1
-                    continue
-
-                data = resource.data()
-                cache.scan_resource(resource, data)
-                resource_count += 1
-
-                # Log progress periodically
-                if logger and resource_count - last_logged_count >= log_interval:
-                    logger(f"  Scanning for StrRefs... {resource_count} resources processed for installation {installation.path()}")
-                    last_logged_count = resource_count
-
-            except Exception:  # noqa: BLE001, S110, S112
-                skipped_count += 1
-                continue
-
-        if logger:
-            logger(f"Cache built: scanned {resource_count} resources (skipped {skipped_count} files) for installation {installation.path()}")
+        cache = build_strref_cache(installation, max_workers=max_workers, logger=logger)
 
     # Convert cache entries to StrRefSearchResult format
     results: dict[int, list[StrRefSearchResult]] = {}
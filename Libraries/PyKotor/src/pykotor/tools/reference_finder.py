@@ -12,7 +12,7 @@ import fnmatch
 import re
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Iterator
 
 from pykotor.common.stream import BinaryReader
 from pykotor.extract.file import FileResource
@@ -22,6 +22,7 @@ from pykotor.resource.type import ResourceType
 
 if TYPE_CHECKING:
     from pykotor.extract.installation import Installation
+    from pykotor.tools.reference_index import ReferenceIndex
 
 
 @dataclass(frozen=True)
@@ -53,6 +54,7 @@ def find_script_references(
     file_pattern: str | None = None,
     file_types: set[str] | None = None,
     logger: Callable[[str], None] | None = None,
+    index: ReferenceIndex | None = None,
 ) -> list[ReferenceSearchResult]:
     """Find all references to a script (NCS/NSS) resref in GFF files and NCS bytecode.
 
@@ -65,6 +67,7 @@ def find_script_references(
         file_pattern: Optional file pattern to filter results (e.g., "*.mod", "*_s.rim")
         file_types: Optional set of file type abbreviations to search (e.g., {"UTC", "UTD", "ARE"})
         logger: Optional logging function
+        index: Optional ReferenceIndex to answer the query from instead of parsing every resource
 
     Returns:
     -------
@@ -80,6 +83,7 @@ def find_script_references(
         file_pattern=file_pattern,
         file_types=file_types,
         logger=logger,
+        index=index,
     )
 
 
@@ -92,6 +96,7 @@ def find_tag_references(
     file_pattern: str | None = None,
     file_types: set[str] | None = None,
     logger: Callable[[str], None] | None = None,
+    index: ReferenceIndex | None = None,
 ) -> list[ReferenceSearchResult]:
     """Find all references to a tag in GFF files.
 
@@ -104,6 +109,7 @@ def find_tag_references(
         file_pattern: Optional file pattern to filter results
         file_types: Optional set of file type abbreviations to search
         logger: Optional logging function
+        index: Optional ReferenceIndex to answer the query from instead of parsing every resource
 
     Returns:
     -------
@@ -119,6 +125,7 @@ def find_tag_references(
         file_pattern=file_pattern,
         file_types=file_types,
         logger=logger,
+        index=index,
     )
 
 
@@ -131,6 +138,7 @@ def find_template_resref_references(
     file_pattern: str | None = None,
     file_types: set[str] | None = None,
     logger: Callable[[str], None] | None = None,
+    index: ReferenceIndex | None = None,
 ) -> list[ReferenceSearchResult]:
     """Find all references to a TemplateResRef in GFF files.
 
@@ -146,6 +154,7 @@ def find_template_resref_references(
         file_pattern: Optional file pattern to filter results
         file_types: Optional set of file type abbreviations to search
         logger: Optional logging function
+        index: Optional ReferenceIndex to answer the query from instead of parsing every resource
 
     Returns:
     -------
@@ -162,6 +171,7 @@ def find_template_resref_references(
         file_pattern=file_pattern,
         file_types=file_types,
         logger=logger,
+        index=index,
     )
 
 
@@ -174,6 +184,7 @@ def find_conversation_references(
     file_pattern: str | None = None,
     file_types: set[str] | None = None,
     logger: Callable[[str], None] | None = None,
+    index: ReferenceIndex | None = None,
 ) -> list[ReferenceSearchResult]:
     """Find all references to a conversation (DLG) resref in GFF files.
 
@@ -186,6 +197,7 @@ def find_conversation_references(
         file_pattern: Optional file pattern to filter results
         file_types: Optional set of file type abbreviations to search
         logger: Optional logging function
+        index: Optional ReferenceIndex to answer the query from instead of parsing every resource
 
     Returns:
     -------
@@ -201,6 +213,7 @@ def find_conversation_references(
         file_pattern=file_pattern,
         file_types=file_types,
         logger=logger,
+        index=index,
     )
 
 
@@ -216,6 +229,7 @@ def find_resref_references(
     file_pattern: str | None = None,
     file_types: set[str] | None = None,
     logger: Callable[[str], None] | None = None,
+    index: ReferenceIndex | None = None,
 ) -> list[ReferenceSearchResult]:
     """Find all references to a ResRef in GFF files and optionally NCS bytecode.
 
@@ -231,6 +245,7 @@ def find_resref_references(
         file_pattern: Optional file pattern to filter results
         file_types: Optional set of file type abbreviations to search
         logger: Optional logging function
+        index: Optional ReferenceIndex to answer the query from instead of parsing every resource
 
     Returns:
     -------
@@ -242,9 +257,25 @@ def find_resref_references(
     # Build search pattern
     search_pattern = _build_search_pattern(resref, partial_match, case_sensitive)
 
+    if index is not None:
+        return _search_index(
+            installation,
+            index,
+            resref,
+            search_pattern,
+            field_names,
+            field_types,
+            search_ncs,
+            partial_match,
+            case_sensitive,
+            file_pattern,
+            file_types,
+            logger,
+        )
+
     results: list[ReferenceSearchResult] = []
 
-    exclude_types = {ResourceType.NCS} if search_ncs else None
+    exclude_types = None if search_ncs else {ResourceType.NCS}
 
     # Cache parsed GFF files by FileResource to avoid re-parsing the same file
     # This handles cases where the same resource appears multiple times in the installation iterator
@@ -317,6 +348,7 @@ def find_field_value_references(
     file_pattern: str | None = None,
     file_types: set[str] | None = None,
     logger: Callable[[str], None] | None = None,
+    index: ReferenceIndex | None = None,
 ) -> list[ReferenceSearchResult]:
     """Find all references to a field value in GFF files.
 
@@ -333,6 +365,7 @@ def find_field_value_references(
         file_pattern: Optional file pattern to filter results
         file_types: Optional set of file type abbreviations to search
         logger: Optional logging function
+        index: Optional ReferenceIndex to answer the query from instead of parsing every resource
 
     Returns:
     -------
@@ -344,6 +377,22 @@ def find_field_value_references(
     # Build search pattern
     search_pattern: re.Pattern[str] = _build_search_pattern(search_value, partial_match, case_sensitive)
 
+    if index is not None:
+        return _search_index(
+            installation,
+            index,
+            search_value,
+            search_pattern,
+            field_names,
+            field_types,
+            False,  # noqa: FBT003
+            partial_match,
+            case_sensitive,
+            file_pattern,
+            file_types,
+            logger,
+        )
+
     results: list[ReferenceSearchResult] = []
 
     # Cache parsed GFF files by FileResource to avoid re-parsing the same file
@@ -400,6 +449,72 @@ def find_field_value_references(
     return results
 
 
+def _search_index(
+    installation: Installation,
+    index: ReferenceIndex,
+    search_value: str,
+    search_pattern: re.Pattern[str],
+    field_names: set[str] | None,
+    field_types: set[GFFFieldType],
+    search_ncs: bool,
+    partial_match: bool,
+    case_sensitive: bool,
+    file_pattern: str | None,
+    file_types: set[str] | None,
+    logger: Callable[[str], None] | None,
+) -> list[ReferenceSearchResult]:
+    """Answer a reference search from a ReferenceIndex, applying the same matching rules as the GFF/NCS scanners.
+
+    The index is only checked against the installation on the first search, and again after `ReferenceIndex.mark_stale`.
+    """
+    index.refresh(installation)
+
+    results: list[ReferenceSearchResult] = []
+    search_key = search_value if case_sensitive else search_value.lower()
+    for ref in index.candidates(search_value, partial=partial_match):
+        resource = ref.file_resource
+        restype = resource.restype()
+        if ref.field_type is None:
+            if not search_ncs or restype is not ResourceType.NCS:
+                continue
+            file_type = "NCS"
+        else:
+            if ref.field_type not in field_types or ref.field_type not in (GFFFieldType.ResRef, GFFFieldType.String):
+                continue
+            if field_names is not None and ref.label not in field_names:
+                continue
+            file_type = restype.extension.upper()
+            if file_types and file_type not in file_types:
+                continue
+        if not _should_search_resource(resource, file_pattern, file_types, None):
+            continue
+
+        candidate = ref.value if case_sensitive else ref.value.lower()
+        if partial_match:
+            match_found = search_key in candidate
+        elif ref.field_type is GFFFieldType.ResRef:
+            # ResRef equality is case-insensitive, as in the scanning search.
+            match_found = candidate.lower() == search_value.lower()
+        else:
+            match_found = candidate == search_key
+        if not match_found and not search_pattern.search(ref.value):
+            continue
+
+        results.append(
+            ReferenceSearchResult(
+                file_resource=resource,
+                field_path=ref.field_path,
+                matched_value=ref.value,
+                file_type=file_type,
+                byte_offset=ref.byte_offset,
+            ),
+        )
+        if logger is not None:
+            logger(f"Found '{search_value}' in {resource.filename()} at {ref.field_path}")
+
+    return results
+
+
 def _build_search_pattern(value: str, partial_match: bool, case_sensitive: bool) -> re.Pattern[str]:
     """Build a regex pattern for searching."""
     if partial_match:
@@ -733,15 +848,38 @@ def _search_ncs_for_string(
 
     try:
         ncs_data = resource.data()
+    except OSError:
+        return results
+
+    for string_offset, string_value in _iter_ncs_string_constants(ncs_data):
+        if search_pattern.search(string_value):
+            results.append(
+                ReferenceSearchResult(
+                    file_resource=resource,
+                    field_path="(NCS bytecode)",
+                    matched_value=string_value,
+                    file_type="NCS",
+                    byte_offset=string_offset,
+                ),
+            )
+            if logger is not None:
+                logger(f"Found '{search_string}' in {resource.filename()} at byte offset {string_offset:#X}")
+
+    return results
+
+
+def _iter_ncs_string_constants(ncs_data: bytes) -> Iterator[tuple[int, str]]:
+    """Yield (byte offset, value) for every CONSTS (string constant) instruction in NCS bytecode."""
+    try:
         with BinaryReader.from_auto(ncs_data) as reader:
             # Skip NCS header
             if reader.read_string(4) != "NCS ":
-                return results
+                return
             if reader.read_string(4) != "V1.0":
-                return results
+                return
             magic_byte = reader.read_uint8()
             if magic_byte != 0x42:  # noqa: PLR2004
-                return results
+                return
             total_size = reader.read_uint32(big=True)
 
             # Search for CONSTS (string constant) instructions
@@ -754,19 +892,7 @@ def _search_ncs_for_string(
                     string_offset = reader.position()
                     str_len = reader.read_uint16(big=True)
                     if str_len > 0 and reader.remaining() >= str_len:
-                        string_value = reader.read_string(str_len, encoding="ascii", errors="ignore")
-                        if search_pattern.search(string_value):
-                            results.append(
-                                ReferenceSearchResult(
-                                    file_resource=resource,
-                                    field_path="(NCS bytecode)",
-                                    matched_value=string_value,
-                                    file_type="NCS",
-                                    byte_offset=string_offset,
-                                ),
-                            )
-                            if logger is not None:
-                                logger(f"Found '{search_string}' in {resource.filename()} at byte offset {string_offset:#X}")
+                        yield string_offset, reader.read_string(str_len, encoding="ascii", errors="ignore")
 
                 # Skip to next instruction based on opcode/qualifier
                 elif opcode == NCSByteCode.CONSTx:
@@ -808,7 +934,5 @@ def _search_ncs_for_string(
                 # Other instructions have no additional data
 
     except Exception:  # noqa: BLE001
-        # If anything fails, return what we found so far
-        pass
-
-    return results
+        # If anything fails, stop at what we found so far
+        return
@@ -0,0 +1,350 @@
+"""Persistent inverted index of reference-bearing values in a KotOR installation.
+
+The reference finder functions in :mod:`pykotor.tools.reference_finder` walk every resource of an
+installation and parse every GFF for each query. :class:`ReferenceIndex` does that walk once,
+extracting every value a reference search could match (GFF String/ResRef/LocalizedString fields,
+NCS string constants, 2DA cells and SSF strrefs) into an SQLite database. Subsequent lookups are
+B-tree hits on the indexed value or on its word tokens.
+
+The index is maintained per container (BIF, ERF/RIM capsule or loose file): a container is only
+re-read when its size or modification time changes, and containers that disappear from the
+installation are dropped on the next :meth:`ReferenceIndex.update`.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import weakref
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+from loggerplus import RobustLogger
+from pykotor.extract.file import FileResource
+from pykotor.resource.formats.gff import GFFFieldType, GFFList, GFFStruct, read_gff
+from pykotor.resource.formats.ssf import SSFSound, read_ssf
+from pykotor.resource.formats.twoda import read_2da
+from pykotor.resource.type import ResourceType
+from pykotor.tools.sqlite_store import SQLiteStore
+
+if TYPE_CHECKING:
+    from pykotor.extract.installation import Installation
+
+SCHEMA_VERSION = 1
+
+# Word tokens as matched by the ``\b`` boundaries of the reference finder's search patterns.
+_TOKEN_PATTERN: re.Pattern[str] = re.compile(r"\w+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS containers (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resources (
+    id INTEGER PRIMARY KEY,
+    container_id INTEGER NOT NULL REFERENCES containers(id) ON DELETE CASCADE,
+    resname TEXT NOT NULL,
+    restype TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS refs (
+    id INTEGER PRIMARY KEY,
+    resource_id INTEGER NOT NULL REFERENCES resources(id) ON DELETE CASCADE,
+    value_key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    label TEXT NOT NULL,
+    field_path TEXT NOT NULL,
+    field_type INTEGER,
+    byte_offset INTEGER
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    token TEXT NOT NULL,
+    ref_id INTEGER NOT NULL REFERENCES refs(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS resources_container ON resources(container_id);
+CREATE INDEX IF NOT EXISTS refs_value_key ON refs(value_key);
+CREATE INDEX IF NOT EXISTS refs_resource ON refs(resource_id);
+CREATE INDEX IF NOT EXISTS tokens_token ON tokens(token);
+CREATE INDEX IF NOT EXISTS tokens_ref ON tokens(ref_id);
+"""
+
+_INDEXED_GFF_TYPES: frozenset[GFFFieldType] = frozenset(
+    {GFFFieldType.String, GFFFieldType.ResRef, GFFFieldType.LocalizedString},
+)
+
+
+@dataclass(frozen=True)
+class IndexedReference:
+    """A single reference-bearing value recorded in a :class:`ReferenceIndex`.
+
+    Attributes:
+    ----------
+        file_resource: The resource containing the value
+        field_path: Location of the value (GFF field path, ``[row].column`` for 2DA, sound name for SSF, ``(NCS bytecode)`` for NCS)
+        label: The field label, 2DA column or SSF sound name the value is stored under
+        value: The value as stored in the resource (LocalizedString fields store their stringref)
+        field_type: The GFF field type, or None for non-GFF resources
+        byte_offset: Byte offset of NCS string constants, None otherwise
+    """
+
+    file_resource: FileResource
+    field_path: str
+    label: str
+    value: str
+    field_type: GFFFieldType | None = None
+    byte_offset: int | None = None
+
+
+def _iter_gff_values(gff_struct: GFFStruct, path_prefix: str = "") -> Iterator[tuple[str, str, GFFFieldType, str]]:
+    """Yield (field path, label, field type, value) for every indexed field of a GFF struct tree."""
+    for label, field_type, value in gff_struct:
+        field_path = f"{path_prefix}.{label}" if path_prefix else label
+        if field_type is GFFFieldType.Struct and isinstance(value, GFFStruct):
+            yield from _iter_gff_values(value, field_path)
+        elif field_type is GFFFieldType.List and isinstance(value, GFFList):
+            for idx, item in enumerate(value):
+                if isinstance(item, GFFStruct):
+                    yield from _iter_gff_values(item, f"{field_path}[{idx}]")
+        elif field_type is GFFFieldType.LocalizedString:
+            if value.stringref != -1:
+                yield field_path, label, field_type, str(value.stringref)
+        elif field_type in _INDEXED_GFF_TYPES:
+            text = str(value)
+            if text:
+                yield field_path, label, field_type, text
+
+
+def _extract_references(
+    resource: FileResource,
+    data: bytes,
+) -> Iterator[tuple[str, str, str, GFFFieldType | None, int | None]]:
+    """Yield (value, label, field path, field type, byte offset) for every indexed value of a resource."""
+    restype: ResourceType = resource.restype()
+    if restype.is_gff():
+        for field_path, label, field_type, value in _iter_gff_values(read_gff(data).root):
+            yield value, label, field_path, field_type, None
+    elif restype is ResourceType.NCS:
+        from pykotor.tools.reference_finder import _iter_ncs_string_constants  # Prevent circular imports
+
+        for byte_offset, value in _iter_ncs_string_constants(data):
+            yield value, "", "(NCS bytecode)", None, byte_offset
+    elif restype is ResourceType.TwoDA:
+        twoda = read_2da(data)
+        headers: list[str] = twoda.get_headers()
+        for row in twoda:
+            for header in headers:
+                cell: str = row.get_string(header)
+                if cell and cell != "****":
+                    yield cell, header, f"[{row.label()}].{header}", None, None
+    elif restype is ResourceType.SSF:
+        ssf = read_ssf(data)
+        for sound in SSFSound:
+            stringref: int | None = ssf.get(sound)
+            if stringref is not None and stringref != -1:
+                yield str(stringref), sound.name, sound.name, None, None
+
+
+def is_indexable(restype: ResourceType) -> bool:
+    """Returns True if resources of the given type contribute values to a :class:`ReferenceIndex`."""
+    return restype.is_gff() or restype in (ResourceType.NCS, ResourceType.TwoDA, ResourceType.SSF)
+
+
+class ReferenceIndex(SQLiteStore):
+    """SQLite-backed inverted index mapping values to the resources and fields that contain them.
+
+    Call :meth:`update` before querying: it only re-reads containers whose size or mtime changed since
+    the last update, so repeated calls against an unchanged installation cost one ``stat`` per container.
+    Reference searches use :meth:`refresh`, which does that check once per installation until
+    :meth:`mark_stale` is called, e.g. from an :class:`~pykotor.extract.installation_watcher.InstallationWatcher`'s
+    ``on_change``.
+    """
+
+    SCHEMA = _SCHEMA
+    SCHEMA_VERSION = SCHEMA_VERSION
+    TABLES = ("tokens", "refs", "resources", "containers")
+    FOREIGN_KEYS = True
+
+    def __init__(self, path: os.PathLike | str | None = None):
+        super().__init__(path)
+        # Installations checked by `refresh` since the index was opened or last marked stale
+        self._current: weakref.WeakSet[Installation] = weakref.WeakSet()
+
+    def __len__(self) -> int:
+        """Number of indexed values."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM refs").fetchone()[0]
+
+    def containers(self) -> list[Path]:
+        """Returns the paths of every container currently held in the index."""
+        with self._lock:
+            return [Path(row[0]) for row in self._conn.execute("SELECT path FROM containers ORDER BY id")]
+
+    def update(
+        self,
+        installation: Installation | Iterable[FileResource],
+        logger: Callable[[str], None] | None = None,
+    ) -> int:
+        """Brings the index up to date with the resources of an installation.
+
+        Args:
+        ----
+            installation: The installation (or any iterable of FileResources) to index
+            logger: Optional logging function, called once per re-indexed container
+
+        Returns:
+        -------
+            The number of containers that were (re)indexed.
+        """
+        grouped: dict[str, dict[tuple[str, ResourceType, int], FileResource]] = {}
+        for resource in installation:
+            if not is_indexable(resource.restype()):
+                continue
+            container = str(resource.filepath())
+            grouped.setdefault(container, {})[(resource.resname().lower(), resource.restype(), resource.offset())] = resource
+
+        with self._lock:
+            known: dict[str, tuple[int, int, int]] = {
+                path: (container_id, mtime_ns, size)
+                for container_id, path, mtime_ns, size in self._conn.execute("SELECT id, path, mtime_ns, size FROM containers")
+            }
+            reindexed = 0
+            with self._conn:
+                for path in known.keys() - grouped.keys():
+                    self._conn.execute("DELETE FROM containers WHERE id = ?", (known[path][0],))
+
+                for path, resources in grouped.items():
+                    try:
+                        stat: os.stat_result = os.stat(path)  # noqa: PTH116
+                    except OSError as e:
+                        RobustLogger().debug(f"Not indexing references in '{path}', it cannot be read: {e}")
+                        continue
+                    previous = known.get(path)
+                    if previous is not None and previous[1:] == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    if previous is not None:
+                        self._conn.execute("DELETE FROM containers WHERE id = ?", (previous[0],))
+                    self._index_container(path, stat, resources.values())
+                    reindexed += 1
+                    if logger is not None:
+                        logger(f"Indexed references in '{path}' ({len(resources)} resources)")
+            return reindexed
+
+    def refresh(
+        self,
+        installation: Installation,
+        logger: Callable[[str], None] | None = None,
+    ) -> int:
+        """Calls :meth:`update` for an installation, unless it was already refreshed and the index was not marked stale since.
+
+        Returns:
+        -------
+            The number of containers that were (re)indexed.
+        """
+        with self._lock:
+            if installation in self._current:
+                return 0
+            reindexed: int = self.update(installation, logger)
+            self._current.add(installation)
+            return reindexed
+
+    def mark_stale(self):
+        """Makes the next :meth:`refresh` of every installation check its containers for changes again."""
+        with self._lock:
+            self._current.clear()
+
+    def _index_container(self, path: str, stat: os.stat_result, resources: Iterable[FileResource]):
+        cursor: sqlite3.Cursor = self._conn.execute(
+            "INSERT INTO containers(path, mtime_ns, size) VALUES (?, ?, ?)",
+            (path, stat.st_mtime_ns, stat.st_size),
+        )
+        container_id = cursor.lastrowid
+        for resource in resources:
+            try:
+                data: bytes = resource.data()
+                references = list(_extract_references(resource, data))
+            except Exception as e:  # noqa: BLE001
+                RobustLogger().debug(f"Skipping '{resource.filename()}' in '{path}' while indexing references: {e}")
+                continue
+            resource_id = self._conn.execute(
+                "INSERT INTO resources(container_id, resname, restype, offset, size) VALUES (?, ?, ?, ?, ?)",
+                (container_id, resource.resname(), resource.restype().extension, resource.offset(), resource.size()),
+            ).lastrowid
+            for value, label, field_path, field_type, byte_offset in references:
+                key = value.lower()
+                ref_id = self._conn.execute(
+                    "INSERT INTO refs(resource_id, value_key, value, label, field_path, field_type, byte_offset) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (resource_id, key, value, label, field_path, None if field_type is None else field_type.value, byte_offset),
+                ).lastrowid
+                self._conn.executemany(
+                    "INSERT INTO tokens(token, ref_id) VALUES (?, ?)",
+                    ((token, ref_id) for token in set(_TOKEN_PATTERN.findall(key))),
+                )
+
+    def clear(self):
+        """Drops every indexed container."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM containers")
+
+    def lookup(
+        self,
+        value: str,
+        *,
+        partial: bool = False,
+        case_sensitive: bool = False,
+    ) -> list[IndexedReference]:
+        """Returns every indexed value equal to ``value`` (or containing it, if ``partial``)."""
+        if partial:
+            rows = self._query("WHERE instr(refs.value_key, ?) > 0", (value.lower(),))
+        else:
+            rows = self._query("WHERE refs.value_key = ?", (value.lower(),))
+        if case_sensitive:
+            rows = [ref for ref in rows if (value in ref.value if partial else ref.value == value)]
+        return rows
+
+    def candidates(self, value: str, *, partial: bool = False) -> list[IndexedReference]:
+        """Returns a superset of the indexed values a reference finder search for ``value`` can match.
+
+        Whole-word searches are answered from the token table; partial searches and values without
+        any word characters fall back to a substring scan of the value column.
+        """
+        key = value.lower()
+        tokens: list[str] = _TOKEN_PATTERN.findall(key)
+        if partial or not tokens:
+            return self._query("WHERE instr(refs.value_key, ?) > 0", (key,))
+        return self._query("JOIN tokens ON tokens.ref_id = refs.id WHERE tokens.token = ?", (max(tokens, key=len),))
+
+    def _query(self, clause: str, params: tuple) -> list[IndexedReference]:
+        sql = (
+            "SELECT resources.resname, resources.restype, resources.size, resources.offset, containers.path,"
+            " refs.field_path, refs.label, refs.value, refs.field_type, refs.byte_offset"
+            " FROM refs JOIN resources ON resources.id = refs.resource_id"
+            " JOIN containers ON containers.id = resources.container_id "
+            f"{clause} ORDER BY refs.id"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        resource_cache: dict[tuple, FileResource] = {}
+        results: list[IndexedReference] = []
+        for resname, restype, size, offset, path, field_path, label, value, field_type, byte_offset in rows:
+            resource_key = (resname, restype, size, offset, path)
+            resource = resource_cache.get(resource_key)
+            if resource is None:
+                resource = FileResource(resname, ResourceType.from_extension(restype), size, offset, Path(path))
+                resource_cache[resource_key] = resource
+            results.append(
+                IndexedReference(
+                    file_resource=resource,
+                    field_path=field_path,
+                    label=label,
+                    value=value,
+                    field_type=None if field_type is None else GFFFieldType(field_type),
+                    byte_offset=byte_offset,
+                ),
+            )
+        return results
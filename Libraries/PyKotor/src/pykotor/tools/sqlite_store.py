@@ -0,0 +1,77 @@
+"""Shared plumbing of the SQLite-backed caches (translations, validation results, the reference index)."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+
+from pathlib import Path
+from typing import ClassVar
+
+
+class SQLiteStore:
+    """One SQLite connection shared between threads behind a lock, with a versioned schema.
+
+    Pass a filesystem path to keep the data between sessions; the default keeps it in memory.
+
+    Subclasses only define their schema and queries: `SCHEMA` is run on open, and when the stored `SCHEMA_VERSION`
+    differs every table in `TABLES` is dropped first (children before parents). Queries run on `self._conn`
+    while holding `self._lock`.
+    """
+
+    SCHEMA: ClassVar[str]
+    SCHEMA_VERSION: ClassVar[int]
+    TABLES: ClassVar[tuple[str, ...]]
+    FOREIGN_KEYS: ClassVar[bool] = False
+
+    def __init__(self, path: os.PathLike | str | None = None):
+        self._path: Path | None = None if path is None else Path(path)
+        if self._path is not None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection = sqlite3.connect(
+            ":memory:" if self._path is None else str(self._path),
+            check_same_thread=False,
+        )
+        if self.FOREIGN_KEYS:
+            self._conn.execute("PRAGMA foreign_keys = ON")
+        if self._path is not None:
+            self._conn.execute("PRAGMA journal_mode = WAL")
+        self._create_schema()
+
+    @property
+    def path(self) -> Path | None:
+        return self._path
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            row = None
+            if self._conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meta'").fetchone() is not None:
+                row = self._conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is not None and int(row[0]) != self.SCHEMA_VERSION:
+                for table in (*self.TABLES, "meta"):
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+            self._conn.executescript(
+                f"""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                );
+                {self.SCHEMA}
+                """,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES ('schema_version', ?)",
+                (str(self.SCHEMA_VERSION),),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: object):
+        self.close()
@@ -0,0 +1,417 @@
+"""Headless texture thumbnails, served from a memory LRU and a persistent on-disk cache.
+
+Resource browsers show the same textures every time a list is opened or scrolled, and decoding a DXT-compressed TPC
+is far more expensive than the thumbnail that comes out of it. :class:`ThumbnailCache` makes that a one-time cost:
+
+- Thumbnails are generated from the smallest mip level that still covers the requested size, so only one (small)
+  mip is decompressed, then downscaled to fit the requested size.
+- Results are stored on disk under a hash of (container file, offset, size, modification time, thumbnail size),
+  so a changed file or a different size is a new entry and stale entries are never served.
+- The on-disk cache is bounded: once it grows past its byte budget the least recently used entries are pruned.
+- Recently used thumbnails are kept in memory under a key that needs no filesystem access, so repeated lookups
+  (and :meth:`ThumbnailCache.cached` from a GUI thread) never touch the disk.
+
+Thumbnails are RGB or RGBA :class:`TPCMipmap` objects, bottom row first like the TPC data they come from.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import threading
+
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loggerplus import RobustLogger
+from pykotor.resource.formats.tpc import TPCTextureFormat, read_tpc
+from pykotor.resource.formats.tpc.tpc_data import TPCMipmap
+from pykotor.resource.type import ResourceType
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias  # pyright: ignore[reportMissingModuleSource]
+
+    from pykotor.extract.file import FileResource
+
+    # (file, offset, size, filename, thumbnail size)
+    _MemoryKey: TypeAlias = tuple[str, int, int, str, int]
+
+CACHE_VERSION = 1
+DEFAULT_MEMORY_ITEMS = 1024
+DEFAULT_DISK_BYTES = 256 * 1024 * 1024
+_DISK_PRUNE_RATIO = 0.75  # pruning goes down to this fraction of the budget, so it does not run on every write
+
+_HEADER = struct.Struct("<IIII")
+_TPC_TYPES = (ResourceType.TPC, ResourceType.TGA, ResourceType.DDS)
+_DISPLAY_FORMATS: dict[TPCTextureFormat, TPCTextureFormat] = {
+    TPCTextureFormat.DXT1: TPCTextureFormat.RGB,
+    TPCTextureFormat.DXT3: TPCTextureFormat.RGBA,
+    TPCTextureFormat.DXT5: TPCTextureFormat.RGBA,
+    TPCTextureFormat.BGRA: TPCTextureFormat.RGBA,
+    TPCTextureFormat.BGR: TPCTextureFormat.RGB,
+    TPCTextureFormat.Greyscale: TPCTextureFormat.RGBA,
+}
+
+
+def serialize_thumbnail(mipmap: TPCMipmap) -> bytes:
+    """Pack a thumbnail as (width, height, format, data length) followed by the pixel data."""
+    return _HEADER.pack(mipmap.width, mipmap.height, mipmap.tpc_format.value, len(mipmap.data)) + bytes(mipmap.data)
+
+
+def deserialize_thumbnail(data: bytes) -> TPCMipmap:
+    width, height, format_value, data_length = _HEADER.unpack_from(data)
+    pixels = bytearray(data[_HEADER.size : _HEADER.size + data_length])
+    if len(pixels) != data_length:
+        msg = f"Truncated thumbnail data: expected {data_length} bytes, got {len(pixels)}"
+        raise ValueError(msg)
+    return TPCMipmap(width=width, height=height, tpc_format=TPCTextureFormat(format_value), data=pixels)
+
+
+def choose_thumbnail_mipmap(mipmaps: list[TPCMipmap], size: int) -> TPCMipmap:
+    """Returns the smallest mipmap whose larger side is at least `size`, or the largest mipmap if none is."""
+    if not mipmaps:
+        msg = "Texture has no mipmaps"
+        raise ValueError(msg)
+    adequate: list[TPCMipmap] = [mipmap for mipmap in mipmaps if max(mipmap.width, mipmap.height) >= size]
+    if adequate:
+        return min(adequate, key=lambda mipmap: mipmap.width * mipmap.height)
+    return max(mipmaps, key=lambda mipmap: mipmap.width * mipmap.height)
+
+
+def _fit(mipmap: TPCMipmap, size: int) -> TPCMipmap:
+    """Downscale an RGB/RGBA mipmap so its larger side is at most `size`."""
+    longest: int = max(mipmap.width, mipmap.height)
+    if longest <= size:
+        return mipmap
+    width: int = max(1, mipmap.width * size // longest)
+    height: int = max(1, mipmap.height * size // longest)
+    try:
+        from PIL import Image
+    except ImportError:
+        RobustLogger().debug("Pillow is not installed, downscaling the thumbnail by sampling")
+    else:
+        image = mipmap.to_pil_image().resize((width, height), Image.Resampling.BOX)
+        return TPCMipmap(width=width, height=height, tpc_format=mipmap.tpc_format, data=bytearray(image.tobytes()))
+
+    # Without Pillow: nearest-neighbour sampling, one channel of one row at a time
+    bpp: int = mipmap.tpc_format.bytes_per_pixel()
+    step: int = -(-longest // size)  # ceil, so the result fits
+    width, height = -(-mipmap.width // step), -(-mipmap.height // step)
+    row_bytes: int = mipmap.width * bpp
+    data = bytearray(width * height * bpp)
+    for y in range(height):
+        row = mipmap.data[y * step * row_bytes : (y * step + 1) * row_bytes]
+        out_row = bytearray(width * bpp)
+        for channel in range(bpp):
+            out_row[channel::bpp] = row[channel :: step * bpp][:width]
+        data[y * width * bpp : (y + 1) * width * bpp] = out_row
+    return TPCMipmap(width=width, height=height, tpc_format=mipmap.tpc_format, data=data)
+
+
+def make_thumbnail(
+    restype: ResourceType,
+    data: bytes,
+    size: int,
+) -> TPCMipmap:
+    """Build an RGB/RGBA thumbnail that fits in a `size` x `size` square.
+
+    TPC, TGA and DDS textures only decompress the mip level the thumbnail is made from.
+    Other image formats need Pillow.
+    """
+    if restype in _TPC_TYPES:
+        try:
+            tpc = read_tpc(data)
+        except Exception:
+            if restype is ResourceType.TPC:
+                raise
+        else:
+            mipmap: TPCMipmap = choose_thumbnail_mipmap(tpc.layers[0].mipmaps, size).copy()
+            target_format: TPCTextureFormat | None = _DISPLAY_FORMATS.get(mipmap.tpc_format)
+            if target_format is not None:
+                mipmap.convert(target_format)
+            return _fit(mipmap, size)
+
+    from PIL import Image
+
+    with Image.open(BytesIO(data)) as opened:
+        image = opened.convert("RGBA").transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+    return _fit(TPCMipmap(width=image.width, height=image.height, tpc_format=TPCTextureFormat.RGBA, data=bytearray(image.tobytes())), size)
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _memory_key(
+    resource: FileResource,
+    size: int,
+) -> _MemoryKey:
+    return (str(resource.filepath()), resource.offset(), resource.size(), resource.filename().lower(), size)
+
+
+def thumbnail_key(
+    resource: FileResource,
+    size: int,
+    mtime_ns: int | None = None,
+) -> str:
+    """Returns the on-disk cache key of a resource's thumbnail; it changes whenever the file holding the resource is modified.
+
+    Args:
+    ----
+        resource: The texture resource
+        size: Size of the square the thumbnail must fit in
+        mtime_ns: Modification time of the file holding the resource, if already known; stats the file otherwise
+    """
+    filepath: Path = resource.filepath()
+    if mtime_ns is None:
+        mtime_ns = _mtime_ns(filepath)
+    key: str = f"{CACHE_VERSION}|{filepath}|{resource.offset()}|{resource.size()}|{mtime_ns}|{size}|{resource.filename().lower()}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ThumbnailCache:
+    """Thumbnails by resource and size: memory LRU first, then the on-disk cache, then generated.
+
+    The memory tier is keyed by the resource's location and size only. :meth:`get` checks the file's modification
+    time before serving from it; :meth:`cached`, :meth:`put` and :meth:`discard` never touch the filesystem, so they
+    are cheap enough for a GUI thread, and a changed file is picked up by the next :meth:`get`.
+
+    Args:
+    ----
+        directory: Folder of the on-disk cache (created on first write), or None to keep thumbnails in memory only
+        memory_items: Maximum number of thumbnails kept in memory
+        disk_bytes: Size budget of the on-disk cache; least recently used entries are pruned beyond it
+
+    Attributes:
+    ----------
+        memory_hits: Thumbnails served from memory
+        disk_hits: Thumbnails read from the on-disk cache
+        generated: Thumbnails decoded from the texture data
+    """
+
+    def __init__(
+        self,
+        directory: os.PathLike | str | None = None,
+        *,
+        memory_items: int = DEFAULT_MEMORY_ITEMS,
+        disk_bytes: int = DEFAULT_DISK_BYTES,
+    ):
+        self.directory: Path | None = None if directory is None else Path(directory)
+        self.memory_items: int = max(0, memory_items)
+        self.disk_bytes: int = max(0, disk_bytes)
+        # Memory entries remember the mtime of their file (None when stored through `put`)
+        self._memory: OrderedDict[_MemoryKey, tuple[TPCMipmap, int | None]] = OrderedDict()
+        self._disk_usage: int | None = None  # estimate of the on-disk cache size, scanned on the first write
+        self._lock = threading.Lock()
+        self.memory_hits: int = 0
+        self.disk_hits: int = 0
+        self.generated: int = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
+
+    def get(
+        self,
+        resource: FileResource,
+        size: int,
+        data: bytes | None = None,
+    ) -> TPCMipmap:
+        """Returns the thumbnail of a texture resource, generating and caching it if needed.
+
+        Args:
+        ----
+            resource: The texture resource
+            size: Size of the square the thumbnail must fit in
+            data: The resource data, if already loaded
+
+        Returns:
+        -------
+            The thumbnail; it is shared with the cache and must not be modified
+        """
+        memory_key: _MemoryKey = _memory_key(resource, size)
+        mtime_ns: int = _mtime_ns(resource.filepath())
+        mipmap: TPCMipmap | None = self._memory_get(memory_key, mtime_ns)
+        if mipmap is not None:
+            return mipmap
+        key: str = thumbnail_key(resource, size, mtime_ns)
+        mipmap = self._disk_get(key)
+        if mipmap is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            mipmap = make_thumbnail(resource.restype(), resource.data() if data is None else data, size)
+            with self._lock:
+                self.generated += 1
+            self._disk_put(key, mipmap)
+        self._memory_put(memory_key, mipmap, mtime_ns)
+        return mipmap
+
+    def cached(
+        self,
+        resource: FileResource,
+        size: int,
+    ) -> TPCMipmap | None:
+        """Returns the thumbnail if it is in memory, without touching the disk or the resource."""
+        return self._memory_get(_memory_key(resource, size))
+
+    def put(
+        self,
+        resource: FileResource,
+        size: int,
+        mipmap: TPCMipmap,
+    ):
+        """Store a thumbnail made elsewhere (e.g. in a worker process) in memory."""
+        self._memory_put(_memory_key(resource, size), mipmap)
+
+    def discard(
+        self,
+        resource: FileResource,
+        size: int,
+    ):
+        """Forget a thumbnail in memory.
+
+        On-disk entries are keyed by the file's modification time, so those of a changed file are never served again
+        and are pruned once unused.
+        """
+        with self._lock:
+            self._memory.pop(_memory_key(resource, size), None)
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+
+    def _memory_get(
+        self,
+        key: _MemoryKey,
+        mtime_ns: int | None = None,
+    ) -> TPCMipmap | None:
+        """Returns the thumbnail stored for a key; when `mtime_ns` is given it must match the one stored with it."""
+        with self._lock:
+            entry: tuple[TPCMipmap, int | None] | None = self._memory.get(key)
+            if entry is None or (mtime_ns is not None and entry[1] != mtime_ns):
+                return None
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return entry[0]
+
+    def _memory_put(
+        self,
+        key: _MemoryKey,
+        mipmap: TPCMipmap,
+        mtime_ns: int | None = None,
+    ):
+        if not self.memory_items:
+            return
+        with self._lock:
+            self._memory[key] = (mipmap, mtime_ns)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / key[:2] / f"{key}.thumb"
+
+    def _disk_get(self, key: str) -> TPCMipmap | None:
+        if self.directory is None:
+            return None
+        path: Path = self._disk_path(key)
+        try:
+            mipmap: TPCMipmap = deserialize_thumbnail(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, struct.error) as e:
+            RobustLogger().debug(f"Ignoring unreadable thumbnail cache entry '{key}': {e}")
+            return None
+        try:
+            os.utime(path)  # the modification time orders entries for pruning
+        except OSError as e:
+            RobustLogger().debug(f"Could not mark thumbnail cache entry '{path}' as used: {e}")
+        return mipmap
+
+    def _disk_put(self, key: str, mipmap: TPCMipmap):
+        if self.directory is None:
+            return
+        path: Path = self._disk_path(key)
+        temp_path: Path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        entry: bytes = serialize_thumbnail(mipmap)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(entry)
+            os.replace(temp_path, path)  # atomic, so concurrent readers never see a partial entry
+        except OSError as e:
+            RobustLogger().warning(f"Could not write thumbnail cache entry '{path}': {e}")
+            temp_path.unlink(missing_ok=True)
+            return
+        with self._lock:
+            if self._disk_usage is None:
+                self._disk_usage = sum(size for _path, size, _mtime in self._disk_entries())
+            else:
+                self._disk_usage += len(entry)
+            over_budget: bool = self._disk_usage > self.disk_bytes
+        if over_budget:
+            self.prune()
+
+    def _disk_entries(self) -> list[tuple[Path, int, int]]:
+        """Returns (path, size, mtime_ns) of every on-disk entry."""
+        assert self.directory is not None
+        entries: list[tuple[Path, int, int]] = []
+        for path in self.directory.glob("*/*.thumb"):
+            try:
+                stat: os.stat_result = path.stat()
+            except OSError:  # noqa: PERF203
+                RobustLogger().debug(f"Thumbnail cache entry '{path}' was removed while scanning")
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def prune(self, max_bytes: int | None = None):
+        """Delete the least recently used on-disk entries until the cache fits in a fraction of its budget.
+
+        Args:
+        ----
+            max_bytes: Size to prune down to; defaults to part of `disk_bytes`, so pruning is not needed on every write
+        """
+        if self.directory is None:
+            return
+        target: int = int(self.disk_bytes * _DISK_PRUNE_RATIO) if max_bytes is None else max_bytes
+        entries: list[tuple[Path, int, int]] = self._disk_entries()
+        usage: int = sum(size for _path, size, _mtime in entries)
+        for path, size, _mtime in sorted(entries, key=lambda entry: entry[2]):
+            if usage <= target:
+                break
+            try:
+                path.unlink(missing_ok=True)  # another process may have pruned it first
+            except OSError as e:
+                RobustLogger().debug(f"Could not prune thumbnail cache entry '{path}': {e}")
+                continue
+            usage -= size
+        with self._lock:
+            self._disk_usage = usage
+
+
+_THUMBNAIL_CACHES: dict[Path | None, ThumbnailCache] = {}
+_THUMBNAIL_CACHES_LOCK = threading.Lock()
+
+
+def get_thumbnail_cache(directory: os.PathLike | str | None = None) -> ThumbnailCache:
+    """Returns the process-wide ThumbnailCache for an on-disk cache folder (or the memory-only one for None)."""
+    key: Path | None = None if directory is None else Path(directory)
+    with _THUMBNAIL_CACHES_LOCK:
+        cache: ThumbnailCache | None = _THUMBNAIL_CACHES.get(key)
+        if cache is None:
+            cache = _THUMBNAIL_CACHES[key] = ThumbnailCache(key)
+        return cache
+
+
+def clear_thumbnail_caches():
+    """Drop the process-wide ThumbnailCache instances (on-disk entries are kept)."""
+    with _THUMBNAIL_CACHES_LOCK:
+        _THUMBNAIL_CACHES.clear()
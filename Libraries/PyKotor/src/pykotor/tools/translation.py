@@ -0,0 +1,236 @@
+"""Deduplicating, cached translation of TLK entries and GFF LocalizedStrings.
+
+Batch translation sees the same source strings many times: dialog.tlk repeats lines, every module repeats
+blueprint names and descriptions, and a re-run after a small upstream change repeats nearly everything.
+:class:`TranslationPipeline` sits between the patching code and ``config.translator``:
+
+- Requests are deduplicated by (text, source language) before anything is sent to the translator.
+- Results are stored in a :class:`TranslationCache` keyed by (text, source language, target language).
+  Pass a path to keep the cache between sessions, so only new or changed strings are translated again.
+- Misses are sent in batches: to ``translator.translate_batch(texts, from_lang=...)`` when the translator
+  provides it, otherwise to ``translator.translate`` from a thread pool.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from loggerplus import RobustLogger
+from pykotor.common.language import Language, LocalizedString
+from pykotor.resource.formats.gff import GFFFieldType, GFFList, GFFStruct
+from pykotor.tools.sqlite_store import SQLiteStore
+
+if TYPE_CHECKING:
+    from pykotor.resource.formats.gff import GFF
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    text TEXT NOT NULL,
+    from_lang TEXT NOT NULL,
+    to_lang TEXT NOT NULL,
+    translated TEXT NOT NULL,
+    PRIMARY KEY (text, from_lang, to_lang)
+);
+"""
+
+
+class TranslationCache(SQLiteStore):
+    """SQLite store of translations keyed by (text, source language, target language)."""
+
+    SCHEMA = _SCHEMA
+    SCHEMA_VERSION = SCHEMA_VERSION
+    TABLES = ("translations",)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM translations")
+
+    def get_many(
+        self,
+        texts: Iterable[str],
+        from_lang: Language,
+        to_lang: Language,
+    ) -> dict[str, str]:
+        """Returns the stored translation of every given text that has one."""
+        found: dict[str, str] = {}
+        with self._lock:
+            for text in texts:
+                row = self._conn.execute(
+                    "SELECT translated FROM translations WHERE text = ? AND from_lang = ? AND to_lang = ?",
+                    (text, from_lang.name, to_lang.name),
+                ).fetchone()
+                if row is not None:
+                    found[text] = row[0]
+        return found
+
+    def put_many(
+        self,
+        translations: dict[str, str],
+        from_lang: Language,
+        to_lang: Language,
+    ):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations(text, from_lang, to_lang, translated) VALUES (?, ?, ?, ?)",
+                [(text, from_lang.name, to_lang.name, translated) for text, translated in translations.items()],
+            )
+
+
+class TranslationPipeline:
+    """Translates strings through a translator with deduplication, batching and a persistent cache.
+
+    The pipeline can be shared between threads: a string another thread is already translating is waited for
+    rather than sent to the translator again.
+
+    Attributes:
+    ----------
+        requested: Number of strings requested
+        cached: Number of distinct strings answered from the cache
+        translated: Number of distinct strings sent to the translator
+    """
+
+    def __init__(
+        self,
+        translator: Any,
+        cache: TranslationCache | None = None,
+        *,
+        batch_size: int = 64,
+        max_threads: int = 2,
+        log: Callable[[str], None] | None = None,
+    ):
+        self.translator: Any = translator
+        self.cache: TranslationCache = TranslationCache() if cache is None else cache
+        self.batch_size: int = max(1, batch_size)
+        self.max_threads: int = max(1, max_threads)
+        self._log: Callable[[str], None] | None = log
+        self._lock = threading.Lock()
+        self._in_flight: dict[tuple[str, Language], threading.Event] = {}
+        self.requested: int = 0
+        self.cached: int = 0
+        self.translated: int = 0
+
+    @property
+    def to_lang(self) -> Language:
+        return self.translator.to_lang
+
+    def translate(self, text: str, from_lang: Language) -> str:
+        """Translate one string, answering from the cache when possible."""
+        return self.translate_many([(text, from_lang)])[(text, from_lang)]
+
+    def translate_many(
+        self,
+        items: Iterable[tuple[str, Language]],
+    ) -> dict[tuple[str, Language], str]:
+        """Translate many strings at once.
+
+        Args:
+        ----
+            items: (text, source language) pairs; duplicates are translated once
+
+        Returns:
+        -------
+            Mapping of every requested (text, source language) pair to its translation (empty if it could not be translated)
+        """
+        by_lang: dict[Language, dict[str, None]] = {}
+        count: int = 0
+        for text, from_lang in items:
+            by_lang.setdefault(from_lang, {})[text] = None
+            count += 1
+        with self._lock:
+            self.requested += count
+
+        results: dict[tuple[str, Language], str] = {}
+        for from_lang, unique in by_lang.items():
+            found: dict[str, str] = self.cache.get_many(unique, from_lang, self.to_lang)
+            missing: list[str] = []
+            awaited: list[threading.Event] = []
+            with self._lock:
+                for text in unique:
+                    if text in found:
+                        continue
+                    event: threading.Event | None = self._in_flight.get((text, from_lang))
+                    if event is None:
+                        self._in_flight[(text, from_lang)] = threading.Event()
+                        missing.append(text)
+                    else:
+                        awaited.append(event)
+                self.cached += len(unique) - len(missing)
+                self.translated += len(missing)
+            if missing and self._log is not None:
+                self._log(f"Translating {len(missing)} of {len(unique)} distinct strings from {from_lang.name} ({len(found)} cached)")
+            try:
+                for start in range(0, len(missing), self.batch_size):
+                    batch: list[str] = missing[start : start + self.batch_size]
+                    translated: dict[str, str] = self._translate_batch(batch, from_lang)
+                    self.cache.put_many(translated, from_lang, self.to_lang)
+                    found.update(translated)
+            finally:
+                with self._lock:
+                    for text in missing:
+                        self._in_flight.pop((text, from_lang)).set()
+            if awaited:
+                for event in awaited:
+                    event.wait()
+                found.update(self.cache.get_many([text for text in unique if text not in found], from_lang, self.to_lang))
+            results.update(((text, from_lang), found.get(text, "")) for text in unique)
+        return results
+
+    def _translate_batch(self, texts: list[str], from_lang: Language) -> dict[str, str]:
+        """Send one batch of distinct strings to the translator. Failed strings are left out (and not cached)."""
+        translate_batch: Callable[..., Iterable[str]] | None = getattr(self.translator, "translate_batch", None)
+        if translate_batch is not None:
+            try:
+                return {text: str(translated) for text, translated in zip(texts, translate_batch(texts, from_lang=from_lang))}
+            except Exception as e:  # noqa: BLE001
+                RobustLogger().warning(f"Batch translation failed ({e.__class__.__name__}: {e}), translating one by one")
+
+        def translate_one(text: str) -> str | None:
+            try:
+                return str(self.translator.translate(text, from_lang=from_lang))
+            except Exception as e:  # noqa: BLE001
+                RobustLogger().warning(f"Could not translate {text!r}: {e}")
+                return None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_threads, len(texts))) as executor:
+            return {text: translated for text, translated in zip(texts, executor.map(translate_one, texts)) if translated is not None}
+
+
+def iter_locstring_texts(gff_struct: GFFStruct) -> Iterator[tuple[str, Language]]:
+    """Yield (text, language) for every non-blank substring of every LocalizedString in a GFF struct tree."""
+    for label, field_type, value in gff_struct:
+        if label.lower() == "mod_name":
+            continue
+        if field_type is GFFFieldType.Struct and isinstance(value, GFFStruct):
+            yield from iter_locstring_texts(value)
+        elif field_type is GFFFieldType.List and isinstance(value, GFFList):
+            for item in value:
+                yield from iter_locstring_texts(item)
+        elif field_type is GFFFieldType.LocalizedString and isinstance(value, LocalizedString):
+            for lang, _gender, text in value:
+                if text is not None and text.strip():
+                    yield text, lang
+
+
+def prefetch_gff_translations(pipeline: TranslationPipeline, gffs: Iterable[GFF]) -> int:
+    """Translate the LocalizedStrings of many GFFs in one deduplicated pass.
+
+    Later per-field translations of these GFFs are then answered from the pipeline's cache.
+
+    Returns:
+    -------
+        The number of distinct strings found
+    """
+    items: dict[tuple[str, Language], None] = {}
+    for gff in gffs:
+        items.update((item, None) for item in iter_locstring_texts(gff.root))
+    pipeline.translate_many(items)
+    return len(items)
@@ -21,12 +21,14 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict
 
+from loggerplus import RobustLogger
 from pykotor.extract.file import ResourceIdentifier
 from pykotor.extract.installation import Installation, SearchLocation
 from pykotor.resource.type import ResourceType
 
 if TYPE_CHECKING:
     from pykotor.common.module import Module
+    from pykotor.extract.file import FileResource
 
 
 class ValidationResult(TypedDict):
@@ -148,7 +150,7 @@ def get_module_referenced_resources(
         >>> textures, lightmaps = get_module_referenced_resources(module)
         >>> print(f"Module references {len(textures)} textures and {len(lightmaps)} lightmaps")
     """
-    from pykotor.tools.model import iterate_lightmaps, iterate_textures
+    from pykotor.tools.model import scan_model_references
 
     all_lightmaps: set[str] = set()
     all_textures: set[str] = set()
@@ -158,12 +160,12 @@ def get_module_referenced_resources(
             mdl_data = mdl.data()
             if mdl_data is None:
                 continue
-            for lm in iterate_lightmaps(mdl_data):
-                all_lightmaps.add(lm.lower())
-            for tex in iterate_textures(mdl_data):
-                all_textures.add(tex.lower())
-        except Exception:
+            references = scan_model_references(mdl_data)
+        except Exception as e:  # noqa: BLE001
+            RobustLogger().debug(f"Could not scan the model '{mdl.resname()}' for texture references: {e}")
             continue
+        all_textures.update(references.textures)
+        all_lightmaps.update(references.lightmaps)
 
     return all_textures, all_lightmaps
 
@@ -210,6 +212,48 @@ def check_missing_resources_referenced(
     return results
 
 
+def find_missing_model_textures(
+    installation: Installation,
+    *,
+    max_workers: int | None = None,
+) -> dict[str, list[str]]:
+    """Find the textures and lightmaps referenced by models that no TPC/TGA in the installation provides.
+
+    Every model in the installation is scanned with `batch_model_references`, so the work is spread over
+    a process pool with one task per capsule, BIF or Override folder.
+
+    Args:
+    ----
+        installation: Installation to check
+        max_workers: Number of worker processes (default: CPU count, 1 scans in-process)
+
+    Returns:
+    -------
+        Dictionary mapping model filenames to their missing textures and lightmaps, sorted
+
+    Example:
+    -------
+        >>> missing = find_missing_model_textures(installation)
+        >>> for model, textures in missing.items():
+        ...     print(f"{model}: {', '.join(textures)}")
+    """
+    from pykotor.tools.model import batch_model_references
+
+    resources: list[FileResource] = list(installation)
+    available: set[str] = {
+        resource.resname().lower()
+        for resource in resources
+        if resource.restype() in (ResourceType.TPC, ResourceType.TGA)
+    }
+
+    missing: dict[str, set[str]] = {}
+    for resource, references in batch_model_references(resources, max_workers=max_workers).items():
+        names = {name for name in (*references.textures, *references.lightmaps) if name not in available}
+        if names:
+            missing.setdefault(resource.filename().lower(), set()).update(names)
+    return {model: sorted(names) for model, names in sorted(missing.items())}
+
+
 def investigate_module_structure(
     module: Module,
 ) -> dict:
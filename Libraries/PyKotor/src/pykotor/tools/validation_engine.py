@@ -0,0 +1,695 @@
+"""Installation-wide resource validation with parallel checkers and a persistent result cache.
+
+:func:`run_validation` runs every registered checker (missing textures, scripts and dialogs, broken 2DA
+references, dangling conversation links, unreadable GFFs, ...) over the resources of an installation:
+
+- Each resource is identified by a BLAKE2b digest of its type and contents. Digests are stored per
+  container (BIF, ERF/RIM capsule or loose file) in a :class:`ValidationCache` and only recomputed
+  for containers whose size or mtime changed.
+- Checker results are cached by (content digest, checker, context), where the context is a digest of
+  only the installation-wide facts the checker reads. Identical contents found in several places (the
+  same blueprint in many modules) are validated once, and a later run only re-runs a checker on
+  resources whose contents, or the facts that checker reads, changed: adding a texture re-validates
+  models, not dialogs.
+- Uncached resources are validated in a process pool, one task per container with loose files batched
+  per folder, falling back to in-process validation when worker processes are unavailable.
+
+Checkers are registered with :func:`register_checker`. They run in worker processes that look them up by
+name, so custom checkers must be defined in an importable module rather than in ``__main__``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import multiprocessing
+import os
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, NamedTuple
+
+from loggerplus import RobustLogger
+from pykotor.extract.file import FileResource
+from pykotor.resource.formats.gff import GFFFieldType, GFFList, GFFStruct, read_gff
+from pykotor.resource.formats.twoda import read_2da
+from pykotor.resource.type import ResourceType
+from pykotor.tools.sqlite_store import SQLiteStore
+
+if TYPE_CHECKING:
+    from pykotor.extract.installation import Installation
+    from pykotor.resource.formats.gff import GFF
+
+SCHEMA_VERSION = 2
+
+SEVERITY_ERROR = "error"
+SEVERITY_WARNING = "warning"
+
+_DIGEST_SIZE = 16
+_LOOSE_FILES_PER_SHARD = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS containers (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS digests (
+    container_id INTEGER NOT NULL REFERENCES containers(id) ON DELETE CASCADE,
+    restype TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    PRIMARY KEY (container_id, restype, offset, size)
+);
+CREATE TABLE IF NOT EXISTS results (
+    digest BLOB NOT NULL,
+    checker TEXT NOT NULL,
+    context TEXT NOT NULL,
+    issues TEXT NOT NULL,
+    PRIMARY KEY (digest, checker, context)
+);
+"""
+
+_GFF_TYPES: frozenset[ResourceType] = frozenset(restype for restype in ResourceType if restype.is_gff())
+
+# Unset values of integer GFF fields that reference 2DA rows.
+_UNSET_ROW_VALUES: dict[GFFFieldType, int] = {
+    GFFFieldType.UInt8: 0xFF,
+    GFFFieldType.UInt16: 0xFFFF,
+    GFFFieldType.UInt32: 0xFFFFFFFF,
+}
+_INTEGER_FIELD_TYPES: frozenset[GFFFieldType] = frozenset(
+    {GFFFieldType.UInt8, GFFFieldType.Int8, GFFFieldType.UInt16, GFFFieldType.Int16, GFFFieldType.UInt32, GFFFieldType.Int32},
+)
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """A problem found by a checker.
+
+    Attributes:
+    ----------
+        checker: Name of the checker that reported the issue
+        severity: ``"error"`` or ``"warning"``
+        resource: Filename of the resource, e.g. ``m01aa.utc``
+        location: Path of the file or container the resource was read from
+        message: Description of the problem
+    """
+
+    checker: str
+    severity: str
+    resource: str
+    location: str
+    message: str
+
+
+@dataclass
+class ValidationReport:
+    """Issues found by :func:`run_validation` and how much work was needed to find them.
+
+    Attributes:
+    ----------
+        issues: Every issue, sorted by location, resource and checker
+        resources: Number of resources the checkers apply to
+        validated: Number of distinct contents the checkers actually ran on
+        cached: Number of distinct contents whose results all came from the cache
+    """
+
+    issues: list[ValidationIssue] = field(default_factory=list)
+    resources: int = 0
+    validated: int = 0
+    cached: int = 0
+
+    @property
+    def valid(self) -> bool:
+        return not any(issue.severity == SEVERITY_ERROR for issue in self.issues)
+
+    def by_checker(self) -> dict[str, list[ValidationIssue]]:
+        grouped: dict[str, list[ValidationIssue]] = {}
+        for issue in self.issues:
+            grouped.setdefault(issue.checker, []).append(issue)
+        return grouped
+
+
+@dataclass(frozen=True)
+class ValidationContext:
+    """Installation-wide facts the checkers validate references against.
+
+    It is built once per run and shipped to every worker. The :meth:`digest` of the fields a checker reads
+    is part of that checker's cache key, so adding a missing texture re-validates the models that referenced
+    it but not the results of checkers that never look at textures.
+    """
+
+    textures: frozenset[str] = frozenset()
+    scripts: frozenset[str] = frozenset()
+    dialogs: frozenset[str] = frozenset()
+    twoda_rows: tuple[tuple[str, int], ...] = ()
+
+    @classmethod
+    def from_installation(
+        cls,
+        installation: Installation,
+        resources: Iterable[FileResource] | None = None,
+    ) -> ValidationContext:
+        """Collect the available textures, scripts and dialogs and the row count of every referenced 2DA."""
+        from pykotor.extract.twoda import TwoDARegistry
+
+        names: dict[ResourceType, set[str]] = {
+            restype: set() for restype in (ResourceType.TPC, ResourceType.TGA, ResourceType.NCS, ResourceType.DLG, ResourceType.TwoDA)
+        }
+        for resource in installation if resources is None else resources:
+            bucket: set[str] | None = names.get(resource.restype())
+            if bucket is not None:
+                bucket.add(resource.resname().lower())
+
+        twoda_rows: dict[str, int] = {}
+        for identifier in TwoDARegistry.gff_field_mapping().values():
+            resname: str = identifier.resname.lower()
+            if resname in twoda_rows or resname not in names[ResourceType.TwoDA]:
+                continue
+            result = installation.resource(resname, ResourceType.TwoDA)
+            if result is None:
+                continue
+            try:
+                twoda_rows[resname] = read_2da(result.data).get_height()
+            except Exception as e:  # noqa: BLE001
+                RobustLogger().warning(f"Could not read '{resname}.2da' for validation: {e}")
+
+        return cls(
+            textures=frozenset(names[ResourceType.TPC] | names[ResourceType.TGA]),
+            scripts=frozenset(names[ResourceType.NCS]),
+            dialogs=frozenset(names[ResourceType.DLG]),
+            twoda_rows=tuple(sorted(twoda_rows.items())),
+        )
+
+    @classmethod
+    def facets(cls) -> tuple[str, ...]:
+        """Returns the names of the fields checkers can declare they read."""
+        return tuple(context_field.name for context_field in fields(cls))
+
+    def digest(self, facets: Iterable[str] | None = None) -> str:
+        """Returns a digest of the given fields (default: all of them)."""
+        hasher = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+        for facet in self.facets() if facets is None else sorted(facets):
+            value: frozenset[str] | tuple[tuple[str, int], ...] = getattr(self, facet)
+            hasher.update(facet.encode())
+            hasher.update(b"\0")
+            hasher.update(("\n".join(sorted(value)) if isinstance(value, frozenset) else repr(value)).encode())
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+
+class CheckedResource:
+    """A resource handed to the checkers; the GFF is parsed at most once and shared between them."""
+
+    def __init__(self, restype: ResourceType, data: bytes):
+        self.restype: ResourceType = restype
+        self.data: bytes = data
+        self._gff: GFF | None = None
+
+    def gff(self) -> GFF:
+        if self._gff is None:
+            self._gff = read_gff(self.data)
+        return self._gff
+
+
+# A checker yields (severity, message) for every problem it finds in a resource.
+CheckerFunction = Callable[[CheckedResource, ValidationContext], Iterable["tuple[str, str]"]]
+
+
+class Checker(NamedTuple):
+    """A registered validation check.
+
+    Attributes:
+    ----------
+        name: Unique name, used in reports and cache keys
+        restypes: The resource types the checker applies to
+        function: The check itself
+        uses_context: Whether results depend on the :class:`ValidationContext`, not only on the resource contents
+        version: Bump to invalidate cached results after changing the check
+        reads: The context fields the results depend on (None: all of them)
+    """
+
+    name: str
+    restypes: frozenset[ResourceType]
+    function: CheckerFunction
+    uses_context: bool = True
+    version: int = 1
+    reads: frozenset[str] | None = None
+
+    def cache_context(self, context: ValidationContext) -> str:
+        return f"{self.version}:{context.digest(self.reads) if self.uses_context else ''}"
+
+
+_CHECKERS: dict[str, Checker] = {}
+
+
+def register_checker(
+    name: str,
+    restypes: Iterable[ResourceType],
+    *,
+    uses_context: bool = True,
+    reads: Iterable[str] | None = None,
+    version: int = 1,
+) -> Callable[[CheckerFunction], CheckerFunction]:
+    """Decorator registering a checker function under a name.
+
+    Args:
+    ----
+        name: Unique checker name; registering a name again replaces the previous checker
+        restypes: The resource types the checker applies to
+        uses_context: Whether results depend on the installation-wide `ValidationContext`
+        reads: The `ValidationContext` fields the results depend on (default: all of them); cached results
+            are only invalidated when one of these changes
+        version: Bump to invalidate cached results after changing the check
+
+    Returns:
+    -------
+        The decorator, which returns the function unchanged
+
+    Raises:
+    ------
+        ValueError: `reads` names a field `ValidationContext` does not have
+    """
+    facets: frozenset[str] | None = None if reads is None else frozenset(reads)
+    unknown: frozenset[str] = frozenset() if facets is None else facets.difference(ValidationContext.facets())
+    if unknown:
+        msg = f"Checker '{name}' reads unknown context fields: {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+
+    def decorator(function: CheckerFunction) -> CheckerFunction:
+        _CHECKERS[name] = Checker(name, frozenset(restypes), function, uses_context, version, facets)
+        return function
+
+    return decorator
+
+
+def registered_checkers() -> dict[str, Checker]:
+    """Returns the registered checkers by name."""
+    return dict(_CHECKERS)
+
+
+def _iter_fields(gff_struct: GFFStruct) -> Iterator[tuple[str, GFFFieldType, object]]:
+    """Yield (label, field type, value) for every field of a GFF struct tree."""
+    for label, field_type, value in gff_struct:
+        yield label, field_type, value
+        if field_type is GFFFieldType.Struct and isinstance(value, GFFStruct):
+            yield from _iter_fields(value)
+        elif field_type is GFFFieldType.List and isinstance(value, GFFList):
+            for item in value:
+                yield from _iter_fields(item)
+
+
+def _is_script_field(label: str) -> bool:
+    return label.startswith(("On", "Script", "Mod_On")) or label in ("Active", "Active2")
+
+
+@register_checker("invalid_gff", _GFF_TYPES, uses_context=False)
+def _check_invalid_gff(resource: CheckedResource, context: ValidationContext) -> Iterator[tuple[str, str]]:
+    try:
+        resource.gff()
+    except Exception as e:  # noqa: BLE001
+        yield SEVERITY_ERROR, f"Invalid GFF structure: {e.__class__.__name__}: {e}"
+
+
+@register_checker("missing_textures", (ResourceType.MDL,), reads=("textures",))
+def _check_missing_textures(resource: CheckedResource, context: ValidationContext) -> Iterator[tuple[str, str]]:
+    import struct
+
+    from pykotor.tools.model import scan_model_references
+
+    try:
+        references = scan_model_references(resource.data)
+    except (struct.error, ValueError) as e:
+        yield SEVERITY_ERROR, f"Unreadable model: {e}"
+        return
+    for texture in references.textures:
+        if texture not in context.textures:
+            yield SEVERITY_WARNING, f"Missing texture '{texture}'"
+    for lightmap in references.lightmaps:
+        if lightmap not in context.textures:
+            yield SEVERITY_WARNING, f"Missing lightmap '{lightmap}'"
+
+
+@register_checker("missing_scripts", _GFF_TYPES, reads=("scripts",))
+def _check_missing_scripts(resource: CheckedResource, context: ValidationContext) -> Iterator[tuple[str, str]]:
+    try:
+        root = resource.gff().root
+    except Exception:  # noqa: BLE001
+        return  # reported by invalid_gff
+    for label, field_type, value in _iter_fields(root):
+        if field_type is not GFFFieldType.ResRef or not _is_script_field(label):
+            continue
+        script: str = str(value).lower()
+        if script and script not in context.scripts:
+            yield SEVERITY_WARNING, f"{label} references missing script '{script}'"
+
+
+@register_checker("broken_2da_references", _GFF_TYPES, reads=("twoda_rows",))
+def _check_2da_references(resource: CheckedResource, context: ValidationContext) -> Iterator[tuple[str, str]]:
+    from pykotor.extract.twoda import TwoDARegistry
+
+    try:
+        root = resource.gff().root
+    except Exception:  # noqa: BLE001
+        return  # reported by invalid_gff
+    mapping = TwoDARegistry.gff_field_mapping()
+    rows: dict[str, int] = dict(context.twoda_rows)
+    for label, field_type, value in _iter_fields(root):
+        identifier = mapping.get(label)
+        if identifier is None or field_type not in _INTEGER_FIELD_TYPES or not isinstance(value, int):
+            continue
+        height: int | None = rows.get(identifier.resname.lower())
+        if height is None or value < 0 or value == _UNSET_ROW_VALUES.get(field_type):
+            continue
+        if value >= height:
+            yield SEVERITY_ERROR, f"{label}={value} is out of range for {identifier.resname}.2da ({height} rows)"
+
+
+@register_checker("dangling_conversation_links", (ResourceType.DLG,), uses_context=False)
+def _check_conversation_links(resource: CheckedResource, context: ValidationContext) -> Iterator[tuple[str, str]]:
+    try:
+        root = resource.gff().root
+    except Exception:  # noqa: BLE001
+        return  # reported by invalid_gff
+
+    entries: GFFList = root.get_list("EntryList") if root.exists("EntryList") else GFFList()
+    replies: GFFList = root.get_list("ReplyList") if root.exists("ReplyList") else GFFList()
+    links: list[tuple[str, GFFList, str, int]] = [("StartingList", root.get_list("StartingList"), "EntryList", len(entries))] if root.exists("StartingList") else []
+    for index, entry in enumerate(entries):
+        if entry.exists("RepliesList"):
+            links.append((f"EntryList[{index}].RepliesList", entry.get_list("RepliesList"), "ReplyList", len(replies)))
+    for index, reply in enumerate(replies):
+        if reply.exists("EntriesList"):
+            links.append((f"ReplyList[{index}].EntriesList", reply.get_list("EntriesList"), "EntryList", len(entries)))
+    for path, link_list, target, count in links:
+        for link in link_list:
+            node_index: int = link.acquire("Index", -1)
+            if not 0 <= node_index < count:
+                yield SEVERITY_ERROR, f"{path} links to {target}[{node_index}] but only {count} exist"
+
+
+@register_checker("missing_conversations", _GFF_TYPES - {ResourceType.DLG}, reads=("dialogs",))
+def _check_conversations(resource: CheckedResource, context: ValidationContext) -> Iterator[tuple[str, str]]:
+    try:
+        root = resource.gff().root
+    except Exception:  # noqa: BLE001
+        return  # reported by invalid_gff
+    for label, field_type, value in root:
+        if label != "Conversation" or field_type is not GFFFieldType.ResRef:
+            continue
+        dialog: str = str(value).lower()
+        if dialog and dialog not in context.dialogs:
+            yield SEVERITY_WARNING, f"Conversation references missing dialog '{dialog}'"
+
+
+class ValidationCache(SQLiteStore):
+    """SQLite store of resource digests and checker results."""
+
+    SCHEMA = _SCHEMA
+    SCHEMA_VERSION = SCHEMA_VERSION
+    TABLES = ("results", "digests", "containers")
+    FOREIGN_KEYS = True
+
+    def clear(self):
+        """Drop every stored digest and result."""
+        with self._lock, self._conn:
+            for table in ("results", "digests", "containers"):
+                self._conn.execute(f"DELETE FROM {table}")  # noqa: S608
+
+    def container_digests(self, path: str, mtime_ns: int, size: int) -> dict[tuple[str, int, int], bytes] | None:
+        """Returns the digests stored for a container, or None if it changed since they were stored."""
+        with self._lock:
+            row = self._conn.execute("SELECT id, mtime_ns, size FROM containers WHERE path = ?", (path,)).fetchone()
+            if row is None or row[1] != mtime_ns or row[2] != size:
+                return None
+            rows = self._conn.execute("SELECT restype, offset, size, digest FROM digests WHERE container_id = ?", (row[0],)).fetchall()
+        return {(restype, offset, resource_size): bytes(digest) for restype, offset, resource_size, digest in rows}
+
+    def store_container_digests(self, path: str, mtime_ns: int, size: int, digests: dict[tuple[str, int, int], bytes]):
+        """Replace the digests stored for a container."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM containers WHERE path = ?", (path,))
+            container_id = self._conn.execute(
+                "INSERT INTO containers(path, mtime_ns, size) VALUES (?, ?, ?)",
+                (path, mtime_ns, size),
+            ).lastrowid
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO digests(container_id, restype, offset, size, digest) VALUES (?, ?, ?, ?, ?)",
+                [(container_id, restype, offset, resource_size, digest) for (restype, offset, resource_size), digest in digests.items()],
+            )
+
+    def results(self, keys: Iterable[tuple[bytes, str, str]]) -> dict[tuple[bytes, str, str], list[tuple[str, str]]]:
+        """Returns the stored issues for every (digest, checker, context) key that has results."""
+        found: dict[tuple[bytes, str, str], list[tuple[str, str]]] = {}
+        with self._lock:
+            for digest, checker, context in keys:
+                row = self._conn.execute(
+                    "SELECT issues FROM results WHERE digest = ? AND checker = ? AND context = ?",
+                    (digest, checker, context),
+                ).fetchone()
+                if row is not None:
+                    found[(digest, checker, context)] = [(severity, message) for severity, message in json.loads(row[0])]
+        return found
+
+    def store_results(self, results: dict[tuple[bytes, str, str], list[tuple[str, str]]]):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results(digest, checker, context, issues) VALUES (?, ?, ?, ?)",
+                [(digest, checker, context, json.dumps(issues)) for (digest, checker, context), issues in results.items()],
+            )
+
+
+_VALIDATION_CACHE: ValidationCache | None = None
+
+
+def get_validation_cache() -> ValidationCache:
+    """Returns the process-wide, in-memory validation cache."""
+    global _VALIDATION_CACHE  # noqa: PLW0603
+    if _VALIDATION_CACHE is None:
+        _VALIDATION_CACHE = ValidationCache()
+    return _VALIDATION_CACHE
+
+
+def clear_validation_cache() -> None:
+    """Clear the process-wide validation cache to free memory."""
+    if _VALIDATION_CACHE is not None:
+        _VALIDATION_CACHE.clear()
+
+
+def _hash_resource(restype: ResourceType, data: bytes) -> bytes:
+    hasher = hashlib.blake2b(restype.extension.encode(), digest_size=_DIGEST_SIZE)
+    hasher.update(b"\0")
+    hasher.update(data)
+    return hasher.digest()
+
+
+def _resource_key(resource: FileResource) -> tuple[str, int, int]:
+    return (resource.restype().name, resource.offset(), resource.size())
+
+
+def _digest_container(
+    cache: ValidationCache,
+    container: str,
+    resources: list[FileResource],
+) -> dict[FileResource, bytes]:
+    """Digest the resources of one container, reusing stored digests while the container is unchanged."""
+    stat: os.stat_result | None = None
+    with contextlib.suppress(OSError):  # not a real file, e.g. a resource nested inside a SAVEGAME.sav
+        stat = os.stat(container)  # noqa: PTH116
+    stored = None if stat is None else cache.container_digests(container, stat.st_mtime_ns, stat.st_size)
+    if stored is not None and all(_resource_key(resource) in stored for resource in resources):
+        return {resource: stored[_resource_key(resource)] for resource in resources}
+
+    digests: dict[FileResource, bytes] = {}
+    readable: bool = stat is not None and not any(resource.inside_bzf for resource in resources)
+    try:
+        if readable:
+            with open(container, "rb") as f:  # noqa: PTH123
+                for resource in sorted(resources, key=lambda r: r.offset()):
+                    f.seek(resource.offset())
+                    digests[resource] = _hash_resource(resource.restype(), f.read(resource.size()))
+        else:
+            # Compressed BIFs and resources nested in other files must be extracted to be hashed.
+            for resource in resources:
+                digests[resource] = _hash_resource(resource.restype(), resource.data())
+    except (OSError, ValueError) as e:
+        RobustLogger().warning(f"Could not read resources in '{container}' for validation: {e}")
+        return digests
+    if stat is not None:
+        cache.store_container_digests(container, stat.st_mtime_ns, stat.st_size, {_resource_key(resource): digest for resource, digest in digests.items()})
+    return digests
+
+
+def _shard_entries(
+    work: list[tuple[FileResource, tuple[str, ...]]],
+) -> list[list[tuple[str, str, str, int, int, tuple[str, ...]]]]:
+    """Group resources to validate into shards: one per capsule/BIF, loose files batched per folder."""
+    containers: dict[str, list[tuple[str, str, str, int, int, tuple[str, ...]]]] = {}
+    loose: dict[str, list[tuple[str, str, str, int, int, tuple[str, ...]]]] = {}
+    for resource, checker_names in work:
+        filepath = resource.filepath()
+        entry = (str(filepath), resource.resname(), resource.restype().name, resource.offset(), resource.size(), checker_names)
+        if resource.inside_capsule or resource.inside_bif or resource.inside_bzf:
+            containers.setdefault(entry[0], []).append(entry)
+        else:
+            loose.setdefault(str(filepath.parent), []).append(entry)
+
+    shards = list(containers.values())
+    for entries in loose.values():
+        shards.extend(entries[i : i + _LOOSE_FILES_PER_SHARD] for i in range(0, len(entries), _LOOSE_FILES_PER_SHARD))
+    return shards
+
+
+_WORKER_CONTEXT: ValidationContext | None = None
+
+
+def _init_worker(context: ValidationContext):
+    global _WORKER_CONTEXT  # noqa: PLW0603
+    _WORKER_CONTEXT = context
+
+
+def _validate_shard(
+    entries: list[tuple[str, str, str, int, int, tuple[str, ...]]],
+    context: ValidationContext | None = None,
+) -> list[dict[str, list[tuple[str, str]]]]:
+    """Run the requested checkers on every resource of a shard.
+
+    Runs in a worker process: only resource locations and checker names are sent to the worker and only
+    the (severity, message) pairs are sent back. The context is installed once per worker by `_init_worker`.
+    """
+    if context is None:
+        assert _WORKER_CONTEXT is not None
+        context = _WORKER_CONTEXT
+    results: list[dict[str, list[tuple[str, str]]]] = []
+    for filepath, resname, restype_name, offset, size, checker_names in entries:
+        restype: ResourceType = ResourceType.__members__[restype_name]
+        issues: dict[str, list[tuple[str, str]]] = {}
+        try:
+            checked = CheckedResource(restype, FileResource(resname, restype, size, offset, filepath).data())
+        except Exception as e:  # noqa: BLE001
+            results.append({name: [(SEVERITY_ERROR, f"Unreadable resource: {e}")] for name in checker_names})
+            continue
+        for name in checker_names:
+            try:
+                issues[name] = [(str(severity), str(message)) for severity, message in _CHECKERS[name].function(checked, context)]
+            except Exception as e:  # noqa: BLE001
+                issues[name] = [(SEVERITY_ERROR, f"Checker failed: {e.__class__.__name__}: {e}")]
+        results.append(issues)
+    return results
+
+
+def run_validation(
+    installation: Installation,
+    *,
+    checkers: Iterable[str] | None = None,
+    cache: ValidationCache | None = None,
+    max_workers: int | None = None,
+    logger: Callable[[str], None] | None = None,
+) -> ValidationReport:
+    """Validate every resource of an installation with the registered checkers.
+
+    Args:
+    ----
+        installation: Installation to validate
+        checkers: Names of the checkers to run (default: all registered checkers)
+        cache: Cache of digests and results (default: the process-wide in-memory cache)
+        max_workers: Number of worker processes (default: CPU count, 1 validates in-process)
+        logger: Optional progress callback
+
+    Returns:
+    -------
+        The issues found, including those restored from the cache
+
+    Example:
+    -------
+        >>> cache = ValidationCache("validation.sqlite")
+        >>> report = run_validation(installation, cache=cache)
+        >>> for issue in report.issues:
+        ...     print(f"{issue.resource}: [{issue.checker}] {issue.message}")
+    """
+    if cache is None:
+        cache = get_validation_cache()
+    selected: list[Checker] = list(_CHECKERS.values()) if checkers is None else [_CHECKERS[name] for name in checkers]
+
+    all_resources: list[FileResource] = list(installation)
+    context = ValidationContext.from_installation(installation, all_resources)
+    cache_contexts: dict[str, str] = {checker.name: checker.cache_context(context) for checker in selected}
+
+    applicable: dict[FileResource, list[Checker]] = {}
+    for resource in all_resources:
+        matching = [checker for checker in selected if resource.restype() in checker.restypes]
+        if matching:
+            applicable[resource] = matching
+
+    by_container: dict[str, list[FileResource]] = {}
+    for resource in applicable:
+        by_container.setdefault(str(resource.filepath()), []).append(resource)
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(by_container)))) as executor:
+        digests: dict[FileResource, bytes] = {}
+        for container_digests in executor.map(lambda item: _digest_container(cache, *item), by_container.items()):
+            digests.update(container_digests)
+
+    # Look up every (content, checker) pair once; contents without a complete set of results are validated.
+    keys: dict[bytes, dict[str, tuple[bytes, str, str]]] = {}
+    for resource, digest in digests.items():
+        keys.setdefault(digest, {}).update(
+            (checker.name, (digest, checker.name, cache_contexts[checker.name])) for checker in applicable[resource]
+        )
+    stored = cache.results(key for checker_keys in keys.values() for key in checker_keys.values())
+
+    work: list[tuple[FileResource, tuple[str, ...]]] = []
+    queued: set[bytes] = set()
+    for resource, digest in digests.items():
+        if digest in queued:
+            continue
+        missing = tuple(name for name, key in keys[digest].items() if key not in stored)
+        if missing:
+            queued.add(digest)
+            work.append((resource, missing))
+
+    report = ValidationReport(resources=len(applicable), validated=len(work), cached=len(keys) - len(work))
+    if logger is not None:
+        logger(f"Validating {len(work)} of {len(keys)} distinct resources ({report.cached} cached)")
+
+    shards = _shard_entries(work)
+    if max_workers is None:
+        max_workers = multiprocessing.cpu_count()
+    max_workers = max(1, min(max_workers, len(shards)))
+    validated: list[list[dict[str, list[tuple[str, str]]]]] | None = None
+    if max_workers > 1:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(context,),
+            ) as executor:
+                validated = list(executor.map(_validate_shard, shards))
+        except (OSError, RuntimeError) as e:
+            # Worker processes unavailable (frozen build, sandbox, broken pool): fall back to validating in-process.
+            RobustLogger().warning(f"Parallel validation failed ({e.__class__.__name__}: {e}), validating in-process")
+    if validated is None:
+        validated = [_validate_shard(entries, context) for entries in shards]
+
+    new_results: dict[tuple[bytes, str, str], list[tuple[str, str]]] = {}
+    digest_of_entry: dict[tuple[str, str, str, int, int], bytes] = {
+        (str(resource.filepath()), resource.resname(), resource.restype().name, resource.offset(), resource.size()): digests[resource]
+        for resource, _names in work
+    }
+    for entries, shard_results in zip(shards, validated):
+        for entry, issues in zip(entries, shard_results):
+            digest = digest_of_entry[entry[:5]]
+            new_results.update((keys[digest][name], found) for name, found in issues.items())
+    cache.store_results(new_results)
+    stored.update(new_results)
+
+    for resource, digest in digests.items():
+        for checker in applicable[resource]:
+            for severity, message in stored.get(keys[digest][checker.name], []):
+                report.issues.append(ValidationIssue(checker.name, severity, resource.filename(), str(resource.filepath()), message))
+    report.issues.sort(key=lambda issue: (issue.location, issue.resource, issue.checker, issue.message))
+    return report
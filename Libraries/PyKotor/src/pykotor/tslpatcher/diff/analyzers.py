@@ -353,6 +353,9 @@ class GFFDiffAnalyzer(DiffAnalyzer):
         modifications: ModificationsGFF,
     ):
         """Recursively analyze struct differences."""
+        if left_struct.content_hash() == right_struct.content_hash():
+            return  # identical subtree
+
         # Get all fields
         left_fields: set[str] = {label for label, _, _ in left_struct}
         right_fields: set[str] = {label for label, _, _ in right_struct}
@@ -419,16 +422,16 @@ class GFFDiffAnalyzer(DiffAnalyzer):
         # Compare values based on type
         is_struct_type = left_field_type == GFFFieldType.Struct
         if is_struct_type:
-            # Recursively analyze nested struct
-            left_nested: GFFStruct | None = left_struct.get_struct(field_label)
-            right_nested: GFFStruct | None = right_struct.get_struct(field_label)
+            # Recursively analyze nested struct (the stored values keep their cached content hashes, copies would not)
+            left_nested: GFFStruct | None = left_field.value()
+            right_nested: GFFStruct | None = right_field.value()
             if left_nested is not None and right_nested is not None:
                 self._analyze_struct(left_nested, right_nested, field_path, modifications)
 
         elif left_field_type == GFFFieldType.List:
             # Analyze list differences
-            left_list: GFFList | None = left_struct.get_list(field_label)
-            right_list: GFFList | None = right_struct.get_list(field_label)
+            left_list: GFFList | None = left_field.value()
+            right_list: GFFList | None = right_field.value()
             if left_list is not None and right_list is not None:
                 self._analyze_list(left_list, right_list, field_path, modifications)
 
@@ -457,6 +460,9 @@ class GFFDiffAnalyzer(DiffAnalyzer):
         modifications: ModificationsGFF,
     ):
         """Analyze list differences."""
+        if left_list.content_hash() == right_list.content_hash():
+            return  # identical subtree
+
         left_size = len(left_list)
         right_size = len(right_list)
 
@@ -7,7 +7,8 @@ YAML cache files, allowing reuse of diff analysis without re-scanning files.
 The cache includes:
 - File comparison metadata (which files changed, added, removed)
 - Copies of modified/different files for regenerating diffs
-- StrRef reference cache (which files reference which StrRefs) for TLK linking
+- StrRef reference cache (which files reference which StrRefs) for TLK linking,
+  stored in the compact binary format of StrRefReferenceCache.to_bytes()
 
 This allows --from-results to skip both file scanning and StrRef cache building,
 significantly speeding up repeated TSLPatcher data generation.
@@ -28,6 +29,8 @@ if TYPE_CHECKING:
     from pykotor.common.misc import Game
     from pykotor.tools.reference_cache import StrRefReferenceCache
 
+STRREF_CACHE_FILENAME = "strref_cache.bin"
+
 
 @dataclass
 class DiffCache:
@@ -52,7 +55,9 @@ class DiffCache:
     files: list[CachedFileComparison] | None = None
     # StrRef cache data (for TLK linking patches)
     strref_cache_game: str | None = None  # Game type (K1/K2) for StrRef cache
-    strref_cache_data: dict[str, Any] | None = None  # Serialized StrRef cache
+    strref_cache_data: dict[str, Any] | None = None  # Serialized StrRef cache (legacy YAML form)
+    strref_cache_file: str | None = None  # Binary StrRef cache file, relative to the cache data directory
+    strref_cache_bytes: bytes | None = None  # Binary StrRef cache contents (loaded, not written to YAML)
 
     def __post_init__(self):
         """Initialize mutable defaults."""
@@ -84,6 +89,8 @@ class DiffCache:
             result["strref_cache_game"] = self.strref_cache_game
         if self.strref_cache_data is not None:
             result["strref_cache_data"] = self.strref_cache_data
+        if self.strref_cache_file is not None:
+            result["strref_cache_file"] = self.strref_cache_file
 
         return result
 
@@ -108,6 +115,7 @@ class DiffCache:
             ],
             strref_cache_game=data.get("strref_cache_game"),
             strref_cache_data=data.get("strref_cache_data"),
+            strref_cache_file=data.get("strref_cache_file"),
         )
 
 
@@ -133,16 +141,19 @@ def save_diff_cache(
     if log_func is None:
         log_func = print
 
+    # Create companion data directory
+    cache_dir = cache_file.parent / f"{cache_file.stem}_data"
+    cache_dir.mkdir(exist_ok=True)
+
     # Add StrRef cache to DiffCache if provided
     if strref_cache is not None:
         cache.strref_cache_game = str(strref_cache.game)
-        cache.strref_cache_data = strref_cache.to_dict()
+        cache.strref_cache_data = None
+        cache.strref_cache_bytes = strref_cache.to_bytes()
+        cache.strref_cache_file = STRREF_CACHE_FILENAME
+        (cache_dir / STRREF_CACHE_FILENAME).write_bytes(cache.strref_cache_bytes)
         log_func(f"  Including StrRef cache: {len(strref_cache._cache)} StrRefs, {strref_cache._total_references_found} references")
 
-    # Create companion data directory
-    cache_dir = cache_file.parent / f"{cache_file.stem}_data"
-    cache_dir.mkdir(exist_ok=True)
-
     left_dir = cache_dir / "left"
     right_dir = cache_dir / "right"
     left_dir.mkdir(exist_ok=True)
@@ -207,7 +218,14 @@ def load_diff_cache(
     log_func(f"  Original older: {cache.older}")
 
     # Log StrRef cache data if present
-    if cache.strref_cache_data is not None:
+    if cache.strref_cache_file is not None:
+        strref_cache_path = cache_dir / cache.strref_cache_file
+        if strref_cache_path.is_file():
+            cache.strref_cache_bytes = strref_cache_path.read_bytes()
+            log_func(f"  Cached StrRef data: {strref_cache_path.name} ({len(cache.strref_cache_bytes)} bytes, game: {cache.strref_cache_game})")
+        else:
+            log_func(f"  [Warning] StrRef cache file missing: {strref_cache_path}")
+    elif cache.strref_cache_data is not None:
         strref_count: int = len(cache.strref_cache_data)
         total_refs: int = sum(len(ref["locations"]) for refs in cache.strref_cache_data.values() for ref in refs)
         log_func(f"  Cached StrRef data: {strref_count} StrRefs, {total_refs} references (game: {cache.strref_cache_game})")
@@ -222,7 +240,7 @@ def restore_strref_cache_from_cache(
     """Restore StrRef cache from DiffCache.
 
     Args:
-        cache: DiffCache object with strref_cache_data
+        cache: DiffCache object with strref_cache_bytes or strref_cache_data
         game: Optional Game instance (if None, will be parsed from cache.strref_cache_game)
 
     Returns:
@@ -230,11 +248,11 @@ def restore_strref_cache_from_cache(
     """
     from pykotor.tools.reference_cache import StrRefReferenceCache  # noqa: PLC0415
 
-    if cache.strref_cache_data is None:
+    if cache.strref_cache_data is None and cache.strref_cache_bytes is None:
         return None
 
-    # Determine game from cache if not provided
-    if game is None:
+    # Determine game from cache if not provided (the binary format records it in its header)
+    if game is None and cache.strref_cache_bytes is None:
         if cache.strref_cache_game is None:
             return None
 
@@ -248,4 +266,7 @@ def restore_strref_cache_from_cache(
         else:
             return None
 
+    if cache.strref_cache_bytes is not None:
+        return StrRefReferenceCache.from_bytes(cache.strref_cache_bytes, game)
+    assert cache.strref_cache_data is not None
     return StrRefReferenceCache.from_dict(game, cache.strref_cache_data)
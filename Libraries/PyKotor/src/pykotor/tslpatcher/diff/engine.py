@@ -54,6 +54,7 @@ from pykotor.resource.type import ResourceType
 from pykotor.tools.misc import is_capsule_file, is_rim_file
 from pykotor.tools.path import CaseAwarePath
 from pykotor.tslpatcher.diff.analyzers import DiffAnalyzer, DiffAnalyzerFactory
+from pykotor.tslpatcher.diff.fingerprint import get_fingerprint_cache
 from pykotor.tslpatcher.mods.gff import ModificationsGFF, ModifyGFF
 from pykotor.tslpatcher.mods.install import InstallFile
 from pykotor.tslpatcher.mods.ncs import ModificationsNCS, ModifyNCS  # noqa: F401
@@ -1999,12 +2000,18 @@ def diff_capsule_files(  # noqa: C901, PLR0913
         message = f"Resource missing:\t{c_file2_rel}\t{resref}\t{res_ext}"
         log_func(message)
 
-    # Check for differences in common resources
+    # Check for differences in common resources, skipping byte-identical ones
     is_same_result: bool | None = True
     common_resrefs: set[str] = capsule1_resources.keys() & capsule2_resources.keys()
+    fingerprints = get_fingerprint_cache().resources(
+        [capsule1_resources[resref] for resref in common_resrefs] + [capsule2_resources[resref] for resref in common_resrefs],
+    )
     for resref in sorted(common_resrefs):
         res1: FileResource = capsule1_resources[resref]
         res2: FileResource = capsule2_resources[resref]
+        fingerprint1 = fingerprints.get(res1)
+        if fingerprint1 is not None and fingerprint1 == fingerprints.get(res2):
+            continue
         ext: str = res1.restype().extension.casefold()
         ctx = DiffContext(c_file1_rel, c_file2_rel, ext, resref)
         result: bool | None = diff_data(
@@ -2484,6 +2491,18 @@ def diff_directories(
     total_files: int = len(remaining_files)
     log_func(f"Comparing {total_files} files...")
 
+    # Fingerprint both sides in parallel first: byte-identical files never reach the format-aware comparers
+    fingerprint_cache = get_fingerprint_cache()
+    fingerprints1 = fingerprint_cache.files(dir1 / rel_path for rel_path in existing_in_both)
+    fingerprints2 = fingerprint_cache.files(dir2 / rel_path for rel_path in existing_in_both)
+    identical_files: set[str] = {
+        rel_path
+        for rel_path in existing_in_both
+        if (fingerprint := fingerprints1.get(dir1 / rel_path)) is not None and fingerprint == fingerprints2.get(dir2 / rel_path)
+    }
+    if identical_files:
+        log_func(f"Skipping {len(identical_files)} byte-identical files")
+
     # Process files that exist in both directories
     for idx, rel_path in enumerate(existing_in_both, 1):
         log_func(f"Progress: {idx}/{total_files} files processed...")
@@ -2491,7 +2510,7 @@ def diff_directories(
         file1_path = dir1 / rel_path
         file2_path = dir2 / rel_path
 
-        result: bool | None = diff_files_func(file1_path, file2_path)
+        result: bool | None = True if rel_path in identical_files else diff_files_func(file1_path, file2_path)
         is_same_result = None if result is None else result and is_same_result
 
         # Record in cache if caching enabled
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Content fingerprints for diff pre-filtering.
+
+Most resources in a modded installation are byte-identical to the vanilla ones. Parsing and
+structurally comparing them is the dominant cost of a diff, so the diff engine first fingerprints
+both sides (size + BLAKE2b digest) and only hands resources whose fingerprints differ to the
+format-aware comparers.
+
+Fingerprints are computed one container (BIF, capsule or loose file) per task in a thread pool:
+each task opens its container once and hashes its resources in offset order. File reads and
+hashlib both release the GIL, so threads scale without the cost of shipping data between
+processes. Results are cached per container and invalidated when its size or mtime changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+from loggerplus import RobustLogger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pykotor.extract.file import FileResource
+
+_DIGEST_SIZE = 16
+_READ_CHUNK = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Size and content digest of a resource. Equal fingerprints mean byte-identical data."""
+
+    size: int
+    digest: bytes
+
+
+def fingerprint_bytes(data: bytes) -> Fingerprint:
+    """Fingerprint in-memory resource data."""
+    return Fingerprint(len(data), hashlib.blake2b(data, digest_size=_DIGEST_SIZE).digest())
+
+
+def _default_workers() -> int:
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class FingerprintCache:
+    """Per-container cache of resource fingerprints, invalidated by container size and mtime."""
+
+    def __init__(self):
+        # container path -> (mtime_ns, size, {(offset, size): Fingerprint})
+        self._containers: dict[str, tuple[int, int, dict[tuple[int, int], Fingerprint]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._containers)
+
+    def clear(self):
+        with self._lock:
+            self._containers.clear()
+
+    def _entries_for(self, container: str, stat: os.stat_result) -> dict[tuple[int, int], Fingerprint]:
+        with self._lock:
+            cached = self._containers.get(container)
+            if cached is None or cached[0] != stat.st_mtime_ns or cached[1] != stat.st_size:
+                cached = (stat.st_mtime_ns, stat.st_size, {})
+                self._containers[container] = cached
+            return cached[2]
+
+    def _fingerprint_container(
+        self,
+        container: str,
+        resources: list[FileResource],
+    ) -> list[tuple[FileResource, Fingerprint | None]]:
+        try:
+            stat: os.stat_result = os.stat(container)  # noqa: PTH116
+        except OSError:
+            # Not a real file (e.g. a resource nested inside a SAVEGAME.sav): hash the extracted data uncached.
+            return [(resource, self._fingerprint_data(resource)) for resource in resources]
+
+        entries = self._entries_for(container, stat)
+        results: list[tuple[FileResource, Fingerprint | None]] = []
+        missing: list[FileResource] = []
+        for resource in resources:
+            fingerprint = entries.get((resource.offset(), resource.size()))
+            if fingerprint is None:
+                missing.append(resource)
+            else:
+                results.append((resource, fingerprint))
+        if not missing:
+            return results
+
+        computed: list[tuple[FileResource, Fingerprint | None]] = []
+        if any(resource.inside_bzf for resource in missing):
+            # Compressed BIF payloads must be decompressed to compare their contents.
+            computed = [(resource, self._fingerprint_data(resource)) for resource in missing]
+        else:
+            try:
+                with open(container, "rb") as f:  # noqa: PTH123
+                    for resource in sorted(missing, key=lambda r: r.offset()):
+                        f.seek(resource.offset())
+                        computed.append((resource, self._fingerprint_stream(f, resource.size())))
+            except OSError as e:
+                RobustLogger().warning(f"Could not fingerprint resources in '{container}': {e}")
+                computed = [(resource, None) for resource in missing]
+
+        with self._lock:
+            for resource, fingerprint in computed:
+                if fingerprint is not None:
+                    entries[(resource.offset(), resource.size())] = fingerprint
+        return results + computed
+
+    @staticmethod
+    def _fingerprint_stream(f, size: int) -> Fingerprint | None:
+        hasher = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+        remaining: int = size
+        while remaining > 0:
+            chunk: bytes = f.read(min(_READ_CHUNK, remaining))
+            if not chunk:
+                return None
+            hasher.update(chunk)
+            remaining -= len(chunk)
+        return Fingerprint(size, hasher.digest())
+
+    @staticmethod
+    def _fingerprint_data(resource: FileResource) -> Fingerprint | None:
+        try:
+            return fingerprint_bytes(resource.data())
+        except (OSError, ValueError):
+            return None
+
+    def resources(
+        self,
+        resources: Iterable[FileResource],
+        *,
+        max_workers: int | None = None,
+    ) -> dict[FileResource, Fingerprint]:
+        """Fingerprint resources, hashing each container in parallel.
+
+        Args:
+            resources: The resources to fingerprint
+            max_workers: Number of worker threads (default: CPU count + 4, capped at 32)
+
+        Returns:
+            Fingerprint of every resource that could be read
+        """
+        by_container: dict[str, list[FileResource]] = {}
+        for resource in resources:
+            by_container.setdefault(str(resource.filepath()), []).append(resource)
+
+        results: dict[FileResource, Fingerprint] = {}
+        workers: int = max(1, min(max_workers or _default_workers(), len(by_container)))
+        if workers == 1:
+            batches = [self._fingerprint_container(container, items) for container, items in by_container.items()]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batches = list(executor.map(self._fingerprint_container, by_container.keys(), by_container.values()))
+        for batch in batches:
+            results.update((resource, fingerprint) for resource, fingerprint in batch if fingerprint is not None)
+        return results
+
+    def file(self, path: Path) -> Fingerprint | None:
+        """Fingerprint a whole file, or None if it cannot be read."""
+        try:
+            stat: os.stat_result = os.stat(path)  # noqa: PTH116
+        except OSError:
+            return None
+        entries = self._entries_for(str(path), stat)
+        key = (0, stat.st_size)
+        fingerprint = entries.get(key)
+        if fingerprint is not None:
+            return fingerprint
+        try:
+            with open(path, "rb") as f:  # noqa: PTH123
+                fingerprint = self._fingerprint_stream(f, stat.st_size)
+        except OSError:
+            return None
+        if fingerprint is not None:
+            with self._lock:
+                entries[key] = fingerprint
+        return fingerprint
+
+    def files(
+        self,
+        paths: Iterable[Path],
+        *,
+        max_workers: int | None = None,
+    ) -> dict[Path, Fingerprint]:
+        """Fingerprint whole files, hashing them in parallel.
+
+        Args:
+            paths: The files to fingerprint
+            max_workers: Number of worker threads (default: CPU count + 4, capped at 32)
+
+        Returns:
+            Fingerprint of every file that could be read
+        """
+        path_list: list[Path] = list(paths)
+        workers: int = max(1, min(max_workers or _default_workers(), len(path_list)))
+        if workers == 1:
+            fingerprints = [self.file(path) for path in path_list]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fingerprints = list(executor.map(self.file, path_list))
+        return {path: fingerprint for path, fingerprint in zip(path_list, fingerprints) if fingerprint is not None}
+
+
+_FINGERPRINT_CACHE = FingerprintCache()
+
+
+def get_fingerprint_cache() -> FingerprintCache:
+    """Returns the process-wide fingerprint cache shared by the diff engine."""
+    return _FINGERPRINT_CACHE
+
+
+def clear_fingerprint_cache() -> None:
+    """Clear the process-wide fingerprint cache to free memory."""
+    _FINGERPRINT_CACHE.clear()
@@ -71,6 +71,7 @@ class ResolvedResource:
     location_type: str | None  # Type of location (Override, Modules, Chitin, etc.)
     filepath: Path | None  # Full path to the file containing this resource
     all_locations: dict[str, list[Path]] | None = None  # All locations where resource was found
+    file_resource: FileResource | None = None  # The FileResource chosen by the resolution order
 
 
 def get_location_display_name(location_type: str | None) -> str:
@@ -89,6 +90,7 @@ def resolve_resource_in_installation(
     log_func: Callable | None = None,
     verbose: bool = True,  # noqa: ARG001
     resource_index: dict[ResourceIdentifier, list[FileResource]] | None = None,
+    load_data: bool = True,
 ) -> ResolvedResource:
     """Resolve a resource in an installation using game priority order.
 
@@ -106,6 +108,7 @@ def resolve_resource_in_installation(
         log_func: Optional logging function
         verbose: If True, log detailed search process (ignored - logging now handled externally)
         resource_index: Optional pre-built index for O(1) lookups (massive performance gain)
+        load_data: If False, only pick the winning location and leave data as None
 
     Returns:
         ResolvedResource with data and source location info
@@ -235,10 +238,10 @@ def resolve_resource_in_installation(
         # Read the data from the chosen location (O(1) lookup with stored instances)
         data: bytes | None = None
         file_resource = resource_instances.get(chosen_filepath)
-        if file_resource is not None:
+        if file_resource is not None and load_data:
             data = file_resource.data()
 
-        if data is None:
+        if data is None and load_data:
             return ResolvedResource(
                 identifier=identifier,
                 data=None,
@@ -290,6 +293,7 @@ def resolve_resource_in_installation(
             location_type=location_type,
             filepath=chosen_filepath,
             all_locations=all_locs,
+            file_resource=file_resource,
         )
 
     except Exception as e:  # noqa: BLE001
@@ -535,6 +539,41 @@ def determine_tslpatcher_destination(
     return "Override"
 
 
+def _find_identical_resources(
+    install1: Installation,
+    install2: Installation,
+    identifiers: list[ResourceIdentifier],
+    index1: dict[ResourceIdentifier, list[FileResource]],
+    index2: dict[ResourceIdentifier, list[FileResource]],
+    *,
+    log_func: Callable[[str], None],
+) -> set[ResourceIdentifier]:
+    """Return the identifiers whose resolved resources are byte-identical in both installations.
+
+    Only the location selection of the resolution order runs here; the chosen resources are then
+    fingerprinted in parallel through the shared, mtime-invalidated fingerprint cache.
+    """
+    from pykotor.tslpatcher.diff.fingerprint import get_fingerprint_cache  # noqa: PLC0415
+
+    chosen: dict[ResourceIdentifier, tuple[FileResource, FileResource]] = {}
+    for identifier in identifiers:
+        resolved1 = resolve_resource_in_installation(install1, identifier, resource_index=index1, load_data=False)
+        resolved2 = resolve_resource_in_installation(install2, identifier, resource_index=index2, load_data=False)
+        if resolved1.file_resource is not None and resolved2.file_resource is not None:
+            chosen[identifier] = (resolved1.file_resource, resolved2.file_resource)
+
+    fingerprints = get_fingerprint_cache().resources(resource for pair in chosen.values() for resource in pair)
+    identical: set[ResourceIdentifier] = set()
+    for identifier, (resource1, resource2) in chosen.items():
+        fingerprint1 = fingerprints.get(resource1)
+        if fingerprint1 is not None and fingerprint1 == fingerprints.get(resource2):
+            identical.add(identifier)
+
+    log_func(f"Fingerprinted {len(chosen)} resources present in both installations: {len(identical)} byte-identical, {len(chosen) - len(identical)} to compare")
+    log_func("")
+    return identical
+
+
 def diff_installations_with_resolution(  # noqa: PLR0913, PLR0915, C901
     files_and_folders_and_installations: list[Path | Installation],
     *,
@@ -878,6 +917,17 @@ def _diff_installations_with_resolution_impl(  # noqa: PLR0913, PLR0915, C901
     # Cache for resolved resources to avoid re-resolution
     resolution_cache: dict[tuple[int, ResourceIdentifier], ResolvedResource] = {}
 
+    # Fingerprint the winning resource of each side in parallel (one container per task) before reading
+    # or parsing anything: resources whose size and digest match are byte-identical and need no diff.
+    identical_identifiers: set[ResourceIdentifier] = _find_identical_resources(
+        install1,
+        install2,
+        all_identifiers,
+        index1,
+        index2,
+        log_func=log_func,
+    )
+
     # Compare each resource
     is_same_result: bool | None = True
     processed_count: int = 0
@@ -896,6 +946,10 @@ def _diff_installations_with_resolution_impl(  # noqa: PLR0913, PLR0915, C901
         if processed_count % 100 == 0:
             log_func(f"Progress: {processed_count}/{len(all_identifiers)} resources processed...")
 
+        if identifier in identical_identifiers:
+            identical_count += 1
+            continue
+
         # Resolve in both installations using indices (O(1) lookups instead of O(n) scans)
         # Use cache to avoid re-resolving the same resource
         cache_key1 = (0, identifier)
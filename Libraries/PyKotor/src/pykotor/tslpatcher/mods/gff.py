@@ -356,7 +356,7 @@ class AddStructToListGFF(ModifyGFF):
             logger.add_error(f"Failed to add a new struct to list '{self.path}' in [{self.identifier}]. Reason: Expected GFFStruct but got '{new_struct}' ({new_struct!r}) of type {type(new_struct).__name__} Skipping...")
             return
 
-        list_container._structs.append(new_struct)  # noqa: SLF001
+        list_container.append(new_struct)
         if self.index_to_token is not None:
             length = str(len(list_container) - 1)
             logger.add_verbose(f"Set 2DAMEMORY{self.index_to_token}={length}")
@@ -2554,27 +2554,11 @@ class IncrementalTSLPatchDataWriter:
             twoda_filename: Name of the 2DA file (e.g., "soundset.2da")
             targets: List of 2DA row targets to find references for
         """
-        from pykotor.tools.reference_cache import TwoDAMemoryReferenceCache  # noqa: PLC0415
+        from pykotor.tools.reference_cache import build_twoda_memory_cache  # noqa: PLC0415
 
-        # Build or use cache for batch processing
-        cache = TwoDAMemoryReferenceCache(source.game())
-
-        # Scan all GFF resources to build cache (only once)
+        # Scan all GFF resources once to build the cache for the batch
         self.log_func(f"Building 2DA reference cache for {twoda_filename}...")
-        resource_count = 0
-        for resource in source:
-            try:
-                restype = resource.restype()
-                if restype not in GFFContent.get_restypes():
-                    continue
-
-                data = resource.data()
-                cache.scan_resource(resource, data)
-                resource_count += 1
-            except Exception:  # noqa: BLE001, S110, S112
-                continue
-
-        self.log_func(f"Cache built: scanned {resource_count} GFF resources")
+        cache = build_twoda_memory_cache(source, logger=self.log_func)
 
         # Get the 2DA identifier for field mapping
         twoda_resname: str = twoda_filename.lower().replace(".2da", "")
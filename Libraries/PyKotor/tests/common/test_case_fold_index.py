@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+
+from unittest import TestCase
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.tools.path import CaseAwarePath, CaseFoldDirectoryIndex
+
+
+class TestCaseFoldDirectoryIndex(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_lookup_is_case_insensitive(self):
+        (self.root / "Override").mkdir()
+        (self.root / "Dialog.TLK").write_bytes(b"")
+        index = CaseFoldDirectoryIndex()
+
+        self.assertEqual(index.entries(str(self.root), "override"), (("Override", True),))
+        self.assertEqual(index.entries(str(self.root), "DIALOG.tlk"), (("Dialog.TLK", False),))
+        self.assertEqual(index.entries(str(self.root), "missing"), ())
+        self.assertIsNone(index.entries(str(self.root / "nope"), "x"))
+
+    def test_listing_refreshes_when_directory_changes(self):
+        index = CaseFoldDirectoryIndex(racy_window=0)
+        self.assertEqual(index.entries(str(self.root), "new.txt"), ())
+
+        (self.root / "NEW.txt").write_bytes(b"")
+        stat = self.root.stat()
+        os.utime(self.root, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(index.entries(str(self.root), "new.txt"), (("NEW.txt", False),))
+
+    def test_racy_listing_rescans_on_miss(self):
+        index = CaseFoldDirectoryIndex(racy_window=3600)
+        self.assertEqual(index.entries(str(self.root), "late.txt"), ())
+
+        stat = self.root.stat()
+        (self.root / "Late.txt").write_bytes(b"")
+        os.utime(self.root, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # Simulate a coarse mtime that did not tick.
+        self.assertEqual(index.entries(str(self.root), "late.txt"), (("Late.txt", False),))
+
+    def test_resize_evicts_oldest(self):
+        index = CaseFoldDirectoryIndex()
+        for name in ("a", "b", "c"):
+            (self.root / name).mkdir()
+            index.entries(str(self.root / name), "x")
+        index.resize(2)
+        self.assertEqual(len(index), 2)
+
+
+@unittest.skipIf(os.name == "nt", "CaseAwarePath is the native WindowsPath on Windows.")
+class TestCaseAwarePathBatchResolution(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.temp_dir.name)
+        self.override = self.root / "Override"
+        self.override.mkdir()
+        for name in ("P_Bastila.UTC", "n_darthmalak.utc", "Lights.2DA"):
+            (self.override / name).write_bytes(b"")
+        CaseAwarePath.clear_dir_cache()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_batch_matches_single_resolution(self):
+        queries = [
+            self.root / "override" / "p_bastila.utc",
+            self.root / "OVERRIDE" / "N_DARTHMALAK.UTC",
+            self.root / "Override" / "lights.2da",
+            self.root / "override" / "missing.utc",
+            self.root / "nothere" / "file.txt",
+        ]
+        batch = CaseAwarePath.get_case_sensitive_paths(queries)
+        single = [CaseAwarePath.get_case_sensitive_path(query) for query in queries]
+
+        self.assertEqual([str(pathlib.Path(p)) for p in batch], [str(pathlib.Path(p)) for p in single])
+        self.assertEqual(pathlib.Path(batch[0]), self.override / "P_Bastila.UTC")
+        self.assertEqual(pathlib.Path(batch[1]), self.override / "n_darthmalak.utc")
+        self.assertEqual(pathlib.Path(batch[3]), self.override / "missing.utc")
+
+    def test_directory_preferred_for_intermediate_components(self):
+        (self.root / "modules").write_bytes(b"")
+        (self.root / "Modules").mkdir()
+        (self.root / "Modules" / "danm13.rim").write_bytes(b"")
+
+        resolved = CaseAwarePath.get_case_sensitive_paths([self.root / "MODULES" / "DANM13.RIM"])[0]
+        self.assertEqual(pathlib.Path(resolved), self.root / "Modules" / "danm13.rim")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import TestCase
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.common.misc import ResRef
+from pykotor.extract.capsule import Capsule
+from pykotor.resource.formats.erf import ERF, ERFType, write_erf
+from pykotor.resource.formats.gff import GFF, GFFContent, GFFList, bytes_gff, read_gff
+from pykotor.resource.formats.rim import RIM, write_rim
+from pykotor.resource.type import ResourceType
+from pykotor.tools.patching import PatchingConfig, batch_patch_capsules, patch_folder
+
+MDL_PATH = THIS_SCRIPT_PATH.parents[1] / "test_files" / "mdl" / "c_dewback.mdl"
+
+
+def _dialog(sound: str) -> bytes:
+    gff = GFF(GFFContent.DLG)
+    gff.root.set_uint8("Skippable", 1)
+    entries: GFFList = gff.root.set_list("EntryList", GFFList())
+    entries.add(0).set_resref("Sound", ResRef(sound))
+    return bytes_gff(gff)
+
+
+def _contents(path: Path) -> dict[str, bytes]:
+    return {f"{resource.resname()}.{resource.restype().extension}": resource.data() for resource in Capsule(path)}
+
+
+def _skippable(data: bytes) -> int:
+    return read_gff(data).root.get_uint8("Skippable")
+
+
+class TestBatchPatching(TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source = self.temp_dir / "source"
+        self.source.mkdir()
+        self.creature = bytes_gff(GFF(GFFContent.UTC))
+        self.model = MDL_PATH.read_bytes()
+
+        rim = RIM()
+        for index in range(70):  # more than one worker task
+            rim.set_data(f"alien{index}", ResourceType.DLG, _dialog("n_genwook_grts1"))
+        rim.set_data("human", ResourceType.DLG, _dialog("m01aa_human01"))
+        rim.set_data("guard", ResourceType.UTC, self.creature)
+        rim.set_data("m01aa_01a", ResourceType.MDL, self.model)
+        write_rim(rim, self.source / "m01aa.rim")
+
+        erf = ERF(ERFType.MOD)
+        erf.set_data("wookiee", ResourceType.DLG, _dialog("n_genwook_coms1"))
+        write_erf(erf, self.source / "m02aa.mod")
+
+        unchanged = RIM()
+        unchanged.set_data("guard", ResourceType.UTC, self.creature)
+        write_rim(unchanged, self.source / "m03aa.rim")
+
+        (self.source / "loose.dlg").write_bytes(_dialog("n_genwook_coms2"))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _patch_copy(self, name: str, max_workers: int) -> tuple[Path, list[str]]:
+        folder = self.temp_dir / name
+        shutil.copytree(self.source, folder)
+        messages: list[str] = []
+        config = PatchingConfig()
+        config.set_unskippable = True
+        config.max_workers = max_workers
+        config.log_callback = messages.append
+        patch_folder(folder, config)
+        return folder, messages
+
+    def test_set_unskippable_in_capsules_and_loose_files(self):
+        folder, messages = self._patch_copy("serial", 1)
+
+        contents = _contents(folder / "m01aa.rim")
+        self.assertEqual(len(contents), 73)
+        self.assertTrue(all(_skippable(contents[f"alien{index}.dlg"]) == 0 for index in range(70)))
+        self.assertEqual(contents["human.dlg"], _contents(self.source / "m01aa.rim")["human.dlg"])
+        self.assertEqual(contents["guard.utc"], self.creature)
+        self.assertEqual(contents["m01aa_01a.mdl"], self.model)
+        self.assertEqual(_skippable(_contents(folder / "m02aa.mod")["wookiee.dlg"]), 0)
+        self.assertEqual(_skippable((folder / "loose.dlg").read_bytes()), 0)
+        self.assertEqual((folder / "m03aa.rim").read_bytes(), (self.source / "m03aa.rim").read_bytes())
+
+        self.assertIn("Patched 70 of 73 resources in 'm01aa.rim'", " ".join(messages))
+        self.assertTrue(any(message.startswith("Patched '") and message.endswith(" ms") for message in messages))
+
+    def test_parallel_patching_matches_serial(self):
+        serial, _ = self._patch_copy("serial", 1)
+        parallel, _ = self._patch_copy("parallel", 4)
+        for name in ("m01aa.rim", "m02aa.mod", "m03aa.rim", "loose.dlg"):
+            self.assertEqual((parallel / name).read_bytes(), (serial / name).read_bytes(), name)
+
+    def test_unchanged_capsules_are_not_rewritten(self):
+        folder = self.temp_dir / "unchanged"
+        shutil.copytree(self.source, folder)
+        config = PatchingConfig()
+        config.set_unskippable = True
+        config.max_workers = 1
+        written = batch_patch_capsules({folder / "m03aa.rim": folder / "m03aa.rim", folder / "m02aa.mod": folder / "m02aa_patched.mod"}, config)
+        self.assertEqual(written, [folder / "m02aa_patched.mod"])
+        self.assertEqual((folder / "m02aa.mod").read_bytes(), (self.source / "m02aa.mod").read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
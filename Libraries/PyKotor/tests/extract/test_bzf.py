@@ -0,0 +1,147 @@
+"""Tests for the random-access BZF archive reader and its decompressed payload cache."""
+
+from __future__ import annotations
+
+import lzma
+import os
+import struct
+
+from pathlib import Path
+
+import pytest
+
+from pykotor.extract.bzf import BZFArchive, BZFFile, BZFPayloadCache, clear_bzf_cache, get_bzf_archive, get_bzf_cache, prefetch_bzf_resources
+from pykotor.extract.file import FileResource
+from pykotor.resource.type import ResourceType
+
+_LZMA_RAW_FILTERS = [{"id": lzma.FILTER_LZMA1}]
+
+
+def _write_bzf(path: Path, payloads: list[bytes], signature: bytes = b"BIFF") -> list[int]:
+    """Write a BZF with one variable resource per payload and return the payload offsets."""
+    compressed = [lzma.compress(payload, format=lzma.FORMAT_RAW, filters=_LZMA_RAW_FILTERS) for payload in payloads]
+    offsets: list[int] = []
+    offset = 20 + 16 * len(payloads)
+    for blob in compressed:
+        offsets.append(offset)
+        offset += len(blob) + (-len(blob) % 4)
+
+    data = bytearray(signature + b"V1  ")
+    data += struct.pack("<III", len(payloads), 0, 20)
+    for i, (payload, res_offset) in enumerate(zip(payloads, offsets)):
+        data += struct.pack("<IIII", i, res_offset, len(payload), ResourceType.TXT.type_id)
+    for blob in compressed:
+        data += blob + b"\0" * (-len(blob) % 4)
+    path.write_bytes(bytes(data))
+    return offsets
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_bzf_cache()
+    yield
+    clear_bzf_cache()
+
+
+def test_archive_reads_each_payload(tmp_path: Path):
+    payloads = [b"Hello World 1", b"second payload" * 50, b"x"]
+    bzf_path = tmp_path / "data.bzf"
+    offsets = _write_bzf(bzf_path, payloads)
+
+    archive = BZFArchive(bzf_path)
+    assert len(archive) == 3
+    for i, payload in enumerate(payloads):
+        assert archive.read(i) == payload
+        assert archive.read_at(offsets[i]) == payload
+
+
+def test_archive_accepts_bzf_signature(tmp_path: Path):
+    bzf_path = tmp_path / "data.bzf"
+    _write_bzf(bzf_path, [b"abc"], signature=b"BZF ")
+    assert BZFArchive(bzf_path).read(0) == b"abc"
+
+
+def test_repeated_reads_hit_cache(tmp_path: Path):
+    bzf_path = tmp_path / "data.bzf"
+    _write_bzf(bzf_path, [b"payload"])
+    archive = get_bzf_archive(bzf_path)
+
+    archive.read(0)
+    archive.read(0)
+    stats = get_bzf_cache().stats()
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+
+
+def test_read_many_preserves_order(tmp_path: Path):
+    payloads = [f"resource {i}".encode() * (i + 1) for i in range(20)]
+    bzf_path = tmp_path / "data.bzf"
+    _write_bzf(bzf_path, payloads)
+    archive = get_bzf_archive(bzf_path)
+
+    order = [5, 0, 19, 7, 7, 3]
+    assert list(archive.read_many(order)) == [(i, payloads[i]) for i in order]
+
+
+def test_cache_evicts_least_recently_used():
+    cache = BZFPayloadCache(max_bytes=10)
+    cache.put(("a", 0, 0, 0), b"12345")
+    cache.put(("a", 0, 0, 1), b"12345")
+    assert cache.get(("a", 0, 0, 0)) == b"12345"
+    cache.put(("a", 0, 0, 2), b"12345")
+
+    assert ("a", 0, 0, 1) not in cache
+    assert ("a", 0, 0, 0) in cache
+    assert ("a", 0, 0, 2) in cache
+    cache.put(("a", 0, 0, 3), b"x" * 11)
+    assert ("a", 0, 0, 3) not in cache
+
+
+def test_archive_reloads_when_file_changes(tmp_path: Path):
+    bzf_path = tmp_path / "data.bzf"
+    _write_bzf(bzf_path, [b"old"])
+    assert get_bzf_archive(bzf_path).read(0) == b"old"
+
+    _write_bzf(bzf_path, [b"new data"])
+    stat = bzf_path.stat()
+    os.utime(bzf_path, (stat.st_atime, stat.st_mtime + 5))
+    assert get_bzf_archive(bzf_path).read(0) == b"new data"
+
+
+def test_rewritten_file_with_the_same_mtime_is_not_served_from_cache(tmp_path: Path):
+    bzf_path = tmp_path / "data.bzf"
+    _write_bzf(bzf_path, [b"old"])
+    mtime_ns = bzf_path.stat().st_mtime_ns
+    with bzf_path.open("rb") as bzf:
+        assert BZFFile(bzf).get_resource(0) == b"old"
+    assert get_bzf_archive(bzf_path).read(0) == b"old"
+
+    _write_bzf(bzf_path, [b"new data"])
+    os.utime(bzf_path, ns=(mtime_ns, mtime_ns))
+    with bzf_path.open("rb") as bzf:
+        assert BZFFile(bzf).get_resource(0) == b"new data"
+    assert get_bzf_archive(bzf_path).read(0) == b"new data"
+
+
+def test_file_resource_data_decompresses(tmp_path: Path):
+    payloads = [b"first", b"second resource"]
+    bzf_path = tmp_path / "data.bzf"
+    offsets = _write_bzf(bzf_path, payloads)
+    resources = [
+        FileResource(f"res{i}", ResourceType.TXT, len(payload), offsets[i], bzf_path)
+        for i, payload in enumerate(payloads)
+    ]
+
+    prefetch_bzf_resources(resources)
+    assert all(resource.inside_bzf for resource in resources)
+    assert [resource.data() for resource in resources] == payloads
+    assert resources[1].exists()
+    assert resources[1].path_ident() == bzf_path / "res1.txt"
+    assert not FileResource("missing", ResourceType.TXT, 1, offsets[1] + 1, bzf_path).exists()
+
+
+def test_out_of_range_index(tmp_path: Path):
+    bzf_path = tmp_path / "data.bzf"
+    _write_bzf(bzf_path, [b"only"])
+    with pytest.raises(IndexError):
+        get_bzf_archive(bzf_path).read(1)
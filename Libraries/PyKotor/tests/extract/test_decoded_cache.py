@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+import unittest
+
+from pathlib import Path
+from unittest import TestCase
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.extract.decoded_cache import DecodedResourceCache, ResourceLocation, acquire_tpc, tpc_nbytes
+from pykotor.resource.formats.tpc import TPC, TPCTextureFormat, bytes_tpc
+
+
+def _texture(size: int) -> bytes:
+    tpc = TPC()
+    tpc.set_single(bytearray(bytes((x + y) % 256 for y in range(size) for x in range(size) for _ in range(4))), TPCTextureFormat.RGBA, size, size)
+    return bytes_tpc(tpc)
+
+
+class TestDecodedResourceCache(TestCase):
+    def test_leased_entries_are_never_evicted(self):
+        cache = DecodedResourceCache(max_bytes=100)
+        first = cache.acquire("first", lambda: "a", lambda _value: 60)
+        second = cache.acquire("second", lambda: "b", lambda _value: 60)
+        self.assertEqual((cache.total_bytes, cache.leased_bytes, cache.evictions), (120, 120, 0))
+
+        # Releasing makes an entry evictable; the least recently used unleased entry goes first
+        second.release()
+        second.release()  # a lease is only released once
+        self.assertEqual((len(cache), cache.total_bytes, cache.evictions), (1, 60, 1))
+        self.assertNotIn("second", cache)
+
+        again = cache.acquire("first", lambda: self.fail("cached value was decoded again"), lambda _value: 60)
+        self.assertIs(again.value, first.value)
+        first.release()
+        again.release()
+        self.assertEqual((cache.hits, cache.misses, cache.leased_bytes), (1, 2, 0))
+        self.assertEqual(cache.get("first"), "a")
+
+    def test_failed_decodes_are_not_cached(self):
+        cache = DecodedResourceCache()
+
+        def fail() -> str:
+            raise ValueError("corrupt")
+
+        with self.assertRaises(ValueError):
+            cache.acquire("key", fail, len)
+        self.assertEqual(len(cache), 0)
+        with cache.acquire("key", lambda: "value", len) as lease:
+            self.assertEqual(lease.value, "value")
+        self.assertEqual(cache.total_bytes, 5)
+
+    def test_dropped_entries_are_disposed_of_once_unleased(self):
+        cache = DecodedResourceCache(max_bytes=100)
+        disposed: list[str] = []
+        self.assertIsNone(cache.lease("block"))
+        first = cache.acquire("block", lambda: "a", lambda _value: 60, dispose=disposed.append)
+        second = cache.lease("block")
+        assert second is not None
+        self.assertIs(second.value, first.value)
+
+        # Invalidated while leased: disposed of when the last lease goes, not before
+        cache.invalidate("block")
+        first.release()
+        self.assertEqual((disposed, cache.total_bytes), ([], 0))
+        second.release()
+        self.assertEqual(disposed, ["a"])
+
+        cache.acquire("old", lambda: "b", lambda _value: 60, dispose=disposed.append).release()
+        cache.acquire("new", lambda: "c", lambda _value: 60, dispose=disposed.append).release()
+        self.assertEqual((disposed, cache.evictions), (["a", "b"], 1))
+        cache.clear()
+        self.assertEqual(disposed, ["a", "b", "c"])
+
+    def test_concurrent_requests_decode_once(self):
+        cache = DecodedResourceCache()
+        started, finish = threading.Event(), threading.Event()
+        calls: list[int] = []
+
+        def slow_decode() -> bytes:
+            calls.append(1)
+            started.set()
+            finish.wait(5)
+            return b"pixels"
+
+        results: list[bytes] = []
+        owner = threading.Thread(target=lambda: results.append(cache.acquire("tex", slow_decode, len).value))
+        owner.start()
+        started.wait(5)
+        waiter = threading.Thread(target=lambda: results.append(cache.acquire("tex", slow_decode, len).value))
+        waiter.start()
+        finish.set()
+        owner.join(5)
+        waiter.join(5)
+        self.assertEqual((results, len(calls), cache.hits, cache.misses), ([b"pixels", b"pixels"], 1, 1, 1))
+
+    def test_textures_are_keyed_by_location_and_modification_time(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            data = _texture(16)
+            path = Path(tmp, "textures.erf")
+            path.write_bytes(b"\0" * 32 + data)
+            location = ResourceLocation(str(path), 32, len(data))
+            cache = DecodedResourceCache()
+
+            with acquire_tpc(location, cache) as first, acquire_tpc(location, cache) as second:
+                self.assertIs(first.value, second.value)
+                self.assertEqual(first.value.get(0, 0).width, 16)
+                self.assertEqual(cache.total_bytes, tpc_nbytes(first.value))
+            self.assertEqual((cache.misses, cache.hits), (1, 1))
+
+            # Rewriting the file changes its modification time, so the texture is decoded again
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            with acquire_tpc(location, cache) as reloaded:
+                self.assertIsNot(reloaded.value, first.value)
+            self.assertEqual(cache.misses, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+from pathlib import Path
+from unittest import TestCase
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.extract.installation import Installation, SearchLocation
+from pykotor.extract.installation_watcher import InstallationWatcher, WatchedLocation
+from pykotor.resource.formats.rim import RIM, write_rim
+from pykotor.resource.type import ResourceType
+
+sys.path.insert(0, str(THIS_SCRIPT_PATH.parents[1] / "cli"))
+from test_diff_comprehensive import DiffTestDataHelper
+
+
+class _WatcherTestsMixin:
+    backend: str = "poll"
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.install_path = self.temp_dir / "install"
+        DiffTestDataHelper.create_installation(
+            self.install_path,
+            with_override=True,
+            override_resources={"p_bastila.utc": b"OLD"},
+            modules_resources={"m01aa.rim": {"m01aa.are": b"ARE_DATA"}},
+        )
+        self.installation = Installation(self.install_path)
+        self.installation.load_override()
+        self.installation.load_modules()
+        self.override = Path(str(self.installation.override_path()))
+        self.modules = Path(str(self.installation.module_path()))
+        self.watcher = InstallationWatcher(self.installation, backend=self.backend)  # type: ignore[arg-type]
+
+    def tearDown(self):
+        self.watcher.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _touch_later(self, path: Path):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_override_file_modified(self):
+        self.assertEqual(self.installation.resource("p_bastila", ResourceType.UTC, [SearchLocation.OVERRIDE]).data, b"OLD")
+
+        target = self.override / "p_bastila.utc"
+        target.write_bytes(b"NEW CONTENT")
+        self._touch_later(target)
+        changes = self.watcher.poll(0.5)
+
+        self.assertEqual([(c.kind, c.location) for c in changes], [("modified", WatchedLocation.OVERRIDE)])
+        self.assertEqual(self.installation.resource("p_bastila", ResourceType.UTC, [SearchLocation.OVERRIDE]).data, b"NEW CONTENT")
+
+    def test_override_file_created_and_deleted(self):
+        new_file = self.override / "n_carth.utc"
+        new_file.write_bytes(b"CARTH")
+        self.watcher.poll(0.5)
+        self.assertEqual(self.installation.resource("n_carth", ResourceType.UTC, [SearchLocation.OVERRIDE]).data, b"CARTH")
+
+        new_file.unlink()
+        changes = self.watcher.poll(0.5)
+        self.assertEqual([c.kind for c in changes], ["deleted"])
+        self.assertIsNone(self.installation.resource("n_carth", ResourceType.UTC, [SearchLocation.OVERRIDE]))
+
+    def test_module_created_and_deleted(self):
+        rim = RIM()
+        rim.set_data("m02aa", ResourceType.ARE, b"NEW_MODULE")
+        write_rim(rim, self.modules / "m02aa.rim")
+        self.watcher.poll(0.5)
+        self.assertIn("m02aa.rim", self.installation.modules_list())
+        self.assertEqual(self.installation.resource("m02aa", ResourceType.ARE, [SearchLocation.MODULES]).data, b"NEW_MODULE")
+
+        (self.modules / "m02aa.rim").unlink()
+        self.watcher.poll(0.5)
+        self.assertNotIn("m02aa.rim", self.installation.modules_list())
+        self.assertIn("m01aa.rim", self.installation.modules_list())
+
+    def test_on_change_callback(self):
+        received = []
+        self.watcher.on_change = received.append
+        (self.override / "new.2da").write_bytes(b"2DA V2.b")
+        self.watcher.poll(0.5)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0][0].path.name, "new.2da")
+
+    def test_restart_after_stop(self):
+        self.watcher.poll_interval = 0.05
+        self.watcher.start()
+        self.watcher.stop()
+
+        target = self.override / "p_bastila.utc"
+        target.write_bytes(b"WHILE STOPPED")
+        self._touch_later(target)
+        received = []
+        self.watcher.on_change = received.append
+        self.watcher.start()
+        with self.watcher.lock:
+            self.assertEqual(self.installation.resource("p_bastila", ResourceType.UTC, [SearchLocation.OVERRIDE]).data, b"WHILE STOPPED")
+
+        (self.override / "new.2da").write_bytes(b"2DA V2.b")
+        deadline = time.monotonic() + 5
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.watcher.stop()
+        self.assertEqual({change.path.name for batch in received for change in batch}, {"new.2da"})
+
+
+class TestInstallationWatcherPolling(_WatcherTestsMixin, TestCase):
+    backend = "poll"
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux-only")
+class TestInstallationWatcherInotify(_WatcherTestsMixin, TestCase):
+    backend = "inotify"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import TestCase, mock
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.common import module_closure
+from pykotor.common.module import Module
+from pykotor.common.module_closure import ModuleClosureCache, configure_module_closure_cache, get_module_closure_cache
+from pykotor.extract.installation import Installation
+from pykotor.resource.formats.erf import ERF, ERFType, write_erf
+from pykotor.resource.formats.gff import GFF, GFFContent, bytes_gff
+from pykotor.resource.formats.lyt.lyt_auto import bytes_lyt
+from pykotor.resource.formats.lyt.lyt_data import LYT, LYTRoom
+from pykotor.resource.generics.git import GIT, bytes_git
+from pykotor.resource.type import ResourceType
+from utility.common.geometry import Vector3
+
+sys.path.insert(0, str(THIS_SCRIPT_PATH.parents[1] / "cli"))
+from test_diff_comprehensive import DiffTestDataHelper
+
+MDL_PATH = THIS_SCRIPT_PATH.parents[1] / "test_files" / "mdl" / "c_dewback.mdl"
+
+
+def _lyt(*models: str) -> bytes:
+    lyt = LYT()
+    lyt.rooms.extend(LYTRoom(model, Vector3.from_null()) for model in models)
+    return bytes_lyt(lyt)
+
+
+def _snapshot(module: Module) -> dict[str, tuple[list[str], str | None]]:
+    return {
+        str(ident): ([str(location) for location in resource.locations()], str(resource.active()) if resource.isActive() else None)
+        for ident, resource in module.resources.items()
+    }
+
+
+class TestModuleClosureCache(TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.install_path = self.temp_dir / "install"
+        model_data = MDL_PATH.read_bytes()
+        DiffTestDataHelper.create_installation(
+            self.install_path,
+            override_resources={"c_dewback01.tpc": b"TPC_DATA"},
+            modules_resources={
+                "m01aa.rim": {
+                    "m01aa.are": bytes_gff(GFF(GFFContent.ARE)),
+                    "m01aa.git": bytes_git(GIT()),
+                    "m01aa.lyt": _lyt("m01aa_01a", "m01aa_01b"),
+                    "module.ifo": bytes_gff(GFF(GFFContent.IFO)),
+                },
+                "m01aa_s.rim": {"m01aa_01a.mdl": model_data, "m01aa_01b.mdl": model_data},
+            },
+        )
+        (self.install_path / "swkotor.exe").touch()
+        self.installation = Installation(self.install_path)
+        self.cache_path = self.temp_dir / "cache" / "modules.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _touch_later(self, path: Path):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_cold_load_resolves_model_textures(self):
+        cache = ModuleClosureCache()
+        module = Module("m01aa", self.installation, use_dot_mod=False, closure_cache=cache)
+        texture = module.resource("c_dewback01", ResourceType.TPC)
+        assert texture is not None
+        self.assertEqual(texture.active(), self.install_path / "Override" / "c_dewback01.tpc")
+        self.assertEqual(module.resource("m01aa_01b", ResourceType.MDL).active(), self.install_path / "Modules" / "m01aa_s.rim")  # pyright: ignore[reportOptionalMemberAccess]
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        models = module.models()
+        serial = module._read_model_textures(models[:1])
+        parallel = module._read_model_textures(models)
+        self.assertEqual(parallel[0], serial[0])
+        self.assertEqual([textures for _data, textures, _lightmaps in parallel], [{"c_dewback01"}, {"c_dewback01"}])
+
+    def test_warm_load_matches_cold_load_across_sessions(self):
+        cold_cache = ModuleClosureCache(self.cache_path)
+        cold = Module("m01aa", self.installation, use_dot_mod=False, closure_cache=cold_cache)
+        self.assertFalse(self.cache_path.exists())
+        cold_cache.close()
+        self.assertTrue(self.cache_path.is_file())
+
+        cache = ModuleClosureCache(self.cache_path)
+        warm = Module("m01aa", self.installation, use_dot_mod=False, closure_cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+        self.assertEqual(_snapshot(warm), _snapshot(cold))
+        self.assertEqual(list(warm.resources), list(cold.resources))
+        self.assertEqual(warm.module_id(), cold.module_id())
+        assert warm.git() is not None
+        self.assertIsInstance(warm.git().resource(), GIT)  # pyright: ignore[reportOptionalMemberAccess]
+
+        other = Module("m01aa", self.installation, use_dot_mod=False, load_textures=False, closure_cache=cache)
+        self.assertEqual(cache.misses, 1)
+        self.assertIsNone(other.resource("c_dewback01", ResourceType.TPC))
+
+    def test_changed_dependencies_invalidate(self):
+        cache = ModuleClosureCache()
+        Module("m01aa", self.installation, use_dot_mod=False, closure_cache=cache)
+
+        self._touch_later(self.install_path / "Modules" / "m01aa_s.rim")
+        Module("m01aa", self.installation, use_dot_mod=False, closure_cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        Module("m01aa", self.installation, use_dot_mod=False, closure_cache=cache)
+        self.assertEqual(cache.hits, 1)
+
+        override_model = self.install_path / "Override" / "m01aa_01a.mdl"
+        shutil.copyfile(MDL_PATH, override_model)
+        self._touch_later(override_model.parent)
+        self.installation.load_override(".")
+        module = Module("m01aa", self.installation, use_dot_mod=False, closure_cache=cache)
+        self.assertEqual(cache.misses, 3)
+        self.assertIn(override_model, module.resource("m01aa_01a", ResourceType.MDL).locations())  # pyright: ignore[reportOptionalMemberAccess]
+
+    def test_new_module_capsule_invalidates(self):
+        (self.install_path / "swkotor.exe").unlink()
+        (self.install_path / "swkotor2.exe").touch()
+        installation = Installation(self.install_path)
+        cache = ModuleClosureCache()
+        Module("m01aa", installation, use_dot_mod=False, closure_cache=cache)
+        Module("m01aa", installation, use_dot_mod=False, closure_cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        dlg_erf = ERF(ERFType.ERF)
+        dlg_erf.set_data("m01aa_guard", ResourceType.DLG, bytes_gff(GFF(GFFContent.DLG)))
+        dlg_path = self.install_path / "Modules" / "m01aa_dlg.erf"
+        write_erf(dlg_erf, dlg_path)
+        module = Module("m01aa", installation, use_dot_mod=False, closure_cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertEqual(module.resource("m01aa_guard", ResourceType.DLG).active(), dlg_path)  # pyright: ignore[reportOptionalMemberAccess]
+
+    def test_flush_writes_only_changes(self):
+        cache = ModuleClosureCache(self.cache_path)
+        cache.flush()
+        self.assertFalse(self.cache_path.exists())
+
+        Module("m01aa", self.installation, use_dot_mod=False, closure_cache=cache)
+        Module("m01aa", self.installation, use_dot_mod=False, load_textures=False, closure_cache=cache)
+        cache.flush()
+        self.assertEqual(len(ModuleClosureCache(self.cache_path)), 2)
+
+        self.cache_path.unlink()
+        Module("m01aa", self.installation, use_dot_mod=False, closure_cache=cache)
+        cache.flush()
+        self.assertFalse(self.cache_path.exists())  # a warm load leaves nothing to write
+
+    def test_process_wide_cache_is_in_memory_by_default(self):
+        with mock.patch.dict(os.environ, {"HOME": str(self.temp_dir), "XDG_CACHE_HOME": str(self.temp_dir / "xdg")}):
+            os.environ.pop("PYKOTOR_CACHE_DIR", None)
+            with mock.patch.object(module_closure, "_MODULE_CLOSURE_CACHE", None):
+                Module("m01aa", self.installation, use_dot_mod=False)
+                get_module_closure_cache().close()
+                self.assertEqual(get_module_closure_cache().misses, 1)
+        self.assertEqual(list(self.temp_dir.glob("**/module_closures.json")), [])
+
+    def test_process_wide_cache_is_persisted_when_configured(self):
+        with mock.patch.object(module_closure, "_MODULE_CLOSURE_CACHE", None):
+            configure_module_closure_cache(self.cache_path)
+            cold = Module("m01aa", self.installation, use_dot_mod=False)
+            configure_module_closure_cache(None)
+        self.assertTrue(self.cache_path.is_file())
+
+        cache_dir = self.temp_dir / "user_cache"
+        with mock.patch.dict(os.environ, {"PYKOTOR_CACHE_DIR": str(cache_dir)}):
+            with mock.patch.object(module_closure, "_MODULE_CLOSURE_CACHE", None):
+                Module("m01aa", self.installation, use_dot_mod=False)
+                self.assertEqual(get_module_closure_cache().misses, 1)
+                module_closure._flush_module_closure_cache()  # noqa: SLF001
+            self.assertTrue((cache_dir / "module_closures.json").is_file())
+
+            # A later session restores the module from disk
+            with mock.patch.object(module_closure, "_MODULE_CLOSURE_CACHE", None):
+                warm = Module("m01aa", self.installation, use_dot_mod=False)
+                self.assertEqual((get_module_closure_cache().hits, get_module_closure_cache().misses), (1, 0))
+        self.assertEqual(_snapshot(warm), _snapshot(cold))
+
+
+if __name__ == "__main__":
+    unittest.main()
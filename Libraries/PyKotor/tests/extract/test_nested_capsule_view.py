@@ -0,0 +1,152 @@
+"""Tests for the memory-mapped nested capsule view and the incremental SAVEGAME.sav writer."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pykotor.extract.file import ResourceIdentifier
+from pykotor.extract.nested_capsule import NestedCapsuleView, write_nested_capsule
+from pykotor.extract.savedata import SaveNestedCapsule
+from pykotor.resource.formats.erf import ERF, ERFType, bytes_erf, read_erf, write_erf
+from pykotor.resource.type import ResourceType
+
+MODULE_A = ResourceIdentifier("danm13", ResourceType.SAV)
+MODULE_B = ResourceIdentifier("danm14aa", ResourceType.SAV)
+NOTES = ResourceIdentifier("notes", ResourceType.TXT)
+
+
+def _module(payload: bytes) -> bytes:
+    erf = ERF(ERFType.MOD)
+    erf.set_data("module", ResourceType.IFO, payload)
+    erf.set_data("area", ResourceType.ARE, payload * 3)
+    return bytes_erf(erf, ResourceType.SAV)
+
+
+def _write_savegame(path: Path) -> Path:
+    erf = ERF(ERFType.MOD, is_save=True)
+    erf.set_data(MODULE_A.resname, MODULE_A.restype, _module(b"A" * 64))
+    erf.set_data(MODULE_B.resname, MODULE_B.restype, _module(b"B" * 64))
+    erf.set_data(NOTES.resname, NOTES.restype, b"0123456789")
+    write_erf(erf, path, ResourceType.SAV)
+    return path
+
+
+def _contents(path: Path) -> dict[ResourceIdentifier, bytes]:
+    return {resource.identifier(): resource.data for resource in read_erf(path)}
+
+
+def test_view_resolves_nested_windows(tmp_path: Path):
+    path = _write_savegame(tmp_path / "SAVEGAME.sav")
+    with NestedCapsuleView(path) as view:
+        assert [entry.identifier for entry in view] == [MODULE_A, MODULE_B, NOTES]
+        assert view.read(NOTES) == b"0123456789"
+
+        inner = view.open_nested(MODULE_B)
+        assert inner.read(ResourceIdentifier("module", ResourceType.IFO)) == b"B" * 64
+
+        entry = view.resolve(["danm14aa.sav", "area.are"])
+        assert view.read_entry(entry) == b"B" * 192
+        assert path.read_bytes()[entry.offset:entry.offset + entry.size] == b"B" * 192
+
+        with pytest.raises(FileNotFoundError):
+            view.resolve(["danm14aa.sav", "missing.git"])
+
+
+def test_small_change_is_appended_without_touching_live_payloads(tmp_path: Path):
+    path = _write_savegame(tmp_path / "SAVEGAME.sav")
+    before = path.read_bytes()
+    with NestedCapsuleView(path) as view:
+        module_a, notes = view.entry(MODULE_A), view.entry(NOTES)
+        assert module_a is not None and notes is not None
+
+    assert write_nested_capsule(path, {NOTES: b"short"}) is True
+    after = path.read_bytes()
+    assert after[len(before):] == b"short"
+    for entry in (module_a, notes):
+        assert after[entry.offset:entry.offset + entry.size] == before[entry.offset:entry.offset + entry.size]
+    assert _contents(path)[NOTES] == b"short"
+
+
+def test_failed_patch_leaves_the_save_intact(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = _write_savegame(tmp_path / "SAVEGAME.sav")
+    before = path.read_bytes()
+
+    def fail_sync(fd: int):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("pykotor.extract.nested_capsule.os.fsync", fail_sync)
+    with pytest.raises(OSError, match="disk full"):
+        write_nested_capsule(path, {NOTES: b"short", MODULE_A: _module(b"C" * 64)})
+    assert path.read_bytes() == before
+
+
+def test_growing_change_is_appended(tmp_path: Path):
+    path = _write_savegame(tmp_path / "SAVEGAME.sav")
+    size_before = path.stat().st_size
+    new_module = _module(b"C" * 200)
+
+    assert write_nested_capsule(path, {MODULE_A: new_module}, max_waste_ratio=0.9) is True
+    assert path.stat().st_size == size_before + len(new_module)
+    contents = _contents(path)
+    assert contents[MODULE_A] == new_module
+    assert contents[MODULE_B] == _module(b"B" * 64)
+
+
+def test_added_and_removed_resources_rewrite_compactly(tmp_path: Path):
+    path = _write_savegame(tmp_path / "SAVEGAME.sav")
+    extra = ResourceIdentifier("inventory", ResourceType.RES)
+
+    assert write_nested_capsule(path, {NOTES: None, extra: b"items"}) is False
+    with NestedCapsuleView(path) as view:
+        assert [entry.identifier for entry in view] == [MODULE_A, MODULE_B, extra]
+        assert view.read(extra) == b"items"
+        assert view.signature == b"MOD "
+
+
+def test_waste_threshold_triggers_compaction(tmp_path: Path):
+    path = _write_savegame(tmp_path / "SAVEGAME.sav")
+    assert write_nested_capsule(path, {MODULE_A: _module(b"C" * 400)}, max_waste_ratio=0.0) is False
+    assert _contents(path)[MODULE_A] == _module(b"C" * 400)
+
+
+def test_save_nested_capsule_only_writes_changed_resources(tmp_path: Path):
+    _write_savegame(tmp_path / "SAVEGAME.sav")
+    sav = SaveNestedCapsule(tmp_path)
+    sav.load_cached()
+    before = (tmp_path / "SAVEGAME.sav").read_bytes()
+
+    assert sav.write() is True
+    assert (tmp_path / "SAVEGAME.sav").read_bytes() == before
+
+    sav.other_resources[NOTES] = b"edited"
+    assert sav.write() is True
+    after = (tmp_path / "SAVEGAME.sav").read_bytes()
+    assert after[len(before):] == b"edited"
+    assert _contents(tmp_path / "SAVEGAME.sav")[NOTES] == b"edited"
+
+    sav.cached_modules[MODULE_B].set_data("module", ResourceType.IFO, b"changed")
+    sav.write()
+    reloaded = SaveNestedCapsule(tmp_path)
+    reloaded.load_cached()
+    assert reloaded.cached_modules[MODULE_B].get("module", ResourceType.IFO) == b"changed"
+    assert reloaded.cached_modules[MODULE_A].get("module", ResourceType.IFO) == b"A" * 64
+
+
+def test_save_nested_capsule_keeps_undecoded_payloads_mapped(tmp_path: Path):
+    _write_savegame(tmp_path / "SAVEGAME.sav")
+    sav = SaveNestedCapsule(tmp_path)
+    sav.load_cached()
+    assert isinstance(sav.other_resources[NOTES], memoryview)
+    assert sav.other_resources[NOTES] == b"0123456789"
+
+    # A rewrite replaces the file; untouched payloads follow it to the new mapping
+    sav.remove_resource(MODULE_A)
+    assert sav.write() is False
+    assert sav.other_resources[NOTES] == b"0123456789"
+    assert _contents(tmp_path / "SAVEGAME.sav")[NOTES] == b"0123456789"
+
+    sav.close()
+    assert sav.other_resources[NOTES] == b"0123456789"
+    assert isinstance(sav.resource_data[NOTES], bytes)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import TestCase, mock
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.common.language import LocalizedString
+from pykotor.common.misc import ResRef
+from pykotor.extract.installation import Installation
+from pykotor.extract.installation_watcher import InstallationWatcher
+from pykotor.resource.formats.gff import GFF, GFFContent, GFFFieldType, GFFList, bytes_gff
+from pykotor.resource.formats.ncs import NCS, NCSInstructionType, bytes_ncs
+from pykotor.resource.formats.rim import RIM, write_rim
+from pykotor.resource.formats.twoda import TwoDA, bytes_2da
+from pykotor.resource.type import ResourceType
+from pykotor.tools.reference_finder import (
+    find_conversation_references,
+    find_resref_references,
+    find_script_references,
+    find_tag_references,
+)
+from pykotor.tools.reference_index import ReferenceIndex
+
+sys.path.insert(0, str(THIS_SCRIPT_PATH.parents[1] / "cli"))
+from test_diff_comprehensive import DiffTestDataHelper
+
+
+def _utc(tag: str, heartbeat: str, conversation: str) -> bytes:
+    gff = GFF(GFFContent.UTC)
+    gff.root.set_string("Tag", tag)
+    gff.root.set_resref("ScriptHeartbeat", ResRef(heartbeat))
+    gff.root.set_resref("Conversation", ResRef(conversation))
+    gff.root.set_locstring("FirstName", LocalizedString(42))
+    items = gff.root.set_list("ItemList", GFFList())
+    items.add(0).set_resref("InventoryRes", ResRef("g_w_lghtsbr01"))
+    return bytes_gff(gff)
+
+
+def _ncs(*strings: str) -> bytes:
+    ncs = NCS()
+    for string in strings:
+        ncs.add(NCSInstructionType.CONSTS, [string])
+        ncs.add(NCSInstructionType.MOVSP, [-4])
+    ncs.add(NCSInstructionType.RETN)
+    return bytes_ncs(ncs)
+
+
+def _twoda() -> bytes:
+    twoda = TwoDA(["label", "script"])
+    twoda.add_row("0", {"label": "bastila", "script": "k_ai_master"})
+    twoda.add_row("1", {"label": "carth", "script": "****"})
+    return bytes_2da(twoda)
+
+
+class TestReferenceIndex(TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.install_path = self.temp_dir / "install"
+        DiffTestDataHelper.create_installation(
+            self.install_path,
+            override_resources={
+                "p_bastila.utc": _utc("Bastila", "k_ai_master", "bastila_dlg"),
+                "k_act_spawn.ncs": _ncs("k_ai_master", "c_bantha"),
+                "party.2da": _twoda(),
+            },
+            modules_resources={"m01aa.rim": {"n_carth.utc": _utc("carth_tag", "k_def_heartbeat", "carth")}},
+        )
+        (self.install_path / "swkotor.exe").touch()
+        self.installation = Installation(self.install_path)
+        self.index = ReferenceIndex(self.temp_dir / "cache" / "refs.sqlite")
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _touch_later(self, path: Path):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_lookup_covers_gff_ncs_2da_and_strrefs(self):
+        self.index.update(self.installation)
+
+        found = {(ref.file_resource.filename(), ref.field_path) for ref in self.index.lookup("K_AI_MASTER")}
+        self.assertEqual(
+            found,
+            {("p_bastila.utc", "ScriptHeartbeat"), ("k_act_spawn.ncs", "(NCS bytecode)"), ("party.2da", "[0].script")},
+        )
+        self.assertEqual([ref.field_path for ref in self.index.lookup("g_w_lghtsbr01")], ["ItemList[0].InventoryRes"] * 2)
+        [strref] = {ref.field_type for ref in self.index.lookup("42")}
+        self.assertIs(strref, GFFFieldType.LocalizedString)
+        self.assertEqual(self.index.lookup("****"), [])
+        self.assertEqual(self.index.lookup("k_ai_master", case_sensitive=True)[0].value, "k_ai_master")
+        self.assertEqual({ref.value for ref in self.index.lookup("heartbeat", partial=True)}, {"k_def_heartbeat"})
+
+    def test_indexed_search_matches_scan(self):
+        queries = [
+            lambda **kw: find_script_references(self.installation, "k_ai_master", **kw),
+            lambda **kw: find_script_references(self.installation, "k_ai", partial_match=True, **kw),
+            lambda **kw: find_tag_references(self.installation, "bastila", **kw),
+            lambda **kw: find_conversation_references(self.installation, "carth", file_pattern="*.utc", **kw),
+            lambda **kw: find_resref_references(self.installation, "G_W_LGHTSBR01", case_sensitive=True, **kw),
+        ]
+        for query in queries:
+            scanned = sorted((r.file_resource.filename(), r.field_path, str(r.matched_value), r.byte_offset) for r in query())
+            indexed = sorted((r.file_resource.filename(), r.field_path, str(r.matched_value), r.byte_offset) for r in query(index=self.index))
+            self.assertEqual(indexed, scanned)
+
+        ncs_hits = [r for r in find_script_references(self.installation, "c_bantha", index=self.index) if r.file_type == "NCS"]
+        self.assertEqual(len(ncs_hits), 1)
+
+    def test_update_only_reindexes_changed_containers(self):
+        first = self.index.update(self.installation)
+        self.assertGreater(first, 0)
+        self.assertEqual(self.index.update(self.installation), 0)
+
+        module = self.install_path / "Modules" / "m01aa.rim"
+        rim = RIM()
+        rim.set_data("n_carth", ResourceType.UTC, _utc("carth_tag", "k_new_heartbeat", "carth"))
+        write_rim(rim, module)
+        self._touch_later(module)
+        self.installation.reload_module("m01aa.rim")
+
+        self.assertEqual(self.index.update(self.installation), 1)
+        self.assertEqual(self.index.lookup("k_def_heartbeat"), [])
+        self.assertEqual(len(self.index.lookup("k_new_heartbeat")), 1)
+
+    def test_index_persists_between_sessions(self):
+        self.index.update(self.installation)
+        self.index.close()
+
+        self.index = ReferenceIndex(self.temp_dir / "cache" / "refs.sqlite")
+        self.assertEqual(self.index.update(self.installation), 0)
+        self.assertEqual(len(self.index.lookup("bastila_dlg")), 1)
+
+    def test_removed_containers_are_dropped(self):
+        self.index.update(self.installation)
+        (self.install_path / "Override" / "party.2da").unlink()
+        self.installation.load_override(".")
+
+        self.index.update(self.installation)
+        self.assertNotIn("party.2da", {path.name for path in self.index.containers()})
+        self.assertEqual({ref.file_resource.filename() for ref in self.index.lookup("k_ai_master")}, {"p_bastila.utc", "k_act_spawn.ncs"})
+
+    def test_searches_refresh_the_index_once_until_marked_stale(self):
+        watcher = InstallationWatcher(self.installation, backend="poll", on_change=lambda _changes: self.index.mark_stale())
+        with mock.patch.object(self.index, "update", wraps=self.index.update) as update:
+            for _ in range(3):
+                find_script_references(self.installation, "k_ai_master", index=self.index)
+            self.assertEqual(update.call_count, 1)
+
+            bastila = self.install_path / "Override" / "p_bastila.utc"
+            bastila.write_bytes(_utc("Bastila", "k_new_master", "bastila_dlg"))
+            self._touch_later(bastila)
+            self.assertEqual(find_script_references(self.installation, "k_new_master", index=self.index), [])
+            self.assertEqual(update.call_count, 1)
+
+            self.assertTrue(watcher.poll())
+            found = find_script_references(self.installation, "k_new_master", index=self.index)
+            self.assertEqual([r.file_resource.filename() for r in found], ["p_bastila.utc"])
+            self.assertEqual(update.call_count, 2)
+        watcher.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import TestCase
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.extract.file import FileResource
+from pykotor.extract.installation import Installation
+from pykotor.extract.resource_index import ResourceSearchIndex
+from pykotor.resource.formats.rim import RIM, write_rim
+from pykotor.resource.type import ResourceType
+
+sys.path.insert(0, str(THIS_SCRIPT_PATH.parents[1] / "cli"))
+from test_diff_comprehensive import DiffTestDataHelper
+
+
+def _names(page_items: list[tuple[str, FileResource]]) -> list[str]:
+    return [f"{partition}/{resource.filename()}" for partition, resource in page_items]
+
+
+class TestResourceSearchIndex(TestCase):
+    def setUp(self):
+        self.index = ResourceSearchIndex()
+        capsule = Path("m01aa.rim")
+        self.index.set_partition(
+            "module:m01aa.rim",
+            [
+                FileResource("k_hb_guard", ResourceType.NCS, 10, 0, capsule),
+                FileResource("guard", ResourceType.UTC, 10, 10, capsule),
+                FileResource("guard", ResourceType.DLG, 10, 20, capsule),
+                FileResource("m01aa_01a", ResourceType.MDL, 10, 30, capsule),
+                FileResource("KA", ResourceType.NCS, 10, 40, capsule),
+            ],
+        )
+        self.index.set_partition("override", [FileResource("Guard", ResourceType.UTC, 10, 0, Path("Override/guard.utc"))])
+
+    def test_query_modes(self):
+        self.assertEqual(
+            _names(self.index.search("uard").items),
+            ["module:m01aa.rim/guard.dlg", "module:m01aa.rim/guard.utc", "override/guard.utc", "module:m01aa.rim/k_hb_guard.ncs"],
+        )
+        self.assertEqual(_names(self.index.search("K", mode="prefix").items), ["module:m01aa.rim/k_hb_guard.ncs", "module:m01aa.rim/ka.ncs"])
+        self.assertEqual(_names(self.index.search("a", restypes={ResourceType.NCS}).items), ["module:m01aa.rim/k_hb_guard.ncs", "module:m01aa.rim/ka.ncs"])
+        self.assertEqual(_names(self.index.search("m0?aa_*a", mode="glob").items), ["module:m01aa.rim/m01aa_01a.mdl"])
+        self.assertEqual(_names(self.index.search("*guard", mode="glob", partitions={"override"}).items), ["override/guard.utc"])
+        self.assertEqual(self.index.search("zzz").items, [])
+        self.assertEqual(self.index.count("guard"), 4)
+        with self.assertRaises(ValueError):
+            self.index.search("guard", mode="regex")  # type: ignore[arg-type]
+
+    def test_pages(self):
+        first = self.index.search("", limit=4)
+        self.assertEqual(first.next_offset, 4)
+        second = self.index.search("", offset=first.next_offset, limit=4)
+        self.assertFalse(second.truncated)
+        self.assertEqual(first.items + second.items, self.index.search("").items)
+        self.assertEqual(len(first.items + second.items), len(self.index))
+
+    def test_incremental_updates(self):
+        guard = FileResource("Guard", ResourceType.UTC, 10, 0, Path("Override/guard.utc"))
+        self.assertEqual(self.index.partitions_of(guard), ["override"])
+        self.index.discard("override", guard)
+        self.assertEqual(self.index.partitions_of(guard), [])
+        self.assertEqual(self.index.count("guard"), 3)
+        self.index.remove_partition("module:m01aa.rim")
+        self.assertEqual((len(self.index), self.index.count("")), (0, 0))
+        self.index.add("override", guard)
+        self.index.add("override", guard)  # replaces the equal resource
+        self.assertEqual(_names(self.index.search("gua", mode="prefix").items), ["override/guard.utc"])
+
+
+class TestInstallationSearchIndex(TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.install_path = self.temp_dir / "install"
+        DiffTestDataHelper.create_installation(
+            self.install_path,
+            override_resources={"guard.utc": b"UTC V3.2", "k_hb_guard.ncs": b"NCS V1.0"},
+            modules_resources={"m01aa.rim": {"guard.dlg": b"DLG V3.2", "m01aa_guard.utc": b"UTC V3.2"}},
+        )
+        (self.install_path / "swkotor.exe").touch()
+        self.installation = Installation(self.install_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _matches(self, query: str) -> list[str]:
+        return _names(self.installation.search_index().search(query, partitions={"override", "module:m01aa.rim"}).items)
+
+    def test_index_follows_reloads(self):
+        index = self.installation.search_index()
+        self.assertIs(self.installation.search_index(), index)
+        self.assertEqual(self._matches("guard"), ["module:m01aa.rim/guard.dlg", "override/guard.utc", "override/k_hb_guard.ncs", "module:m01aa.rim/m01aa_guard.utc"])
+
+        rim = RIM()
+        rim.set_data("guard", ResourceType.DLG, b"DLG V3.2")
+        rim.set_data("sentry", ResourceType.UTC, b"UTC V3.2")
+        write_rim(rim, self.install_path / "Modules" / "m01aa.rim")
+        self.installation.reload_module("m01aa.rim")
+        (self.install_path / "Override" / "sentry.dlg").write_bytes(b"DLG V3.2")
+        self.installation.reload_override_file(self.install_path / "Override" / "sentry.dlg")
+        self.installation.remove_override_file(self.install_path / "Override" / "k_hb_guard.ncs")
+
+        self.assertIs(self.installation.search_index(), index)
+        self.assertEqual(self._matches("guard"), ["module:m01aa.rim/guard.dlg", "override/guard.utc"])
+        self.assertEqual(self._matches("sentr"), ["override/sentry.dlg", "module:m01aa.rim/sentry.utc"])
+
+        self.installation.remove_module("m01aa.rim")
+        self.assertEqual(self._matches("sentr"), ["override/sentry.dlg"])
+
+
+if __name__ == "__main__":
+    unittest.main()
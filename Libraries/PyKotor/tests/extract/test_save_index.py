@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import TestCase
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.extract.installation import Installation
+from pykotor.extract.savedata import SaveFolderEntry, SaveIndex, SaveInfo, clear_save_index
+from pykotor.resource.formats.gff import GFF, GFFContent, GFFList, write_gff
+from pykotor.resource.formats.gff.io_gff import GFFBinaryReader
+
+sys.path.insert(0, str(THIS_SCRIPT_PATH.parents[1] / "cli"))
+from test_diff_comprehensive import DiffTestDataHelper
+
+
+def _write_save(folder: Path, name: str, area: str, time_played: int, *, screenshot: bool = True):
+    folder.mkdir(parents=True, exist_ok=True)
+    info = SaveInfo(folder)
+    info.savegame_name = name
+    info.area_name = area
+    info.last_module = "danm13"
+    info.time_played = time_played
+    info.timestamp = 133_000_000_000_000_000
+    info.save()
+    if screenshot:
+        # Uncompressed 32-bit TGA header with a 4-byte image ID, followed by a 2x1 image.
+        header = struct.pack("<BBBHHBHHHHBB", 4, 0, 2, 0, 0, 0, 0, 0, 2, 1, 32, 8)
+        (folder / "Screen.tga").write_bytes(header + b"ABCD" + b"\xff" * 8)
+
+
+class TestSaveIndex(TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.saves = self.temp_dir / "saves"
+        _write_save(self.saves / "000001 - Game0", "Before Malak", "Star Forge", 3600)
+        _write_save(self.saves / "000002 - Game1", "Dantooine", "Jedi Enclave", 120, screenshot=False)
+        self.index = SaveIndex()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _bump_mtime(self, path: Path):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_summaries_read_listing_fields(self):
+        summaries = {s.save_path.name: s for s in self.index.summaries(self.saves)}
+
+        first = summaries["000001 - Game0"]
+        self.assertEqual(first.savegame_name, "Before Malak")
+        self.assertEqual(first.area_name, "Star Forge")
+        self.assertEqual(first.last_module, "danm13")
+        self.assertEqual(first.time_played, 3600)
+        self.assertEqual(first.timestamp, 133_000_000_000_000_000)
+        self.assertEqual(first.screenshot_offset, 18 + 4)
+        self.assertEqual((first.screenshot_width, first.screenshot_height), (2, 1))
+        self.assertIsNone(summaries["000002 - Game1"].screenshot_path)
+
+    def test_summaries_do_not_require_savegame_sav(self):
+        summary = self.index.summary(self.saves / "000001 - Game0")
+        assert summary is not None
+        entry = summary.open()
+        self.assertIsInstance(entry, SaveFolderEntry)
+        self.assertFalse((self.saves / "000001 - Game0" / "SAVEGAME.sav").exists())
+
+    def test_summary_is_cached_until_savenfo_changes(self):
+        folder = self.saves / "000001 - Game0"
+        first = self.index.summary(folder)
+        self.assertIs(self.index.summary(folder), first)
+
+        _write_save(folder, "Renamed", "Star Forge", 3601)
+        self._bump_mtime(folder / "savenfo.res")
+        refreshed = self.index.summary(folder)
+        assert refreshed is not None
+        self.assertIsNot(refreshed, first)
+        self.assertEqual(refreshed.savegame_name, "Renamed")
+
+    def test_removed_saves_are_dropped(self):
+        self.index.summaries(self.saves)
+        self.assertEqual(len(self.index), 2)
+        shutil.rmtree(self.saves / "000002 - Game1")
+        self.assertEqual([s.savegame_name for s in self.index.summaries(self.saves)], ["Before Malak"])
+        self.assertEqual(len(self.index), 1)
+
+    def test_root_labels_skip_other_fields(self):
+        gff = GFF(GFFContent.NFO)
+        gff.root.set_string("SAVEGAMENAME", "x")
+        gff.root.set_list("BIGLIST", GFFList()).add(0).set_uint32("Value", 1)
+        path = self.temp_dir / "filtered.res"
+        write_gff(gff, path)
+
+        root = GFFBinaryReader(path, root_labels={"SAVEGAMENAME"}).load().root
+        self.assertEqual(root.get_string("SAVEGAMENAME"), "x")
+        self.assertFalse(root.exists("BIGLIST"))
+
+
+class TestInstallationSaveSummaries(TestCase):
+    def setUp(self):
+        clear_save_index()
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.install_path = self.temp_dir / "install"
+        DiffTestDataHelper.create_installation(self.install_path)
+        (self.install_path / "swkotor.exe").touch()
+        _write_save(self.install_path / "saves" / "000001 - Game0", "Quick Save", "Ebon Hawk", 60)
+        self.installation = Installation(self.install_path)
+
+    def tearDown(self):
+        clear_save_index()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_load_saves_defers_savegame_parsing(self):
+        self.installation.load_saves()
+        self.assertEqual(len(self.installation.save_folders), 1)
+
+    def test_save_summaries(self):
+        summaries = [s for location in self.installation.save_summaries().values() for s in location]
+        self.assertEqual([s.savegame_name for s in summaries], ["Quick Save"])
+
+
+if __name__ == "__main__":
+    unittest.main()
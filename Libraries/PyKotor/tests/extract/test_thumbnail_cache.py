@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+from pathlib import Path
+from unittest import TestCase, mock
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.extract.capsule import Capsule
+from pykotor.extract.file import FileResource
+from pykotor.resource.formats.erf import ERF, ERFType, write_erf
+from pykotor.resource.formats.tpc import TPC, TPCTextureFormat, bytes_tpc
+from pykotor.resource.type import ResourceType
+from pykotor.tools.thumbnails import ThumbnailCache, choose_thumbnail_mipmap, make_thumbnail
+
+
+def _texture(size: int, tpc_format: TPCTextureFormat = TPCTextureFormat.RGBA) -> bytes:
+    tpc = TPC()
+    tpc.set_single(bytearray(bytes((x + y) % 256 for y in range(size) for x in range(size) for _ in range(4))), TPCTextureFormat.RGBA, size, size)
+    tpc.convert(tpc_format)
+    return bytes_tpc(tpc)
+
+
+class TestThumbnailCache(TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.texture_path = self.temp_dir / "tex.tpc"
+        self.texture_path.write_bytes(_texture(128))
+        self.resource = FileResource("tex", ResourceType.TPC, self.texture_path.stat().st_size, 0, self.texture_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_thumbnails_use_the_smallest_adequate_mipmap(self):
+        thumbnail = make_thumbnail(ResourceType.TPC, _texture(64, TPCTextureFormat.DXT1), 16)
+        self.assertEqual((thumbnail.width, thumbnail.height, thumbnail.tpc_format), (16, 16, TPCTextureFormat.RGB))
+        self.assertEqual(len(thumbnail.data), 16 * 16 * 3)
+
+        # 128 -> 64 -> 32 -> ...: 40 is covered by the 64x64 mipmap, which is then downscaled
+        thumbnail = make_thumbnail(ResourceType.TPC, self.texture_path.read_bytes(), 40)
+        self.assertEqual((thumbnail.width, thumbnail.height, thumbnail.tpc_format), (40, 40, TPCTextureFormat.RGBA))
+        self.assertEqual(len(thumbnail.data), 40 * 40 * 4)
+
+        with self.assertRaises(ValueError):
+            choose_thumbnail_mipmap([], 64)
+
+    def test_memory_and_disk_tiers(self):
+        directory = self.temp_dir / "cache"
+        cache = ThumbnailCache(directory)
+        first = cache.get(self.resource, 32)
+        self.assertIs(cache.get(self.resource, 32), first)
+        self.assertEqual((cache.generated, cache.disk_hits, cache.memory_hits), (1, 0, 1))
+        cache.get(self.resource, 16)
+        self.assertEqual(cache.generated, 2)
+        self.assertEqual(len(list(directory.rglob("*.thumb"))), 2)
+
+        # A new session reads the thumbnail back from disk instead of decoding the texture
+        second_session = ThumbnailCache(directory)
+        thumbnail = second_session.get(self.resource, 32)
+        self.assertEqual((second_session.generated, second_session.disk_hits), (0, 1))
+        self.assertEqual(thumbnail, first)
+        self.assertIsNone(ThumbnailCache(directory).cached(self.resource, 32))
+
+        # Rewriting the texture changes the key, so the stale thumbnail is not served
+        self.texture_path.write_bytes(_texture(64))
+        stat = self.texture_path.stat()
+        os.utime(self.texture_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        changed = FileResource("tex", ResourceType.TPC, stat.st_size, 0, self.texture_path)
+        second_session.get(changed, 32)
+        self.assertEqual(second_session.generated, 1)
+
+        # The memory tier is checked against the file's mtime too, even when the resource looks the same
+        os.utime(self.texture_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        second_session.get(changed, 32)
+        self.assertEqual(second_session.generated, 2)
+
+    def test_gui_thread_lookups_do_not_touch_the_filesystem(self):
+        cache = ThumbnailCache(self.temp_dir / "cache")
+        thumbnail = cache.get(self.resource, 32)
+        with mock.patch.object(Path, "stat", side_effect=AssertionError("stat called")):
+            with mock.patch.object(Path, "unlink", side_effect=AssertionError("unlink called")):
+                self.assertIs(cache.cached(self.resource, 32), thumbnail)
+                cache.discard(self.resource, 32)
+                self.assertIsNone(cache.cached(self.resource, 32))
+                cache.put(self.resource, 32, thumbnail)
+                self.assertIs(cache.cached(self.resource, 32), thumbnail)
+
+    def test_disk_cache_prunes_least_recently_used_entries(self):
+        erf = ERF(ERFType.ERF)
+        for index in range(3):
+            erf.set_data(f"tex{index}", ResourceType.TPC, _texture(16 << index))
+        write_erf(erf, self.temp_dir / "textures.erf")
+        resources = list(Capsule(self.temp_dir / "textures.erf"))
+
+        directory = self.temp_dir / "cache"
+        entry_bytes = 16 + 16 * 16 * 4
+        cache = ThumbnailCache(directory, memory_items=0, disk_bytes=entry_bytes * 3 - 100)
+        cache.get(resources[0], 16)
+        cache.get(resources[1], 16)
+        now = time.time()
+        for age, path in zip((200, 100), sorted(directory.rglob("*.thumb"), key=lambda path: path.stat().st_mtime_ns)):
+            os.utime(path, (now - age, now - age))
+        cache.get(resources[0], 16)  # a disk hit marks tex0 as recently used
+        self.assertEqual((cache.generated, cache.disk_hits), (2, 1))
+
+        cache.get(resources[2], 16)
+        self.assertEqual(len(list(directory.rglob("*.thumb"))), 2)
+        self.assertLessEqual(sum(path.stat().st_size for path in directory.rglob("*.thumb")), cache.disk_bytes)
+        cache.get(resources[0], 16)
+        cache.get(resources[1], 16)
+        self.assertEqual((cache.generated, cache.disk_hits), (4, 2))
+
+    def test_memory_lru_and_capsule_resources(self):
+        erf = ERF(ERFType.ERF)
+        for index in range(3):
+            erf.set_data(f"tex{index}", ResourceType.TPC, _texture(16 << index))
+        write_erf(erf, self.temp_dir / "textures.erf")
+        resources = list(Capsule(self.temp_dir / "textures.erf"))
+
+        cache = ThumbnailCache(memory_items=2)
+        sizes = [(thumbnail.width, thumbnail.height) for thumbnail in (cache.get(resource, 32) for resource in resources)]
+        self.assertEqual(sizes, [(16, 16), (32, 32), (32, 32)])
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.cached(resources[0], 32))
+        self.assertIsNotNone(cache.cached(resources[2], 32))
+        cache.discard(resources[2], 32)
+        self.assertIsNone(cache.cached(resources[2], 32))
+
+
+if __name__ == "__main__":
+    unittest.main()
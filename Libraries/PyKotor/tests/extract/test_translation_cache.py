@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import pathlib
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+from pathlib import Path
+from unittest import TestCase, mock
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.common.language import Gender, Language, LocalizedString
+from pykotor.extract.capsule import Capsule
+from pykotor.resource.formats.gff import GFF, GFFContent, bytes_gff, read_gff
+from pykotor.resource.formats.rim import RIM, write_rim
+from pykotor.resource.formats.tlk import TLK
+from pykotor.resource.type import ResourceType
+from pykotor.tools import patching
+from pykotor.tools.patching import PatchingConfig, patch_folder, process_translations
+from pykotor.tools.translation import SCHEMA_VERSION, TranslationCache, TranslationPipeline
+
+
+class StandInTranslator:
+    """Offline translator that tags text with the target language and counts what it was asked to translate."""
+
+    def __init__(self, to_lang: Language):
+        self.to_lang: Language = to_lang
+        self.requests: list[str] = []
+        self._lock = threading.Lock()
+
+    def translate(self, text: str, from_lang: Language) -> str:
+        with self._lock:
+            self.requests.append(text)
+        return f"[{self.to_lang.name}] {text}"
+
+
+class BatchingTranslator(StandInTranslator):
+    def __init__(self, to_lang: Language):
+        super().__init__(to_lang)
+        self.batches: list[int] = []
+
+    def translate_batch(self, texts: list[str], from_lang: Language) -> list[str]:
+        self.batches.append(len(texts))
+        return [self.translate(text, from_lang) for text in texts]
+
+
+def _tlk(lines: list[str]) -> TLK:
+    tlk = TLK()
+    for line in lines:
+        tlk.add(line)
+    return tlk
+
+
+def _item(name: str) -> bytes:
+    gff = GFF(GFFContent.UTI)
+    gff.root.set_locstring("LocalizedName", LocalizedString.from_english(name))
+    gff.root.set_locstring("Description", LocalizedString.from_english("A common item."))
+    return bytes_gff(gff)
+
+
+class TestTranslationCache(TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _config(self, translator: StandInTranslator, cache: TranslationCache | None = None) -> PatchingConfig:
+        config = PatchingConfig()
+        config.translate = True
+        config.translator = translator
+        config.translation_cache = cache
+        return config
+
+    def test_tlk_translates_each_distinct_string_once(self):
+        lines = [f"Line {index % 10}" for index in range(100)] + ["", "42", "Do not translate this text"]
+        tlk = _tlk(lines)
+        translator = StandInTranslator(Language.FRENCH)
+        process_translations(tlk, Language.ENGLISH, self._config(translator))
+
+        self.assertEqual(sorted(translator.requests), sorted(f"Line {index}" for index in range(10)))
+        self.assertEqual([entry.text for _strref, entry in tlk][:100], [f"[FRENCH] {line}" for line in lines[:100]])
+        self.assertEqual([entry.text for _strref, entry in tlk][100:], ["", "42", "Do not translate this text"])
+
+    def test_persistent_cache_only_translates_the_delta(self):
+        cache_path = self.temp_dir / "translations.sqlite"
+        lines = [f"Line {index}" for index in range(200)]
+        first = StandInTranslator(Language.GERMAN)
+        process_translations(_tlk(lines), Language.ENGLISH, self._config(first, TranslationCache(cache_path)))
+        self.assertEqual(len(first.requests), 200)
+
+        lines[5] = "A changed line"
+        lines.append("A new line")
+        second = StandInTranslator(Language.GERMAN)
+        tlk = _tlk(lines)
+        process_translations(tlk, Language.ENGLISH, self._config(second, TranslationCache(cache_path)))
+        self.assertEqual(sorted(second.requests), ["A changed line", "A new line"])
+        self.assertEqual(tlk[5].text, "[GERMAN] A changed line")
+
+        # Translations are keyed by target language too
+        third = StandInTranslator(Language.FRENCH)
+        process_translations(_tlk(lines[:3]), Language.ENGLISH, self._config(third, TranslationCache(cache_path)))
+        self.assertEqual(len(third.requests), 3)
+
+    def test_schema_change_drops_stored_translations(self):
+        cache_path = self.temp_dir / "translations.sqlite"
+        with TranslationCache(cache_path) as cache:
+            cache.put_many({"Hello": "Bonjour"}, Language.ENGLISH, Language.FRENCH)
+        with TranslationCache(cache_path) as cache:
+            self.assertEqual(cache.get_many(["Hello"], Language.ENGLISH, Language.FRENCH), {"Hello": "Bonjour"})
+        with mock.patch.object(TranslationCache, "SCHEMA_VERSION", SCHEMA_VERSION + 1):
+            with TranslationCache(cache_path) as cache:
+                self.assertEqual(len(cache), 0)
+
+    def test_batches_are_sent_to_batching_translators(self):
+        translator = BatchingTranslator(Language.SPANISH)
+        pipeline = TranslationPipeline(translator, batch_size=16)
+        results = pipeline.translate_many([(f"Text {index % 40}", Language.ENGLISH) for index in range(120)])
+        self.assertEqual(translator.batches, [16, 16, 8])
+        self.assertEqual(results[("Text 3", Language.ENGLISH)], "[SPANISH] Text 3")
+        self.assertEqual((pipeline.requested, pipeline.translated, pipeline.cached), (120, 40, 0))
+
+        pipeline.translate("Text 3", Language.ENGLISH)
+        pipeline.translate("Text 3", Language.GERMAN)
+        self.assertEqual((pipeline.cached, pipeline.translated), (1, 41))
+
+    def test_gff_locstrings_are_shared_across_files(self):
+        folder = self.temp_dir / "mod"
+        folder.mkdir()
+        rim = RIM()
+        for index in range(5):
+            rim.set_data(f"item{index}", ResourceType.UTI, _item(f"Item {index % 2}"))
+        write_rim(rim, folder / "items.rim")
+        (folder / "loose.uti").write_bytes(_item("Item 0"))
+
+        translator = StandInTranslator(Language.FRENCH)
+        config = self._config(translator)
+        config.max_workers = 2
+        with mock.patch.object(patching, "read_gff", wraps=read_gff) as parse:
+            patch_folder(folder, config)
+
+        self.assertEqual(sorted(translator.requests), ["A common item.", "Item 0", "Item 1"])
+        self.assertEqual(parse.call_count, 6)  # each GFF is parsed once, for both translating and patching
+        patched = {resource.resname(): read_gff(resource.data()) for resource in Capsule(folder / "items_fr.rim")}
+        self.assertEqual(
+            patched["item3"].root.get_locstring("LocalizedName").get(Language.FRENCH, Gender.MALE),
+            "[FRENCH] Item 1",
+        )
+        loose = read_gff((folder / "loose_fr.uti").read_bytes())
+        self.assertEqual(loose.root.get_locstring("Description").get(Language.FRENCH, Gender.MALE), "[FRENCH] A common item.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import TestCase
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.common.misc import ResRef
+from pykotor.extract.installation import Installation
+from pykotor.resource.formats.gff import GFF, GFFContent, GFFList, bytes_gff
+from pykotor.resource.formats.twoda import TwoDA, bytes_2da
+from pykotor.tools.validation_engine import ValidationCache, ValidationReport, register_checker, run_validation
+
+sys.path.insert(0, str(THIS_SCRIPT_PATH.parents[1] / "cli"))
+from test_diff_comprehensive import DiffTestDataHelper
+
+MDL_PATH = THIS_SCRIPT_PATH.parents[1] / "test_files" / "mdl" / "c_dewback.mdl"
+
+
+def _creature(appearance: int, conversation: str = "", heartbeat: str = "") -> bytes:
+    gff = GFF(GFFContent.UTC)
+    gff.root.set_uint16("Appearance_Type", appearance)
+    gff.root.set_resref("Conversation", ResRef(conversation))
+    gff.root.set_resref("ScriptHeartbeat", ResRef(heartbeat))
+    return bytes_gff(gff)
+
+
+def _dialog(reply_index: int) -> bytes:
+    gff = GFF(GFFContent.DLG)
+    entries: GFFList = gff.root.set_list("EntryList", GFFList())
+    replies: GFFList = gff.root.set_list("ReplyList", GFFList())
+    starting: GFFList = gff.root.set_list("StartingList", GFFList())
+    starting.add(0).set_uint32("Index", 0)
+    entries.add(0).set_list("RepliesList", GFFList()).add(0).set_uint32("Index", reply_index)
+    replies.add(0).set_list("EntriesList", GFFList())
+    return bytes_gff(gff)
+
+
+def _appearance(rows: int) -> bytes:
+    twoda = TwoDA(["label"])
+    for index in range(rows):
+        twoda.add_row(str(index), {"label": f"row{index}"})
+    return bytes_2da(twoda)
+
+
+def _summary(report: ValidationReport) -> list[tuple[str, str, str]]:
+    return [(issue.resource, issue.checker, issue.message) for issue in report.issues]
+
+
+class _RecordingCache(ValidationCache):
+    """Remembers which checkers the last run stored new results for."""
+
+    def __init__(self):
+        super().__init__()
+        self.rerun: set[str] = set()
+
+    def store_results(self, results):
+        self.rerun = {checker for _digest, checker, _context in results}
+        super().store_results(results)
+
+
+class TestValidationEngine(TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.install_path = self.temp_dir / "install"
+        DiffTestDataHelper.create_installation(
+            self.install_path,
+            override_resources={
+                "appearance.2da": _appearance(3),
+                "k_hb.ncs": b"NCS V1.0",
+                "guard.utc": _creature(1, "guard", "k_hb"),
+                "broken.utc": b"UTC V3.2" + b"\xff" * 64,
+            },
+            modules_resources={
+                "m01aa.rim": {
+                    "guard.utc": _creature(1, "guard", "k_hb"),
+                    "stranger.utc": _creature(7, "nobody", "k_missing"),
+                    "guard.dlg": _dialog(0),
+                    "broken.dlg": _dialog(5),
+                    "m01aa_01a.mdl": MDL_PATH.read_bytes(),
+                },
+            },
+        )
+        (self.install_path / "swkotor.exe").touch()
+        self.installation = Installation(self.install_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_checkers_report_issues(self):
+        report = run_validation(self.installation, cache=ValidationCache(), max_workers=1)
+        summary = _summary(report)
+        self.assertIn(("broken.dlg", "dangling_conversation_links", "EntryList[0].RepliesList links to ReplyList[5] but only 1 exist"), summary)
+        self.assertIn(("stranger.utc", "broken_2da_references", "Appearance_Type=7 is out of range for appearance.2da (3 rows)"), summary)
+        self.assertIn(("stranger.utc", "missing_conversations", "Conversation references missing dialog 'nobody'"), summary)
+        self.assertIn(("stranger.utc", "missing_scripts", "ScriptHeartbeat references missing script 'k_missing'"), summary)
+        self.assertIn(("m01aa_01a.mdl", "missing_textures", "Missing texture 'c_dewback01'"), summary)
+        self.assertEqual([checker for resource, checker, _message in summary if resource == "broken.utc"], ["invalid_gff"])
+        self.assertFalse([issue for issue in report.issues if issue.resource in ("guard.utc", "guard.dlg")])
+        self.assertFalse(report.valid)
+        # Both guard.utc copies are byte-identical, so they are validated once
+        self.assertEqual((report.resources, report.validated, report.cached), (7, 6, 0))
+
+        self.assertEqual(_summary(run_validation(self.installation, cache=ValidationCache(), max_workers=2)), summary)
+
+    def test_rerun_only_validates_changed_resources(self):
+        cache_path = self.temp_dir / "cache" / "validation.sqlite"
+        first = run_validation(self.installation, cache=ValidationCache(cache_path), max_workers=1)
+
+        cache = ValidationCache(cache_path)
+        second = run_validation(self.installation, cache=cache, max_workers=1)
+        self.assertEqual((second.validated, second.cached), (0, 6))
+        self.assertEqual(_summary(second), _summary(first))
+
+        broken = self.install_path / "Override" / "broken.utc"
+        broken.write_bytes(_creature(2))
+        stat = broken.stat()
+        os.utime(broken, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.installation.load_override(".")
+        third = run_validation(self.installation, cache=cache, max_workers=1)
+        self.assertEqual((third.validated, third.cached), (1, 5))
+        self.assertNotIn("broken.utc", {issue.resource for issue in third.issues})
+
+    def test_context_changes_revalidate_dependent_checkers(self):
+        cache = _RecordingCache()
+        run_validation(self.installation, cache=cache, max_workers=1)
+        override = self.install_path / "Override"
+
+        # Each change only re-runs the checker reading the changed facts, on the resources it applies to
+        (override / "c_dewback01.tpc").write_bytes(b"TPC_DATA")
+        self.installation.load_override(".")
+        report = run_validation(self.installation, cache=cache, max_workers=1)
+        self.assertEqual((cache.rerun, report.validated), ({"missing_textures"}, 1))
+        self.assertNotIn("missing_textures", {issue.checker for issue in report.issues})
+
+        (override / "k_missing.ncs").write_bytes(b"NCS V1.0")
+        self.installation.load_override(".")
+        report = run_validation(self.installation, cache=cache, max_workers=1)
+        self.assertEqual((cache.rerun, report.validated), ({"missing_scripts"}, 5))
+        self.assertNotIn("missing_scripts", {issue.checker for issue in report.issues})
+
+        # guard.dlg has the same contents, so the new dialog itself is already validated
+        (override / "nobody.dlg").write_bytes(_dialog(0))
+        self.installation.load_override(".")
+        report = run_validation(self.installation, cache=cache, max_workers=1)
+        self.assertEqual((cache.rerun, report.validated), ({"missing_conversations"}, 3))
+        self.assertNotIn("missing_conversations", {issue.checker for issue in report.issues})
+
+        appearance = override / "appearance.2da"
+        appearance.write_bytes(_appearance(8))
+        stat = appearance.stat()
+        os.utime(appearance, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.installation.load_override(".")
+        report = run_validation(self.installation, cache=cache, max_workers=1)
+        self.assertEqual((cache.rerun, report.validated), ({"broken_2da_references"}, 5))
+        # The dialog link and GFF structure checks read nothing from the context and were never re-run
+        self.assertEqual([(issue.resource, issue.checker) for issue in report.issues], [("broken.dlg", "dangling_conversation_links"), ("broken.utc", "invalid_gff")])
+
+        report = run_validation(self.installation, cache=cache, max_workers=1)
+        self.assertEqual((cache.rerun, report.validated), (set(), 0))
+
+    def test_checkers_must_read_known_context_fields(self):
+        with self.assertRaisesRegex(ValueError, "unknown context fields: sounds"):
+            register_checker("missing_sounds", (), reads=("sounds", "textures"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Benchmark: mesh world matrices of a module's objects, batched (as DrawList does) against per-node GLM products.
+
+Not part of the test suite (wall-clock comparisons are too noisy on shared CI machines). Run it directly:
+
+    python Libraries/PyKotor/tests/gl/benchmark_transforms.py [objects] [meshes per object]
+"""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import time
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[2].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[4].joinpath("Libraries", "Utility", "src")
+for path in (PYKOTOR_PATH, UTILITY_PATH):
+    if path.exists() and str(path) not in sys.path:
+        sys.path.append(str(path))
+
+import glm  # noqa: E402
+import numpy as np  # noqa: E402
+
+from pykotor.gl.native.transforms import matrix_array  # noqa: E402
+
+
+def _transforms(count: int, rng: np.random.Generator) -> list:
+    positions = rng.uniform(-200, 200, (count, 3))
+    rotations = rng.uniform(-np.pi, np.pi, (count, 3))
+    return [glm.translate(glm.vec3(*position)) * glm.mat4_cast(glm.quat(glm.vec3(*rotation))) for position, rotation in zip(positions, rotations)]
+
+
+def run(objects: int = 2000, meshes: int = 8, repeats: int = 5) -> tuple[float, float]:
+    """Returns the (per-node, batched) seconds to compute the world matrices of every mesh of `objects` objects."""
+    rng = np.random.default_rng(3)
+    object_transforms = _transforms(objects, rng)
+    node_transforms = _transforms(meshes, rng)
+    stacked_nodes = np.array([matrix_array(node) for node in node_transforms])
+
+    start = time.perf_counter()
+    for obj in object_transforms:
+        for node in node_transforms:
+            matrix_array(obj * node)
+    per_node = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for obj in object_transforms:
+            (stacked_nodes @ matrix_array(obj)).astype(np.float32)
+    batched = (time.perf_counter() - start) / repeats
+    return per_node, batched
+
+
+if __name__ == "__main__":
+    object_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    mesh_count = int(sys.argv[2]) if len(sys.argv) > 2 else 8  # noqa: PLR2004
+    per_node_seconds, batched_seconds = run(object_count, mesh_count)
+    print(f"{object_count} objects x {mesh_count} meshes: per-node {per_node_seconds * 1000:.2f}ms, batched {batched_seconds * 1000:.2f}ms")
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pykotor.extract.decoded_cache import DecodedResourceCache, ResourceLocation
+from pykotor.gl.scene.async_loader import (
+    AsyncResourceLoader,
+    IntermediateMesh,
+    IntermediateModel,
+    IntermediateNode,
+    IntermediateTexture,
+    _share_model,
+    shared_blocks,
+)
+from pykotor.gl.scene.shared_buffers import SharedBlockWriter, SharedBufferHandle, SharedBufferPool, shared_buffer_pool, shared_memory_available
+from pykotor.gl.scene.texture_streaming import mip_chain
+from pykotor.resource.formats.tpc import TPC, TPCTextureFormat, bytes_tpc
+from pykotor.resource.type import ResourceType
+
+pytestmark = pytest.mark.skipif(not shared_memory_available(), reason="multiprocessing.shared_memory is unavailable")
+
+
+def _mesh(vertex_data: bytes, element_data: bytes) -> IntermediateMesh:
+    return IntermediateMesh("tex", "", vertex_data, element_data, 12, 1, 0, -1, -1, -1, True)
+
+
+def test_pool_recycles_blocks_by_size_class():
+    with SharedBufferPool(min_block_size=1024, max_idle_bytes=4096) as pool:
+        first = pool.acquire(100)
+        second = pool.acquire(1500)
+        assert first is not None and second is not None
+        assert (first.capacity, second.capacity) == (1024, 2048)
+        assert (pool.capacity(first.name), pool.capacity("unknown")) == (1024, 0)
+
+        with SharedBlockWriter(first) as writer:
+            handle = writer.write(b"pixels")
+            assert writer.write(b"x" * 2000) == b"x" * 2000  # does not fit: stays in the result as bytes
+        assert isinstance(handle, SharedBufferHandle)
+        view = pool.view(handle)
+        assert bytes(view) == b"pixels"
+        view.release()
+
+        pool.release(first.name)
+        assert pool.idle_bytes == 1024
+        assert pool.acquire(1000) == first
+        assert (pool.created, pool.reused, pool.leased_count) == (2, 1, 2)
+
+        # Releasing beyond max_idle_bytes unlinks instead of keeping the block around
+        big = pool.acquire(4000)
+        assert big is not None
+        for lease in (first, second, big):
+            pool.release(lease.name)
+        assert pool.idle_bytes == 1024 + 2048
+        assert pool.leased_count == 0
+
+
+def test_block_with_live_views_is_unlinked_once_they_are_released():
+    with SharedBufferPool(min_block_size=1024, max_idle_bytes=0) as pool:
+        lease = pool.acquire(100)
+        assert lease is not None
+        with SharedBlockWriter(lease) as writer:
+            handle = writer.write(b"pixels")
+        assert isinstance(handle, SharedBufferHandle)
+        view = pool.view(handle)
+
+        pool.release(lease.name)
+        assert pool.unlinking_count == 1
+        with SharedBlockWriter(lease) as writer:  # the block was not unlinked under the view
+            assert isinstance(writer.write(b"mapped"), SharedBufferHandle)
+        assert bytes(view) == b"mapped"
+
+        view.release()
+        pool.release("unknown")  # any later release unlinks the dropped blocks nothing views anymore
+        assert pool.unlinking_count == 0
+        with pytest.raises(FileNotFoundError), SharedBlockWriter(lease) as writer:
+            writer.write(b"gone")
+
+
+def test_model_buffers_move_to_shared_memory():
+    child = IntermediateNode("child", (0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 1.0), _mesh(b"\x01" * 36, b"\x00\x00\x01\x00\x02\x00"), [], True)
+    root = IntermediateNode("root", (0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 1.0), _mesh(b"\x02" * 24, b"\x00\x00\x01\x00"), [child], True)
+    model = IntermediateModel(root, (0.0, 0.0, 0.0), (1.0, 1.0, 1.0))
+
+    with SharedBufferPool() as pool:
+        lease = pool.acquire(1024)
+        assert lease is not None
+        shared = _share_model(model, lease)
+        assert shared_blocks(shared) == {lease.name}
+        shared_child = shared.root.children[0]
+        assert isinstance(shared_child.mesh.vertex_data, SharedBufferHandle)
+        assert shared_child.mesh.vertex_data.offset % 16 == 0
+        assert bytes(pool.view(shared_child.mesh.vertex_data)) == child.mesh.vertex_data
+        assert bytes(pool.view(shared.root.mesh.element_data)) == root.mesh.element_data
+        assert shared_blocks(model) == set()
+
+
+@pytest.mark.parametrize("shared_buffers", [True, False])
+def test_worker_returns_texture_pixels_through_shared_memory(tmp_path: Path, shared_buffers: bool):  # noqa: FBT001
+    pixels = bytearray(bytes((x * 7 + y) % 256 for y in range(32) for x in range(32) for _ in range(4)))
+    tpc = TPC()
+    tpc.set_single(pixels, TPCTextureFormat.RGBA, 32, 32)
+    texture_path = tmp_path / "tex.tpc"
+    texture_path.write_bytes(bytes_tpc(tpc))
+    location = (str(texture_path), 0, texture_path.stat().st_size, ResourceType.TPC.type_id)
+
+    with AsyncResourceLoader(texture_location_resolver=lambda _name: location, max_workers=1, shared_buffers=shared_buffers, share_decoded=False) as loader:
+        name, intermediate, error = loader.load_texture_async("tex").result(timeout=120)
+        assert (name, error) == ("tex", None)
+        assert intermediate is not None
+        if not shared_buffers:
+            assert loader.buffer_pool is None
+            assert intermediate.rgba_data == bytes(pixels)
+            return
+        assert loader.buffer_pool is not None
+        assert isinstance(intermediate.rgba_data, SharedBufferHandle)
+        view = loader.buffer_pool.view(intermediate.rgba_data)
+        assert bytes(view) == bytes(pixels)
+        view.release()
+        assert loader.buffer_pool.leased_count == 1
+        loader.release_buffers(intermediate)
+        assert loader.buffer_pool.leased_count == 0
+
+        # Failed loads hand their lease straight back to the pool
+        texture_path.unlink()
+        _name, intermediate, error = loader.load_texture_async("tex").result(timeout=120)
+        assert intermediate is None and error
+        assert loader.buffer_pool.leased_count == 0
+
+
+def test_decoded_results_are_leased_to_every_loader_from_shared_memory(tmp_path: Path):
+    """A second loader (another window's scene) gets an already decoded texture from the cache, without a worker or a copy."""
+    tpc = TPC()
+    tpc.set_single(bytearray(b"\x80" * (16 * 16 * 4)), TPCTextureFormat.RGBA, 16, 16)
+    texture_path = tmp_path / "shared.tpc"
+    texture_path.write_bytes(bytes_tpc(tpc))
+    location = (str(texture_path), 0, texture_path.stat().st_size, ResourceType.TPC.type_id)
+    cache = DecodedResourceCache()
+    first = AsyncResourceLoader(texture_location_resolver=lambda _name: location, max_workers=1, cache=cache)
+    second = AsyncResourceLoader(texture_location_resolver=lambda _name: location, max_workers=1, cache=cache)
+    try:
+        _name, decoded, error = first.load_texture_async("shared").result(timeout=120)
+        assert error is None and isinstance(decoded, IntermediateTexture)
+        assert first.buffer_pool is shared_buffer_pool()
+        assert isinstance(decoded.rgba_data, SharedBufferHandle)
+        view = first.buffer_pool.view(decoded.rgba_data)
+        assert bytes(view) == b"\x80" * (16 * 16 * 4)
+        view.release()
+        # The level 0 pixels and the smaller levels decoded with them, leased until the scene is done with them;
+        # the entry pins their whole block, so that is what it is charged for
+        written = sum(level.nbytes for level in mip_chain(16, 16, decoded.mipmap_count))
+        total = first.buffer_pool.capacity(decoded.rgba_data.block)
+        assert total >= written
+        assert (len(cache), cache.total_bytes, cache.leased_bytes) == (1, total, total)
+
+        future = second.load_texture_async("shared")
+        assert future.done()
+        shared = future.result()[1]
+        assert shared is not decoded and shared.rgba_data == decoded.rgba_data
+
+        # The cache keeps the block after both scenes are done, and recycles it once the entry is dropped
+        leased = first.buffer_pool.leased_count
+        first.release_buffers(decoded)
+        second.release_buffers(shared)
+        assert (cache.leased_bytes, first.buffer_pool.leased_count) == (0, leased)
+        cache.clear()
+        assert first.buffer_pool.leased_count == leased - 1
+    finally:
+        first.shutdown()
+        second.shutdown()
+
+
+def test_texture_leases_are_sized_for_the_requested_levels(tmp_path: Path):
+    tpc = TPC()
+    tpc.set_single(bytearray(b"\x40" * (64 * 64 * 4)), TPCTextureFormat.RGBA, 64, 64)
+    texture_path = tmp_path / "levels.tpc"
+    texture_path.write_bytes(bytes_tpc(tpc))
+    location = (str(texture_path), 0, texture_path.stat().st_size, ResourceType.TPC.type_id)
+    resource_location = ResourceLocation(*location[:3])
+
+    with AsyncResourceLoader(texture_location_resolver=lambda _name: location, max_workers=1, share_decoded=False) as loader:
+        # Before the mip chain is known, the estimate shrinks by a quarter per skipped level
+        assert loader._texture_lease_size(resource_location, 2, None) == (location[2] * 8) >> 4  # noqa: SLF001
+
+        _name, decoded, error = loader.load_texture_async("levels").result(timeout=120)
+        assert error is None and decoded is not None and decoded.mipmap_count > 3
+        loader.release_buffers(decoded)
+
+        levels = mip_chain(64, 64, decoded.mipmap_count)
+        assert loader._texture_lease_size(resource_location, 2, None) == sum(level.nbytes for level in levels[2:])  # noqa: SLF001
+        assert loader._texture_lease_size(resource_location, 1, 3) == levels[1].nbytes + levels[2].nbytes  # noqa: SLF001
+
+        _name, streamed, error = loader.load_texture_async("levels", base_level=1, stop_level=3).result(timeout=120)
+        assert error is None and streamed is not None and streamed.base_level == 1
+        assert isinstance(streamed.rgba_data, SharedBufferHandle) and isinstance(streamed.mip_data, SharedBufferHandle)
+        loader.release_buffers(streamed)
@@ -0,0 +1,136 @@
+"""Tests for batched frustum culling (CullingIndex) against the per-object Frustum tests."""
+
+from __future__ import annotations
+
+import random
+import time
+
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from pykotor.gl.glm_compat import vec3, vec4
+from pykotor.gl.scene.culling import CullingIndex
+from pykotor.gl.scene.frustum import CullingStats, Frustum
+
+
+class _Point(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+
+class _SphereObject:
+    """Stands in for a RenderObject: a bounding sphere that reports moves to its listener."""
+
+    def __init__(self, x: float, y: float, z: float, radius: float):
+        self.center = _Point(x, y, z)
+        self.radius = radius
+        self.sphere_calls = 0
+        self._bounds_listener: Callable[[_SphereObject], None] | None = None
+
+    def bounding_sphere(self, _scene, _default_radius: float = 5.0) -> tuple[_Point, float]:
+        self.sphere_calls += 1
+        return self.center, self.radius
+
+    def move(self, x: float, y: float, z: float):
+        self.center = _Point(x, y, z)
+        if self._bounds_listener is not None:
+            self._bounds_listener(self)
+
+
+def _random_frustum(rng: random.Random) -> Frustum:
+    frustum = Frustum()
+    planes = []
+    for _ in range(6):
+        normal = np.array([rng.uniform(-1, 1) for _ in range(3)])
+        normal /= np.linalg.norm(normal)
+        planes.append(vec4(*normal, rng.uniform(20, 120)))
+    frustum.planes = planes
+    return frustum
+
+
+def _objects(rng: random.Random, count: int) -> list[_SphereObject]:
+    return [_SphereObject(rng.uniform(-200, 200), rng.uniform(-200, 200), rng.uniform(-20, 20), rng.uniform(0.5, 8)) for _ in range(count)]
+
+
+def _expected(frustum: Frustum, objects: list[_SphereObject]) -> list[bool]:
+    return [frustum.sphere_in_frustum(vec3(*obj.center), obj.radius) for obj in objects]
+
+
+def test_batch_and_bvh_match_per_object_culling():
+    rng = random.Random(1234)
+    objects = _objects(rng, 3000)
+    brute_force = CullingIndex()
+    hierarchy = CullingIndex(bvh_threshold=1, leaf_size=16)
+    brute_force.sync(objects, None)
+    hierarchy.sync(objects, None)
+    assert not brute_force.uses_bvh and hierarchy.uses_bvh
+
+    for _ in range(10):
+        frustum = _random_frustum(rng)
+        expected = _expected(frustum, objects)
+        assert brute_force.cull(frustum).tolist() == expected
+        assert hierarchy.cull(frustum).tolist() == expected
+        assert hierarchy.is_visible(objects[7]) == expected[7]
+
+        mins, maxs = brute_force.centers - 3.0, brute_force.centers + 3.0
+        expected_boxes = [frustum.aabb_in_frustum(vec3(*low), vec3(*high)) for low, high in zip(mins[:500], maxs[:500])]
+        assert frustum.aabbs_in_frustum(mins[:500], maxs[:500]).tolist() == expected_boxes
+
+
+def test_only_moved_objects_are_refreshed():
+    rng = random.Random(99)
+    objects = _objects(rng, 200)
+    index = CullingIndex(bvh_threshold=1, leaf_size=8)
+    index.sync(objects, None)
+    assert all(obj.sphere_calls == 1 for obj in objects)
+
+    index.sync(objects, None)
+    assert all(obj.sphere_calls == 1 for obj in objects)
+
+    # Moving an object far away culls it; only that object's sphere is recomputed
+    frustum = Frustum()
+    frustum.planes = [vec4(1, 0, 0, 500), vec4(-1, 0, 0, 500), vec4(0, 1, 0, 500), vec4(0, -1, 0, 500), vec4(0, 0, 1, 500), vec4(0, 0, -1, 500)]
+    assert index.cull(frustum).all()
+    objects[3].move(5000, 0, 0)
+    index.sync(objects, None)
+    assert [obj.sphere_calls for obj in objects[2:5]] == [1, 2, 1]
+    assert index.cull(frustum).tolist() == _expected(frustum, objects)
+    assert not index.is_visible(objects[3])
+
+    # A new object list re-indexes everything and detaches the old objects
+    replacement = objects[:100]
+    index.sync(replacement, None)
+    assert len(index) == 100
+    objects[150].move(0, 0, 0)
+    assert objects[150]._bounds_listener is None
+
+
+def test_culling_stats_batches():
+    stats = CullingStats()
+    stats.record_batch(visible=35, culled=65)
+    stats.record_object(visible=True)
+    assert (stats.total_objects, stats.visible_objects, stats.culled_objects) == (101, 36, 65)
+
+
+def test_batch_culling_performance():
+    """One batched call for 10000 objects must beat testing them one by one (headless CPU benchmark)."""
+    rng = random.Random(7)
+    objects = _objects(rng, 10000)
+    frustum = _random_frustum(rng)
+    spheres = [(vec3(*obj.center), obj.radius) for obj in objects]
+    index = CullingIndex()
+    index.sync(objects, None)
+
+    start = time.perf_counter()
+    for center, radius in spheres:
+        frustum.sphere_in_frustum(center, radius)
+    per_object = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(10):
+        index.cull(frustum)
+    batched = (time.perf_counter() - start) / 10
+
+    assert batched < per_object, f"batched culling took {batched * 1000:.2f}ms, per-object {per_object * 1000:.2f}ms"
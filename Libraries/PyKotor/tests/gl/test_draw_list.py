@@ -0,0 +1,211 @@
+"""Tests for material-batched draw lists, using stand-in scene/model/mesh objects (no GL context needed)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from pykotor.gl.glm_compat import mat4, vec4
+from pykotor.gl.models.mdl import Mesh
+from pykotor.gl.scene.draw_list import DrawList
+
+
+def _translation(x: float, y: float = 0.0, z: float = 0.0) -> mat4:
+    transform = mat4()
+    transform[3] = vec4(x, y, z, 1.0)
+    return transform
+
+
+class _Mesh:
+    def __init__(self, texture: str, lightmap: str = "NULL"):
+        self.texture = texture
+        self.lightmap = lightmap
+        self.log: list[tuple] = []
+
+    def bounding_radius(self) -> float:
+        return 0.5
+
+    def bind_material(self, _shader, diffuse_tex, lightmap_tex):
+        self.log.append(("bind", diffuse_tex.name, lightmap_tex.name))
+
+    def draw_elements(self):
+        self.log.append(("draw", self.texture))
+
+
+class _Node:
+    def __init__(self, mesh: _Mesh | None, transform: mat4 | None = None, children: list[_Node] | None = None, *, render: bool = True):
+        self._transform = mat4() if transform is None else transform
+        self.mesh = mesh
+        self.render = render
+        self.children = children or []
+
+
+class _Object:
+    def __init__(self, model: str, x: float = 0.0, *, data: str = "placeable", override_texture: str | None = None):
+        self.model = model
+        self.data = data
+        self.override_texture = override_texture
+        self.children: list[_Object] = []
+        self._transform = _translation(x)
+
+    def transform(self) -> mat4:
+        return self._transform
+
+    def set_x(self, x: float):
+        self._transform = _translation(x)
+
+
+class _Shader:
+    def __init__(self, log: list[tuple]):
+        self.log = log
+
+    def use(self):
+        pass
+
+    def set_matrix4(self, name: str, value: mat4):
+        self.log.append((name, value[3][0]))
+
+
+class _Scene:
+    def __init__(self, models: dict[str, _Model], blend_modes: dict[str, int] | None = None):
+        self.models = models
+        self.blend_modes = blend_modes or {}
+        self.hidden: set[str] = set()
+
+    def model(self, name: str) -> _Model:
+        return self.models[name]
+
+    def texture(self, name: str, *, lightmap: bool = False) -> SimpleNamespace:
+        return SimpleNamespace(name=name, blend_mode=self.blend_modes.get(name, 0))
+
+    def should_hide_obj(self, obj: _Object) -> bool:
+        return obj.data in self.hidden
+
+
+class _Model:
+    def __init__(self, root: _Node):
+        self.root = root
+
+
+def _model(*nodes: _Node, transform: mat4 | None = None) -> _Model:
+    return _Model(_Node(None, transform, list(nodes)))
+
+
+@pytest.fixture
+def meshes() -> dict[str, _Mesh]:
+    return {name: _Mesh(name.split("-")[0], "lm") for name in ("stone-a", "wood-a", "stone-b", "glow-a")}
+
+
+@pytest.fixture
+def scene(meshes: dict[str, _Mesh]) -> _Scene:
+    return _Scene(
+        {
+            "crate": _model(_Node(meshes["wood-a"]), _Node(meshes["stone-a"], _translation(0, 1))),
+            "pillar": _model(_Node(meshes["stone-b"], None, [_Node(meshes["glow-a"], _translation(0, 0, 2))])),
+            "hidden_mesh": _model(_Node(meshes["stone-a"], render=False)),
+        },
+        {"glow": 1},
+    )
+
+
+def test_items_are_flattened_and_grouped_by_material(scene: _Scene, meshes: dict[str, _Mesh]):
+    crate, pillar = _Object("crate", 10), _Object("pillar", 20, override_texture=None)
+    child = _Object("hidden_mesh", 5)
+    pillar.children.append(child)
+    draw_list = DrawList()
+    draw_list.update([crate, pillar], None, scene)
+
+    assert [(batch.texture, len(batch.items)) for batch in draw_list.batches] == [("glow", 1), ("stone", 2), ("wood", 1)]
+    assert len(draw_list) == 4
+    stone_items = draw_list.batches[1].items
+    assert [item.mesh for item in stone_items] == [meshes["stone-a"], meshes["stone-b"]]
+    assert stone_items[0].transform[3][1] == 1.0 and stone_items[0].transform[3][0] == 10.0
+    assert draw_list.batches[0].items[0].transform[3][2] == 2.0
+
+    override = _Object("crate", 0, override_texture="painted")
+    draw_list.update([override], None, scene)
+    assert [(batch.texture, len(batch.items)) for batch in draw_list.batches] == [("painted", 2)]
+
+
+def test_only_changed_objects_are_rebuilt(scene: _Scene):
+    objects = [_Object("crate", x) for x in range(5)]
+    draw_list = DrawList()
+    draw_list.update(objects, None, scene)
+    assert draw_list.rebuilt == 5
+    batches = draw_list.batches
+
+    draw_list.update(objects, None, scene)
+    assert draw_list.rebuilt == 0
+    assert draw_list.batches is batches
+
+    objects[2].set_x(100)
+    draw_list.update(objects, None, scene)
+    assert draw_list.rebuilt == 1
+    assert sorted(item.transform[3][0] for item in draw_list.batches[-1].items) == [0, 1, 3, 4, 100]
+
+    # The async loader replacing a placeholder model rebuilds every object using it
+    scene.models["crate"] = _model(_Node(_Mesh("metal")))
+    draw_list.update(objects, None, scene)
+    assert draw_list.rebuilt == 5
+    assert [batch.texture for batch in draw_list.batches] == ["metal"]
+
+
+def test_culled_and_hidden_objects_are_skipped(scene: _Scene):
+    crate, pillar, creature = _Object("crate"), _Object("pillar"), _Object("crate", data="creature")
+    draw_list = DrawList()
+    draw_list.update([crate, pillar, creature], [True, False, True], scene)
+    assert len(draw_list) == 4
+
+    # Culled objects keep their entries, so they come back without a rebuild
+    draw_list.update([crate, pillar, creature], [False, True, True], scene)
+    assert (len(draw_list), draw_list.rebuilt) == (4, 1)
+    draw_list.update([crate, pillar, creature], [True, True, True], scene)
+    assert (len(draw_list), draw_list.rebuilt) == (6, 0)
+
+    scene.hidden.add("creature")
+    draw_list.update([crate, pillar, creature], None, scene, ("creature",))
+    assert (len(draw_list), draw_list.rebuilt) == (4, 2)
+
+
+def test_draw_binds_each_material_once(scene: _Scene, meshes: dict[str, _Mesh], monkeypatch: pytest.MonkeyPatch):
+    log: list[tuple] = []
+    for mesh in meshes.values():
+        mesh.log = log
+    monkeypatch.setattr(Mesh, "reset_material", staticmethod(lambda _shader: log.append(("reset",))))
+
+    draw_list = DrawList()
+    draw_list.update([_Object("pillar", 1), _Object("crate", 2), _Object("pillar", 3)], None, scene)
+    draw_list.draw(_Shader(log), scene)
+
+    assert log == [
+        ("bind", "stone", "lm"),
+        ("model", 1.0),
+        ("draw", "stone"),
+        ("model", 2.0),
+        ("draw", "stone"),
+        ("model", 3.0),
+        ("draw", "stone"),
+        ("bind", "wood", "lm"),
+        ("model", 2.0),
+        ("draw", "wood"),
+        # Additive materials are drawn after everything else
+        ("bind", "glow", "lm"),
+        ("model", 1.0),
+        ("draw", "glow"),
+        ("model", 3.0),
+        ("draw", "glow"),
+        ("reset",),
+    ]
+
+
+def test_texture_distances_use_the_nearest_mesh(scene: _Scene):
+    draw_list = DrawList()
+    draw_list.update([_Object("crate", 10), _Object("pillar", 20), _Object("crate", -3)], None, scene)
+
+    distances = dict(draw_list.texture_distances((0.0, 0.0, 0.0), {"stone", "lm", "glow", "unused"}))
+    assert distances["stone"] == pytest.approx((3.0**2 + 1.0) ** 0.5 - 0.5)
+    assert distances["glow"] == pytest.approx((20.0**2 + 2.0**2) ** 0.5 - 0.5)
+    assert distances["lm"] == pytest.approx(2.5)
+    assert set(distances) == {"stone", "lm", "glow"}
+    assert draw_list.texture_distances((0.0, 0.0, 0.0), set()) == []
@@ -0,0 +1,102 @@
+"""Tests for applying GIT edits to a scene's render objects with SceneCache.update_instances."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from pykotor.common.misc import ResRef
+from pykotor.gl.scene import scene_cache
+from pykotor.gl.scene.scene_cache import SceneCache
+from pykotor.resource.generics.git import GIT, GITStore, GITTrigger, GITWaypoint
+
+
+class _RenderObject:
+    """Records what SceneCache does to a render object."""
+
+    def __init__(self, model: str, *_args, data=None, **_kwargs):
+        self.model = model
+        self.data = data
+        self.position = (0.0, 0.0, 0.0)
+        self.rotation = (0.0, 0.0, 0.0)
+
+    def set_position(self, x: float, y: float, z: float):
+        self.position = (x, y, z)
+
+    def set_rotation(self, x: float, y: float, z: float):
+        self.rotation = (x, y, z)
+
+
+class _Scene(SimpleNamespace):
+    def __init__(self):
+        super().__init__(objects={}, _module=object(), invalidations=0)
+
+    def _invalidate_object_cache(self):
+        self.invalidations += 1
+
+
+@pytest.fixture(autouse=True)
+def _record_render_objects(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(scene_cache, "RenderObject", _RenderObject)
+
+
+def test_update_instances_only_touches_given_instances():
+    scene = _Scene()
+    waypoints = [GITWaypoint(float(i), 0, 0) for i in range(3)]
+    store = GITStore(0, 5, 0)
+    SceneCache.update_instances(scene, added=[*waypoints, store])
+    assert [scene.objects[wp].position for wp in waypoints] == [(0, 0, 0), (1, 0, 0), (2, 0, 0)]
+    assert scene.objects[store].model == "store"
+    assert scene.invalidations == 1
+
+    # Moving one instance retransforms its render object in place
+    originals = dict(scene.objects)
+    waypoints[1].position.x = 40.0
+    waypoints[1].bearing = 1.5
+    SceneCache.update_instances(scene, changed=[waypoints[1]])
+    assert scene.objects[waypoints[1]] is originals[waypoints[1]]
+    assert (scene.objects[waypoints[1]].position, scene.objects[waypoints[1]].rotation) == ((40.0, 0, 0), (0, 0, 1.5))
+    assert scene.invalidations == 1
+
+    SceneCache.update_instances(scene, removed=[waypoints[0], GITWaypoint(9, 9, 9)])
+    assert waypoints[0] not in scene.objects
+    assert len(scene.objects) == 3
+    assert scene.invalidations == 2
+
+
+def test_changed_resref_recreates_render_object():
+    scene = _Scene()
+    trigger = GITTrigger(1, 2, 3)
+    SceneCache.update_instances(scene, added=[trigger])
+    original = scene.objects[trigger]
+    assert (original.model, original.rotation) == ("trigger", (0, 0, 0))
+
+    # Instances hash by resref, so after an edit the old entry is only reachable by identity
+    trigger.resref = ResRef("new_trigger")
+    SceneCache.update_instances(scene, changed=[trigger])
+    assert len(scene.objects) == 1
+    assert trigger in scene.objects
+    assert scene.objects[trigger] is not original
+    assert scene.objects[trigger].identifier == trigger.identifier()
+    assert scene.invalidations == 2
+
+    # Moving it afterwards keeps the recreated render object
+    recreated = scene.objects[trigger]
+    trigger.position.x = 7.0
+    SceneCache.update_instances(scene, changed=[trigger])
+    assert scene.objects[trigger] is recreated
+    assert scene.invalidations == 2
+
+
+def test_removed_instances_are_pruned_in_one_pass():
+    git = GIT()
+    git.waypoints = [GITWaypoint(float(i), 0, 0) for i in range(500)]
+    objects = {waypoint: _RenderObject("waypoint", data=waypoint) for waypoint in git.waypoints}
+    room = object()
+    objects[room] = _RenderObject("room")  # not a GIT instance: never pruned
+    kept = git.waypoints[::2]
+    git.waypoints = kept
+
+    SceneCache._del_git_objects(git, objects)  # noqa: SLF001
+    assert set(map(id, objects)) == {*map(id, kept), id(room)}
@@ -0,0 +1,160 @@
+"""Tests for mip level selection and budgeted texture streaming (no GL context needed)."""
+
+from __future__ import annotations
+
+import pytest
+
+from pykotor.gl.scene.async_loader import _parse_texture_data, add_texture_levels, create_texture_from_intermediate
+from pykotor.gl.scene.texture_streaming import TextureStreamer, desired_mip_level, initial_mip_level, mip_chain
+from pykotor.gl.shader import texture as texture_module
+from pykotor.gl.shader.texture import Texture
+from pykotor.resource.formats.tpc import TPC, TPCTextureFormat, bytes_tpc
+from pykotor.resource.type import ResourceType
+
+
+class _Texture:
+    """Tracks uploads like a texture created with only its smallest levels resident."""
+
+    def __init__(self, size: int, resident_level: int, held_level: int | None = None):
+        self.levels = mip_chain(size, size, size.bit_length())
+        self.resident_level = resident_level
+        self.held_level = 0 if held_level is None else held_level
+        self.uploads: list[int] = []
+
+    @property
+    def mip_count(self) -> int:
+        return len(self.levels)
+
+    def level_nbytes(self, level: int) -> int:
+        return self.levels[level].nbytes
+
+    def upload_level(self, level: int):
+        assert level == self.resident_level - 1 >= self.held_level
+        self.uploads.append(level)
+        self.resident_level = level
+
+
+def test_mip_layout_and_level_selection():
+    levels = mip_chain(256, 64, 9)
+    assert [(level.width, level.height) for level in levels][-3:] == [(4, 1), (2, 1), (1, 1)]
+    assert levels[1].offset == levels[0].nbytes == 256 * 64 * 4
+
+    # Smallest levels first, as many as fit the initial budget
+    assert initial_mip_level(levels, max_bytes=0) == 8
+    assert initial_mip_level(levels, max_bytes=16 * 1024) == 2
+    assert initial_mip_level(levels, max_bytes=10**9) == 0
+    assert initial_mip_level(levels[5:], max_bytes=10**9) == 5
+
+    assert [desired_mip_level(9, distance, 10.0) for distance in (0, 10, 19, 20, 45, 10**6)] == [0, 0, 0, 1, 2, 8]
+    assert desired_mip_level(1, 10**6, 10.0) == 0
+
+
+def test_streamer_serves_nearest_textures_within_budget():
+    near, far, unseen = _Texture(256, 4), _Texture(256, 4), _Texture(256, 4)
+    streamer = TextureStreamer(bytes_per_frame=2 * (32 * 32 + 64 * 64) * 4, full_detail_distance=10.0)
+    for name, texture in (("Near", near), ("far", far), ("unseen", unseen)):
+        streamer.register(name, texture)
+    streamer.register("resident", _Texture(256, 0))
+    assert streamer.pending == {"near", "far", "unseen"}
+
+    # Far only needs level 2; every texture goes up one level before any goes up two
+    streamer.observe([("near", 0.0), ("FAR", 45.0), ("missing", 1.0)])
+    assert streamer.plan() == [("near", 3), ("far", 3), ("near", 2), ("far", 2)]
+    assert streamer.update() == 2 * (32 * 32 + 64 * 64) * 4
+    assert (near.resident_level, far.resident_level, unseen.uploads) == (2, 2, [])
+
+    # A single level bigger than the budget still goes out, alone
+    assert streamer.update() == 128 * 128 * 4
+    assert streamer.update() == 256 * 256 * 4
+    assert near.resident_level == 0
+    assert "near" not in streamer.pending
+    assert streamer.update() == 0
+
+    # Moving closer makes the far texture want more
+    streamer.observe([("far", 12.0)])
+    assert streamer.plan() == [("far", 1)]
+
+
+def test_streamer_fetches_levels_that_were_never_decoded():
+    fetches: list[tuple[str, int, int]] = []
+    texture = _Texture(256, resident_level=5, held_level=4)
+    streamer = TextureStreamer(full_detail_distance=10.0, fetch=lambda *fetch: fetches.append(fetch))
+    streamer.register("wall", texture)
+
+    # Only level 4 was decoded; levels 1-3 are fetched while it is uploaded, and only once
+    streamer.observe([("wall", 25.0)])
+    assert streamer.plan() == [("wall", 4)]
+    assert streamer.fetches() == [("wall", 1, 4)]
+    streamer.update()
+    streamer.update()
+    assert (texture.uploads, fetches) == ([4], [("wall", 1, 4)])
+
+    texture.held_level = 1
+    streamer.fetched("wall")
+    streamer.update()
+    assert (texture.resident_level, fetches) == (1, [("wall", 1, 4)])
+
+    assert [streamer.first_level(distance) for distance in (None, 5.0, 45.0)] == [0, 0, 2]
+
+
+def test_textures_are_created_with_their_smallest_levels(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(texture_module, "HAS_PYOPENGL", False)
+    levels = mip_chain(64, 64, 7)
+    chain = [bytes([level.level]) * level.nbytes for level in levels]
+
+    texture = Texture.from_rgba_mips(64, 64, [memoryview(level) for level in chain], 7, max_initial_bytes=2048)
+    assert (texture.mip_count, texture.resident_level, texture.held_level) == (7, 2, 0)
+    with pytest.raises(ValueError, match="resident level is 2"):
+        texture.upload_level(0)
+    texture.upload_level(1)
+    assert sorted(texture._mip_data) == [0]  # noqa: SLF001
+    texture.upload_level(0)
+    assert texture._rgba_cache == chain[0]  # noqa: SLF001
+    assert texture._mip_data == {}  # noqa: SLF001
+
+    # A far texture only gets the levels it was decoded from; larger ones are added when fetched
+    far = Texture.from_rgba_mips(64, 64, chain[3:], 7, base_level=3, max_initial_bytes=10**9)
+    assert (far.resident_level, far.held_level, far._rgba_cache) == (3, 3, None)  # noqa: SLF001
+    far.add_levels(0, chain[:2])  # does not adjoin level 3
+    assert far.held_level == 3
+    far.add_levels(1, chain[1:3])
+    assert far.held_level == 1
+    far.upload_level(2)
+    far.upload_level(1)
+    assert (far.resident_level, far._mip_data) == (1, {})  # noqa: SLF001
+
+    # An incomplete chain falls back to the largest level with generated mipmaps
+    single = Texture.from_rgba_mips(64, 64, chain[:-1], 7)
+    assert (single.mip_count, single.resident_level) == (1, 0)
+
+
+def test_worker_decodes_only_the_levels_asked_for(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(texture_module, "HAS_PYOPENGL", False)
+    tpc = TPC()
+    tpc.set_single(bytearray(range(256)) * (64 * 32 * 4 // 256), TPCTextureFormat.RGBA, 64, 32)
+    tpc.convert(TPCTextureFormat.DXT1)
+    data = bytes_tpc(tpc)
+
+    _name, full, error = _parse_texture_data("stone", data, ResourceType.TPC)
+    assert error is None and full is not None
+    levels = mip_chain(64, 32, full.mipmap_count)
+    assert full.mipmap_count == len(tpc.layers[0].mipmaps) == 6
+    assert (full.base_level, len(full.rgba_data)) == (0, levels[0].nbytes)
+    assert len(full.mip_data) == sum(level.nbytes for level in levels[1:])
+
+    _name, far, error = _parse_texture_data("stone", data, ResourceType.TPC, base_level=3)
+    assert error is None and far is not None
+    assert (far.base_level, far.mipmap_count, len(far.rgba_data)) == (3, 6, levels[3].nbytes)
+    assert far.rgba_data == full.mip_data[levels[3].offset - levels[1].offset :][: levels[3].nbytes]
+    assert len(far.mip_data) == levels[4].nbytes + levels[5].nbytes
+
+    # Past the end of the chain clamps to the smallest level
+    assert _parse_texture_data("stone", data, ResourceType.TPC, base_level=99)[1].base_level == 5
+
+    texture = create_texture_from_intermediate(far)
+    assert (texture.resident_level, texture.held_level) == (3, 3)
+    _name, nearer, error = _parse_texture_data("stone", data, ResourceType.TPC, base_level=1, stop_level=3)
+    assert error is None and nearer is not None
+    assert (len(nearer.rgba_data), len(nearer.mip_data)) == (levels[1].nbytes, levels[2].nbytes)
+    add_texture_levels(texture, nearer)
+    assert texture.held_level == 1
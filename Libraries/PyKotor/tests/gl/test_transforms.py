@@ -0,0 +1,51 @@
+"""Tests for the NumPy transform math against the GLM computations it replaces."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pykotor.gl.native.transforms import invert, matrix_array, unproject
+from pykotor.gl.scene.frustum import Frustum
+
+glm = pytest.importorskip("glm")
+
+
+class _Camera:
+    def __init__(self, eye: tuple[float, float, float], target: tuple[float, float, float]):
+        self._view = glm.lookAt(glm.vec3(*eye), glm.vec3(*target), glm.vec3(0, 0, 1))
+        self._projection = glm.perspective(1.0, 16 / 9, 0.1, 100.0)
+
+    def view(self):
+        return self._view
+
+    def projection(self):
+        return self._projection
+
+
+def test_matrix_arrays_match_glm_layout():
+    transform = glm.translate(glm.vec3(1, -2, 3)) * glm.mat4_cast(glm.quat(glm.vec3(0.3, -1.2, 2.0)))
+    matrix = matrix_array(transform)
+    assert np.allclose(matrix[3, :3], (1, -2, 3))
+    assert np.allclose(np.array([[1.0, -2.0, 3.0, 1.0]]) @ matrix, [tuple(transform * glm.vec4(1, -2, 3, 1))], atol=1e-5)
+    assert np.allclose(invert(matrix), matrix_array(glm.inverse(transform)), atol=1e-5)
+
+
+def test_frustum_planes_and_unproject_match_glm():
+    camera = _Camera((0, -10, 2), (0, 0, 2))
+    frustum = Frustum()
+    frustum.update_from_camera(camera)
+    vp_hash = frustum._cached_vp_hash  # noqa: SLF001
+    assert frustum.point_in_frustum(glm.vec3(0, 0, 2))
+    assert not frustum.point_in_frustum(glm.vec3(0, -20, 2))
+    assert not frustum.point_in_frustum(glm.vec3(0, 200, 2))
+    # The near plane faces along the view direction, 0.1 units in front of the eye
+    assert np.allclose(tuple(frustum.planes[4]), (0, 1, 0, 9.9), atol=1e-4)
+    frustum.update_from_camera(camera)
+    assert frustum._cached_vp_hash == vp_hash  # noqa: SLF001
+
+    viewport = glm.vec4(0, 0, 640, 360)
+    expected = glm.unProject(glm.vec3(100, 50, 0.9), camera.view(), camera.projection(), viewport)
+    actual = unproject(np.array([(100, 50, 0.9)]), matrix_array(camera.view()), matrix_array(camera.projection()), (0, 0, 640, 360))
+    assert np.allclose(actual[0], tuple(expected), atol=1e-3)
+
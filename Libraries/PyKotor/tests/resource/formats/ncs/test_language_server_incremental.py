@@ -0,0 +1,182 @@
+"""Tests for incremental, cancellable analysis in the NSS language server."""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import queue
+import sys
+import threading
+
+# Setup paths
+THIS_FILE = pathlib.Path(__file__).resolve()
+REPO_ROOT = THIS_FILE.parents[6]
+PYKOTOR_SRC = REPO_ROOT / "Libraries" / "PyKotor" / "src"
+UTILITY_SRC = REPO_ROOT / "Libraries" / "Utility" / "src"
+
+for path in (PYKOTOR_SRC, UTILITY_SRC):
+    as_posix = path.as_posix()
+    if as_posix not in sys.path:
+        sys.path.insert(0, as_posix)
+
+import pytest
+
+from pykotor.common.scriptdefs import KOTOR_CONSTANTS, KOTOR_FUNCTIONS
+from pykotor.common.scriptlib import KOTOR_LIBRARY
+from pykotor.resource.formats.ncs.compiler.incremental import AnalysisCancelledError, split_top_level
+from pykotor.resource.formats.ncs.compiler.language_server import REQUEST_CANCELLED, NSSLanguageServer
+
+SCRIPT = """// Spawns the party
+#include "k_inc_debug"
+struct Spawn { int count; };
+int g_spawned = 0;
+void Helper(int n);
+
+void Helper(int n) {
+    g_spawned = g_spawned + n;
+}
+
+void main() {
+    Helper(2);
+}
+"""
+
+
+def _new_server() -> NSSLanguageServer:
+    return NSSLanguageServer(list(KOTOR_FUNCTIONS), list(KOTOR_CONSTANTS), dict(KOTOR_LIBRARY))
+
+
+def _summary(server: NSSLanguageServer, text: str, filepath: str | None = None):
+    result = server.analyze(text, filepath)
+    diagnostics = sorted((d.range.start.line, d.code, d.message) for d in result.diagnostics)
+    symbols = [(s.name, s.detail, s.range.start.line, s.range.end.line) for s in result.symbols]
+    return result, diagnostics, symbols
+
+
+@pytest.fixture
+def server() -> NSSLanguageServer:
+    return _new_server()
+
+
+def test_split_top_level_declarations():
+    text = SCRIPT + 'string s = "a;}{\\"b";\n/* ; { */ struct Spawn Make() { return Spawn; }\n'
+    chunks = split_top_level(text)
+    assert "".join(chunk.text for chunk in chunks) == text
+    assert [chunk.text.strip().split("\n")[-1] for chunk in chunks if chunk.has_code] == [
+        '#include "k_inc_debug"',
+        "struct Spawn { int count; };",
+        "int g_spawned = 0;",
+        "void Helper(int n);",
+        "}",
+        "}",
+        'string s = "a;}{\\"b";',
+        "/* ; { */ struct Spawn Make() { return Spawn; }",
+    ]
+    assert [chunk.start_line for chunk in chunks if chunk.has_code][:5] == [0, 2, 2, 3, 4]
+
+
+def test_edit_reparses_only_changed_declaration(server: NSSLanguageServer):
+    first, _, _ = _summary(server, SCRIPT)
+    assert first.parse_successful
+    assert first.metrics is not None
+    assert first.metrics.reparsed_chunks == first.metrics.chunks
+
+    edited = SCRIPT.replace("Helper(2);", "Helper(3);")
+    result, diagnostics, symbols = _summary(server, edited)
+    assert result.metrics is not None
+    assert result.metrics.reparsed_chunks == 1
+    assert (diagnostics, symbols) == _summary(_new_server(), edited)[1:]
+    assert [name for name, *_ in symbols] == ["Spawn", "g_spawned", "Helper", "main"]
+    assert symbols[2][1] == "void Helper(int n)"
+
+
+def test_reused_declarations_follow_line_shifts(server: NSSLanguageServer):
+    broken = SCRIPT.replace("Helper(2);", "Helper(2)")
+    _, diagnostics, _ = _summary(server, broken)
+    [syntax_error] = [d for d in diagnostics if d[1] == "compile-error"]
+    assert syntax_error[0] == 12
+
+    shifted = "\n\n" + broken
+    result, diagnostics, symbols = _summary(server, shifted)
+    assert result.metrics is not None
+    assert result.metrics.reparsed_chunks == 1
+    assert not result.parse_successful
+    assert (diagnostics, symbols) == _summary(_new_server(), shifted)[1:]
+    assert [d for d in diagnostics if d[1] == "compile-error"][0][0] == 14
+    # Declarations that parsed keep the outline populated while another one is broken
+    assert ("Helper", "void Helper(int n)", 8, 10) in symbols
+
+
+def test_include_symbols_are_shared_and_invalidated(server: NSSLanguageServer, tmp_path: pathlib.Path):
+    include = tmp_path / "k_inc_custom.nss"
+    include.write_text("int CustomCount(object oTarget);\n", encoding="utf-8")
+    text = '#include "k_inc_custom"\n#include "k_inc_missing"\nvoid main() { }\n'
+
+    result = server.analyze(text, tmp_path / "first.nss")
+    assert result.metrics is not None
+    assert result.metrics.include_misses == 1
+    [missing] = [d for d in result.diagnostics if d.code == "missing-include"]
+    assert missing.range.start.line == 1
+    assert "k_inc_missing" in missing.message
+
+    result = server.analyze(text, tmp_path / "second.nss")
+    assert result.metrics is not None
+    assert (result.metrics.include_hits, result.metrics.include_misses) == (1, 0)
+    [completion] = [c for c in server.get_completions("Custom", 0, 6, tmp_path / "second.nss") if c.label == "CustomCount"]
+    assert completion.detail == "int CustomCount(object oTarget)"
+
+    include.write_text("int CustomTotal();\n", encoding="utf-8")
+    stat = include.stat()
+    os.utime(include, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    result = server.analyze(text + "\n", tmp_path / "second.nss")
+    assert result.metrics is not None
+    assert result.metrics.include_misses == 1
+    hover = server.get_hover("CustomTotal", 0, 3, tmp_path / "second.nss")
+    assert hover is not None
+    assert "int CustomTotal()" in hover.contents
+
+
+def test_cancelled_analysis_keeps_previous_state(server: NSSLanguageServer):
+    server.analyze(SCRIPT)
+    edited = SCRIPT.replace("Helper(2);", "Helper(5);")
+    with pytest.raises(AnalysisCancelledError):
+        server.analyze(edited, is_cancelled=lambda: True)
+    assert server.latency.cancelled == 1
+
+    result = server.analyze(edited)
+    assert result.metrics is not None
+    assert result.metrics.reparsed_chunks == 1
+    assert server.latency.summary()["count"] == 2
+
+
+def test_run_server_coalesces_queued_analyses():
+    requests: queue.Queue = queue.Queue()
+    responses: queue.Queue = queue.Queue()
+    for request_id, text in ((1, SCRIPT), (2, SCRIPT.replace("2", "4"))):
+        requests.put({"id": request_id, "method": "analyze", "params": {"text": text, "filepath": None}})
+    requests.put({"id": 3, "method": "analyze", "params": {"text": SCRIPT, "filepath": "other.nss"}})
+    requests.put({"id": 4, "method": "cancel", "params": {"id": 3}})
+    requests.put({"id": 5, "method": "metrics", "params": {}})
+
+    server_thread = threading.Thread(
+        target=NSSLanguageServer.run_server,
+        args=(requests, responses, False, list(KOTOR_FUNCTIONS), list(KOTOR_CONSTANTS), dict(KOTOR_LIBRARY)),
+        kwargs={"debounce": 0.0},
+    )
+    server_thread.start()
+    received: dict[int | None, list[dict]] = {}
+    try:
+        while 5 not in received:
+            response = responses.get(timeout=30.0)
+            received.setdefault(response["id"], []).append(response)
+    finally:
+        # A shutdown signal also cancels any analysis still queued or running
+        requests.put(None)
+        server_thread.join(timeout=30.0)
+    assert received[None][0]["result"]["status"] == "ready"
+    assert received[1][0]["error"]["code"] == REQUEST_CANCELLED
+    assert received[2][0]["result"]["parse_successful"]
+    assert received[2][0]["result"]["metrics"]["chunks"] > 0
+    assert received[3][0]["error"]["code"] == REQUEST_CANCELLED
+    assert received[4][0]["result"]["status"] == "not-found"
+    assert received[5][0]["result"] == {**received[5][0]["result"], "count": 1, "cancelled": 2}
@@ -0,0 +1,157 @@
+"""Tests for cached GFFStruct/GFFList content hashes and hash-based diff pruning."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+from copy import deepcopy
+from pathlib import PureWindowsPath
+
+THIS_FILE = pathlib.Path(__file__).resolve()
+REPO_ROOT = THIS_FILE.parents[5]
+PYKOTOR_SRC = REPO_ROOT / "Libraries" / "PyKotor" / "src"
+UTILITY_SRC = REPO_ROOT / "Libraries" / "Utility" / "src"
+
+for path in (PYKOTOR_SRC, UTILITY_SRC):
+    as_posix = path.as_posix()
+    if as_posix not in sys.path:
+        sys.path.insert(0, as_posix)
+
+from pykotor.common.language import LocalizedString  # pyright: ignore[reportMissingImports]
+from pykotor.common.misc import ResRef  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.gff import GFF, GFFComparisonResult, GFFContent, GFFList, GFFStruct, bytes_gff, read_gff  # pyright: ignore[reportMissingImports]
+from pykotor.tslpatcher.diff.analyzers import GFFDiffAnalyzer  # pyright: ignore[reportMissingImports]
+from pykotor.tslpatcher.logger import PatchLogger  # pyright: ignore[reportMissingImports]
+from pykotor.tslpatcher.memory import PatcherMemory  # pyright: ignore[reportMissingImports]
+from pykotor.tslpatcher.mods.gff import AddStructToListGFF, FieldValueConstant  # pyright: ignore[reportMissingImports]
+from utility.common.geometry import Vector3
+
+
+def _silent_logger(*args: object, **kwargs: object) -> None:
+    _ = args, kwargs
+
+
+def _dialog(entries: int = 50) -> GFF:
+    gff = GFF(GFFContent.DLG)
+    gff.root.set_resref("EndConversation", ResRef("k_end"))
+    entry_list = gff.root.set_list("EntryList", GFFList())
+    for index in range(entries):
+        entry = entry_list.add(index)
+        entry.set_locstring("Text", LocalizedString.from_english(f"Line {index}"))
+        entry.set_vector3("Position", Vector3(float(index), 0.5, 1.0))
+        links = entry.set_list("RepliesList", GFFList())
+        links.add(0).set_uint32("Index", index)
+    return gff
+
+
+def test_identical_trees_have_identical_hashes() -> None:
+    left = _dialog()
+    right = read_gff(bytes_gff(_dialog()))
+    assert left.root.content_hash() == right.root.content_hash()
+    assert left.root.get_list("EntryList").content_hash() == right.root.get_list("EntryList").content_hash()
+
+    # Field order does not matter, field values, types and struct IDs do
+    a, b = GFFStruct(), GFFStruct()
+    a.set_int32("A", 1)
+    a.set_string("B", "x")
+    b.set_string("B", "x")
+    b.set_int32("A", 1)
+    assert a.content_hash() == b.content_hash()
+    b.set_uint32("A", 1)
+    assert a.content_hash() != b.content_hash()
+    b.set_int32("A", 1)
+    b.struct_id = 4
+    assert a.content_hash() != b.content_hash()
+
+
+def test_nested_mutations_invalidate_ancestor_hashes() -> None:
+    gff = _dialog()
+    root_hash = gff.root.content_hash()
+    entries: GFFList = gff.root.value("EntryList")
+    link: GFFStruct = entries[10].value("RepliesList")[0]
+
+    link.set_uint32("Index", 99)
+    changed_hash = gff.root.content_hash()
+    assert changed_hash != root_hash
+
+    link.set_uint32("Index", 10)
+    assert gff.root.content_hash() == root_hash
+
+    entries.add(99)
+    assert gff.root.content_hash() != root_hash
+    entries.remove(len(entries) - 1)
+    assert gff.root.content_hash() == root_hash
+
+    locstring: LocalizedString = entries[3].get_locstring("Text")
+    locstring.stringref = 42  # changed in place: not tracked until invalidated
+    entries[3].invalidate_content_hash()
+    assert gff.root.content_hash() != root_hash
+
+
+def test_copies_do_not_share_cached_hashes() -> None:
+    gff = _dialog(5)
+    original_hash = gff.root.content_hash()
+    copied = deepcopy(gff.root)
+    assert copied.content_hash() == original_hash
+    copied.value("EntryList")[0].set_uint8("Skippable", 1)
+    assert copied.content_hash() != original_hash
+    assert gff.root.content_hash() == original_hash
+
+
+def test_compare_skips_identical_subtrees_and_reports_changes() -> None:
+    left = _dialog()
+    right = read_gff(bytes_gff(_dialog()))
+    assert left.compare(right, _silent_logger)
+
+    calls: list[tuple[str, str]] = []
+    original_compare = GFFStruct.compare
+
+    def counting_compare(self: GFFStruct, *args, **kwargs) -> bool:
+        calls.append(("compare", str(args[1] if len(args) > 1 else "")))
+        return original_compare(self, *args, **kwargs)
+
+    right.root.value("EntryList")[7].set_vector3("Position", Vector3(-1.0, 0.5, 1.0))
+    result = GFFComparisonResult()
+    GFFStruct.compare = counting_compare  # type: ignore[method-assign]
+    try:
+        left.compare(right, _silent_logger, comparison_result=result)
+    finally:
+        GFFStruct.compare = original_compare  # type: ignore[method-assign]
+    assert result.has_field_differences()
+    # Only the root is walked field by field; the list entries are matched by their hashes
+    assert len(calls) == 1
+
+    modifications = GFFDiffAnalyzer().analyze(bytes_gff(left), bytes_gff(right), "dialog.dlg")
+    assert modifications is not None
+    assert [str(modifier.path) for modifier in modifications.modifiers] == ["EntryList\\7\\Position"]
+    assert GFFDiffAnalyzer().analyze(bytes_gff(left), bytes_gff(_dialog()), "dialog.dlg") is None
+
+
+def test_tslpatcher_list_additions_invalidate_hashes() -> None:
+    original = _dialog()
+    patched = deepcopy(original)
+    assert original.compare(patched, _silent_logger)  # caches the hashes of both trees
+
+    AddStructToListGFF("add_entry", FieldValueConstant(GFFStruct(99)), PureWindowsPath("EntryList")).apply(patched.root, PatcherMemory(), PatchLogger())
+
+    assert len(patched.root.value("EntryList")) == 51
+    assert original.root.content_hash() != patched.root.content_hash()
+    assert not original.compare(patched, _silent_logger, comparison_result=GFFComparisonResult())
+
+
+def test_compare_counts_used_fields_of_identical_subtrees() -> None:
+    left = _dialog()
+    right = read_gff(bytes_gff(_dialog()))
+
+    result = GFFComparisonResult()
+    assert left.compare(right, _silent_logger, comparison_result=result)
+    assert result.field_stats["used"]["Text"] == 50
+    assert result.field_stats["used"]["Index"] == 50
+
+    right.root.value("EntryList")[7].set_vector3("Position", Vector3(-1.0, 0.5, 1.0))
+    result = GFFComparisonResult()
+    left.compare(right, _silent_logger, comparison_result=result)
+    # The changed entry is reported as replaced; the 49 untouched ones still count as used
+    assert result.field_stats["used"]["Text"] == 49
+    assert result.field_stats["missing"] == result.field_stats["extra"] == {"GFFRoot\\EntryList": 1}
@@ -0,0 +1,101 @@
+"""Unit tests for the batched MDL texture/lightmap/child-model reference scanner."""
+
+from __future__ import annotations
+
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[3].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[5].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.extract.installation import Installation
+from pykotor.tools.model import batch_model_references, iterate_lightmaps, iterate_textures, scan_model_references
+from pykotor.tools.validation import find_missing_model_textures
+
+sys.path.insert(0, str(THIS_SCRIPT_PATH.parents[2] / "cli"))
+from test_diff_comprehensive import DiffTestDataHelper
+
+MDL_DIR = THIS_SCRIPT_PATH.parents[2] / "test_files" / "mdl"
+
+
+class TestModelReferences(unittest.TestCase):
+    def setUp(self):
+        self.models: dict[str, bytes] = {path.name.lower(): path.read_bytes() for path in sorted(MDL_DIR.glob("*.mdl"))}
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _installation(self) -> Installation:
+        install_path = self.temp_dir / "install"
+        DiffTestDataHelper.create_installation(
+            install_path,
+            bif_resources={"models.bif": {"c_dewback.mdl": self.models["c_dewback.mdl"]}},
+            override_resources={"c_dewback01.tpc": b"TPC_DATA", "m12aa_c03_char02.mdl": self.models["m12aa_c03_char02.mdl"]},
+            modules_resources={"m01aa_s.rim": {name: data for name, data in self.models.items() if name != "c_dewback.mdl"}},
+        )
+        (install_path / "Data").rename(install_path / "data")  # chitin.key refers to 'data/models.bif'
+        (install_path / "swkotor.exe").touch()
+        return Installation(install_path)
+
+    def test_scan_matches_iterators(self):
+        self.assertTrue(self.models)
+        for name, data in self.models.items():
+            references = scan_model_references(data)
+            self.assertEqual(set(references.textures), {texture.lower() for texture in iterate_textures(data)}, name)
+            self.assertEqual(set(references.lightmaps), {lightmap.lower() for lightmap in iterate_lightmaps(data)}, name)
+        self.assertEqual(scan_model_references(self.models["c_dewback.mdl"]).textures, ("c_dewback01",))
+        self.assertEqual(scan_model_references(memoryview(self.models["m12aa_c03_char02.mdl"])).models, ("s_female02",))
+
+    def test_batch_scans_capsules_bifs_and_loose_files(self):
+        installation = self._installation()
+        serial = batch_model_references(installation, max_workers=1)
+        self.assertEqual(len(serial), len(self.models) + 1)
+        for resource, references in serial.items():
+            self.assertEqual(references, scan_model_references(resource.data()), resource.path_ident())
+        self.assertEqual(
+            {str(resource.filepath().name) for resource in serial if resource.resname() == "m12aa_c03_char02"},
+            {"m12aa_c03_char02.mdl", "m01aa_s.rim"},
+        )
+        self.assertEqual(batch_model_references(installation, max_workers=2), serial)
+
+    def test_unreadable_models_are_skipped(self):
+        installation = self._installation()
+        broken = installation.override_path() / "broken.mdl"
+        broken.write_bytes(b"\0" * 12 + b"\xff" * 200)
+        installation.load_override(".")
+        results = batch_model_references(installation, max_workers=1)
+        self.assertNotIn("broken", {resource.resname() for resource in results})
+        self.assertEqual(len(results), len(self.models) + 1)
+
+    def test_find_missing_model_textures(self):
+        installation = self._installation()
+        missing = find_missing_model_textures(installation, max_workers=1)
+        self.assertNotIn("c_dewback.mdl", missing)
+        expected = {
+            name: sorted({*scan_model_references(data).textures, *scan_model_references(data).lightmaps} - {"c_dewback01"})
+            for name, data in self.models.items()
+        }
+        self.assertEqual(missing, {name: names for name, names in expected.items() if names})
+
+
+if __name__ == "__main__":
+    unittest.main()
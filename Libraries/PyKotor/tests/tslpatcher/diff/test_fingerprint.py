@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import TestCase
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[4].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[6].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+from pykotor.extract.capsule import Capsule
+from pykotor.resource.formats.erf import ERF, ERFType, write_erf
+from pykotor.resource.type import ResourceType
+from pykotor.tslpatcher.diff.engine import diff_directories
+from pykotor.tslpatcher.diff.fingerprint import FingerprintCache, clear_fingerprint_cache, fingerprint_bytes
+
+
+def _write_erf(path: Path, resources: dict[str, bytes]):
+    erf = ERF(ERFType.ERF)
+    for resname, data in resources.items():
+        erf.set_data(resname, ResourceType.TXT, data)
+    write_erf(erf, path)
+
+
+class TestFingerprintCache(TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        clear_fingerprint_cache()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _touch_later(self, path: Path):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_capsule_resources_match_in_memory_fingerprints(self):
+        erf_path = self.temp_dir / "test.erf"
+        _write_erf(erf_path, {"alpha": b"alpha data", "beta": b"beta data" * 1000, "gamma": b"alpha data"})
+        resources = list(Capsule(erf_path))
+
+        cache = FingerprintCache()
+        fingerprints = cache.resources(resources, max_workers=4)
+        self.assertEqual({res.resname(): fp for res, fp in fingerprints.items()}, {res.resname(): fingerprint_bytes(res.data()) for res in resources})
+        by_name = {res.resname(): fp for res, fp in fingerprints.items()}
+        self.assertEqual(by_name["alpha"], by_name["gamma"])
+        self.assertNotEqual(by_name["alpha"], by_name["beta"])
+        self.assertEqual(len(cache), 1)
+
+    def test_files_are_cached_until_modified(self):
+        paths = [self.temp_dir / f"file{i}.txt" for i in range(3)]
+        for i, path in enumerate(paths):
+            path.write_bytes(b"x" * i)
+
+        cache = FingerprintCache()
+        first = cache.files(paths, max_workers=2)
+        self.assertEqual(first[paths[2]], fingerprint_bytes(b"xx"))
+        self.assertIs(cache.file(paths[2]), first[paths[2]])
+
+        paths[2].write_bytes(b"yy")
+        self._touch_later(paths[2])
+        self.assertEqual(cache.file(paths[2]), fingerprint_bytes(b"yy"))
+        self.assertIsNone(cache.file(self.temp_dir / "missing.txt"))
+
+    def test_diff_directories_skips_identical_files(self):
+        dir1 = self.temp_dir / "a"
+        dir2 = self.temp_dir / "b"
+        for directory in (dir1, dir2):
+            directory.mkdir()
+            (directory / "same.txt").write_bytes(b"unchanged")
+        (dir1 / "changed.txt").write_bytes(b"old")
+        (dir2 / "changed.txt").write_bytes(b"new")
+
+        compared: list[str] = []
+
+        def diff_files(file1: Path, file2: Path) -> bool:
+            compared.append(file1.name)
+            return file1.read_bytes() == file2.read_bytes()
+
+        result = diff_directories(dir1, dir2, log_func=lambda _msg: None, diff_files_func=diff_files)
+        self.assertFalse(result)
+        self.assertEqual(compared, ["changed.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import TestCase
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+PYKOTOR_PATH = THIS_SCRIPT_PATH.parents[4].joinpath("src")
+UTILITY_PATH = THIS_SCRIPT_PATH.parents[6].joinpath("Libraries", "Utility", "src")
+
+
+def add_sys_path(p: pathlib.Path):
+    working_dir = str(p)
+    if working_dir not in sys.path:
+        sys.path.append(working_dir)
+
+
+if PYKOTOR_PATH.joinpath("pykotor").exists():
+    add_sys_path(PYKOTOR_PATH)
+if UTILITY_PATH.joinpath("utility").exists():
+    add_sys_path(UTILITY_PATH)
+
+import yaml
+
+from pykotor.common.language import LocalizedString
+from pykotor.common.misc import Game
+from pykotor.extract.installation import Installation
+from pykotor.resource.formats.gff import GFF, GFFContent, GFFList, bytes_gff
+from pykotor.resource.formats.ssf import SSF, SSFSound, bytes_ssf
+from pykotor.resource.formats.twoda import TwoDA, bytes_2da
+from pykotor.tools.reference_cache import (
+    StrRefReferenceCache,
+    TwoDAMemoryReferenceCache,
+    build_strref_cache,
+    build_twoda_memory_cache,
+    find_all_strref_references,
+)
+from pykotor.tslpatcher.diff.cache import DiffCache, load_diff_cache, restore_strref_cache_from_cache, save_diff_cache
+
+sys.path.insert(0, str(THIS_SCRIPT_PATH.parents[2] / "cli"))
+from test_diff_comprehensive import DiffTestDataHelper
+
+
+def _utc(strref: int, appearance: int) -> bytes:
+    gff = GFF(GFFContent.UTC)
+    gff.root.set_locstring("FirstName", LocalizedString(strref))
+    gff.root.set_uint16("Appearance_Type", appearance)
+    items = gff.root.set_list("ItemList", GFFList())
+    items.add(0).set_locstring("LocalizedName", LocalizedString(strref + 1))
+    return bytes_gff(gff)
+
+
+def _ssf(strref: int) -> bytes:
+    ssf = SSF()
+    ssf.set_data(SSFSound.BATTLE_CRY_1, strref)
+    return bytes_ssf(ssf)
+
+
+def _spells() -> bytes:
+    twoda = TwoDA(["label", "name", "spelldesc"])
+    twoda.add_row("0", {"label": "heal", "name": "100", "spelldesc": "****"})
+    return bytes_2da(twoda)
+
+
+def _snapshot(cache: StrRefReferenceCache | TwoDAMemoryReferenceCache) -> dict:
+    return {key: {str(identifier): sorted(locations) for identifier, locations in refs.items()} for key, refs in cache._cache.items()}
+
+
+class TestReferenceCacheShards(TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.install_path = self.temp_dir / "install"
+        DiffTestDataHelper.create_installation(
+            self.install_path,
+            override_resources={
+                "p_bastila.utc": _utc(10, 4),
+                "p_bastila.ssf": _ssf(20),
+                "spells.2da": _spells(),
+            },
+            modules_resources={
+                "m01aa.rim": {"n_carth.utc": _utc(30, 4)},
+                "m02aa.rim": {"n_mission.utc": _utc(10, 7)},
+            },
+        )
+        (self.install_path / "swkotor.exe").touch()
+        self.installation = Installation(self.install_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _serial_strref_cache(self) -> StrRefReferenceCache:
+        cache = StrRefReferenceCache(self.installation.game())
+        for resource in self.installation:
+            cache.scan_resource(resource, resource.data())
+        return cache
+
+    def test_sharded_build_matches_serial_scan(self):
+        expected = _snapshot(self._serial_strref_cache())
+        self.assertEqual(_snapshot(build_strref_cache(self.installation, max_workers=1)), expected)
+        parallel = build_strref_cache(self.installation, max_workers=2)
+        self.assertEqual(_snapshot(parallel), expected)
+        self.assertEqual(len(parallel.get_references(10)), 2)
+        self.assertEqual(parallel.get_statistics()["total_references"], 8)
+
+        results, _cache = find_all_strref_references(self.installation, [20, 100], max_workers=1)
+        self.assertEqual([r.resource.filename() for r in results[20]], ["p_bastila.ssf"])
+        self.assertEqual([r.resource.filename() for r in results[100]], ["spells.2da"])
+
+    def test_binary_round_trip_is_smaller_than_yaml(self):
+        cache = build_strref_cache(self.installation, max_workers=1)
+        data = cache.to_bytes()
+        restored = StrRefReferenceCache.from_bytes(data)
+        self.assertIs(restored.game, Game.K1)
+        self.assertEqual(_snapshot(restored), _snapshot(cache))
+        self.assertEqual(restored.get_statistics(), cache.get_statistics())
+        self.assertLess(len(data), len(yaml.dump(cache.to_dict())))
+
+        with self.assertRaises(ValueError):
+            TwoDAMemoryReferenceCache.from_bytes(data)
+
+    def test_merge_combines_shards(self):
+        first = StrRefReferenceCache(Game.K1)
+        first._add_reference(5, next(iter(self.installation)).identifier(), "A")
+        second = StrRefReferenceCache.from_bytes(first.to_bytes())
+        second._add_reference(6, next(iter(self.installation)).identifier(), "B")
+        first.merge(second)
+        self.assertEqual(first.get_references(5)[0][1], ["A", "A"])
+        self.assertTrue(first.has_references(6))
+        self.assertEqual(first.get_statistics()["total_references"], 3)
+
+    def test_twoda_memory_cache(self):
+        cache = build_twoda_memory_cache(self.installation, max_workers=1)
+        self.assertEqual(len(cache.get_references("appearance.2da", 4)), 2)
+        restored = TwoDAMemoryReferenceCache.from_bytes(cache.to_bytes())
+        self.assertEqual(_snapshot(restored), _snapshot(cache))
+        self.assertTrue(restored.has_references("APPEARANCE.2da", 7))
+
+    def test_diff_cache_stores_binary_strref_cache(self):
+        cache_file = self.temp_dir / "results.yaml"
+        strref_cache = build_strref_cache(self.installation, max_workers=1)
+        save_diff_cache(DiffCache(version="1", mine="a", older="b"), cache_file, self.temp_dir, self.temp_dir, strref_cache=strref_cache, log_func=lambda _msg: None)
+
+        saved = yaml.safe_load(cache_file.read_text(encoding="utf-8"))
+        self.assertNotIn("strref_cache_data", saved)
+        self.assertTrue((self.temp_dir / "results_data" / saved["strref_cache_file"]).is_file())
+
+        loaded, _left, _right = load_diff_cache(cache_file, log_func=lambda _msg: None)
+        restored = restore_strref_cache_from_cache(loaded)
+        assert restored is not None
+        self.assertEqual(_snapshot(restored), _snapshot(strref_cache))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -43,6 +43,10 @@ if TYPE_CHECKING:
     from pykotor.common.script import ScriptConstant, ScriptFunction
 
 
+# Error code of superseded/cancelled requests (NSSLanguageServer's REQUEST_CANCELLED)
+REQUEST_CANCELLED = -32800
+
+
 @dataclass
 class AnalysisResult:
     """Result of a document analysis."""
@@ -232,6 +236,11 @@ class LanguageServerClient:
                     # Check if there's a pending request
                     pending = self._pending_requests.pop(request_id, None)
                     
+                    error = response.get('error')
+                    if pending is not None and isinstance(error, dict) and error.get('code') == REQUEST_CANCELLED:
+                        # Superseded by a newer request; its own response will follow
+                        continue
+                    
                     if pending is not None:
                         # Store result
                         if response.get('error'):
@@ -373,6 +382,7 @@ class LanguageServerClient:
         line: int,
         character: int,
         callback: Callable[[list[dict[str, Any]]], None] | None = None,
+        filepath: str | Path | None = None,
     ) -> int:
         """Request completion suggestions.
         
@@ -381,6 +391,7 @@ class LanguageServerClient:
             line: 0-indexed line number
             character: 0-indexed character position
             callback: Optional callback for the result
+            filepath: Document whose own and included declarations should be offered
             
         Returns:
             Request ID (or -1 on failure)
@@ -391,6 +402,7 @@ class LanguageServerClient:
                 'text': text,
                 'line': line,
                 'character': character,
+                'filepath': str(filepath) if filepath else None,
             },
             callback=callback,
         )
@@ -401,6 +413,7 @@ class LanguageServerClient:
         line: int,
         character: int,
         callback: Callable[[dict[str, Any] | None], None] | None = None,
+        filepath: str | Path | None = None,
     ) -> int:
         """Request hover information.
         
@@ -409,6 +422,7 @@ class LanguageServerClient:
             line: 0-indexed line number
             character: 0-indexed character position
             callback: Optional callback for the result
+            filepath: Document whose own and included declarations should be searched
             
         Returns:
             Request ID (or -1 on failure)
@@ -419,10 +433,45 @@ class LanguageServerClient:
                 'text': text,
                 'line': line,
                 'character': character,
+                'filepath': str(filepath) if filepath else None,
             },
             callback=callback,
         )
     
+    def request_metrics(
+        self,
+        callback: Callable[[dict[str, Any]], None] | None = None,
+    ) -> int:
+        """Request the server's analysis latency statistics.
+        
+        Args:
+            callback: Optional callback for the result
+            
+        Returns:
+            Request ID (or -1 on failure)
+        """
+        return self._send_request(method='metrics', params={}, callback=callback)
+    
+    def cancel(self, request_id: int):
+        """Cancel a pending request; its callback will not be called.
+        
+        Args:
+            request_id: The request ID returned by a request method
+        """
+        with self._lock:
+            self._pending_requests.pop(request_id, None)
+        if self.is_running:
+            self._send_request('cancel', {'id': request_id})
+    
+    def close_document(self, filepath: str | Path | None = None):
+        """Tell the server to drop the incremental state kept for a document.
+        
+        Args:
+            filepath: The document's file path (None for an untitled document)
+        """
+        if self.is_running:
+            self._send_request('close', {'filepath': str(filepath) if filepath else None})
+    
     def get_result(self, request_id: int) -> Any | None:
         """Get the result of a request if available.
         
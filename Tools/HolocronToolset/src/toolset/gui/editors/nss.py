@@ -2015,6 +2015,7 @@ class NSSEditor(Editor):
             line=line,
             character=character,
             callback=lambda r, w=word, rid=request_id: self._on_hover_complete(r, requested_word=w, request_id=rid),
+            filepath=self._filepath,
         )
 
     def _on_hover_complete(self, result: dict[str, Any] | None, *, requested_word: str, request_id: int):
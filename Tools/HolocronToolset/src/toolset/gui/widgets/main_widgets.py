@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import glob
 import multiprocessing
 import os
 
@@ -9,7 +10,7 @@ from collections import defaultdict
 from concurrent.futures import Future, ProcessPoolExecutor
 from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, TypeVar, cast
 
 from qtpy import QtCore
 from qtpy.QtCore import (
@@ -17,6 +18,7 @@ from qtpy.QtCore import (
     QObject,
     QPoint,  # pyright: ignore[reportAttributeAccessIssue, reportPrivateImportUsage]
     QSortFilterProxyModel,  # pyright: ignore[reportAttributeAccessIssue, reportPrivateImportUsage]
+    QStandardPaths,  # pyright: ignore[reportAttributeAccessIssue, reportPrivateImportUsage]
     QTimer,  # pyright: ignore[reportAttributeAccessIssue, reportPrivateImportUsage]
     Qt,  # pyright: ignore[reportAttributeAccessIssue, reportPrivateImportUsage]
     Signal,  # pyright: ignore[reportAttributeAccessIssue, reportPrivateImportUsage]
@@ -29,17 +31,19 @@ from loggerplus import RobustLogger  # type: ignore[import-untyped, note]  # pyr
 from pykotor.extract.file import FileResource
 from pykotor.resource.formats.tpc import TPC, TPCMipmap, TPCTextureFormat, read_tpc, write_tpc
 from pykotor.resource.type import ResourceType
+from pykotor.tools.thumbnails import ThumbnailCache, get_thumbnail_cache
 from toolset.data.installation import HTInstallation
 from toolset.gui.dialogs.load_from_location_result import ResourceItems
 from toolset.gui.widgets.settings.installations import GlobalSettings
 from toolset.gui.widgets.texture_loader import TextureLoaderProcess, deserialize_mipmap
-from toolset.gui.widgets.texture_preview import load_resource_preview_mipmap, qimage_to_preview_mipmap
+from toolset.gui.widgets.texture_preview import qimage_to_preview_mipmap
 
 if TYPE_CHECKING:
     from qtpy.QtCore import QAbstractItemModel, QModelIndex, QRect
     from qtpy.QtGui import QMouseEvent, QResizeEvent, QShowEvent
     from qtpy.QtWidgets import QScrollBar, _QMenu
 
+    from pykotor.extract.resource_index import ResourceSearchIndex
     from pykotor.resource.formats.tpc.tpc_data import TPC
     from toolset.data.installation import HTInstallation
     from utility.ui_libraries.qt.widgets.itemviews.listview import RobustListView
@@ -154,6 +158,7 @@ class ResourceList(MainWindowList):
     ):
         """Set the installation for the resource list."""
         self._installation: HTInstallation = installation
+        self.modules_model.set_installation(installation)
 
     def set_resources(
         self,
@@ -184,10 +189,7 @@ class ResourceList(MainWindowList):
                     continue
                 if item.resource in resource_set:
                     continue
-                parent_item: QStandardItem | None = item.parent()
-                if parent_item is None:
-                    continue
-                parent_item.removeRow(item.row())
+                self.modules_model.remove_resource_item(item)
         self.modules_model.remove_unused_categories()
 
     def set_sections(
@@ -447,14 +449,26 @@ class ResourceProxyModel(QSortFilterProxyModel):
         super().__init__(parent)
         self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.filter_string: str = ""
+        # Resources matching filter_string, answered once per filter change by the source model's search index
+        self._matches: set[FileResource] | None = None
+        self._matches_version: int = -1
 
     def set_filter_string(
         self,
         filter_string: str,
     ):
         self.filter_string = filter_string.lower()
+        self._matches = None
         self.invalidateFilter()
 
+    def _matching_resources(self, model: QStandardItemModel) -> set[FileResource] | None:
+        if not self.filter_string or not isinstance(model, ResourceModel):
+            return None
+        if self._matches is None or self._matches_version != model.index_version():
+            self._matches = model.matching_resources(self.filter_string)
+            self._matches_version = model.index_version()
+        return self._matches
+
     def filterAcceptsRow(
         self,
         source_row: int,
@@ -465,6 +479,10 @@ class ResourceProxyModel(QSortFilterProxyModel):
         resref_index: QModelIndex = model.index(source_row, 0, source_parent)
         item: ResourceStandardItem | QStandardItem | None = model.itemFromIndex(resref_index)
         if isinstance(item, ResourceStandardItem):
+            matches: set[FileResource] | None = self._matching_resources(model)
+            if matches is not None:
+                return item.resource in matches
+
             # Get the file name and resource name
             filename: str = item.resource.filepath().name.lower()
             resname: str = item.resource.filename().lower()
@@ -486,6 +504,17 @@ class ResourceModel(QStandardItemModel):
         """Initialize the resource model."""
         super().__init__()
         self._category_items: dict[str, QStandardItem] = {}
+        # Rows by resource, plus the groupings the filter matches container names and extensions against
+        self._rows: dict[FileResource, ResourceStandardItem] = {}
+        self._container_rows: defaultdict[str, set[FileResource]] = defaultdict(set)
+        self._restype_rows: defaultdict[ResourceType, set[FileResource]] = defaultdict(set)
+        self._index_version: int = 0
+        # Which partitions of the installation's search index the rows come from, and which rows it does not index
+        self._installation: HTInstallation | None = None
+        self._covered_index: ResourceSearchIndex | None = None
+        self._covered_version: int = -1
+        self._covered_partitions: set[str] = set()
+        self._unindexed_rows: set[FileResource] = set()
         self._proxy_model: ResourceProxyModel = ResourceProxyModel(self)
         self._proxy_model.setSourceModel(self)
         self._proxy_model.setRecursiveFilteringEnabled(True)
@@ -495,10 +524,20 @@ class ResourceModel(QStandardItemModel):
     def proxy_model(self) -> ResourceProxyModel:
         return self._proxy_model
 
+    def set_installation(self, installation: HTInstallation | None):
+        """Set the installation whose search index answers the filter."""
+        self._installation = installation
+        self._covered_index = None
+        self._index_version += 1
+
     def clear(self):
         """Clear the resource model."""
         super().clear()
         self._category_items = {}
+        self._rows.clear()
+        self._container_rows.clear()
+        self._restype_rows.clear()
+        self._index_version += 1
         self.setColumnCount(2)
         self.setHorizontalHeaderLabels(["ResRef", "Type"])
 
@@ -517,14 +556,98 @@ class ResourceModel(QStandardItemModel):
             self.appendRow([category_item, unused_item])
         return self._category_items[chosen_category]
 
+    def index_version(self) -> int:
+        """Returns a counter that changes whenever resources are added or removed."""
+        return self._index_version
+
+    def matching_resources(
+        self,
+        filter_string: str,
+    ) -> set[FileResource]:
+        """Returns the resources whose filename or container file name contains the (lowercase) filter string.
+
+        Filenames are answered by a single query on the installation-wide search index, restricted to the partitions
+        the rows come from, and the hits are mapped back to the rows. Only rows the installation does not index (e.g. saves)
+        are tested one by one.
+        """
+        matches: set[FileResource] = set()
+        for container_name, resources in self._container_rows.items():
+            if filter_string in container_name:
+                matches.update(resources)
+
+        # A filename is '<resref>.<extension>' and resrefs have no dots: 'a.b' matches resrefs ending with 'a' of types
+        # whose extension starts with 'b', and a filter without a dot matches either the resref or the extension.
+        stem, dot, suffix = filter_string.rpartition(".")
+        if dot:
+            query: str = f"*{glob.escape(stem)}"
+            restypes: set[ResourceType] = {restype for restype in self._restype_rows if restype.extension.lower().startswith(suffix)}
+            if "." in stem:
+                restypes.clear()
+        else:
+            query = filter_string
+            restypes = set(self._restype_rows)
+            for restype, resources in self._restype_rows.items():
+                if filter_string in restype.extension.lower():
+                    matches.update(resources)
+
+        index: ResourceSearchIndex | None = self._installation_index()
+        unindexed_rows: Iterable[FileResource] = self._rows if index is None else self._unindexed_rows
+        if index is not None and restypes and self._covered_partitions:
+            page = index.search(query, mode="glob" if dot else "substring", restypes=restypes, partitions=self._covered_partitions)
+            matches.update(resource for _partition, resource in page.items if resource in self._rows)
+        matches.update(resource for resource in unindexed_rows if filter_string in resource.filename().lower())
+        return matches
+
+    def _installation_index(self) -> ResourceSearchIndex | None:
+        """Returns the installation's search index, after working out which of its partitions hold the rows."""
+        if self._installation is None:
+            return None
+        index: ResourceSearchIndex = self._installation.search_index()
+        if index is self._covered_index and self._covered_version == self._index_version:
+            return index
+        self._covered_partitions = set()
+        self._unindexed_rows = set()
+        for resource in self._rows:
+            partitions: list[str] = index.partitions_of(resource)
+            if partitions:
+                self._covered_partitions.update(partitions)
+            else:
+                self._unindexed_rows.add(resource)
+        self._covered_index = index
+        self._covered_version = self._index_version
+        return index
+
+    def _add_row(self, item: ResourceStandardItem):
+        resource: FileResource = item.resource
+        self._rows[resource] = item
+        self._container_rows[resource.filepath().name.lower()].add(resource)
+        self._restype_rows[resource.restype()].add(resource)
+        self._index_version += 1
+
+    def remove_resource_item(
+        self,
+        item: ResourceStandardItem,
+    ):
+        parent_item: QStandardItem | None = item.parent()
+        if parent_item is None:
+            return
+        resource: FileResource = item.resource
+        self._rows.pop(resource, None)
+        self._container_rows[resource.filepath().name.lower()].discard(resource)
+        self._restype_rows[resource.restype()].discard(resource)
+        self._index_version += 1
+        parent_item.removeRow(item.row())
+
     def add_resource(
         self,
         resource: FileResource,
         custom_category: str | None = None,
     ):
+        item = ResourceStandardItem(resource.resname(), resource=resource)
+        self._add_row(item)
         self._add_resource_into_category(resource.restype(), custom_category).appendRow(
             [
-                ResourceStandardItem(resource.resname(), resource=resource),
+                item,
                 QStandardItem(resource.restype().extension.upper()),
             ]
         )
@@ -553,9 +676,11 @@ class ResourceModel(QStandardItemModel):
             # Prepare all rows for this category
             rows: list[list[QStandardItem]] = []
             for resource in category_resources:
+                item = ResourceStandardItem(resource.resname(), resource=resource)
+                self._add_row(item)
                 rows.append(
                     [
-                        ResourceStandardItem(resource.resname(), resource=resource),
+                        item,
                         QStandardItem(resource.restype().extension.upper()),
                     ]
                 )
@@ -639,8 +764,12 @@ class TextureList(MainWindowList):
         # Timer for polling the result queue from TextureLoaderProcess
         self._poll_timer: QTimer = QTimer(self)
         self._poll_timer.timeout.connect(self._poll_result_queue)
-        # Map of (section_name, row) -> FileResource for pending process loads
-        self._pending_process_loads: dict[tuple[str, int], FileResource] = {}
+        # Map of (section_name, row, icon_size) -> FileResource for pending process loads
+        self._pending_process_loads: dict[tuple[str, int, int], FileResource] = {}
+        # Icons already built this session are set directly; the workers share a persistent on-disk thumbnail cache
+        self._thumbnails: ThumbnailCache = ThumbnailCache(memory_items=4096)
+        cache_location: str = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        self._thumbnail_dir: str | None = str(Path(cache_location, "thumbnails")) if cache_location else None
 
     def __del__(self):
         """Shutdown the executor when the texture list is deleted."""
@@ -706,7 +835,13 @@ class TextureList(MainWindowList):
         # Start new loader process with installation path
         if installation is not None:
             try:
-                self._loader = TextureLoaderProcess(str(installation.path()), installation.tsl, self._loadRequestQueue, self._loadedTextureQueue)
+                self._loader = TextureLoaderProcess(
+                    str(installation.path()),
+                    installation.tsl,
+                    self._loadRequestQueue,
+                    self._loadedTextureQueue,
+                    self._thumbnail_dir,
+                )
                 self._loader.start()
                 # Start polling for results at 60Hz (every ~16ms)
                 self._poll_timer.start(16)
@@ -979,13 +1114,18 @@ class TextureList(MainWindowList):
         assert isinstance(item, ResourceStandardItem), f"Expected ResourceStandardItem, got {type(item).__name__}"
         if reload:
             self._loading_resources.discard(item.resource)
+            self._thumbnails.discard(item.resource, icon_size)
         if item.resource in self._loading_resources:
             return
+        cached: TPCMipmap | None = self._thumbnails.cached(item.resource, icon_size)
+        if cached is not None:
+            self._set_item_icon(item, cached)
+            return
         self._loading_resources.add(item.resource)
 
         section_name: str = self.ui.sectionCombo.currentData(Qt.ItemDataRole.UserRole)
         row: int = item.row()
-        context = (section_name, row)
+        context = (section_name, row, icon_size)
 
         # Use TextureLoaderProcess if available and running
         if self._loader is not None and self._loader.is_alive():
@@ -1001,11 +1141,11 @@ class TextureList(MainWindowList):
 
         # Fall back to ProcessPoolExecutor
         try:
-            future: Future[tuple[tuple[str, int], TPCMipmap]] = self._executor.submit(get_image_from_resource, context, item.resource, icon_size)
+            future: Future[tuple[tuple[str, int, int], TPCMipmap]] = self._executor.submit(get_image_from_resource, context, item.resource, icon_size, self._thumbnail_dir)
         except BrokenProcessPool as e:
             RobustLogger().error("Broken process pool, recreating...", exc_info=e)
             self._executor = ProcessPoolExecutor(max_workers=multiprocessing.cpu_count())
-            future = self._executor.submit(get_image_from_resource, context, item.resource, icon_size)
+            future = self._executor.submit(get_image_from_resource, context, item.resource, icon_size, self._thumbnail_dir)
         future.add_done_callback(self.sig_icon_loaded.emit)
 
     def _poll_result_queue(self):
@@ -1039,7 +1179,9 @@ class TextureList(MainWindowList):
                     continue
 
                 # Update the icon
-                section_name, row = context
+                section_name, row, icon_size = context
+                if resource is not None:
+                    self._thumbnails.put(resource, icon_size, mipmap)
                 src_index: QModelIndex = self.texture_source_models[section_name].index(row, 0)
                 if not src_index.isValid():
                     continue
@@ -1047,15 +1189,7 @@ class TextureList(MainWindowList):
                 item: QStandardItem | None = self.texture_source_models[section_name].itemFromIndex(src_index)
                 if item is None:
                     continue
-
-                image: QImage = mipmap.to_qimage()
-                y_flipped_image: QPixmap = QPixmap.fromImage(image.mirrored(False, True))
-                pixmap: QPixmap = y_flipped_image.scaled(
-                    self.ui.resourceList.iconSize(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                item.setIcon(QIcon(pixmap))
+                self._set_item_icon(item, mipmap)
 
             except Exception:
                 # Queue is empty or other error, stop polling this cycle
@@ -1090,12 +1224,12 @@ class TextureList(MainWindowList):
     @Slot(Future)
     def on_icon_loaded(
         self,
-        future: Future[tuple[tuple[str, int], TPCMipmap]],  # pyright: ignore[reportArgumentType]
+        future: Future[tuple[tuple[str, int, int], TPCMipmap]],  # pyright: ignore[reportArgumentType]
     ):
         """Handle the completion of an icon load."""
         # print("Icon loaded callback triggered")
         item_context, tpc_mipmap = future.result()
-        section_name, row = item_context
+        section_name, row, icon_size = item_context
         # print(f"Loaded icon for section: {section_name}, row: {row}")
         src_index: QModelIndex = self.texture_source_models[section_name].index(row, 0)
         if not src_index.isValid():
@@ -1105,6 +1239,15 @@ class TextureList(MainWindowList):
         if item is None:
             RobustLogger().warning(f"No item found for row {row}")
             return
+        if isinstance(item, ResourceStandardItem):
+            self._thumbnails.put(item.resource, icon_size, tpc_mipmap)
+        self._set_item_icon(item, tpc_mipmap)
+
+    def _set_item_icon(
+        self,
+        item: QStandardItem,
+        tpc_mipmap: TPCMipmap,
+    ):
         image: QImage = tpc_mipmap.to_qimage()
         y_flipped_image: QPixmap = QPixmap.fromImage(image.mirrored(False, True))
         pixmap: QPixmap = y_flipped_image.scaled(
@@ -1149,14 +1292,15 @@ def get_image_from_resource(
     context: T,
     resource: FileResource,
     icon_size: int = 64,
+    thumbnail_dir: str | None = None,
 ) -> tuple[T, TPCMipmap]:
     """Get a displayable preview mipmap from a resource.
 
-    This delegates to `toolset.gui.widgets.texture_preview` so the Texture tab,
-    loader process, and editors share the same conversion rules (DXT->RGB/RGBA).
+    Thumbnails come from the worker's `pykotor.tools.thumbnails` cache, backed by the on-disk cache in `thumbnail_dir`,
+    so a texture is only decoded the first time it is shown.
     """
     try:
-        return context, load_resource_preview_mipmap(resource, icon_size)
+        return context, get_thumbnail_cache(thumbnail_dir).get(resource, icon_size)
     except Exception as e:  # noqa: BLE001
         RobustLogger().warning(f"Failed to build preview icon for resource '{resource.path_ident()!r}': {e}")
         app_style: QStyle | None = QApplication.style()
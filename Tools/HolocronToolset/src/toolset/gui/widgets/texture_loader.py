@@ -19,9 +19,9 @@ from typing import TYPE_CHECKING, Any
 
 from loggerplus import RobustLogger
 from pykotor.extract.installation import Installation, SearchLocation
-from pykotor.resource.formats.tpc import TPCTextureFormat
 from pykotor.resource.formats.tpc.tpc_data import TPCMipmap
 from pykotor.resource.type import ResourceType
+from pykotor.tools.thumbnails import deserialize_thumbnail, get_thumbnail_cache, serialize_thumbnail
 from toolset.gui.widgets.texture_preview import load_preview_mipmap_from_bytes
 
 if TYPE_CHECKING:
@@ -52,6 +52,7 @@ class TextureLoaderProcess(multiprocessing.Process):
         is_tsl: bool,  # NOTE: is_tsl is stored but not used - Installation auto-detects game version
         request_queue: "Queue[tuple[str, ResourceType, Any, int] | None]",
         result_queue: "Queue[tuple[Any, bytes | None, str | None]]",
+        thumbnail_dir: str | None = None,
     ):
         """Initialize the texture loader process.
 
@@ -60,12 +61,14 @@ class TextureLoaderProcess(multiprocessing.Process):
             is_tsl: True if this is a TSL (KOTOR 2) installation (stored for compatibility, not used)
             request_queue: Queue to receive load requests from
             result_queue: Queue to send loaded textures to (as serialized bytes)
+            thumbnail_dir: Folder of the persistent thumbnail cache, or None to keep thumbnails in memory only
         """
         super().__init__(daemon=True, name="TextureLoaderProcess")
         self._installation_path: str = installation_path
         self._is_tsl: bool = is_tsl  # Stored but not passed to Installation - it auto-detects
         self._request_queue: "Queue[tuple[str, ResourceType, Any, int] | None]" = request_queue
         self._result_queue: "Queue[tuple[Any, bytes | None, str | None]]" = result_queue
+        self._thumbnail_dir: str | None = thumbnail_dir
         self._shutdown: MPEvent = multiprocessing.Event()
 
     def run(self):
@@ -148,9 +151,17 @@ class TextureLoaderProcess(multiprocessing.Process):
             raise FileNotFoundError(f"Texture not found: {resref}.{restype.extension}")
 
         texture_bytes = texture_data.data
-        # IMPORTANT: Always convert to a Qt-displayable pixel format (DXT → RGB/RGBA),
-        # matching the TPCEditor display logic.
-        mipmap = load_preview_mipmap_from_bytes(restype, texture_bytes, icon_size)
+        try:
+            file_resource = texture_data.as_file_resource()
+        except RuntimeError:
+            file_resource = None
+        if file_resource is not None:
+            # Served from memory or the on-disk thumbnail cache when this texture was shown before
+            mipmap = get_thumbnail_cache(self._thumbnail_dir).get(file_resource, icon_size, data=texture_bytes)
+        else:
+            # IMPORTANT: Always convert to a Qt-displayable pixel format (DXT → RGB/RGBA),
+            # matching the TPCEditor display logic.
+            mipmap = load_preview_mipmap_from_bytes(restype, texture_bytes, icon_size)
 
         # Serialize mipmap data for cross-process transfer
         return self._serialize_mipmap(mipmap)
@@ -164,17 +175,10 @@ class TextureLoaderProcess(multiprocessing.Process):
         - format (4 bytes, int - TPCTextureFormat value)
         - data_length (4 bytes, int)
         - data (variable length bytes)
-        """
-        import struct
 
-        header = struct.pack(
-            "<IIII",
-            mipmap.width,
-            mipmap.height,
-            mipmap.tpc_format.value,
-            len(mipmap.data),
-        )
-        return header + bytes(mipmap.data)
+        This is the thumbnail cache's entry format, see `pykotor.tools.thumbnails`.
+        """
+        return serialize_thumbnail(mipmap)
 
     def request_shutdown(self):
         """Request the process to shut down gracefully."""
@@ -202,16 +206,4 @@ def deserialize_mipmap(data: bytes) -> TPCMipmap:
     Returns:
         Reconstructed TPCMipmap object
     """
-    import struct
-
-    header_size = 16  # 4 * 4 bytes
-    width, height, format_value, data_length = struct.unpack("<IIII", data[:header_size])
-
-    mipmap_data = bytearray(data[header_size : header_size + data_length])
-
-    return TPCMipmap(
-        width=width,
-        height=height,
-        tpc_format=TPCTextureFormat(format_value),
-        data=mipmap_data,
-    )
+    return deserialize_thumbnail(data)
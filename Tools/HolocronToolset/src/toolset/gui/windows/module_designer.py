@@ -37,6 +37,7 @@ from pykotor.common.misc import Color, ResRef
 from pykotor.common.module import Module, ModuleResource
 from pykotor.extract.file import ResourceIdentifier
 from pykotor.gl.scene import Camera
+from pykotor.gl.scene.scene_cache import SceneCache
 from pykotor.resource.formats.bwm import BWM
 from pykotor.resource.formats.lyt import LYT, LYTDoorHook, LYTObstacle, LYTRoom, LYTTrack
 from pykotor.resource.generics.git import (
@@ -1520,8 +1521,8 @@ class ModuleDesigner(QMainWindow, BlenderEditorMixin):
         *,
         refresh_lists: bool = False,
     ):
-        if self.ui.mainRenderer._scene:
-            self.ui.mainRenderer._scene.invalidate_cache()
+        if self.ui.mainRenderer._scene and instance is not None:
+            SceneCache.update_instances(self.ui.mainRenderer._scene, changed=[instance])
         self.ui.mainRenderer.update()
         self.ui.flatRenderer.update()
 
@@ -1850,7 +1851,7 @@ class ModuleDesigner(QMainWindow, BlenderEditorMixin):
             assert git_resource is not None
             git_resource.add(instance)
         if self.ui.mainRenderer._scene:
-            self.ui.mainRenderer._scene.invalidate_cache()
+            SceneCache.update_instances(self.ui.mainRenderer._scene, added=[instance])
         
         # Sync to Blender if not already syncing from Blender
         if self.is_blender_mode() and self._blender_controller is not None and not self._instance_sync_in_progress:
@@ -2101,7 +2102,7 @@ class ModuleDesigner(QMainWindow, BlenderEditorMixin):
         self.selected_instances.clear()
         if self.ui.mainRenderer._scene:
             self.ui.mainRenderer._scene.selection.clear()
-            self.ui.mainRenderer._scene.invalidate_cache()
+            SceneCache.update_instances(self.ui.mainRenderer._scene, removed=instances_to_delete)
         self.ui.flatRenderer.instance_selection.clear()
         self.rebuild_instance_list()
 
@@ -18,6 +18,7 @@ from qtpy.QtWidgets import QApplication, QMessageBox, QWidget
 
 import resources_rc  # noqa: PLC0415, F401  # pylint: disable=ungrouped-imports,unused-import
 
+from pykotor.common.module_closure import configure_module_closure_cache, default_cache_path
 from toolset.config import CURRENT_VERSION
 from toolset.gui.windows.main import ToolWindow
 from toolset.main_init import is_running_from_temp
@@ -293,6 +294,7 @@ def main():
 
     setup_post_init_settings()
     setup_toolset_default_env()
+    configure_module_closure_cache(default_cache_path())  # reopen modules warm across sessions
 
     if is_running_from_temp():
         QMessageBox.critical(
@@ -15,10 +15,15 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import concurrent.futures
 import hashlib
 import json
 import os
-from collections.abc import Iterable, Iterator
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
 from typing import Any
@@ -46,7 +51,10 @@ from pykotor.tools.path import CaseAwarePath, find_kotor_paths_from_default
 
 SERVER = Server("KotorMCP")
 
-INSTALLATIONS: dict[Game, Installation] = {}
+# Tool calls run in a bounded pool of worker threads so a slow scan never blocks the event loop.
+MAX_WORKERS: int = min(32, (os.cpu_count() or 1) + 4)
+TOOL_TIMEOUT: float = 120.0
+_EXECUTOR: concurrent.futures.ThreadPoolExecutor | None = None
 DEFAULT_PATH_CACHE = find_kotor_paths_from_default()
 GAME_ALIASES: dict[str, Game] = {
     "k1": Game.K1,
@@ -112,17 +120,162 @@ def _iter_candidate_paths(game: Game, explicit: str | None) -> Iterator[CaseAwar
             yield default_path
 
 
-def _load_installation(game: Game, explicit_path: str | None = None) -> Installation:
-    cached = INSTALLATIONS.get(game)
-    if cached:
-        return cached
+class ToolCancelledError(Exception):
+    """Raised inside a worker when the tool call it serves was cancelled or timed out."""
 
-    for candidate in _iter_candidate_paths(game, explicit_path):
-        if candidate.is_dir():
-            INSTALLATIONS[game] = Installation(candidate)
-            return INSTALLATIONS[game]
 
-    raise ValueError(f"Unable to locate installation for {game.name}. Provide --path or set {ENV_HINTS[game][0]}.")
+def _check_cancelled(cancel: threading.Event) -> None:
+    if cancel.is_set():
+        raise ToolCancelledError
+
+
+@dataclass
+class InstallationSlot:
+    """A cached installation and its readiness: ``loading``, ``ready`` or ``failed``."""
+
+    game: Game
+    state: str = "loading"
+    path: str | None = None
+    installation: Installation | None = None
+    error: str | None = None
+    load_seconds: float | None = None
+    ready: threading.Event = field(default_factory=threading.Event)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "path": self.path,
+            "error": self.error,
+            "loadSeconds": None if self.load_seconds is None else round(self.load_seconds, 3),
+        }
+
+
+INSTALLATIONS: dict[Game, InstallationSlot] = {}
+_INSTALLATIONS_LOCK = threading.Lock()
+
+
+def _load_installation(
+    game: Game,
+    explicit_path: str | None = None,
+    cancel: threading.Event | None = None,
+) -> Installation:
+    """Return the cached installation for a game, loading it once.
+
+    Concurrent callers for a game that is still loading wait for the first load instead of starting their own.
+    A failed load is retried by the next caller.
+
+    `Installation` loads its locations (modules, override, texture packs, stream folders, ...) and builds its
+    search index lazily, without locking. The loading caller does all of that before the slot is marked ready,
+    so the tool threads sharing the installation afterwards only read it.
+    """
+    with _INSTALLATIONS_LOCK:
+        slot = INSTALLATIONS.get(game)
+        owner = slot is None or slot.state == "failed"
+        if owner:
+            slot = INSTALLATIONS[game] = InstallationSlot(game)
+    assert slot is not None
+
+    if not owner:
+        while not slot.ready.wait(0.1):
+            if cancel is not None:
+                _check_cancelled(cancel)
+        if slot.installation is None:
+            raise ValueError(slot.error)
+        return slot.installation
+
+    start = time.perf_counter()
+    try:
+        for candidate in _iter_candidate_paths(game, explicit_path):
+            if candidate.is_dir():
+                slot.path = str(candidate)
+                installation = Installation(candidate)
+                installation.search_index()  # loads every location the tools read
+                slot.installation = installation
+                break
+        else:
+            raise ValueError(f"Unable to locate installation for {game.name}. Provide --path or set {ENV_HINTS[game][0]}.")
+    except Exception as e:
+        slot.state = "failed"
+        slot.error = str(e)
+        raise
+    else:
+        slot.state = "ready"
+    finally:
+        slot.load_seconds = time.perf_counter() - start
+        slot.ready.set()
+    return slot.installation
+
+
+def _installation_for(arguments: dict[str, Any], cancel: threading.Event) -> Installation:
+    game = _resolve_game(arguments.get("game"))
+    if game is None:
+        raise ValueError("Specify game parameter (k1/k2).")
+    return _load_installation(game, cancel=cancel)
+
+
+class ToolMetrics:
+    """Per-tool call counts and latencies, kept for the `serverStatus` tool."""
+
+    WINDOW = 256  # latencies kept per tool for percentiles
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools: dict[str, dict[str, Any]] = {}
+
+    def _entry(self, name: str) -> dict[str, Any]:
+        return self._tools.setdefault(
+            name,
+            {"calls": 0, "inFlight": 0, "errors": 0, "timeouts": 0, "cancelled": 0, "totalSeconds": 0.0, "maxSeconds": 0.0, "recent": deque(maxlen=self.WINDOW)},
+        )
+
+    def begin(self, name: str) -> None:
+        with self._lock:
+            self._entry(name)["inFlight"] += 1
+
+    def end(self, name: str, seconds: float, outcome: str) -> None:
+        with self._lock:
+            entry = self._entry(name)
+            entry["inFlight"] -= 1
+            entry["calls"] += 1
+            entry["totalSeconds"] += seconds
+            entry["maxSeconds"] = max(entry["maxSeconds"], seconds)
+            entry["recent"].append(seconds)
+            if outcome != "ok":
+                entry[outcome] += 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            result: dict[str, dict[str, Any]] = {}
+            for name, entry in self._tools.items():
+                recent = sorted(entry["recent"])
+                result[name] = {
+                    "calls": entry["calls"],
+                    "inFlight": entry["inFlight"],
+                    "errors": entry["errors"],
+                    "timeouts": entry["timeouts"],
+                    "cancelled": entry["cancelled"],
+                    "meanMs": round(entry["totalSeconds"] * 1000 / entry["calls"], 2) if entry["calls"] else None,
+                    "p50Ms": round(recent[len(recent) // 2] * 1000, 2) if recent else None,
+                    "p95Ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000, 2) if recent else None,
+                    "maxMs": round(entry["maxSeconds"] * 1000, 2),
+                }
+            return result
+
+
+METRICS = ToolMetrics()
+
+
+def _executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _EXECUTOR  # noqa: PLW0603
+    if _EXECUTOR is None:
+        _EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="kotormcp")
+    return _EXECUTOR
+
+
+def _preload_installations(games: Iterable[Game]) -> None:
+    """Start loading installations in the worker pool so the first tool calls find them warm."""
+    for game in games:
+        _executor().submit(_load_installation, game)  # failures are recorded in the installation slot
 
 
 def _parse_resource_types(raw: Iterable[str] | None) -> set[ResourceType]:
@@ -170,57 +323,42 @@ def _resolve_module_name(installation: Installation, alias: str) -> str | None:
     return None
 
 
-def _iter_resources_for_location(
+def _index_partitions(
     installation: Installation,
+    partitions: list[str],
     location: str,
     module_filter: str | None,
-) -> Iterator[tuple[str, FileResource]]:
+) -> set[str]:
+    """Map a listResources location to the partitions of the installation's search index."""
     lowered = location.lower()
     if lowered == "auto":
         lowered = "all"
-    if lowered in {"override", "all"}:
-        for resource in installation.override_resources():
-            yield "override", resource
-    if lowered in {"core", "all"}:
-        for resource in installation.core_resources():
-            yield "core", resource
     if lowered.startswith("module:"):
         _, module_alias = lowered.split(":", 1)
         resolved = _resolve_module_name(installation, module_alias)
-        if not resolved:
-            return
-        for resource in installation.module_resources(resolved):
-            yield f"module:{resolved}", resource
-        return
-    if lowered in {"modules", "all"}:
-        for module_name in installation.modules_list():
-            if module_filter and module_filter.lower() not in module_name.lower():
-                continue
-            for resource in installation.module_resources(module_name):
-                yield f"module:{module_name}", resource
-    if lowered in {"chitin", "bif", "all"}:
-        for resource in installation.chitin_resources():
-            yield "chitin", resource
-    if lowered in {"lips", "all"}:
-        for filename in installation.lips_list():
-            for resource in installation.lip_resources(filename):
-                yield f"lips:{filename}", resource
-    if lowered in {"texturepacks", "textures", "all"}:
-        for filename in installation.texturepacks_list():
-            for resource in installation.texturepack_resources(filename):
-                yield f"texturepack:{filename}", resource
-    if lowered in {"streammusic", "all"}:
-        installation.load_streammusic()
-        for resource in installation._streammusic:
-            yield "streammusic", resource
-    if lowered in {"streamsounds", "all"}:
-        installation.load_streamsounds()
-        for resource in installation._streamsounds:
-            yield "streamsounds", resource
-    if lowered in {"streamwaves", "voice", "all"}:
-        installation.load_streamwaves()
-        for resource in installation._streamwaves:
-            yield "streamwaves", resource
+        return set() if resolved is None else {f"module:{resolved}"}
+    groups: dict[str, tuple[str, ...]] = {
+        "override": ("override",),
+        "core": ("core",),
+        "chitin": ("core",),
+        "bif": ("core",),
+        "modules": ("module:",),
+        "lips": ("lips:",),
+        "texturepacks": ("texturepack:",),
+        "textures": ("texturepack:",),
+        "streammusic": ("streammusic",),
+        "streamsounds": ("streamsounds",),
+        "streamwaves": ("streamwaves",),
+        "voice": ("streamwaves",),
+    }
+    selected: set[str] = set()
+    for partition in partitions:
+        if lowered != "all" and not any(partition == group or (group.endswith(":") and partition.startswith(group)) for group in groups.get(lowered, ())):
+            continue
+        if module_filter and partition.startswith("module:") and module_filter.lower() not in partition.lower():
+            continue
+        selected.add(partition)
+    return selected
 
 
 def _summarize_gff(data: bytes) -> dict[str, Any]:
@@ -300,29 +438,33 @@ def _describe_resource(result: ResourceResult) -> dict[str, Any]:
     return summary
 
 
-def _journal_entries(installation: Installation) -> list[dict[str, Any]]:
+def _journal_entries(installation: Installation, cancel: threading.Event | None = None) -> list[dict[str, Any]]:
     """Parse global.jrl and extract plot entries (structure documented in xoreos journal.cpp)."""
     resource = installation.resource("global", ResourceType.JRL)
     if resource is None:
         raise ValueError("Unable to locate global.jrl in the current installation.")
-    gff = read_gff(BytesIO(resource.data))
+    if cancel is not None:
+        _check_cancelled(cancel)
+    gff = read_gff(resource.data)
     categories = []
     for entry in gff.root.get_list("Categories", default=[]):
+        if cancel is not None:
+            _check_cancelled(cancel)
         category = {
             "name": entry.get_string("Name", ""),
             "tag": entry.get_string("Tag", ""),
             "comment": entry.get_string("Comment", ""),
-            "priority": entry.get_uint("Priority", 0),
-            "xp": entry.get_uint("XP", 0),
+            "priority": entry.acquire("Priority", 0),
+            "xp": entry.acquire("XP", 0),
             "entries": [],
         }
         for quest in entry.get_list("EntryList", default=[]):
             category["entries"].append(
                 {
-                    "id": quest.get_uint("ID", 0),
+                    "id": quest.acquire("ID", 0),
                     "text": quest.get_string("Text", "")[:400],
                     "comment": quest.get_string("Comment", ""),
-                    "completes_plot": bool(quest.get_uint("End", 0)),
+                    "completes_plot": bool(quest.acquire("End", 0)),
                 }
             )
         categories.append(category)
@@ -371,7 +513,14 @@ async def list_tools() -> list[types.Tool]:
                         "items": {"type": "string"},
                         "description": "Resource types (NCS, DLG, JRL, .gff, etc.).",
                     },
-                    "resrefQuery": {"type": "string", "description": "Case-insensitive substring filter for resrefs."},
+                    "resrefQuery": {"type": "string", "description": "Case-insensitive filter for resrefs, interpreted according to 'match'."},
+                    "match": {
+                        "type": "string",
+                        "enum": ["substring", "prefix", "glob"],
+                        "default": "substring",
+                        "description": "How resrefQuery is matched: anywhere in the resref, at its start, or as a glob pattern (e.g. 'k_*_01?').",
+                    },
+                    "offset": {"type": "integer", "minimum": 0, "default": 0, "description": "Number of matches to skip (use nextOffset from the previous page)."},
                     "limit": {"type": "integer", "minimum": 1, "maximum": 500, "default": 50},
                 },
             },
@@ -403,93 +552,160 @@ async def list_tools() -> list[types.Tool]:
                 "required": ["game"],
             },
         ),
+        types.Tool(
+            name="serverStatus",
+            description="Report installation readiness, worker pool settings and per-tool latency metrics.",
+            inputSchema={"type": "object", "properties": {}},
+        ),
     ]
 
 
-@SERVER.call_tool()
-async def handle_call_tool(name: str, arguments: dict[str, Any]) -> types.CallToolResult:
-    if name == "detectInstallations":
-        payload = {}
-        for game in (Game.K1, Game.K2):
-            default_keys = {str(path).lower() for path in DEFAULT_PATH_CACHE.get(game, [])}
-            details = []
-            for candidate in _iter_candidate_paths(game, None):
-                key = str(candidate).lower()
-                details.append(
-                    {
-                        "path": str(candidate),
-                        "exists": candidate.is_dir(),
-                        "label": "default" if key in default_keys else "env",
-                    }
-                )
-            payload[game.name] = details
-        return _json_content(payload)
-
-    if name == "loadInstallation":
-        game = _resolve_game(arguments.get("game"))
-        if game is None:
-            raise ValueError("Specify game as k1 or k2.")
-        path = arguments.get("path")
-        installation = _load_installation(game, path)
-        return _json_content({"game": game.name, "path": str(installation.path())})
+ToolFunction = Callable[[dict[str, Any], threading.Event], Any]
+TOOLS: dict[str, ToolFunction] = {}
+INLINE_TOOLS: set[str] = set()  # cheap tools answered on the event loop, even when every worker is busy
 
-    if name == "listResources":
-        game = _resolve_game(arguments.get("game"))
-        if game is None:
-            raise ValueError("Specify game parameter (k1/k2).")
-        installation = _load_installation(game)
-        location = arguments.get("location", "all")
-        module_filter = arguments.get("moduleFilter")
-        type_filters = _parse_resource_types(arguments.get("resourceTypes"))
-        resref_query = (arguments.get("resrefQuery") or "").lower()
-        limit = int(arguments.get("limit", 50))
-        results = []
-        for source, resource in _iter_resources_for_location(installation, location, module_filter):
-            if resref_query and resref_query not in resource.resname().lower():
-                continue
-            if type_filters and resource.restype() not in type_filters:
-                continue
-            results.append(_resource_snapshot(source, resource))
-            if len(results) >= limit:
-                break
-        return _json_content({"count": len(results), "items": results, "truncated": len(results) >= limit})
 
-    if name == "describeResource":
-        game = _resolve_game(arguments.get("game"))
-        if game is None:
-            raise ValueError("Specify game parameter (k1/k2).")
-        installation = _load_installation(game)
-        resref = arguments["resref"]
-        restype = arguments["restype"]
-        order_labels = arguments.get("order") or [
-            SearchLocation.OVERRIDE.name,
-            SearchLocation.CUSTOM_FOLDERS.name,
-            SearchLocation.MODULES.name,
-            SearchLocation.CHITIN.name,
-        ]
-        order: list[SearchLocation] = []
-        for label in order_labels:
-            upper = label.upper()
-            if upper not in SearchLocation.__members__:
-                raise ValueError(f"Unknown SearchLocation '{label}'")
-            order.append(SearchLocation[upper])
-        resource_type = _parse_resource_types([restype]).pop()
-        result = installation.resource(resref, resource_type, order=order)
-        if result is None:
-            raise ValueError(f"{resref}.{resource_type.extension} not found.")
-        summary = _describe_resource(result)
-        return _json_content(summary)
-
-    if name == "journalOverview":
-        game = _resolve_game(arguments.get("game"))
-        if game is None:
-            raise ValueError("Specify game parameter (k1/k2).")
-        installation = _load_installation(game)
-        payload = _journal_entries(installation)
-        return _json_content({"count": len(payload), "categories": payload})
+def _tool(name: str, *, inline: bool = False) -> Callable[[ToolFunction], ToolFunction]:
+    def register(function: ToolFunction) -> ToolFunction:
+        TOOLS[name] = function
+        if inline:
+            INLINE_TOOLS.add(name)
+        return function
 
-    msg = f"Unknown tool '{name}'"
-    raise ValueError(msg)
+    return register
+
+
+@_tool("detectInstallations")
+def _detect_installations(arguments: dict[str, Any], cancel: threading.Event) -> Any:
+    payload = {}
+    for game in (Game.K1, Game.K2):
+        default_keys = {str(path).lower() for path in DEFAULT_PATH_CACHE.get(game, [])}
+        details = []
+        for candidate in _iter_candidate_paths(game, None):
+            _check_cancelled(cancel)
+            key = str(candidate).lower()
+            details.append(
+                {
+                    "path": str(candidate),
+                    "exists": candidate.is_dir(),
+                    "label": "default" if key in default_keys else "env",
+                }
+            )
+        payload[game.name] = details
+    return payload
+
+
+@_tool("loadInstallation")
+def _load_installation_tool(arguments: dict[str, Any], cancel: threading.Event) -> Any:
+    game = _resolve_game(arguments.get("game"))
+    if game is None:
+        raise ValueError("Specify game as k1 or k2.")
+    path = arguments.get("path")
+    installation = _load_installation(game, path, cancel)
+    return {"game": game.name, "path": str(installation.path()), **INSTALLATIONS[game].snapshot()}
+
+
+@_tool("listResources")
+def _list_resources(arguments: dict[str, Any], cancel: threading.Event) -> Any:
+    installation = _installation_for(arguments, cancel)
+    type_filters = _parse_resource_types(arguments.get("resourceTypes"))
+    location = str(arguments.get("location", "all"))
+    offset = int(arguments.get("offset", 0))
+    limit = int(arguments.get("limit", 50))
+    index = installation.search_index()
+    _check_cancelled(cancel)
+    partitions = _index_partitions(installation, index.partitions(), location, arguments.get("moduleFilter"))
+    page = index.search(
+        arguments.get("resrefQuery") or "",
+        mode=arguments.get("match", "substring"),
+        restypes=type_filters or None,
+        partitions=partitions,
+        offset=offset,
+        limit=limit,
+    )
+    # The index files BIF resources under "core"; the chitin/bif locations have always labelled them "chitin"
+    chitin_label = location.lower() in {"chitin", "bif"}
+    results = [_resource_snapshot("chitin" if chitin_label and source == "core" else source, resource) for source, resource in page.items]
+    return {"count": len(results), "items": results, "truncated": page.truncated, "nextOffset": page.next_offset}
+
+
+@_tool("describeResource")
+def _describe_resource_tool(arguments: dict[str, Any], cancel: threading.Event) -> Any:
+    installation = _installation_for(arguments, cancel)
+    resref = arguments["resref"]
+    restype = arguments["restype"]
+    order_labels = arguments.get("order") or [
+        SearchLocation.OVERRIDE.name,
+        SearchLocation.CUSTOM_FOLDERS.name,
+        SearchLocation.MODULES.name,
+        SearchLocation.CHITIN.name,
+    ]
+    order: list[SearchLocation] = []
+    for label in order_labels:
+        upper = label.upper()
+        if upper not in SearchLocation.__members__:
+            raise ValueError(f"Unknown SearchLocation '{label}'")
+        order.append(SearchLocation[upper])
+    resource_type = _parse_resource_types([restype]).pop()
+    result = installation.resource(resref, resource_type, order=order)
+    if result is None:
+        raise ValueError(f"{resref}.{resource_type.extension} not found.")
+    _check_cancelled(cancel)
+    return _describe_resource(result)
+
+
+@_tool("journalOverview")
+def _journal_overview(arguments: dict[str, Any], cancel: threading.Event) -> Any:
+    installation = _installation_for(arguments, cancel)
+    payload = _journal_entries(installation, cancel)
+    return {"count": len(payload), "categories": payload}
+
+
+@_tool("serverStatus", inline=True)
+def _server_status(arguments: dict[str, Any], cancel: threading.Event) -> Any:
+    with _INSTALLATIONS_LOCK:
+        installations = {game.name: slot.snapshot() for game, slot in INSTALLATIONS.items()}
+    return {
+        "workers": MAX_WORKERS,
+        "toolTimeoutSeconds": TOOL_TIMEOUT,
+        "installations": installations,
+        "tools": METRICS.snapshot(),
+    }
+
+
+@SERVER.call_tool()
+async def handle_call_tool(name: str, arguments: dict[str, Any]) -> types.CallToolResult:
+    """Run a tool in the worker pool, bounded by `TOOL_TIMEOUT`.
+
+    When the call times out or the client cancels it, the worker is told to stop at its next checkpoint.
+    """
+    function = TOOLS.get(name)
+    if function is None:
+        msg = f"Unknown tool '{name}'"
+        raise ValueError(msg)
+
+    cancel = threading.Event()
+    outcome = "errors"
+    start = time.perf_counter()
+    METRICS.begin(name)
+    try:
+        if name in INLINE_TOOLS:
+            payload = function(arguments or {}, cancel)
+        else:
+            future = asyncio.get_running_loop().run_in_executor(_executor(), function, arguments or {}, cancel)
+            payload = await asyncio.wait_for(future, timeout=TOOL_TIMEOUT)
+        outcome = "ok"
+    except TimeoutError:
+        outcome = "timeouts"
+        msg = f"Tool '{name}' timed out after {TOOL_TIMEOUT:g}s"
+        raise ValueError(msg) from None
+    except asyncio.CancelledError:
+        outcome = "cancelled"
+        raise
+    finally:
+        cancel.set()
+        METRICS.end(name, time.perf_counter() - start, outcome)
+    return _json_content(payload)
 
 
 async def _run_stdio() -> None:
@@ -657,6 +873,7 @@ def _get_invocation_command() -> str:
 
 
 def main(argv: list[str] | None = None) -> None:
+    global MAX_WORKERS, TOOL_TIMEOUT  # noqa: PLW0603
     import sys
     from pathlib import Path
     
@@ -679,8 +896,37 @@ def main(argv: list[str] | None = None) -> None:
         default=8000,
         help="Port to bind to for HTTP/SSE modes (default: 8000)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"Worker threads for tool calls (default: {MAX_WORKERS})"
+    )
+    parser.add_argument(
+        "--tool-timeout",
+        type=float,
+        default=TOOL_TIMEOUT,
+        help=f"Seconds before a tool call is abandoned (default: {TOOL_TIMEOUT:g})"
+    )
+    parser.add_argument(
+        "--preload",
+        nargs="*",
+        default=[],
+        metavar="GAME",
+        help="Installations to load in the background at startup (k1, k2)"
+    )
     args = parser.parse_args(argv)
 
+    MAX_WORKERS = max(1, args.workers)
+    TOOL_TIMEOUT = args.tool_timeout
+    preload: list[Game] = []
+    for label in args.preload:
+        game = _resolve_game(label)
+        if game is None:
+            parser.error(f"Unknown game '{label}' for --preload")
+        preload.append(game)
+    _preload_installations(preload)
+
     if args.mode == "stdio":
         asyncio.run(_run_stdio())
     elif args.mode == "sse":
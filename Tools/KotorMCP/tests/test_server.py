@@ -0,0 +1,201 @@
+"""Tests for the KotorMCP worker pool: timeouts, cancellation, metrics, warm installations and startup flags."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import json
+import pathlib
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+THIS_SCRIPT_PATH = pathlib.Path(__file__).resolve()
+for path in (
+    THIS_SCRIPT_PATH.parents[1].joinpath("src"),
+    THIS_SCRIPT_PATH.parents[3].joinpath("Libraries", "PyKotor", "src"),
+    THIS_SCRIPT_PATH.parents[3].joinpath("Libraries", "Utility", "src"),
+):
+    if path.exists() and str(path) not in sys.path:
+        sys.path.append(str(path))
+
+pytest.importorskip("mcp")
+
+from pykotor.common.misc import Game  # noqa: E402
+from pykotor.resource.formats.gff import GFF, GFFContent, GFFList, write_gff  # noqa: E402
+from pykotor.resource.formats.key import KEY, write_key  # noqa: E402
+
+from kotormcp import server  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from mcp import types
+
+
+@pytest.fixture
+def fresh_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Give each test its own worker pool, metrics, installations and tool registry."""
+    monkeypatch.setattr(server, "MAX_WORKERS", 2)
+    monkeypatch.setattr(server, "TOOL_TIMEOUT", 10.0)
+    monkeypatch.setattr(server, "_EXECUTOR", None)
+    monkeypatch.setattr(server, "METRICS", server.ToolMetrics())
+    monkeypatch.setattr(server, "INSTALLATIONS", {})
+    monkeypatch.setattr(server, "TOOLS", dict(server.TOOLS))
+    monkeypatch.setattr(server, "INLINE_TOOLS", set(server.INLINE_TOOLS))
+    for env_names in server.ENV_HINTS.values():
+        for env_name in env_names:
+            monkeypatch.delenv(env_name, raising=False)
+    monkeypatch.setattr(server, "DEFAULT_PATH_CACHE", {})
+    yield
+    if server._EXECUTOR is not None:  # noqa: SLF001
+        server._EXECUTOR.shutdown(wait=True)  # noqa: SLF001
+
+
+@pytest.fixture
+def k1_path(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    """A minimal K1 installation with a global.jrl of one category, found through K1_PATH."""
+    install_path = tmp_path / "k1"
+    (install_path / "Override").mkdir(parents=True)
+    (install_path / "Modules").mkdir()
+    (install_path / "swkotor.exe").touch()
+    write_key(KEY(), install_path / "chitin.key")
+    journal = GFF(GFFContent.JRL)
+    category = journal.root.set_list("Categories", GFFList()).add(0)
+    category.set_string("Tag", "k_main")
+    category.set_uint32("XP", 50)
+    category.set_list("EntryList", GFFList()).add(0).set_uint32("ID", 10)
+    write_gff(journal, install_path / "Override" / "global.jrl")
+    monkeypatch.setenv("K1_PATH", str(install_path))
+    return install_path
+
+
+def _payload(result: types.CallToolResult) -> Any:
+    return json.loads(result.content[0].text)
+
+
+def _register_blocking_tool(name: str, release: threading.Event | None = None) -> tuple[threading.Event, threading.Event]:
+    """Register a tool that runs until `release` is set or its call is cancelled; returns its (started, stopped) events."""
+    started, stopped = threading.Event(), threading.Event()
+
+    @server._tool(name)  # noqa: SLF001
+    def _blocking(arguments: dict[str, Any], cancel: threading.Event) -> Any:
+        started.set()
+        try:
+            while release is None or not release.is_set():
+                server._check_cancelled(cancel)  # noqa: SLF001
+                time.sleep(0.01)
+        except server.ToolCancelledError:
+            stopped.set()
+            raise
+        return {"released": True}
+
+    return started, stopped
+
+
+def test_timed_out_call_stops_its_worker(fresh_server: None, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(server, "TOOL_TIMEOUT", 0.2)
+    _started, stopped = _register_blocking_tool("blocking")
+
+    with pytest.raises(ValueError, match="timed out after 0.2s"):
+        asyncio.run(server.handle_call_tool("blocking", {}))
+    assert stopped.wait(5)
+    metrics = server.METRICS.snapshot()["blocking"]
+    assert (metrics["calls"], metrics["timeouts"], metrics["inFlight"]) == (1, 1, 0)
+
+
+def test_cancelled_call_stops_its_worker(fresh_server: None):
+    started, stopped = _register_blocking_tool("blocking")
+
+    async def cancel_call():
+        task = asyncio.create_task(server.handle_call_tool("blocking", {}))
+        assert await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_call())
+    assert stopped.wait(5)
+    metrics = server.METRICS.snapshot()["blocking"]
+    assert (metrics["calls"], metrics["cancelled"], metrics["inFlight"]) == (1, 1, 0)
+
+
+def test_server_status_answers_while_every_worker_is_busy(fresh_server: None, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(server, "MAX_WORKERS", 1)
+    release = threading.Event()
+    started, _stopped = _register_blocking_tool("blocking", release)
+
+    @server._tool("failing")  # noqa: SLF001
+    def _failing(arguments: dict[str, Any], cancel: threading.Event) -> Any:
+        raise ValueError("bad arguments")
+
+    async def check_status():
+        task = asyncio.create_task(server.handle_call_tool("blocking", {}))
+        assert await asyncio.to_thread(started.wait, 5)
+        status = _payload(await asyncio.wait_for(server.handle_call_tool("serverStatus", {}), timeout=1))
+        assert (status["workers"], status["toolTimeoutSeconds"]) == (1, 10.0)
+        assert status["tools"]["blocking"]["inFlight"] == 1
+        release.set()
+        assert _payload(await task) == {"released": True}
+        with pytest.raises(ValueError, match="bad arguments"):
+            await server.handle_call_tool("failing", {})
+        return _payload(await server.handle_call_tool("serverStatus", {}))
+
+    status = asyncio.run(check_status())
+    blocking, failing = status["tools"]["blocking"], status["tools"]["failing"]
+    assert (blocking["calls"], blocking["inFlight"], blocking["errors"]) == (1, 0, 0)
+    assert blocking["p50Ms"] is not None and blocking["p95Ms"] <= blocking["maxMs"]
+    assert (failing["calls"], failing["errors"]) == (1, 1)
+    assert status["tools"]["serverStatus"]["calls"] == 1
+
+
+def test_installations_are_loaded_once_and_warm(fresh_server: None, k1_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    loads: list[pathlib.Path] = []
+    installation_class = server.Installation
+
+    def counting_installation(path: pathlib.Path):
+        loads.append(path)
+        time.sleep(0.2)  # long enough for the other caller to find the load in progress
+        return installation_class(path)
+
+    monkeypatch.setattr(server, "Installation", counting_installation)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        installations = list(executor.map(lambda _: server._load_installation(Game.K1), range(2)))  # noqa: SLF001
+
+    assert len(loads) == 1
+    assert installations[0] is installations[1]
+    # Lazy locations and the search index are built before other threads see the installation
+    assert installations[0]._search_index is not None  # noqa: SLF001
+    assert server.INSTALLATIONS[Game.K1].state == "ready"
+
+
+def test_journal_overview_checks_for_cancellation(fresh_server: None, k1_path: pathlib.Path):
+    overview = _payload(asyncio.run(server.handle_call_tool("journalOverview", {"game": "k1"})))
+    assert overview["count"] == 1
+    assert (overview["categories"][0]["tag"], overview["categories"][0]["xp"], overview["categories"][0]["entries"][0]["id"]) == ("k_main", 50, 10)
+
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(server.ToolCancelledError):
+        server._journal_overview({"game": "k1"}, cancel)  # noqa: SLF001
+
+
+def test_main_applies_workers_timeout_and_preload(fresh_server: None, k1_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    async def no_transport():
+        pass
+
+    monkeypatch.setattr(server, "_run_stdio", no_transport)
+    server.main(["--workers", "3", "--tool-timeout", "5", "--preload", "k1"])
+    assert (server.MAX_WORKERS, server.TOOL_TIMEOUT) == (3, 5.0)
+    assert server._executor()._max_workers == 3  # noqa: SLF001
+
+    slot = server.INSTALLATIONS[Game.K1]
+    assert slot.ready.wait(10)
+    assert (slot.state, slot.path) == ("ready", str(k1_path.resolve()))
+    assert slot.installation is not None and slot.installation._search_index is not None  # noqa: SLF001
+
+    with pytest.raises(SystemExit):
+        server.main(["--preload", "k3"])